@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Benchmark filtered Qdrant search before and after applying the orchestrator collection profile.
+
+Creates a scratch collection, loads synthetic points with project/topic payloads, measures
+filtered search latency, applies the profile (payload indexes plus any configured
+quantization/HNSW/on-disk settings from ORCH_QDRANT_* env vars) and measures again.
+Requires a running Qdrant; ``--url :memory:`` only smoke-tests the script (local mode has no indexes).
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib.util
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+
+def _load_orchestrator():
+    app_path = Path(__file__).resolve().parents[1] / "services" / "orchestrator" / "app.py"
+    spec = importlib.util.spec_from_file_location("orchestrator_app_bench", app_path)
+    if spec is None or spec.loader is None:
+        raise RuntimeError("Unable to load orchestrator app module")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct * (len(ordered) - 1))))]
+
+
+def _vector(rng: random.Random, dim: int) -> list[float]:
+    return [rng.uniform(-1.0, 1.0) for _ in range(dim)]
+
+
+async def _measure(client, models, collection: str, args, rng: random.Random) -> list[float]:
+    timings_ms: list[float] = []
+    for index in range(args.queries):
+        # Small projects are the selective case that an unindexed filter handles worst.
+        project = f"proj_{rng.randrange(args.projects)}" if index % 2 else f"proj_{args.projects - 1}"
+        query_filter = models.Filter(
+            must=[
+                models.FieldCondition(key="project", match=models.MatchValue(value=project)),
+                models.FieldCondition(key="topic_tags", match=models.MatchValue(value=f"topic_{index % 8}")),
+            ]
+        )
+        started = time.perf_counter()
+        await client.query_points(
+            collection_name=collection,
+            query=_vector(rng, args.dim),
+            query_filter=query_filter,
+            limit=args.limit,
+            with_payload=True,
+        )
+        timings_ms.append((time.perf_counter() - started) * 1000)
+    return timings_ms
+
+
+def _report(label: str, timings_ms: list[float]) -> None:
+    print(
+        f"{label:<7} p50={statistics.median(timings_ms):.3f}ms p95={_percentile(timings_ms, 0.95):.3f}ms "
+        f"max={max(timings_ms):.3f}ms"
+    )
+
+
+async def _wait_for_green(client, collection: str, timeout_secs: float) -> None:
+    deadline = time.monotonic() + timeout_secs
+    while time.monotonic() < deadline:
+        info = await client.get_collection(collection_name=collection)
+        if str(getattr(info, "status", "")).lower().endswith("green"):
+            return
+        await asyncio.sleep(0.5)
+
+
+async def _run(args) -> int:
+    orchestrator = _load_orchestrator()
+    from qdrant_client import AsyncQdrantClient
+    from qdrant_client import models
+
+    client = AsyncQdrantClient(location=":memory:") if args.url == ":memory:" else AsyncQdrantClient(
+        url=args.url,
+        api_key=os.getenv("QDRANT_API_KEY") or None,
+    )
+    rng = random.Random(args.seed)
+    collection = f"bench_filtered_{uuid.uuid4().hex[:8]}"
+    await client.create_collection(
+        collection_name=collection,
+        vectors_config=models.VectorParams(size=args.dim, distance=models.Distance.COSINE),
+    )
+    try:
+        # Zipf-like project sizes: a few large tenants and a long tail.
+        weights = [1.0 / (rank + 1) for rank in range(args.projects)]
+        for start in range(0, args.points, 512):
+            batch = []
+            for _ in range(min(512, args.points - start)):
+                project = rng.choices(range(args.projects), weights=weights)[0]
+                batch.append(
+                    models.PointStruct(
+                        id=str(uuid.uuid4()),
+                        vector=_vector(rng, args.dim),
+                        payload={
+                            "project": f"proj_{project}",
+                            "file": f"notes/{rng.randrange(5000)}.md",
+                            "topic_tags": [f"topic_{rng.randrange(8)}"],
+                            "topic_path": f"topic_{rng.randrange(8)}",
+                            "ts": int(time.time()) - rng.randrange(86400 * 90),
+                        },
+                    )
+                )
+            await client.upsert(collection_name=collection, points=batch, wait=True)
+        await _wait_for_green(client, collection, args.index_wait_secs)
+
+        before = await _measure(client, models, collection, args, random.Random(args.seed + 1))
+        info = await client.get_collection(collection_name=collection)
+        profile = await orchestrator._apply_qdrant_collection_profile(client, collection, info)
+        await _wait_for_green(client, collection, args.index_wait_secs)
+        after = await _measure(client, models, collection, args, random.Random(args.seed + 1))
+
+        print(
+            f"points={args.points} projects={args.projects} dim={args.dim} queries={args.queries} "
+            f"indexes={profile['created_indexes']} updated={profile['updated']}"
+        )
+        _report("before", before)
+        _report("after", after)
+        if profile["errors"]:
+            print(f"profile errors: {profile['errors']}")
+    finally:
+        if not args.keep:
+            await client.delete_collection(collection_name=collection)
+        await client.close()
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark filtered Qdrant search with and without the collection profile")
+    parser.add_argument("--url", default=os.getenv("QDRANT_URL", "http://localhost:6333"))
+    parser.add_argument("--points", type=int, default=50000)
+    parser.add_argument("--projects", type=int, default=40)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--index-wait-secs", type=float, default=120.0)
+    parser.add_argument("--keep", action="store_true", help="keep the scratch collection")
+    return asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for orchestrator federated merge scoring (no services required)."""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+SOURCES = ("qdrant", "mongo_raw", "mindsdb", "letta", "memory_bank", "topic_rollups")
+WORDS = (
+    "stop loss rpc provider helius latency migration rollback decision wallet "
+    "strategy signal override retention fanout outbox qdrant mongo letta budget "
+    "slippage priority fee jito bundle validator snapshot index recall"
+).split()
+
+
+def _load_orchestrator():
+    app_path = Path(__file__).resolve().parents[1] / "services" / "orchestrator" / "app.py"
+    spec = importlib.util.spec_from_file_location("orchestrator_app_bench", app_path)
+    if spec is None or spec.loader is None:
+        raise RuntimeError("Unable to load orchestrator app module")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _make_rows(rng: random.Random, source: str, count: int, summary_words: int) -> list[dict]:
+    rows = []
+    for index in range(count):
+        words = [rng.choice(WORDS) for _ in range(summary_words)]
+        if index % 3 == 0:
+            words.insert(rng.randrange(len(words)), f"{rng.randint(1, 99999)}")
+        if index % 7 == 0:
+            words.insert(rng.randrange(len(words)), "61200")
+        rows.append(
+            {
+                "project": f"proj_{index % 5}",
+                "file": f"notes/{source}/{index % 150}.md",
+                "summary": " ".join(words),
+                "score": rng.random(),
+            }
+        )
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark _merge_federated_rows")
+    parser.add_argument("--rows", type=int, default=200, help="rows per source")
+    parser.add_argument("--sources", type=int, default=len(SOURCES), help="number of sources (max 6)")
+    parser.add_argument("--summary-words", type=int, default=48)
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--query", default="stop loss 61200 helius rpc")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument(
+        "--top-k",
+        type=int,
+        default=0,
+        help="rows to materialize (0 = all rows, matching the pre-top-k merge)",
+    )
+    args = parser.parse_args()
+
+    orchestrator = _load_orchestrator()
+    rng = random.Random(args.seed)
+    sources = SOURCES[: max(1, min(args.sources, len(SOURCES)))]
+    results_by_source = {
+        source: _make_rows(rng, source, args.rows, args.summary_words) for source in sources
+    }
+    positive_terms = {"helius", "rollback", "priority", "validator"}
+    negative_terms = {"slippage", "jito", "snapshot"}
+    weights = orchestrator._normalize_retrieval_weights(None)
+
+    merge_kwargs = {"query": args.query}
+    if args.top_k > 0:
+        merge_kwargs["top_k"] = args.top_k
+
+    def _run() -> int:
+        merged = orchestrator._merge_federated_rows(
+            results_by_source,
+            weights,
+            positive_terms,
+            negative_terms,
+            True,
+            **merge_kwargs,
+        )
+        if args.top_k <= 0:
+            # Callers used to sort the full merged list before slicing.
+            merged.sort(key=lambda row: (row["score"], row["base_score"]), reverse=True)
+        return len(merged)
+
+    _run()
+    timings_ms = []
+    merged_rows = 0
+    for _ in range(max(1, args.iterations)):
+        started = time.perf_counter()
+        merged_rows = _run()
+        timings_ms.append((time.perf_counter() - started) * 1000)
+    timings_ms.sort()
+    p95 = timings_ms[min(len(timings_ms) - 1, int(round(0.95 * (len(timings_ms) - 1))))]
+    print(
+        f"sources={len(sources)} rows_per_source={args.rows} top_k={args.top_k or 'all'} merged={merged_rows} "
+        f"iterations={len(timings_ms)}"
+    )
+    print(
+        f"merge_ms mean={statistics.fmean(timings_ms):.3f} "
+        f"p50={statistics.median(timings_ms):.3f} p95={p95:.3f} min={timings_ms[0]:.3f}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
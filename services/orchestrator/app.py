@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import hashlib
+import heapq
 import hmac
 import json
 import logging
@@ -13,6 +14,7 @@ import re
 import random
 import sqlite3
 import sys
+import threading
 import uuid
 import pathlib
 import zlib
@@ -25,12 +27,14 @@ from urllib.parse import unquote
 
 import httpx
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse, PlainTextResponse
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse, PlainTextResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
 try:
+    from bson import ObjectId  # type: ignore
     from pymongo import MongoClient, ReturnDocument, UpdateOne  # type: ignore
 except Exception:  # pragma: no cover - optional dependency
+    ObjectId = None  # type: ignore
     MongoClient = None  # type: ignore
     ReturnDocument = None  # type: ignore
     UpdateOne = None  # type: ignore
@@ -45,11 +49,22 @@ try:
 except Exception:  # pragma: no cover - optional dependency
     Instrumentator = None  # type: ignore
 
+try:
+    from prometheus_client.core import GaugeMetricFamily, REGISTRY as PROMETHEUS_REGISTRY  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    GaugeMetricFamily = None  # type: ignore
+    PROMETHEUS_REGISTRY = None  # type: ignore
+
 try:
     from aiolimiter import AsyncLimiter  # type: ignore
 except Exception:  # pragma: no cover - optional dependency
     AsyncLimiter = None  # type: ignore
 
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    np = None  # type: ignore
+
 try:
     from qdrant_client import AsyncQdrantClient  # type: ignore
     from qdrant_client.http import models as qdrant_models  # type: ignore
@@ -141,6 +156,36 @@ MEMMCP_READ_CACHE_REFRESH_MAX_INFLIGHT = max(
     1,
     int(os.getenv("CONTEXTLATTICE_READ_CACHE_REFRESH_MAX_INFLIGHT", "8")),
 )
+# Shared L2 tier in Redis (ORCH_RETRIEVAL_PATHWAY_REDIS_URL) behind the per-process cache.
+MEMMCP_READ_CACHE_L2_ENABLED = os.getenv(
+    "CONTEXTLATTICE_READ_CACHE_L2_ENABLED",
+    "false",
+).lower() in ("1", "true", "yes", "on")
+MEMMCP_READ_CACHE_L2_PREFIX = os.getenv(
+    "CONTEXTLATTICE_READ_CACHE_L2_PREFIX",
+    "contextlattice:read:",
+).strip() or "contextlattice:read:"
+MEMMCP_READ_CACHE_L2_REVALIDATE_SECS = max(
+    0.0,
+    float(os.getenv("CONTEXTLATTICE_READ_CACHE_L2_REVALIDATE_SECS", "30")),
+)
+# Short-lived "file not found" markers; 0 disables negative caching of reads.
+MEMMCP_READ_NEGATIVE_CACHE_TTL_SECS = max(
+    0.0,
+    float(os.getenv("CONTEXTLATTICE_READ_NEGATIVE_CACHE_TTL_SECS", "30")),
+)
+MEMMCP_READ_NEGATIVE_CACHE_MAX_KEYS = max(
+    0,
+    int(os.getenv("CONTEXTLATTICE_READ_NEGATIVE_CACHE_MAX_KEYS", "5000")),
+)
+MEMMCP_SEARCH_FETCH_CONCURRENCY = max(
+    1,
+    int(os.getenv("CONTEXTLATTICE_SEARCH_FETCH_CONCURRENCY", "8")),
+)
+MEMMCP_SEARCH_FETCH_DEADLINE_SECS = max(
+    0.5,
+    float(os.getenv("CONTEXTLATTICE_SEARCH_FETCH_DEADLINE_SECS", "10")),
+)
 ORCH_LOG_LEVEL = os.getenv("ORCH_LOG_LEVEL", "INFO").upper()
 ORCH_LOG_FILE = os.getenv("ORCH_LOG_FILE", "").strip()
 LANGFUSE_URL = os.getenv("LANGFUSE_URL", "http://langfuse:3000")
@@ -174,6 +219,15 @@ MINDSDB_AUTOSYNC_RETRIES = int(os.getenv("MINDSDB_AUTOSYNC_RETRIES", "5"))
 MINDSDB_AUTOSYNC_BACKOFF_SECS = float(os.getenv("MINDSDB_AUTOSYNC_BACKOFF_SECS", "1.5"))
 MINDSDB_AUTOSYNC_QUEUE_MAX = int(os.getenv("MINDSDB_AUTOSYNC_QUEUE_MAX", "500"))
 MINDSDB_AUTOSYNC_BATCH_SIZE = max(1, int(os.getenv("MINDSDB_AUTOSYNC_BATCH_SIZE", "8")))
+MINDSDB_TERM_INDEX_ENABLED = os.getenv("MINDSDB_TERM_INDEX_ENABLED", "true").lower() in (
+    "1",
+    "true",
+    "yes",
+    "on",
+)
+MINDSDB_TERM_INDEX_SUFFIX = os.getenv("MINDSDB_TERM_INDEX_SUFFIX", "_terms").strip() or "_terms"
+MINDSDB_TERM_INDEX_MAX_TERMS = max(4, int(os.getenv("MINDSDB_TERM_INDEX_MAX_TERMS", "48")))
+MINDSDB_TERM_INDEX_BACKFILL_BATCH = max(10, int(os.getenv("MINDSDB_TERM_INDEX_BACKFILL_BATCH", "200")))
 MINDSDB_FAIL_OPEN_ON_PERMANENT_ERROR = os.getenv(
     "MINDSDB_FAIL_OPEN_ON_PERMANENT_ERROR",
     "true",
@@ -240,6 +294,10 @@ HIGH_RISK_ACTIONS = [
     if item.strip()
 ]
 PREFERENCE_MAX_ENTRIES = int(os.getenv("PREFERENCE_MAX_ENTRIES", "25"))
+# Preference contexts per (project, user_id) are cached until feedback for that scope is
+# recorded; the TTL bounds staleness from feedback written by other processes.
+PREFERENCE_CACHE_TTL_SECS = max(0.0, float(os.getenv("PREFERENCE_CACHE_TTL_SECS", "300")))
+PREFERENCE_CACHE_MAX_KEYS = max(1, int(os.getenv("PREFERENCE_CACHE_MAX_KEYS", "1024")))
 FEEDBACK_MAX_CONTENT = int(os.getenv("FEEDBACK_MAX_CONTENT", "2000"))
 DEFAULT_TOPIC_ROOT = os.getenv("DEFAULT_TOPIC_ROOT", "root")
 
@@ -257,6 +315,30 @@ RETRIEVAL_SOURCES_ENV = os.getenv(
     "qdrant,mongo_raw,mindsdb,topic_rollups,letta,memory_bank",
 )
 RETRIEVAL_MONGO_SCAN_LIMIT = int(os.getenv("ORCH_RETRIEVAL_MONGO_SCAN_LIMIT", "400"))
+RETRIEVAL_MONGO_TEXT_SEARCH_ENABLED = os.getenv(
+    "ORCH_RETRIEVAL_MONGO_TEXT_SEARCH_ENABLED",
+    "true",
+).lower() in ("1", "true", "yes", "on")
+RETRIEVAL_MONGO_TEXT_CANDIDATE_FACTOR = max(
+    1,
+    int(os.getenv("ORCH_RETRIEVAL_MONGO_TEXT_CANDIDATE_FACTOR", "4")),
+)
+RETRIEVAL_MONGO_SNIPPET_CHARS = max(
+    80,
+    int(os.getenv("ORCH_RETRIEVAL_MONGO_SNIPPET_CHARS", "500")),
+)
+RETRIEVAL_MONGO_TEXT_INDEX_RETRY_SECS = max(
+    10.0,
+    float(os.getenv("ORCH_RETRIEVAL_MONGO_TEXT_INDEX_RETRY_SECS", "300")),
+)
+# Field weights for the raw-event text index; summaries carry the most signal.
+MONGO_RAW_TEXT_INDEX_NAME = "raw_text_search"
+MONGO_RAW_TEXT_INDEX_WEIGHTS = {
+    "summary": 10,
+    "file": 6,
+    "topic_path": 4,
+    "content_raw": 1,
+}
 RETRIEVAL_MINDSDB_SCAN_LIMIT = int(os.getenv("ORCH_RETRIEVAL_MINDSDB_SCAN_LIMIT", "300"))
 RETRIEVAL_MEMORY_SCAN_LIMIT = int(os.getenv("ORCH_RETRIEVAL_MEMORY_SCAN_LIMIT", "36"))
 RETRIEVAL_MEMORY_PROJECT_LIMIT = int(os.getenv("ORCH_RETRIEVAL_MEMORY_PROJECT_LIMIT", "12"))
@@ -272,6 +354,18 @@ RETRIEVAL_LETTA_CACHE_ENABLED = os.getenv("ORCH_RETRIEVAL_LETTA_CACHE_ENABLED",
 )
 RETRIEVAL_LETTA_CACHE_TTL_SECS = max(0.0, float(os.getenv("ORCH_RETRIEVAL_LETTA_CACHE_TTL_SECS", "120")))
 RETRIEVAL_LETTA_CACHE_MAX_KEYS = max(1, int(os.getenv("ORCH_RETRIEVAL_LETTA_CACHE_MAX_KEYS", "2000")))
+# "redis" shares Letta results (and background warms) across replicas through
+# ORCH_RETRIEVAL_PATHWAY_REDIS_URL; the in-process cache stays in front of it.
+RETRIEVAL_LETTA_CACHE_BACKEND = os.getenv(
+    "ORCH_RETRIEVAL_LETTA_CACHE_BACKEND",
+    "memory",
+).strip().lower()
+if RETRIEVAL_LETTA_CACHE_BACKEND not in {"memory", "redis"}:
+    RETRIEVAL_LETTA_CACHE_BACKEND = "memory"
+RETRIEVAL_LETTA_CACHE_REDIS_PREFIX = os.getenv(
+    "ORCH_RETRIEVAL_LETTA_CACHE_REDIS_PREFIX",
+    "contextlattice:letta:",
+).strip() or "contextlattice:letta:"
 RETRIEVAL_LETTA_ASYNC_WARM_ENABLED = os.getenv(
     "ORCH_RETRIEVAL_LETTA_ASYNC_WARM_ENABLED",
     "true",
@@ -285,6 +379,59 @@ RETRIEVAL_LETTA_ASYNC_WARM_MAX_INFLIGHT = max(
     int(os.getenv("ORCH_RETRIEVAL_LETTA_ASYNC_WARM_MAX_INFLIGHT", "4")),
 )
 QDRANT_EMBED_TIMEOUT_SECS = float(os.getenv("ORCH_QDRANT_EMBED_TIMEOUT_SECS", "2.0"))
+QDRANT_LOCAL_INDEX_ENABLED = os.getenv(
+    "ORCH_QDRANT_LOCAL_INDEX_ENABLED",
+    "false",
+).lower() in ("1", "true", "yes", "on")
+QDRANT_LOCAL_INDEX_MAX_BYTES = max(
+    1_000_000,
+    int(os.getenv("ORCH_QDRANT_LOCAL_INDEX_MAX_BYTES", str(256 * 1024 * 1024))),
+)
+QDRANT_LOCAL_INDEX_PROJECTS = [
+    item.strip()
+    for item in os.getenv("ORCH_QDRANT_LOCAL_INDEX_PROJECTS", "").split(",")
+    if item.strip()
+]
+QDRANT_LOCAL_INDEX_MAX_PROJECTS = max(
+    1,
+    int(os.getenv("ORCH_QDRANT_LOCAL_INDEX_MAX_PROJECTS", "16")),
+)
+QDRANT_LOCAL_INDEX_REFRESH_SECS = max(
+    60.0,
+    float(os.getenv("ORCH_QDRANT_LOCAL_INDEX_REFRESH_SECS", "900")),
+)
+# Rough per-point payload overhead (summary, file, tags) used for budget accounting.
+QDRANT_LOCAL_INDEX_PAYLOAD_BYTES = 768
+QDRANT_PAYLOAD_INDEXES_ENABLED = os.getenv(
+    "ORCH_QDRANT_PAYLOAD_INDEXES_ENABLED",
+    "true",
+).lower() in ("1", "true", "yes", "on")
+# Payload fields used by search filters, file listing, retention and rollup scrolls.
+QDRANT_PAYLOAD_INDEX_FIELDS: dict[str, str] = {
+    "project": "keyword",
+    "file": "keyword",
+    "topic_path": "keyword",
+    "topic_tags": "keyword",
+    "ts": "integer",
+}
+QDRANT_QUANTIZATION = os.getenv("ORCH_QDRANT_QUANTIZATION", "none").strip().lower()
+if QDRANT_QUANTIZATION not in {"none", "scalar"}:
+    QDRANT_QUANTIZATION = "none"
+QDRANT_QUANTIZATION_QUANTILE = min(
+    1.0,
+    max(0.5, float(os.getenv("ORCH_QDRANT_QUANTIZATION_QUANTILE", "0.99"))),
+)
+QDRANT_QUANTIZATION_ALWAYS_RAM = os.getenv(
+    "ORCH_QDRANT_QUANTIZATION_ALWAYS_RAM",
+    "true",
+).lower() in ("1", "true", "yes", "on")
+QDRANT_ON_DISK_VECTORS = os.getenv(
+    "ORCH_QDRANT_ON_DISK_VECTORS",
+    "false",
+).lower() in ("1", "true", "yes", "on")
+# 0 keeps the server default.
+QDRANT_HNSW_M = max(0, int(os.getenv("ORCH_QDRANT_HNSW_M", "0")))
+QDRANT_HNSW_EF_CONSTRUCT = max(0, int(os.getenv("ORCH_QDRANT_HNSW_EF_CONSTRUCT", "0")))
 RETRIEVAL_QDRANT_TIMEOUT_SECS = float(os.getenv("ORCH_RETRIEVAL_QDRANT_TIMEOUT_SECS", "8"))
 RETRIEVAL_MONGO_TIMEOUT_SECS = float(os.getenv("ORCH_RETRIEVAL_MONGO_TIMEOUT_SECS", "6"))
 RETRIEVAL_MINDSDB_TIMEOUT_SECS = float(os.getenv("ORCH_RETRIEVAL_MINDSDB_TIMEOUT_SECS", "8"))
@@ -316,6 +463,18 @@ RETRIEVAL_MODE_DEEP_MAX_SOURCE_LIMIT = max(
     50,
     int(os.getenv("ORCH_RETRIEVAL_MODE_DEEP_MAX_SOURCE_LIMIT", "300")),
 )
+RETRIEVAL_BATCH_QUERY_CONCURRENCY = max(
+    1,
+    int(os.getenv("ORCH_RETRIEVAL_BATCH_QUERY_CONCURRENCY", "4")),
+)
+RETRIEVAL_BATCH_QUERY_DEADLINE_SECS = max(
+    1.0,
+    float(os.getenv("ORCH_RETRIEVAL_BATCH_QUERY_DEADLINE_SECS", "30")),
+)
+RETRIEVAL_BATCH_QUERY_MAX_REQUESTS = max(
+    1,
+    int(os.getenv("ORCH_RETRIEVAL_BATCH_QUERY_MAX_REQUESTS", "100")),
+)
 RETRIEVAL_PATHWAY_CACHE_ENABLED = os.getenv(
     "ORCH_RETRIEVAL_PATHWAY_CACHE_ENABLED",
     "true",
@@ -350,6 +509,40 @@ RETRIEVAL_PATHWAY_REDIS_COMPRESS = os.getenv(
     "ORCH_RETRIEVAL_PATHWAY_REDIS_COMPRESS",
     "true",
 ).lower() in ("1", "true", "yes", "on")
+RETRIEVAL_PATHWAY_SINGLEFLIGHT_ENABLED = os.getenv(
+    "ORCH_RETRIEVAL_PATHWAY_SINGLEFLIGHT_ENABLED",
+    "true",
+).lower() in ("1", "true", "yes", "on")
+RETRIEVAL_SEMANTIC_CACHE_ENABLED = os.getenv(
+    "ORCH_RETRIEVAL_SEMANTIC_CACHE_ENABLED",
+    "true",
+).lower() in ("1", "true", "yes", "on")
+RETRIEVAL_SEMANTIC_CACHE_MIN_SIMILARITY = max(
+    0.5,
+    min(1.0, float(os.getenv("ORCH_RETRIEVAL_SEMANTIC_CACHE_MIN_SIMILARITY", "0.95"))),
+)
+RETRIEVAL_SEMANTIC_CACHE_MAX_KEYS = max(
+    1,
+    int(os.getenv("ORCH_RETRIEVAL_SEMANTIC_CACHE_MAX_KEYS", "2000")),
+)
+RETRIEVAL_PATHWAY_INVALIDATION_ENABLED = os.getenv(
+    "ORCH_RETRIEVAL_PATHWAY_INVALIDATION_ENABLED",
+    "true",
+).lower() in ("1", "true", "yes", "on")
+# With write-driven invalidation, stale entries are unreachable after a write to
+# their project/topic scope, so the TTL only bounds drift from untracked writers.
+RETRIEVAL_PATHWAY_INVALIDATION_TTL_SECS = max(
+    0.0,
+    float(os.getenv("ORCH_RETRIEVAL_PATHWAY_INVALIDATION_TTL_SECS", "3600")),
+)
+RETRIEVAL_PATHWAY_GENERATION_REDIS_PREFIX = os.getenv(
+    "ORCH_RETRIEVAL_PATHWAY_GENERATION_REDIS_PREFIX",
+    "contextlattice:pathway-gen:",
+).strip() or "contextlattice:pathway-gen:"
+RETRIEVAL_PATHWAY_GENERATION_REFRESH_SECS = max(
+    0.0,
+    float(os.getenv("ORCH_RETRIEVAL_PATHWAY_GENERATION_REFRESH_SECS", "1.0")),
+)
 RETRIEVAL_PATHWAY_TEMPLATE_CACHE_ENABLED = os.getenv(
     "ORCH_RETRIEVAL_PATHWAY_TEMPLATE_CACHE_ENABLED",
     "true",
@@ -390,10 +583,40 @@ RETRIEVAL_PATHWAY_WARMER_CONCURRENCY = max(
     1,
     int(os.getenv("ORCH_RETRIEVAL_PATHWAY_WARMER_CONCURRENCY", "2")),
 )
-RETRIEVAL_LATENCY_HISTORY_LIMIT = max(
-    64,
-    int(os.getenv("ORCH_RETRIEVAL_LATENCY_HISTORY_LIMIT", "2048")),
+# Pathway hotness is an exponentially decayed hit count with this half-life.
+RETRIEVAL_PATHWAY_WARMER_HALFLIFE_SECS = max(
+    30.0,
+    float(os.getenv("ORCH_RETRIEVAL_PATHWAY_WARMER_HALFLIFE_SECS", "900")),
+)
+RETRIEVAL_PATHWAY_WARMER_MIN_SCORE = max(
+    0.0,
+    float(os.getenv("ORCH_RETRIEVAL_PATHWAY_WARMER_MIN_SCORE", "0.5")),
+)
+# Re-run a hot pathway this long before its cached result expires.
+RETRIEVAL_PATHWAY_WARMER_REFRESH_AHEAD_SECS = max(
+    1.0,
+    float(os.getenv("ORCH_RETRIEVAL_PATHWAY_WARMER_REFRESH_AHEAD_SECS", "15")),
+)
+# Summed warm-query time allowed per cycle; warms that would exceed it wait for the next cycle.
+RETRIEVAL_PATHWAY_WARMER_BUDGET_MS = max(
+    100.0,
+    float(os.getenv("ORCH_RETRIEVAL_PATHWAY_WARMER_BUDGET_MS", "5000")),
+)
+# Minimum time between the end of one warm cycle and a write-triggered next one, so
+# steady writes do not turn the warmer into back-to-back federated searches.
+RETRIEVAL_PATHWAY_WARMER_MIN_SPACING_SECS = max(
+    1.0,
+    float(os.getenv("ORCH_RETRIEVAL_PATHWAY_WARMER_MIN_SPACING_SECS", "30")),
+)
+# Relative error of latency quantiles (log-bucket width).
+RETRIEVAL_LATENCY_SKETCH_ACCURACY = min(
+    0.1,
+    max(0.005, float(os.getenv("ORCH_RETRIEVAL_LATENCY_SKETCH_ACCURACY", "0.02"))),
 )
+RETRIEVAL_LATENCY_WINDOWS: dict[str, float] = {"1m": 60.0, "5m": 300.0, "1h": 3600.0}
+RETRIEVAL_LATENCY_SNAPSHOT_WINDOW = os.getenv("ORCH_RETRIEVAL_LATENCY_SNAPSHOT_WINDOW", "1h").strip()
+if RETRIEVAL_LATENCY_SNAPSHOT_WINDOW not in RETRIEVAL_LATENCY_WINDOWS:
+    RETRIEVAL_LATENCY_SNAPSHOT_WINDOW = "1h"
 RETRIEVAL_QUERY_EXPANSION_ENABLED = os.getenv(
     "ORCH_RETRIEVAL_QUERY_EXPANSION_ENABLED",
     "true",
@@ -434,6 +657,10 @@ RECALL_NUMERIC_FACTS_MAX = max(
     4,
     int(os.getenv("ORCH_RECALL_NUMERIC_FACTS_MAX", "80")),
 )
+MEMORY_FEATURE_MAX_TERMS = max(
+    8,
+    int(os.getenv("ORCH_MEMORY_FEATURE_MAX_TERMS", "128")),
+)
 RECALL_STALE_HOURS = max(
     1.0,
     float(os.getenv("ORCH_RECALL_STALE_HOURS", "168")),
@@ -536,6 +763,17 @@ RETRIEVAL_SLOW_SOURCE_MIN_DIVERSITY = max(
     1,
     int(os.getenv("ORCH_RETRIEVAL_SLOW_SOURCE_MIN_DIVERSITY", "2")),
 )
+RETRIEVAL_DEADLINE_HEADER = "x-retrieval-deadline-ms"
+# Sources are not started with less than this much request budget left.
+RETRIEVAL_DEADLINE_MIN_SOURCE_MS = max(
+    1.0,
+    float(os.getenv("ORCH_RETRIEVAL_DEADLINE_MIN_SOURCE_MS", "50")),
+)
+# Budget held back from source fan-out for merge, grounding and response assembly.
+RETRIEVAL_DEADLINE_RESERVE_MS = max(
+    0.0,
+    float(os.getenv("ORCH_RETRIEVAL_DEADLINE_RESERVE_MS", "25")),
+)
 RETRIEVAL_SLOW_SOURCE_STABILITY_ENABLED = os.getenv(
     "ORCH_RETRIEVAL_SLOW_SOURCE_STABILITY_ENABLED",
     "true",
@@ -556,6 +794,74 @@ RETRIEVAL_SLOW_SOURCE_COOLDOWN_SECS = max(
     10.0,
     float(os.getenv("ORCH_RETRIEVAL_SLOW_SOURCE_COOLDOWN_SECS", "180")),
 )
+RETRIEVAL_HEDGE_ENABLED = os.getenv(
+    "ORCH_RETRIEVAL_HEDGE_ENABLED",
+    "false",
+).lower() in ("1", "true", "yes", "on")
+RETRIEVAL_HEDGE_SOURCES_ENV = os.getenv(
+    "ORCH_RETRIEVAL_HEDGE_SOURCES",
+    "letta,memory_bank",
+)
+RETRIEVAL_HEDGE_PERCENTILE = min(
+    0.99,
+    max(0.5, float(os.getenv("ORCH_RETRIEVAL_HEDGE_PERCENTILE", "0.90"))),
+)
+RETRIEVAL_HEDGE_MIN_SAMPLES = max(
+    1,
+    int(os.getenv("ORCH_RETRIEVAL_HEDGE_MIN_SAMPLES", "20")),
+)
+RETRIEVAL_HEDGE_LATENCY_WINDOW = os.getenv("ORCH_RETRIEVAL_HEDGE_LATENCY_WINDOW", "5m").strip()
+if RETRIEVAL_HEDGE_LATENCY_WINDOW not in RETRIEVAL_LATENCY_WINDOWS:
+    RETRIEVAL_HEDGE_LATENCY_WINDOW = "5m"
+RETRIEVAL_HEDGE_MIN_DELAY_MS = max(
+    1.0,
+    float(os.getenv("ORCH_RETRIEVAL_HEDGE_MIN_DELAY_MS", "50")),
+)
+RETRIEVAL_HEDGE_MAX_EXTRA_LOAD = min(
+    1.0,
+    max(0.0, float(os.getenv("ORCH_RETRIEVAL_HEDGE_MAX_EXTRA_LOAD", "0.10"))),
+)
+RETRIEVAL_HEDGE_BUDGET_BURST = max(
+    1.0,
+    float(os.getenv("ORCH_RETRIEVAL_HEDGE_BUDGET_BURST", "5")),
+)
+RETRIEVAL_SOURCE_ROUTER_ENABLED = os.getenv(
+    "ORCH_RETRIEVAL_SOURCE_ROUTER_ENABLED",
+    "false",
+).lower() in ("1", "true", "yes", "on")
+RETRIEVAL_SOURCE_ROUTER_SOURCES_ENV = os.getenv(
+    "ORCH_RETRIEVAL_SOURCE_ROUTER_SOURCES",
+    "letta,mindsdb",
+)
+RETRIEVAL_SOURCE_ROUTER_MIN_OBSERVATIONS = max(
+    1,
+    int(os.getenv("ORCH_RETRIEVAL_SOURCE_ROUTER_MIN_OBSERVATIONS", "20")),
+)
+RETRIEVAL_SOURCE_ROUTER_MIN_PROBABILITY = min(
+    1.0,
+    max(0.0, float(os.getenv("ORCH_RETRIEVAL_SOURCE_ROUTER_MIN_PROBABILITY", "0.05"))),
+)
+RETRIEVAL_SOURCE_ROUTER_EXPLORATION_RATE = min(
+    1.0,
+    max(0.0, float(os.getenv("ORCH_RETRIEVAL_SOURCE_ROUTER_EXPLORATION_RATE", "0.10"))),
+)
+RETRIEVAL_SOURCE_ROUTER_DECAY = min(
+    1.0,
+    max(0.5, float(os.getenv("ORCH_RETRIEVAL_SOURCE_ROUTER_DECAY", "0.98"))),
+)
+RETRIEVAL_SOURCE_ROUTER_MAX_KEYS = max(
+    16,
+    int(os.getenv("ORCH_RETRIEVAL_SOURCE_ROUTER_MAX_KEYS", "4096")),
+)
+# Remember sources that returned no rows for a query; 0 disables.
+RETRIEVAL_EMPTY_SOURCE_CACHE_TTL_SECS = max(
+    0.0,
+    float(os.getenv("ORCH_RETRIEVAL_EMPTY_SOURCE_CACHE_TTL_SECS", "20")),
+)
+RETRIEVAL_EMPTY_SOURCE_CACHE_MAX_KEYS = max(
+    0,
+    int(os.getenv("ORCH_RETRIEVAL_EMPTY_SOURCE_CACHE_MAX_KEYS", "4096")),
+)
 RETRIEVAL_LETTA_DEGRADED_TIMEOUT_SECS = max(
     1.0,
     float(os.getenv("ORCH_RETRIEVAL_LETTA_DEGRADED_TIMEOUT_SECS", "18")),
@@ -726,12 +1032,34 @@ TOPIC_ROLLUP_MAX_SUMMARY_SNIPPETS = max(1, int(os.getenv("TOPIC_ROLLUP_MAX_SUMMA
 TOPIC_ROLLUP_MAX_NUMERIC_FACTS = max(1, int(os.getenv("TOPIC_ROLLUP_MAX_NUMERIC_FACTS", "16")))
 TOPIC_ROLLUP_MAX_UNIQUE_FILES = max(1, int(os.getenv("TOPIC_ROLLUP_MAX_UNIQUE_FILES", "24")))
 TOPIC_ROLLUP_BACKFILL_HOLD_SECS = max(0.0, float(os.getenv("TOPIC_ROLLUP_BACKFILL_HOLD_SECS", "1800")))
+# Fold each persisted write into the affected topic prefixes and append them to a delta
+# log; full rebuilds from history then only run every TOPIC_ROLLUP_REPAIR_SECS.
+TOPIC_ROLLUP_INCREMENTAL_ENABLED = os.getenv("TOPIC_ROLLUP_INCREMENTAL_ENABLED", "true").lower() in (
+    "1",
+    "true",
+    "yes",
+    "on",
+)
+TOPIC_ROLLUP_REPAIR_SECS = max(60.0, float(os.getenv("TOPIC_ROLLUP_REPAIR_SECS", "3600")))
+TOPIC_ROLLUP_DELTA_COMPACT_LINES = max(1, int(os.getenv("TOPIC_ROLLUP_DELTA_COMPACT_LINES", "200")))
 TOPIC_ROLLUP_PATH = Path(
     os.getenv(
         "TOPIC_ROLLUP_PATH",
         str(Path(__file__).resolve().parent / "data" / "topic_rollups.json"),
     )
 )
+# Qdrant/Mongo backfills split the source into ts (Qdrant) or _id (Mongo) ranges scanned
+# by concurrent cursors, and checkpoint each range's cursor so interrupted jobs resume.
+BACKFILL_SEGMENTS = max(1, min(32, int(os.getenv("ORCH_BACKFILL_SEGMENTS", "4"))))
+BACKFILL_PAGE_SIZE = max(16, min(2048, int(os.getenv("ORCH_BACKFILL_PAGE_SIZE", "256"))))
+BACKFILL_JOBS_MAX = max(1, int(os.getenv("ORCH_BACKFILL_JOBS_MAX", "50")))
+BACKFILL_CHECKPOINT_DIR = Path(
+    os.getenv(
+        "ORCH_BACKFILL_CHECKPOINT_DIR",
+        str(Path(__file__).resolve().parent / "data" / "backfill_jobs"),
+    )
+)
+BACKFILL_JOB_ID_PATTERN = re.compile(r"^[A-Za-z0-9_.-]{1,64}$")
 MEMORY_WRITE_ASYNC = os.getenv("MEMORY_WRITE_ASYNC", "true").lower() in ("1", "true", "yes", "on")
 MEMORY_BANK_QUEUE_MAX = int(os.getenv("MEMORY_BANK_QUEUE_MAX", "2000"))
 MEMORY_BANK_WORKERS = int(os.getenv("MEMORY_BANK_WORKERS", "4"))
@@ -885,6 +1213,28 @@ TOPIC_INDEX_PATH = Path(
         str(Path(__file__).resolve().parent / "data" / "topic_index.json"),
     )
 )
+PROJECT_REGISTRY_PATH = Path(
+    os.getenv(
+        "PROJECT_REGISTRY_PATH",
+        str(Path(__file__).resolve().parent / "data" / "project_registry.json"),
+    )
+)
+PROJECT_REGISTRY_RECONCILE_SECS = max(
+    60.0,
+    float(os.getenv("ORCH_PROJECT_REGISTRY_RECONCILE_SECS", "3600")),
+)
+PROJECT_REGISTRY_MAX_PROJECTS = max(
+    1,
+    int(os.getenv("ORCH_PROJECT_REGISTRY_MAX_PROJECTS", "5000")),
+)
+PROJECT_REGISTRY_RETRY_SECS = max(
+    1.0,
+    float(os.getenv("ORCH_PROJECT_REGISTRY_RETRY_SECS", "30")),
+)
+PROJECT_REGISTRY_COUNT_CONCURRENCY = max(
+    1,
+    min(64, int(os.getenv("ORCH_PROJECT_REGISTRY_COUNT_CONCURRENCY", "8"))),
+)
 TASK_DB_PATH = Path(
     os.getenv(
         "TASK_DB_PATH",
@@ -1163,6 +1513,8 @@ if not DEFAULT_RETRIEVAL_FAST_SOURCES:
         RETRIEVAL_SOURCE_TOPIC_ROLLUPS,
     ]
 DEFAULT_RETRIEVAL_SLOW_SOURCES = _normalize_retrieval_source_csv(RETRIEVAL_SLOW_SOURCES_ENV)
+RETRIEVAL_HEDGE_SOURCES = _normalize_retrieval_source_csv(RETRIEVAL_HEDGE_SOURCES_ENV)
+RETRIEVAL_SOURCE_ROUTER_SOURCES = _normalize_retrieval_source_csv(RETRIEVAL_SOURCE_ROUTER_SOURCES_ENV)
 if not DEFAULT_RETRIEVAL_SLOW_SOURCES:
     DEFAULT_RETRIEVAL_SLOW_SOURCES = [
         RETRIEVAL_SOURCE_LETTA,
@@ -1664,6 +2016,92 @@ def _mindsdb_insert_many_query(
     )
 
 
+def _mindsdb_term_table_name(table_name: str) -> str:
+    return f"{table_name}{MINDSDB_TERM_INDEX_SUFFIX}"
+
+
+# Marker row written to a term table once a backfill has covered the whole autosync
+# table. "#" never survives _mindsdb_index_terms, so lookups cannot match it.
+_MINDSDB_TERM_INDEX_COMPLETE_TERM = "#complete"
+
+
+def _mindsdb_index_terms(text: str, max_terms: int = MINDSDB_TERM_INDEX_MAX_TERMS) -> list[str]:
+    """Terms for equality lookups: whole query tokens plus their alphanumeric parts.
+
+    Splitting ``notes/deploy.md`` into ``deploy`` keeps the substring matches the old
+    ``LIKE '%term%'`` predicates found for path-like tokens.
+    """
+    terms: list[str] = []
+    seen: set[str] = set()
+    for token in re.findall(r"[A-Za-z0-9_:/.-]{3,}", str(text or "").lower()):
+        for term in (token, *re.findall(r"[a-z0-9]{3,}", token)):
+            if term in seen or len(term) > 80:
+                continue
+            seen.add(term)
+            terms.append(term)
+            if len(terms) >= max_terms:
+                return terms
+    return terms
+
+
+def _mindsdb_insert_terms_query(
+    rows: list[dict[str, Any]],
+    term_table: str,
+) -> str | None:
+    values: list[str] = []
+    for row in rows:
+        project = _sql_literal(str(row.get("project") or ""))
+        file_name = str(row.get("file") or "")
+        created_at = _sql_literal(str(row.get("created_at") or _utc_now()))
+        for term in _mindsdb_index_terms(f"{file_name}\n{row.get('summary') or ''}"):
+            values.append(f"({_sql_literal(term)}, {project}, {_sql_literal(file_name)}, {created_at})")
+    if not values:
+        return None
+    return (
+        f"INSERT INTO {MINDSDB_AUTOSYNC_DB}.{term_table} "
+        "(term, project, file, created_at) VALUES "
+        f"{', '.join(values)};"
+    )
+
+
+def _mindsdb_delete_terms_query(
+    rows: list[dict[str, Any]],
+    term_table: str,
+) -> str | None:
+    """Delete the term rows of each event row, keyed by (project, file, created_at)."""
+    conditions: list[str] = []
+    seen: set[tuple[str, str, str]] = set()
+    for row in rows:
+        if not row.get("created_at"):
+            continue
+        key = (str(row.get("project") or ""), str(row.get("file") or ""), str(row["created_at"]))
+        if key in seen:
+            continue
+        seen.add(key)
+        conditions.append(
+            f"(project = {_sql_literal(key[0])} AND file = {_sql_literal(key[1])} "
+            f"AND created_at = {_sql_literal(key[2])})"
+        )
+    if not conditions:
+        return None
+    return f"DELETE FROM {MINDSDB_AUTOSYNC_DB}.{term_table} WHERE {' OR '.join(conditions)};"
+
+
+async def _mindsdb_replace_terms(rows: list[dict[str, Any]], term_table: str) -> None:
+    """Write the term rows of ``rows``, replacing any written for them before.
+
+    Backfills and repairs revisit rows that may already be indexed; deleting first keeps
+    the side table at one set of terms per event row and the join hit counts exact.
+    """
+    insert_query = _mindsdb_insert_terms_query(rows, term_table)
+    if insert_query is None:
+        return
+    delete_query = _mindsdb_delete_terms_query(rows, term_table)
+    if delete_query is not None:
+        await _mindsdb_execute(delete_query)
+    await _mindsdb_execute(insert_query)
+
+
 def _looks_like_mindsdb_table_corruption(message: str) -> bool:
     text = message.lower()
     signatures = (
@@ -1720,6 +2158,25 @@ mindsdb_target_table = MINDSDB_AUTOSYNC_TABLE
 mindsdb_queue_task: asyncio.Task | None = None
 mindsdb_trading_table_lock = asyncio.Lock()
 mindsdb_trading_table_ready = False
+mindsdb_term_index_lock = asyncio.Lock()
+mindsdb_term_index_task: asyncio.Task | None = None
+# "table" is the term table currently trusted for retrieval; it is only "ready" once
+# it covers every row of the autosync table (fresh table or completed backfill, as
+# recorded by the completion marker row).
+mindsdb_term_index_state: dict[str, Any] = {
+    "table": None,
+    "ready": False,
+    "backfillRunning": False,
+    "repairPending": False,
+    "backfilledRows": 0,
+    "lastBackfillAt": None,
+    "lastError": None,
+    "indexedRows": 0,
+    "indexErrors": 0,
+    "termQueries": 0,
+    "scanQueries": 0,
+    "termFallbacks": 0,
+}
 
 
 async def _mindsdb_execute(query: str) -> dict[str, Any]:
@@ -1968,6 +2425,9 @@ async def _memory_bank_worker(worker_id: int) -> None:
                 memory_write_history.append(entry)
             await _persist_memory_write(entry)
             await _update_topic_tree(item["project"], item.get("topic_path") or DEFAULT_TOPIC_ROOT)
+            await _apply_topic_rollup_write(entry)
+            await _project_registry_touch([item["project"]], count_write=True)
+            await _bump_retrieval_pathway_generations([(item["project"], item.get("topic_path"))])
             await _enqueue_memory_write_fanout(
                 {
                     "event_id": item.get("event_id"),
@@ -2398,6 +2858,7 @@ async def _memory_write_worker(
                     await push_batch_to_qdrant(payload_rows)
                     for job in qdrant_batch:
                         await _mark_fanout_job_success(job, FANOUT_TARGET_QDRANT)
+                    await _bump_retrieval_pathway_generations_for_jobs(qdrant_batch)
                 except Exception as exc:  # pragma: no cover
                     for job in qdrant_batch:
                         await _handle_fanout_job_error(job, worker_id, exc)
@@ -2420,6 +2881,7 @@ async def _memory_write_worker(
                     await push_batch_to_mindsdb(payload_rows, allow_fallback_queue=False)
                     for job in mindsdb_batch:
                         await _mark_fanout_job_success(job, FANOUT_TARGET_MINDSDB)
+                    await _bump_retrieval_pathway_generations_for_jobs(mindsdb_batch)
                 except Exception as exc:  # pragma: no cover
                     for job in mindsdb_batch:
                         await _handle_fanout_job_error(job, worker_id, exc)
@@ -2440,6 +2902,7 @@ async def _memory_write_worker(
                         raise OrchestratorError(error or "mongo raw batch write failed")
                     for job in mongo_batch:
                         await _mark_fanout_job_success(job, FANOUT_TARGET_MONGO_RAW)
+                    await _bump_retrieval_pathway_generations_for_jobs(mongo_batch)
                 except Exception as exc:  # pragma: no cover
                     for job in mongo_batch:
                         await _handle_fanout_job_error(job, worker_id, exc)
@@ -2491,11 +2954,14 @@ async def _memory_write_worker(
                         *[_sync_letta(job) for job in letta_batch],
                         return_exceptions=True,
                     )
+                    letta_succeeded: list[dict[str, Any]] = []
                     for job, result in zip(letta_batch, results):
                         if isinstance(result, Exception):
                             await _handle_fanout_job_error(job, worker_id, result)
                             continue
                         await _mark_fanout_job_success(job, FANOUT_TARGET_LETTA)
+                        letta_succeeded.append(job)
+                    await _bump_retrieval_pathway_generations_for_jobs(letta_succeeded)
                 except Exception as exc:  # pragma: no cover
                     for job in letta_batch:
                         await _handle_fanout_job_error(job, worker_id, exc)
@@ -2613,6 +3079,28 @@ async def _openai_like_embedding(text: str) -> list[float]:
     return payloads[0]["embedding"]
 
 
+async def _openai_like_embeddings(texts: list[str]) -> list[list[float]]:
+    if not EMBEDDING_BASE_URL:
+        raise OrchestratorError("EMBEDDING_BASE_URL is not set for openai provider")
+    url = EMBEDDING_BASE_URL.rstrip("/") + "/v1/embeddings"
+    headers = {"content-type": "application/json"}
+    if EMBEDDING_API_KEY:
+        headers["authorization"] = f"Bearer {EMBEDDING_API_KEY}"
+    payload = {"model": EMBEDDING_MODEL, "input": list(texts)}
+    async with httpx.AsyncClient(timeout=30.0) as client:
+        resp = await client.post(url, json=payload, headers=headers)
+    if resp.status_code != 200:
+        raise OrchestratorError(f"Embedding request failed: {resp.text}")
+    data = resp.json()
+    payloads = data.get("data") or []
+    if len(payloads) != len(texts):
+        raise OrchestratorError(
+            f"Embedding provider returned {len(payloads)} vectors for {len(texts)} inputs"
+        )
+    ordered = sorted(payloads, key=lambda item: int(item.get("index") or 0))
+    return [item["embedding"] for item in ordered]
+
+
 async def _ollama_embedding(text: str) -> list[float]:
     url = OLLAMA_BASE_URL.rstrip("/") + "/api/embeddings"
     payload = {"model": EMBEDDING_MODEL, "prompt": text}
@@ -2670,6 +3158,38 @@ async def embed_text(text: str) -> list[float]:
     return vector
 
 
+async def embed_texts(texts: list[str]) -> list[list[float]]:
+    """Embed several texts; cache misses go to the provider in one request when it supports lists."""
+    vectors: list[list[float] | None] = [None] * len(texts)
+    missing: dict[str, list[int]] = {}
+    for index, text in enumerate(texts):
+        cached = await _embedding_cache_get(_embedding_cache_key(text))
+        if cached is not None:
+            vectors[index] = cached
+        else:
+            missing.setdefault(text, []).append(index)
+    if len(missing) > 1 and EMBEDDING_PROVIDER in ("openai", "lmstudio", "openai-compatible"):
+        pending = list(missing)
+        try:
+            batch = await _openai_like_embeddings(pending)
+            for text, vector in zip(pending, batch):
+                await _embedding_cache_set(_embedding_cache_key(text), vector)
+                for index in missing.pop(text):
+                    vectors[index] = vector
+        except Exception as exc:
+            logger.warning(
+                "Batched embedding request failed (%s); embedding inputs individually",
+                str(exc)[:300],
+            )
+    if missing:
+        pending = list(missing)
+        singles = await asyncio.gather(*[embed_text(text) for text in pending])
+        for text, vector in zip(pending, singles):
+            for index in missing[text]:
+                vectors[index] = vector
+    return [list(vector or []) for vector in vectors]
+
+
 DEFAULT_RESPONSE_CLASS = ORJSONResponse if orjson is not None else JSONResponse
 
 
@@ -2750,6 +3270,9 @@ if AsyncLimiter is None and any(
 mindsdb_queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=MINDSDB_AUTOSYNC_QUEUE_MAX)
 mindsdb_queue_lock = asyncio.Lock()
 mongo_client_lock = asyncio.Lock()
+mongo_text_index_lock = asyncio.Lock()
+# Held so the background index ensure is not garbage-collected mid-build.
+mongo_text_index_task: asyncio.Task[Any] | None = None
 letta_agent_lock = asyncio.Lock()
 mcp_session_lock = asyncio.Lock()
 service_client_lock = asyncio.Lock()
@@ -2765,6 +3288,26 @@ memory_read_cache_refresh_completed = 0
 memory_read_cache_refresh_failed = 0
 memory_read_cache_refresh_lock = asyncio.Lock()
 memory_read_cache_refresh_inflight: dict[str, float] = {}
+memory_read_cache_l2_stats: dict[str, int] = {
+    "hits": 0,
+    "misses": 0,
+    "writes": 0,
+    "invalidations": 0,
+    "revalidated": 0,
+    "revalidationDrops": 0,
+    "hashMismatches": 0,
+    "errors": 0,
+}
+# tier ("l1"/"l2") -> lookup latency sketch, created on first use.
+memory_read_cache_tier_latency: dict[str, "WindowedLatencySketch"] = {}
+# read cache key -> {"expires_monotonic", "status_code", "detail"} of the not-found error.
+memory_read_negative_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+memory_read_negative_stats: dict[str, int] = {
+    "hits": 0,
+    "stores": 0,
+    "invalidations": 0,
+    "evictions": 0,
+}
 embedding_cache_lock = asyncio.Lock()
 embedding_cache: OrderedDict[str, list[float]] = OrderedDict()
 embedding_cache_hits = 0
@@ -2780,6 +3323,13 @@ letta_search_warm_inflight: dict[str, float] = {}
 letta_search_warm_started = 0
 letta_search_warm_completed = 0
 letta_search_warm_failed = 0
+letta_search_cache_backend_stats: dict[str, int] = {
+    "hits": 0,
+    "misses": 0,
+    "writes": 0,
+    "errors": 0,
+    "warmClaimsLost": 0,
+}
 retrieval_pathway_cache_lock = asyncio.Lock()
 retrieval_pathway_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
 retrieval_pathway_cache_hits = 0
@@ -2792,6 +3342,25 @@ retrieval_pathway_cache_backend_writes = 0
 retrieval_pathway_cache_backend_write_errors = 0
 retrieval_pathway_redis_client = None
 retrieval_pathway_redis_lock = asyncio.Lock()
+retrieval_pathway_inflight_lock = asyncio.Lock()
+retrieval_pathway_inflight: dict[str, dict[str, Any]] = {}
+retrieval_pathway_singleflight_leaders = 0
+retrieval_pathway_singleflight_coalesced = 0
+retrieval_semantic_cache_lock = asyncio.Lock()
+# partition -> {"keys": [pathway_key, ...], "matrix": float32 ndarray (rows, dim), L2-normalized}
+retrieval_semantic_cache_partitions: dict[str, dict[str, Any]] = {}
+retrieval_semantic_cache_lru: OrderedDict[str, str] = OrderedDict()
+retrieval_semantic_cache_hits = 0
+retrieval_semantic_cache_misses = 0
+retrieval_semantic_cache_stale = 0
+retrieval_semantic_cache_evictions = 0
+retrieval_pathway_generation_lock = asyncio.Lock()
+retrieval_pathway_generations: dict[str, int] = {}
+retrieval_pathway_generation_remote: dict[str, dict[str, Any]] = {}
+retrieval_pathway_generation_bumps = 0
+retrieval_pathway_generation_scopes_bumped = 0
+retrieval_pathway_generation_backend_errors = 0
+retrieval_pathway_generation_last_bump_at: str | None = None
 retrieval_template_cache_lock = asyncio.Lock()
 retrieval_template_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
 retrieval_template_cache_hits = 0
@@ -2800,13 +3369,39 @@ retrieval_template_cache_evictions = 0
 retrieval_pathway_stats_lock = asyncio.Lock()
 retrieval_pathway_stats: OrderedDict[str, dict[str, Any]] = OrderedDict()
 retrieval_latency_lock = asyncio.Lock()
-retrieval_source_latency_samples: dict[str, deque[float]] = {}
+# Guards the sketches themselves: the Prometheus collector reads them from the
+# threadpool the metrics handler runs in, outside the event loop.
+retrieval_latency_sketch_lock = threading.Lock()
+# (source, mode) -> window label -> sketch; mode "all" aggregates every mode.
+retrieval_latency_sketches: dict[tuple[str, str], dict[str, "WindowedLatencySketch"]] = {}
 retrieval_source_request_counts: dict[str, int] = {}
 retrieval_source_error_counts: dict[str, int] = {}
 retrieval_source_timeout_counts: dict[str, int] = {}
 retrieval_latency_mode_counts: dict[str, int] = {}
 retrieval_latency_updated_at: str | None = None
 retrieval_slow_source_cooldown_until: dict[str, float] = {}
+retrieval_hedge_lock = asyncio.Lock()
+retrieval_hedge_tokens: dict[str, float] = {}
+retrieval_hedge_stats: dict[str, dict[str, int]] = {}
+retrieval_hedge_primary_tasks: set[asyncio.Task[Any]] = set()
+retrieval_source_router_lock = asyncio.Lock()
+# route key -> source -> decayed {"observed", "contributed"} counts.
+retrieval_source_router: OrderedDict[str, dict[str, dict[str, float]]] = OrderedDict()
+retrieval_source_router_stats: dict[str, int] = {
+    "decisions": 0,
+    "skipped": 0,
+    "explored": 0,
+    "observations": 0,
+}
+retrieval_empty_source_cache_lock = asyncio.Lock()
+# key -> {"expires_monotonic", "scope"}; scope is the pathway generation scope of the search.
+retrieval_empty_source_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+retrieval_empty_source_cache_stats: dict[str, int] = {
+    "hits": 0,
+    "stores": 0,
+    "invalidations": 0,
+    "evictions": 0,
+}
 retrieval_lifecycle_lock = asyncio.Lock()
 retrieval_result_lifecycle: OrderedDict[str, dict[str, Any]] = OrderedDict()
 recall_quality_lock = asyncio.Lock()
@@ -2823,9 +3418,40 @@ recall_quality_updated_at: str | None = None
 agent_memory_profile_lock = asyncio.Lock()
 agent_memory_profiles: dict[str, dict[str, Any]] = {}
 qdrant_collection_dim_cache: dict[str, int] = {}
+qdrant_collection_profile_state: dict[str, dict[str, Any]] = {}
+qdrant_local_index_lock = asyncio.Lock()
+qdrant_local_index: dict[str, dict[str, Any]] = {}
+qdrant_local_index_task: asyncio.Task[Any] | None = None
+# Adds and removes made while a load scrolls Qdrant, replayed onto the loaded index.
+qdrant_local_index_journal: list[tuple[str, list[Any]]] = []
+qdrant_local_index_loads_running = 0
+qdrant_local_index_stats: dict[str, Any] = {
+    "hits": 0,
+    "misses": 0,
+    "degradedServes": 0,
+    "upserts": 0,
+    "deletes": 0,
+    "evictions": 0,
+    "loads": 0,
+    "lastLoadAt": None,
+    "lastLoadDurationMs": None,
+    "lastLoadError": None,
+}
 topic_rollup_last_snapshot_for_delta: dict[str, Any] = {}
+topic_rollup_persisted_delta_seq = -1
 MCP_SESSION_ID: str | None = None
 MONGO_CLIENT = None
+mongo_text_search_state: dict[str, Any] = {
+    "ready": False,
+    "indexName": None,
+    "lastCheckedAt": None,
+    "lastError": None,
+    "retryAfterMonotonic": 0.0,
+    "textQueries": 0,
+    "scanQueries": 0,
+    "textFallbacks": 0,
+    "textEmptyFallbacks": 0,
+}
 FANOUT_OUTBOX_MONGO_CLIENT = None
 fanout_outbox_mongo_lock = asyncio.Lock()
 fanout_outbox_backend_active = FANOUT_OUTBOX_BACKEND if FANOUT_OUTBOX_BACKEND in ("sqlite", "mongo") else "sqlite"
@@ -2890,6 +3516,8 @@ sink_retention_state: dict[str, Any] = {
     "lastResult": {},
 }
 retrieval_pathway_warmer_task: asyncio.Task[Any] | None = None
+# Set by writes that invalidate a hot pathway so the warmer runs before its next scheduled cycle.
+retrieval_pathway_warmer_wakeup = asyncio.Event()
 retrieval_pathway_warmer_state: dict[str, Any] = {
     "enabled": RETRIEVAL_PATHWAY_WARMER_ENABLED,
     "lastRunAt": None,
@@ -2899,6 +3527,9 @@ retrieval_pathway_warmer_state: dict[str, Any] = {
     "lastSkipped": 0,
     "lastError": None,
     "lastResult": {},
+    "writeWakeups": 0,
+    "debouncedWakeups": 0,
+    "nextDueInSecs": None,
 }
 recall_monitor_lock = asyncio.Lock()
 recall_monitor_history: deque[dict[str, Any]] = deque(maxlen=RECALL_MONITOR_HISTORY_LIMIT)
@@ -3063,49 +3694,168 @@ def _letta_search_cache_key(
     return hashlib.sha1(identity).hexdigest()
 
 
-async def _letta_search_cache_get(key: str) -> list[dict[str, Any]] | None:
-    global letta_search_cache_hits, letta_search_cache_misses
-    if not RETRIEVAL_LETTA_CACHE_ENABLED or RETRIEVAL_LETTA_CACHE_TTL_SECS <= 0 or RETRIEVAL_LETTA_CACHE_MAX_KEYS <= 0:
+def _letta_search_cache_backend_enabled() -> bool:
+    return (
+        RETRIEVAL_LETTA_CACHE_BACKEND == "redis"
+        and bool(RETRIEVAL_PATHWAY_REDIS_URL)
+        and redis_async is not None
+    )
+
+
+def _letta_search_cache_redis_key(key: str) -> str:
+    return f"{RETRIEVAL_LETTA_CACHE_REDIS_PREFIX}{key}"
+
+
+async def _letta_search_cache_backend_get(key: str) -> tuple[list[dict[str, Any]], float] | None:
+    """Shared rows for a Letta search key plus their remaining TTL in seconds."""
+    if not _letta_search_cache_backend_enabled():
         return None
-    now = time.monotonic()
-    async with letta_search_cache_lock:
-        payload = letta_search_cache.get(key)
-        if not isinstance(payload, dict):
-            letta_search_cache_misses += 1
-            return None
-        expires_at = float(payload.get("expires_at") or 0.0)
-        if expires_at <= now:
-            letta_search_cache.pop(key, None)
-            letta_search_cache_misses += 1
-            return None
-        rows = payload.get("rows")
-        if not isinstance(rows, list):
-            letta_search_cache.pop(key, None)
-            letta_search_cache_misses += 1
-            return None
-        letta_search_cache.move_to_end(key)
-        letta_search_cache_hits += 1
-        return [dict(row) for row in rows if isinstance(row, dict)]
+    client = await _get_retrieval_pathway_redis_client()
+    if client is None:
+        return None
+    try:
+        blob = await asyncio.wait_for(
+            client.get(_letta_search_cache_redis_key(key)),
+            timeout=RETRIEVAL_PATHWAY_REDIS_TIMEOUT_SECS,
+        )
+    except Exception as exc:
+        letta_search_cache_backend_stats["errors"] += 1
+        logger.debug("Letta search cache backend get failed: %s", exc)
+        return None
+    if blob is None:
+        letta_search_cache_backend_stats["misses"] += 1
+        return None
+    parsed = _decode_redis_cache_payload(blob)
+    rows = parsed.get("rows") if parsed is not None else None
+    if not isinstance(rows, list):
+        letta_search_cache_backend_stats["errors"] += 1
+        return None
+    remaining = float(parsed.get("expires_epoch") or 0.0) - time.time()
+    if remaining <= 0:
+        letta_search_cache_backend_stats["misses"] += 1
+        return None
+    letta_search_cache_backend_stats["hits"] += 1
+    return [dict(row) for row in rows if isinstance(row, dict)], remaining
 
 
-async def _letta_search_cache_set(key: str, rows: list[dict[str, Any]]) -> None:
-    global letta_search_cache_evictions
-    if not RETRIEVAL_LETTA_CACHE_ENABLED or RETRIEVAL_LETTA_CACHE_TTL_SECS <= 0 or RETRIEVAL_LETTA_CACHE_MAX_KEYS <= 0:
+async def _letta_search_cache_backend_set(key: str, rows: list[dict[str, Any]]) -> None:
+    if not _letta_search_cache_backend_enabled():
         return
-    expires_at = time.monotonic() + RETRIEVAL_LETTA_CACHE_TTL_SECS
-    async with letta_search_cache_lock:
-        letta_search_cache[key] = {
-            "expires_at": expires_at,
-            "rows": [dict(row) for row in rows if isinstance(row, dict)],
+    client = await _get_retrieval_pathway_redis_client()
+    if client is None:
+        return
+    payload = _encode_redis_cache_payload(
+        {
+            "rows": _json_clone(rows),
+            "expires_epoch": time.time() + RETRIEVAL_LETTA_CACHE_TTL_SECS,
         }
-        letta_search_cache.move_to_end(key)
-        while len(letta_search_cache) > RETRIEVAL_LETTA_CACHE_MAX_KEYS:
-            letta_search_cache.popitem(last=False)
-            letta_search_cache_evictions += 1
+    )
+    try:
+        await asyncio.wait_for(
+            client.set(
+                _letta_search_cache_redis_key(key),
+                payload,
+                ex=max(1, int(math.ceil(RETRIEVAL_LETTA_CACHE_TTL_SECS))),
+            ),
+            timeout=RETRIEVAL_PATHWAY_REDIS_TIMEOUT_SECS,
+        )
+        letta_search_cache_backend_stats["writes"] += 1
+    except Exception as exc:
+        letta_search_cache_backend_stats["errors"] += 1
+        logger.debug("Letta search cache backend set failed: %s", exc)
 
 
-def _letta_search_params(
-    *,
+async def _letta_search_cache_backend_claim_warm(key: str, ttl_secs: float) -> bool:
+    """Claim the background warm for a key across replicas; True when this replica should run it."""
+    if not _letta_search_cache_backend_enabled():
+        return True
+    client = await _get_retrieval_pathway_redis_client()
+    if client is None:
+        return True
+    try:
+        claimed = await asyncio.wait_for(
+            client.set(
+                _letta_search_cache_redis_key(f"warm:{key}"),
+                b"1",
+                nx=True,
+                ex=max(1, int(math.ceil(ttl_secs))),
+            ),
+            timeout=RETRIEVAL_PATHWAY_REDIS_TIMEOUT_SECS,
+        )
+    except Exception as exc:
+        # Fail open: a duplicate warm is cheaper than a missing one.
+        letta_search_cache_backend_stats["errors"] += 1
+        logger.debug("Letta search warm claim failed: %s", exc)
+        return True
+    if not claimed:
+        letta_search_cache_backend_stats["warmClaimsLost"] += 1
+    return bool(claimed)
+
+
+async def _letta_search_cache_backend_release_warm(key: str) -> None:
+    if not _letta_search_cache_backend_enabled():
+        return
+    client = await _get_retrieval_pathway_redis_client()
+    if client is None:
+        return
+    with contextlib.suppress(Exception):
+        await asyncio.wait_for(
+            client.delete(_letta_search_cache_redis_key(f"warm:{key}")),
+            timeout=RETRIEVAL_PATHWAY_REDIS_TIMEOUT_SECS,
+        )
+
+
+def _letta_search_cache_store_local(key: str, rows: list[dict[str, Any]], ttl_secs: float) -> None:
+    """Insert into the in-process cache; callers hold letta_search_cache_lock."""
+    global letta_search_cache_evictions
+    letta_search_cache[key] = {
+        "expires_at": time.monotonic() + ttl_secs,
+        "rows": [dict(row) for row in rows if isinstance(row, dict)],
+    }
+    letta_search_cache.move_to_end(key)
+    while len(letta_search_cache) > RETRIEVAL_LETTA_CACHE_MAX_KEYS:
+        letta_search_cache.popitem(last=False)
+        letta_search_cache_evictions += 1
+
+
+async def _letta_search_cache_get(key: str) -> list[dict[str, Any]] | None:
+    global letta_search_cache_hits, letta_search_cache_misses
+    if not RETRIEVAL_LETTA_CACHE_ENABLED or RETRIEVAL_LETTA_CACHE_TTL_SECS <= 0 or RETRIEVAL_LETTA_CACHE_MAX_KEYS <= 0:
+        return None
+    now = time.monotonic()
+    async with letta_search_cache_lock:
+        payload = letta_search_cache.get(key)
+        if isinstance(payload, dict):
+            expires_at = float(payload.get("expires_at") or 0.0)
+            rows = payload.get("rows")
+            if expires_at > now and isinstance(rows, list):
+                letta_search_cache.move_to_end(key)
+                letta_search_cache_hits += 1
+                return [dict(row) for row in rows if isinstance(row, dict)]
+            letta_search_cache.pop(key, None)
+
+    backend = await _letta_search_cache_backend_get(key)
+    if backend is not None:
+        rows, remaining = backend
+        async with letta_search_cache_lock:
+            # Promoted entries keep the shared expiry rather than restarting the TTL.
+            _letta_search_cache_store_local(key, rows, remaining)
+        letta_search_cache_hits += 1
+        return [dict(row) for row in rows]
+    letta_search_cache_misses += 1
+    return None
+
+
+async def _letta_search_cache_set(key: str, rows: list[dict[str, Any]]) -> None:
+    if not RETRIEVAL_LETTA_CACHE_ENABLED or RETRIEVAL_LETTA_CACHE_TTL_SECS <= 0 or RETRIEVAL_LETTA_CACHE_MAX_KEYS <= 0:
+        return
+    async with letta_search_cache_lock:
+        _letta_search_cache_store_local(key, rows, RETRIEVAL_LETTA_CACHE_TTL_SECS)
+    await _letta_search_cache_backend_set(key, rows)
+
+
+def _letta_search_params(
+    *,
     query: str,
     top_k: int,
     project_filter: str | None,
@@ -3133,6 +3883,7 @@ def _letta_search_rows_from_payload(
     project_filter: str | None,
     topic_filter: str | None,
 ) -> list[dict[str, Any]]:
+    compiled_query = CompiledQuery(query)
     rows: list[dict[str, Any]] = []
     for item in payload.get("results", []) if isinstance(payload, dict) else []:
         if not isinstance(item, dict):
@@ -3147,7 +3898,7 @@ def _letta_search_rows_from_payload(
             continue
         if topic_filter and topic_path and not topic_path.startswith(topic_filter):
             continue
-        score = _text_match_score(query, f"{project}\n{file_name}\n{summary}\n{content}")
+        score = compiled_query.match_score(f"{project}\n{file_name}\n{summary}\n{content}")
         if score <= 0:
             continue
         rows.append(
@@ -3223,7 +3974,12 @@ async def _schedule_letta_search_cache_warm(
         if len(letta_search_warm_inflight) >= RETRIEVAL_LETTA_ASYNC_WARM_MAX_INFLIGHT:
             return
         letta_search_warm_inflight[cache_key] = now + warm_timeout + 5.0
-        letta_search_warm_started += 1
+    # Another replica already warming this key will publish its rows to the shared cache.
+    if not await _letta_search_cache_backend_claim_warm(cache_key, warm_timeout + 5.0):
+        async with letta_search_warm_lock:
+            letta_search_warm_inflight.pop(cache_key, None)
+        return
+    letta_search_warm_started += 1
 
     async def _runner() -> None:
         global letta_search_warm_completed, letta_search_warm_failed
@@ -3251,6 +4007,7 @@ async def _schedule_letta_search_cache_warm(
         finally:
             async with letta_search_warm_lock:
                 letta_search_warm_inflight.pop(cache_key, None)
+            await _letta_search_cache_backend_release_warm(cache_key)
 
     asyncio.create_task(_runner())
 
@@ -3322,22 +4079,25 @@ def _retrieval_pathway_cache_key(
     learning_enabled: bool,
     positive_terms: set[str],
     negative_terms: set[str],
+    generation_token: str = "",
+    numeric_values: frozenset[str] | set[str] = frozenset(),
 ) -> str:
-    identity = "\n".join(
-        [
-            _normalize_retrieval_mode(retrieval_mode),
-            str(limit),
-            str(project_filter or ""),
-            str(topic_filter or ""),
-            ",".join(sources),
-            _retrieval_weight_signature(source_weights),
-            str(bool(learning_enabled)),
-            ",".join(sorted(positive_terms)),
-            ",".join(sorted(negative_terms)),
-            re.sub(r"\s+", " ", str(query or "").strip().lower()),
-        ]
-    ).encode("utf-8")
-    return hashlib.sha1(identity).hexdigest()
+    parts = [
+        _normalize_retrieval_mode(retrieval_mode),
+        str(generation_token or ""),
+        str(limit),
+        str(project_filter or ""),
+        str(topic_filter or ""),
+        ",".join(sources),
+        _retrieval_weight_signature(source_weights),
+        str(bool(learning_enabled)),
+        ",".join(sorted(positive_terms)),
+        ",".join(sorted(negative_terms)),
+        re.sub(r"\s+", " ", str(query or "").strip().lower()),
+    ]
+    if numeric_values:
+        parts.append("#" + ",".join(sorted(numeric_values)))
+    return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()
 
 
 def _retrieval_pathway_cache_backend_enabled() -> bool:
@@ -3352,9 +4112,30 @@ def _retrieval_pathway_redis_key(key: str) -> str:
     return f"{RETRIEVAL_PATHWAY_REDIS_PREFIX}{key}"
 
 
+def _retrieval_pathway_generation_backend_enabled() -> bool:
+    return (
+        RETRIEVAL_PATHWAY_INVALIDATION_ENABLED
+        and bool(RETRIEVAL_PATHWAY_REDIS_URL)
+        and redis_async is not None
+    )
+
+
+def _retrieval_pathway_cache_ttl_secs() -> float:
+    if RETRIEVAL_PATHWAY_CACHE_TTL_SECS <= 0:
+        return 0.0
+    if RETRIEVAL_PATHWAY_INVALIDATION_ENABLED:
+        return max(RETRIEVAL_PATHWAY_CACHE_TTL_SECS, RETRIEVAL_PATHWAY_INVALIDATION_TTL_SECS)
+    return RETRIEVAL_PATHWAY_CACHE_TTL_SECS
+
+
 async def _get_retrieval_pathway_redis_client():
     global retrieval_pathway_redis_client
-    if not _retrieval_pathway_cache_backend_enabled():
+    if not (
+        _retrieval_pathway_cache_backend_enabled()
+        or _retrieval_pathway_generation_backend_enabled()
+        or _memory_read_cache_l2_enabled()
+        or _letta_search_cache_backend_enabled()
+    ):
         return None
     if retrieval_pathway_redis_client is not None:
         return retrieval_pathway_redis_client
@@ -3376,17 +4157,176 @@ async def _get_retrieval_pathway_redis_client():
             return None
 
 
-def _serialize_retrieval_pathway_bundle(
+def _retrieval_pathway_generation_scope(project: str | None, topic: str | None) -> str:
+    project_text = str(project or "").strip()
+    topic_text = normalize_topic_path(topic) if topic else ""
+    if project_text and topic_text:
+        return f"p:{project_text}|t:{topic_text}"
+    if project_text:
+        return f"p:{project_text}"
+    if topic_text:
+        return f"t:{topic_text}"
+    return "*"
+
+
+def _retrieval_pathway_write_scopes(project: str | None, topic_path: str | None) -> list[str]:
+    """Every search scope whose cached results a write to (project, topic_path) can change."""
+    project_text = str(project or "").strip()
+    scopes = ["*"]
+    if project_text:
+        scopes.append(_retrieval_pathway_generation_scope(project_text, None))
+    for tag in topic_tags_for_path(topic_path or DEFAULT_TOPIC_ROOT):
+        scopes.append(_retrieval_pathway_generation_scope(None, tag))
+        if project_text:
+            scopes.append(_retrieval_pathway_generation_scope(project_text, tag))
+    return list(dict.fromkeys(scopes))
+
+
+async def _retrieval_pathway_remote_generation(scope: str) -> int | None:
+    """Shared generation for a scope, or None when Redis is unreachable and nothing is cached."""
+    global retrieval_pathway_generation_backend_errors
+    now = time.monotonic()
+    async with retrieval_pathway_generation_lock:
+        cached = retrieval_pathway_generation_remote.get(scope)
+        if isinstance(cached, dict) and float(cached.get("expires_at") or 0.0) > now:
+            value = cached.get("value")
+            return None if value is None else int(value)
+    client = await _get_retrieval_pathway_redis_client()
+    if client is None:
+        return None
+    try:
+        raw = await asyncio.wait_for(
+            client.get(f"{RETRIEVAL_PATHWAY_GENERATION_REDIS_PREFIX}{scope}"),
+            timeout=RETRIEVAL_PATHWAY_REDIS_TIMEOUT_SECS,
+        )
+        value = int(raw or 0)
+    except Exception as exc:
+        retrieval_pathway_generation_backend_errors += 1
+        logger.debug("Retrieval pathway generation get failed: %s", exc)
+        if isinstance(cached, dict) and cached.get("value") is not None:
+            return int(cached["value"])
+        return None
+    async with retrieval_pathway_generation_lock:
+        retrieval_pathway_generation_remote[scope] = {
+            "expires_at": time.monotonic() + RETRIEVAL_PATHWAY_GENERATION_REFRESH_SECS,
+            "value": value,
+        }
+    return value
+
+
+async def _retrieval_pathway_generation_token(
+    project_filter: str | None,
+    topic_filter: str | None,
+) -> str:
+    if not RETRIEVAL_PATHWAY_INVALIDATION_ENABLED:
+        return ""
+    scope = _retrieval_pathway_generation_scope(project_filter, topic_filter)
+    # With the Redis backend on, the token is the shared generation alone so every
+    # replica derives the same cache key; the per-process counter is only a fallback
+    # while Redis is off or unreachable (distinct prefixes keep the two from aliasing).
+    if _retrieval_pathway_generation_backend_enabled():
+        remote_generation = await _retrieval_pathway_remote_generation(scope)
+        if remote_generation is not None:
+            return f"{scope}=r{remote_generation}"
+    async with retrieval_pathway_generation_lock:
+        local_generation = int(retrieval_pathway_generations.get(scope) or 0)
+    return f"{scope}=l{local_generation}"
+
+
+async def _retrieval_search_pathway_cache_key(
     *,
-    results: list[dict[str, Any]],
-    retrieval_debug: dict[str, Any],
-    warnings: list[str],
-) -> bytes:
-    payload = {
-        "results": _json_clone(results),
-        "retrieval_debug": _json_clone(retrieval_debug),
-        "warnings": _json_clone(warnings),
-    }
+    query: str,
+    limit: int,
+    project_filter: str | None,
+    topic_filter: str | None,
+    sources: list[str] | None,
+    source_weights: dict[str, float] | None,
+    preferences: dict[str, Any] | None,
+    rerank_with_learning: bool,
+    retrieval_mode: str | None,
+) -> tuple[str, str]:
+    """(pathway cache key, generation token) of a federated search with these arguments.
+
+    The single derivation of the key from raw search arguments, so batch jobs and single
+    queries keep sharing cache entries.
+    """
+    normalized_mode = _normalize_retrieval_mode(retrieval_mode)
+    positive_terms, negative_terms = _extract_learning_terms(preferences)
+    learning_enabled = bool(
+        rerank_with_learning
+        and RETRIEVAL_ENABLE_LEARNING_RERANK
+        and (positive_terms or negative_terms)
+    )
+    generation_token = await _retrieval_pathway_generation_token(project_filter, topic_filter)
+    key = _retrieval_pathway_cache_key(
+        query=query,
+        limit=limit,
+        project_filter=project_filter,
+        topic_filter=topic_filter,
+        sources=_resolve_retrieval_sources_for_mode(mode=normalized_mode, sources=sources),
+        source_weights=_normalize_retrieval_weights(source_weights),
+        retrieval_mode=normalized_mode,
+        learning_enabled=learning_enabled,
+        positive_terms=positive_terms,
+        negative_terms=negative_terms,
+        generation_token=generation_token,
+    )
+    return key, generation_token
+
+
+async def _bump_retrieval_pathway_generations(
+    targets: list[tuple[str | None, str | None]],
+) -> None:
+    global retrieval_pathway_generation_bumps, retrieval_pathway_generation_scopes_bumped
+    global retrieval_pathway_generation_backend_errors, retrieval_pathway_generation_last_bump_at
+    if not targets:
+        return
+    scopes: list[str] = []
+    for project, topic_path in targets:
+        scopes.extend(_retrieval_pathway_write_scopes(project, topic_path))
+    scopes = list(dict.fromkeys(scopes))
+    await _retrieval_empty_source_cache_invalidate(scopes)
+    if not RETRIEVAL_PATHWAY_INVALIDATION_ENABLED:
+        return
+    await _mark_retrieval_pathways_invalidated(scopes)
+    async with retrieval_pathway_generation_lock:
+        for scope in scopes:
+            retrieval_pathway_generations[scope] = int(retrieval_pathway_generations.get(scope) or 0) + 1
+            retrieval_pathway_generation_remote.pop(scope, None)
+        retrieval_pathway_generation_bumps += 1
+        retrieval_pathway_generation_scopes_bumped += len(scopes)
+        retrieval_pathway_generation_last_bump_at = _utc_now()
+    if not _retrieval_pathway_generation_backend_enabled():
+        return
+    client = await _get_retrieval_pathway_redis_client()
+    if client is None:
+        return
+    try:
+        pipe = client.pipeline(transaction=False)
+        for scope in scopes:
+            pipe.incr(f"{RETRIEVAL_PATHWAY_GENERATION_REDIS_PREFIX}{scope}")
+        await asyncio.wait_for(pipe.execute(), timeout=RETRIEVAL_PATHWAY_REDIS_TIMEOUT_SECS)
+    except Exception as exc:
+        retrieval_pathway_generation_backend_errors += 1
+        logger.debug("Retrieval pathway generation bump failed: %s", exc)
+        # The shared generation missed this write; key these scopes off the local
+        # counter for a refresh period rather than reusing the stale shared token.
+        expires_at = time.monotonic() + RETRIEVAL_PATHWAY_GENERATION_REFRESH_SECS
+        async with retrieval_pathway_generation_lock:
+            for scope in scopes:
+                retrieval_pathway_generation_remote[scope] = {"expires_at": expires_at, "value": None}
+
+
+async def _bump_retrieval_pathway_generations_for_jobs(jobs: list[dict[str, Any]]) -> None:
+    targets: list[tuple[str | None, str | None]] = []
+    for job in jobs:
+        payload = job.get("payload") or {}
+        targets.append((payload.get("project"), payload.get("topic_path")))
+    await _bump_retrieval_pathway_generations(list(dict.fromkeys(targets)))
+
+
+def _encode_redis_cache_payload(payload: dict[str, Any]) -> bytes:
+    """JSON-encode a cache payload for Redis, zlib-compressed when ORCH_RETRIEVAL_PATHWAY_REDIS_COMPRESS is on."""
     if orjson is not None:
         raw = orjson.dumps(payload)
     else:
@@ -3396,9 +4336,7 @@ def _serialize_retrieval_pathway_bundle(
     return b"j:" + raw
 
 
-def _deserialize_retrieval_pathway_bundle(
-    raw: bytes,
-) -> tuple[list[dict[str, Any]], dict[str, Any], list[str]] | None:
+def _decode_redis_cache_payload(raw: bytes) -> dict[str, Any] | None:
     if not isinstance(raw, (bytes, bytearray)) or not raw:
         return None
     payload_bytes = bytes(raw)
@@ -3422,6 +4360,30 @@ def _deserialize_retrieval_pathway_bundle(
         return None
     if not isinstance(parsed, dict):
         return None
+    return parsed
+
+
+def _serialize_retrieval_pathway_bundle(
+    *,
+    results: list[dict[str, Any]],
+    retrieval_debug: dict[str, Any],
+    warnings: list[str],
+) -> bytes:
+    return _encode_redis_cache_payload(
+        {
+            "results": _json_clone(results),
+            "retrieval_debug": _json_clone(retrieval_debug),
+            "warnings": _json_clone(warnings),
+        }
+    )
+
+
+def _deserialize_retrieval_pathway_bundle(
+    raw: bytes,
+) -> tuple[list[dict[str, Any]], dict[str, Any], list[str]] | None:
+    parsed = _decode_redis_cache_payload(raw)
+    if parsed is None:
+        return None
     results = parsed.get("results")
     retrieval_debug = parsed.get("retrieval_debug")
     warnings = parsed.get("warnings")
@@ -3476,7 +4438,7 @@ async def _retrieval_pathway_cache_backend_set(
     client = await _get_retrieval_pathway_redis_client()
     if client is None:
         return
-    ttl = max(1, int(math.ceil(RETRIEVAL_PATHWAY_CACHE_TTL_SECS)))
+    ttl = max(1, int(math.ceil(_retrieval_pathway_cache_ttl_secs())))
     payload = _serialize_retrieval_pathway_bundle(
         results=results,
         retrieval_debug=retrieval_debug,
@@ -3537,7 +4499,7 @@ async def _retrieval_pathway_cache_get(
     backend_payload = await _retrieval_pathway_cache_backend_get(key)
     if backend_payload is not None:
         retrieval_pathway_cache_hits += 1
-        expires_at = time.monotonic() + RETRIEVAL_PATHWAY_CACHE_TTL_SECS
+        expires_at = time.monotonic() + _retrieval_pathway_cache_ttl_secs()
         async with retrieval_pathway_cache_lock:
             retrieval_pathway_cache[key] = {
                 "expires_at": expires_at,
@@ -3556,6 +4518,18 @@ async def _retrieval_pathway_cache_get(
     return None
 
 
+def _retrieval_pathway_cache_contains(key: str) -> bool:
+    """Whether the process cache holds a live entry for ``key``; no stats, no LRU touch."""
+    if (
+        not RETRIEVAL_PATHWAY_CACHE_ENABLED
+        or RETRIEVAL_PATHWAY_CACHE_TTL_SECS <= 0
+        or RETRIEVAL_PATHWAY_CACHE_MAX_KEYS <= 0
+    ):
+        return False
+    payload = retrieval_pathway_cache.get(key)
+    return isinstance(payload, dict) and float(payload.get("expires_at") or 0.0) > time.monotonic()
+
+
 async def _retrieval_pathway_cache_set(
     key: str,
     *,
@@ -3570,7 +4544,7 @@ async def _retrieval_pathway_cache_set(
         or RETRIEVAL_PATHWAY_CACHE_MAX_KEYS <= 0
     ):
         return
-    expires_at = time.monotonic() + RETRIEVAL_PATHWAY_CACHE_TTL_SECS
+    expires_at = time.monotonic() + _retrieval_pathway_cache_ttl_secs()
     cached_results = _json_clone(results)
     cached_debug = _json_clone(retrieval_debug)
     cached_warnings = _json_clone(warnings)
@@ -3596,6 +4570,153 @@ async def _retrieval_pathway_cache_set(
     )
 
 
+async def _retrieval_pathway_singleflight(
+    key: str,
+    runner: Any,
+) -> tuple[list[dict[str, Any]], dict[str, Any], list[str]]:
+    """Run one search per pathway key; concurrent identical callers await the same task."""
+    global retrieval_pathway_singleflight_leaders, retrieval_pathway_singleflight_coalesced
+    async with retrieval_pathway_inflight_lock:
+        flight = retrieval_pathway_inflight.get(key)
+        leader = flight is None
+        if flight is None:
+            flight = {"waiters": 0}
+
+            async def _run_flight() -> tuple[list[dict[str, Any]], dict[str, Any], list[str]]:
+                try:
+                    return await runner()
+                finally:
+                    # Drop the entry before the task resolves so the waiter count is final
+                    # by the time the leader decides whether it must copy the results.
+                    async with retrieval_pathway_inflight_lock:
+                        if retrieval_pathway_inflight.get(key) is flight:
+                            retrieval_pathway_inflight.pop(key, None)
+
+            flight["task"] = asyncio.create_task(_run_flight())
+            retrieval_pathway_inflight[key] = flight
+            retrieval_pathway_singleflight_leaders += 1
+        else:
+            flight["waiters"] = int(flight.get("waiters") or 0) + 1
+            retrieval_pathway_singleflight_coalesced += 1
+    results, retrieval_debug, warnings = await asyncio.shield(flight["task"])
+    if leader and not flight.get("waiters"):
+        return results, retrieval_debug, warnings
+    results_copy = [dict(row) for row in _json_clone(results) if isinstance(row, dict)]
+    debug_copy = dict(_json_clone(retrieval_debug))
+    if not leader:
+        cache_debug = debug_copy.get("cache") if isinstance(debug_copy.get("cache"), dict) else {}
+        cache_debug["coalesced"] = True
+        debug_copy["cache"] = cache_debug
+    return results_copy, debug_copy, [str(item) for item in warnings]
+
+
+def _retrieval_semantic_cache_active(sources: list[str]) -> bool:
+    # Only queries that already embed (via search_qdrant) participate, so the
+    # semantic tier never adds an embedding call a cold search would not make.
+    return (
+        np is not None
+        and RETRIEVAL_SEMANTIC_CACHE_ENABLED
+        and RETRIEVAL_PATHWAY_CACHE_ENABLED
+        and RETRIEVAL_PATHWAY_CACHE_TTL_SECS > 0
+        and RETRIEVAL_SOURCE_QDRANT in sources
+    )
+
+
+async def _retrieval_semantic_query_vector(query: str, *, compute: bool) -> Any:
+    """Return the L2-normalized provider embedding for query, or None.
+
+    Deterministic fallback vectors are never cached by embed_text, so reading back
+    through the embedding cache keeps them out of similarity matching.
+    """
+    key = _embedding_cache_key(query)
+    vector = await _embedding_cache_get(key)
+    if vector is None and compute:
+        with contextlib.suppress(Exception):
+            await asyncio.wait_for(embed_text(query), timeout=max(1.0, QDRANT_EMBED_TIMEOUT_SECS))
+            vector = await _embedding_cache_get(key)
+    if not vector:
+        return None
+    array = np.asarray(vector, dtype=np.float32)
+    norm = float(np.linalg.norm(array))
+    if norm <= 0.0:
+        return None
+    return array / norm
+
+
+async def _retrieval_semantic_cache_has_partition(partition: str) -> bool:
+    async with retrieval_semantic_cache_lock:
+        bucket = retrieval_semantic_cache_partitions.get(partition)
+        return bool(bucket and bucket.get("keys"))
+
+
+def _retrieval_semantic_cache_drop_locked(pathway_key: str) -> None:
+    partition = retrieval_semantic_cache_lru.pop(pathway_key, None)
+    if partition is None:
+        return
+    bucket = retrieval_semantic_cache_partitions.get(partition)
+    if not bucket:
+        return
+    keys: list[str] = bucket["keys"]
+    if pathway_key in keys:
+        index = keys.index(pathway_key)
+        keys.pop(index)
+        bucket["matrix"] = np.delete(bucket["matrix"], index, axis=0)
+    if not keys:
+        retrieval_semantic_cache_partitions.pop(partition, None)
+
+
+async def _retrieval_semantic_cache_lookup(partition: str, query_vector: Any) -> tuple[str, float] | None:
+    global retrieval_semantic_cache_hits, retrieval_semantic_cache_misses
+    async with retrieval_semantic_cache_lock:
+        bucket = retrieval_semantic_cache_partitions.get(partition)
+        matrix = bucket.get("matrix") if bucket else None
+        if matrix is None or not len(matrix) or matrix.shape[1] != query_vector.shape[0]:
+            retrieval_semantic_cache_misses += 1
+            return None
+        similarities = matrix @ query_vector
+        best = int(np.argmax(similarities))
+        similarity = float(similarities[best])
+        if similarity < RETRIEVAL_SEMANTIC_CACHE_MIN_SIMILARITY:
+            retrieval_semantic_cache_misses += 1
+            return None
+        pathway_key = bucket["keys"][best]
+        retrieval_semantic_cache_lru.move_to_end(pathway_key)
+        retrieval_semantic_cache_hits += 1
+        return pathway_key, similarity
+
+
+async def _retrieval_semantic_cache_discard(pathway_key: str) -> None:
+    global retrieval_semantic_cache_stale
+    async with retrieval_semantic_cache_lock:
+        if pathway_key in retrieval_semantic_cache_lru:
+            retrieval_semantic_cache_stale += 1
+        _retrieval_semantic_cache_drop_locked(pathway_key)
+
+
+async def _retrieval_semantic_cache_store(partition: str, pathway_key: str, query_vector: Any) -> None:
+    global retrieval_semantic_cache_evictions
+    if query_vector is None:
+        return
+    row = query_vector.reshape(1, -1)
+    async with retrieval_semantic_cache_lock:
+        _retrieval_semantic_cache_drop_locked(pathway_key)
+        bucket = retrieval_semantic_cache_partitions.get(partition)
+        if bucket is None or bucket["matrix"].shape[1] != row.shape[1]:
+            # A dimension change means the embedding model changed; older rows are not comparable.
+            if bucket is not None:
+                for stale_key in list(bucket["keys"]):
+                    retrieval_semantic_cache_lru.pop(stale_key, None)
+            bucket = {"keys": [], "matrix": np.empty((0, row.shape[1]), dtype=np.float32)}
+            retrieval_semantic_cache_partitions[partition] = bucket
+        bucket["keys"].append(pathway_key)
+        bucket["matrix"] = np.vstack([bucket["matrix"], row])
+        retrieval_semantic_cache_lru[pathway_key] = partition
+        while len(retrieval_semantic_cache_lru) > RETRIEVAL_SEMANTIC_CACHE_MAX_KEYS:
+            oldest = next(iter(retrieval_semantic_cache_lru))
+            _retrieval_semantic_cache_drop_locked(oldest)
+            retrieval_semantic_cache_evictions += 1
+
+
 def _retrieval_template_cache_key(mode: str, resolved_sources: list[str]) -> str:
     identity = "\n".join(
         [
@@ -3725,6 +4846,12 @@ def _retrieval_pathway_stat_key(
     return hashlib.sha1(identity).hexdigest()
 
 
+def _retrieval_pathway_decayed_score(entry: dict[str, Any], now: float) -> float:
+    score = float(entry.get("score") or 0.0)
+    elapsed = max(0.0, now - float(entry.get("score_monotonic") or now))
+    return score * math.pow(0.5, elapsed / RETRIEVAL_PATHWAY_WARMER_HALFLIFE_SECS)
+
+
 async def _record_retrieval_pathway_observation(
     *,
     query: str,
@@ -3733,7 +4860,14 @@ async def _record_retrieval_pathway_observation(
     sources: list[str],
     source_weights: dict[str, float],
     retrieval_mode: str,
+    limit: int | None = None,
+    cached_for_secs: float | None = None,
 ) -> None:
+    """Count a live search of a pathway.
+
+    ``cached_for_secs`` is set when the search just filled the pathway cache, so the
+    warmer knows when that entry expires.
+    """
     query_text = re.sub(r"\s+", " ", str(query or "").strip())
     if not query_text:
         return
@@ -3760,8 +4894,15 @@ async def _record_retrieval_pathway_observation(
                 "first_seen_monotonic": now,
             }
         entry["hits"] = int(entry.get("hits", 0) or 0) + 1
+        entry["score"] = _retrieval_pathway_decayed_score(entry, now) + 1.0
+        entry["score_monotonic"] = now
         entry["last_seen_at"] = _utc_now()
         entry["last_seen_monotonic"] = now
+        if limit is not None:
+            entry["limit"] = int(limit)
+        if cached_for_secs:
+            entry["cached_until_monotonic"] = now + cached_for_secs
+            entry["invalidated"] = False
         retrieval_pathway_stats[key] = entry
         retrieval_pathway_stats.move_to_end(key)
         while len(retrieval_pathway_stats) > RETRIEVAL_PATHWAY_STATS_MAX_KEYS:
@@ -3782,12 +4923,15 @@ async def _list_hot_retrieval_pathways(limit: int) -> list[dict[str, Any]]:
             if last_seen <= 0 or (now - last_seen) > ttl:
                 stale_keys.append(key)
                 continue
-            selected.append(dict(entry))
+            item = dict(entry)
+            item["key"] = key
+            item["score"] = round(_retrieval_pathway_decayed_score(entry, now), 4)
+            selected.append(item)
         for key in stale_keys:
             retrieval_pathway_stats.pop(key, None)
         selected.sort(
             key=lambda item: (
-                int(item.get("hits") or 0),
+                float(item.get("score") or 0.0),
                 float(item.get("last_seen_monotonic") or 0.0),
             ),
             reverse=True,
@@ -3795,6 +4939,42 @@ async def _list_hot_retrieval_pathways(limit: int) -> list[dict[str, Any]]:
         return selected[: max(1, int(limit))]
 
 
+async def _mark_retrieval_pathways_invalidated(scopes: list[str]) -> int:
+    """Flag tracked pathways whose search scope a write touched; wakes the warmer for hot ones."""
+    if not scopes:
+        return 0
+    wanted = set(scopes)
+    now = time.monotonic()
+    hot = 0
+    async with retrieval_pathway_stats_lock:
+        for entry in retrieval_pathway_stats.values():
+            scope = _retrieval_pathway_generation_scope(entry.get("project_filter"), entry.get("topic_filter"))
+            if scope not in wanted:
+                continue
+            entry["cached_until_monotonic"] = 0.0
+            entry["invalidated"] = True
+            if _retrieval_pathway_decayed_score(entry, now) >= RETRIEVAL_PATHWAY_WARMER_MIN_SCORE:
+                hot += 1
+    if hot and RETRIEVAL_PATHWAY_WARMER_ENABLED:
+        retrieval_pathway_warmer_state["writeWakeups"] = int(retrieval_pathway_warmer_state.get("writeWakeups") or 0) + 1
+        retrieval_pathway_warmer_wakeup.set()
+    return hot
+
+
+async def _note_retrieval_pathway_warmed(key: str, *, cost_ms: float, cached_for_secs: float) -> None:
+    now = time.monotonic()
+    async with retrieval_pathway_stats_lock:
+        entry = retrieval_pathway_stats.get(key)
+        if not isinstance(entry, dict):
+            return
+        previous = float(entry.get("warm_cost_ms") or 0.0)
+        entry["warm_cost_ms"] = round(cost_ms if previous <= 0 else 0.7 * previous + 0.3 * cost_ms, 3)
+        entry["last_warmed_at"] = _utc_now()
+        entry["invalidated"] = False
+        if cached_for_secs > 0:
+            entry["cached_until_monotonic"] = now + cached_for_secs
+
+
 def _percentile(values: list[float], pct: float) -> float:
     if not values:
         return 0.0
@@ -3812,6 +4992,145 @@ def _percentile(values: list[float], pct: float) -> float:
     return lower + (upper - lower) * weight
 
 
+_LATENCY_SKETCH_MIN_MS = 0.01
+_LATENCY_SKETCH_MAX_MS = 3_600_000.0
+_LATENCY_SKETCH_SLICES = 6
+
+
+class WindowedLatencySketch:
+    """Sliding-window latency histogram over log-spaced buckets.
+
+    Buckets grow by a constant ratio, so quantiles carry a bounded relative error
+    (RETRIEVAL_LATENCY_SKETCH_ACCURACY) and sketches merge by adding bucket counts.
+    The window is split into a few time slices; expired slices are subtracted from the
+    running totals, so recording is O(1) and a quantile is one pass over a fixed number
+    of buckets, independent of traffic.
+    """
+
+    __slots__ = (
+        "window_secs",
+        "slice_secs",
+        "log_gamma",
+        "totals",
+        "count",
+        "total_ms",
+        "errors",
+        "timeouts",
+        "slices",
+    )
+
+    def __init__(self, window_secs: float, accuracy: float = RETRIEVAL_LATENCY_SKETCH_ACCURACY) -> None:
+        gamma = (1.0 + accuracy) / (1.0 - accuracy)
+        self.window_secs = float(window_secs)
+        self.slice_secs = self.window_secs / _LATENCY_SKETCH_SLICES
+        self.log_gamma = math.log(gamma)
+        bucket_count = 2 + int(math.ceil(math.log(_LATENCY_SKETCH_MAX_MS / _LATENCY_SKETCH_MIN_MS) / self.log_gamma))
+        self.totals = [0] * bucket_count
+        self.count = 0
+        self.total_ms = 0.0
+        self.errors = 0
+        self.timeouts = 0
+        # Each slice: [start, {bucket: count}, count, total_ms, errors, timeouts, min_ms, max_ms]
+        self.slices: deque[list[Any]] = deque()
+
+    def _bucket(self, value_ms: float) -> int:
+        if value_ms <= _LATENCY_SKETCH_MIN_MS:
+            return 0
+        index = 1 + int(math.ceil(math.log(value_ms / _LATENCY_SKETCH_MIN_MS) / self.log_gamma))
+        return min(len(self.totals) - 1, index)
+
+    def _bucket_value(self, index: int) -> float:
+        if index <= 0:
+            return _LATENCY_SKETCH_MIN_MS
+        upper = _LATENCY_SKETCH_MIN_MS * math.exp((index - 1) * self.log_gamma)
+        # Midpoint (in relative terms) of (upper / gamma, upper].
+        return 2.0 * upper / (1.0 + math.exp(self.log_gamma))
+
+    def _expire(self, now: float) -> None:
+        cutoff = now - self.window_secs
+        while self.slices and self.slices[0][0] <= cutoff:
+            _, buckets, count, total_ms, errors, timeouts, _, _ = self.slices.popleft()
+            for index, bucket_count in buckets.items():
+                self.totals[index] -= bucket_count
+            self.count -= count
+            self.total_ms -= total_ms
+            self.errors -= errors
+            self.timeouts -= timeouts
+
+    def record(self, value_ms: float, now: float, *, ok: bool = True, timed_out: bool = False) -> None:
+        self._expire(now)
+        if not self.slices or now - self.slices[-1][0] >= self.slice_secs:
+            self.slices.append([now, {}, 0, 0.0, 0, 0, value_ms, value_ms])
+        current = self.slices[-1]
+        index = self._bucket(value_ms)
+        current[1][index] = current[1].get(index, 0) + 1
+        current[2] += 1
+        current[3] += value_ms
+        current[6] = min(current[6], value_ms)
+        current[7] = max(current[7], value_ms)
+        self.totals[index] += 1
+        self.count += 1
+        self.total_ms += value_ms
+        if not ok:
+            current[4] += 1
+            self.errors += 1
+        if timed_out:
+            current[5] += 1
+            self.timeouts += 1
+
+    def samples(self, now: float) -> int:
+        self._expire(now)
+        return self.count
+
+    def quantile(self, pct: float, now: float) -> float | None:
+        # Read-only: expired slices are discounted from a copy of the totals rather than
+        # popped, so exporters can read a sketch without mutating it.
+        cutoff = now - self.window_secs
+        totals = self.totals
+        count = self.count
+        expired = [item for item in self.slices if item[0] <= cutoff]
+        if expired:
+            totals = list(totals)
+            for _, buckets, slice_count, *_ in expired:
+                for index, bucket_count in buckets.items():
+                    totals[index] -= bucket_count
+                count -= slice_count
+        if count <= 0:
+            return None
+        rank = max(0.0, min(1.0, float(pct))) * (count - 1)
+        seen = 0
+        for index, bucket_count in enumerate(totals):
+            seen += bucket_count
+            if seen > rank:
+                return self._bucket_value(index)
+        return self._bucket_value(len(self.totals) - 1)
+
+    def summary(self, now: float) -> dict[str, Any]:
+        self._expire(now)
+        if self.count <= 0:
+            return {"samples": 0, "errors": 0, "timeouts": 0}
+        return {
+            "samples": self.count,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "p50Ms": round(self.quantile(0.50, now) or 0.0, 3),
+            "p95Ms": round(self.quantile(0.95, now) or 0.0, 3),
+            "p99Ms": round(self.quantile(0.99, now) or 0.0, 3),
+            "minMs": round(min(item[6] for item in self.slices), 3),
+            "maxMs": round(max(item[7] for item in self.slices), 3),
+            "avgMs": round(self.total_ms / self.count, 3),
+        }
+
+
+def _retrieval_latency_sketch_windows(source: str, mode: str) -> dict[str, WindowedLatencySketch]:
+    key = (source, mode)
+    windows = retrieval_latency_sketches.get(key)
+    if windows is None:
+        windows = {label: WindowedLatencySketch(secs) for label, secs in RETRIEVAL_LATENCY_WINDOWS.items()}
+        retrieval_latency_sketches[key] = windows
+    return windows
+
+
 async def _record_retrieval_source_latency(
     *,
     source: str,
@@ -3826,12 +5145,12 @@ async def _record_retrieval_source_latency(
         return
     duration = max(0.0, float(duration_ms))
     mode_name = _normalize_retrieval_mode(retrieval_mode)
+    now = time.monotonic()
     async with retrieval_latency_lock:
-        samples = retrieval_source_latency_samples.get(source_name)
-        if samples is None:
-            samples = deque(maxlen=RETRIEVAL_LATENCY_HISTORY_LIMIT)
-            retrieval_source_latency_samples[source_name] = samples
-        samples.append(duration)
+        with retrieval_latency_sketch_lock:
+            for sketch_mode in ("all", mode_name):
+                for sketch in _retrieval_latency_sketch_windows(source_name, sketch_mode).values():
+                    sketch.record(duration, now, ok=ok, timed_out=timed_out)
         retrieval_source_request_counts[source_name] = int(
             retrieval_source_request_counts.get(source_name, 0) or 0
         ) + 1
@@ -3849,42 +5168,96 @@ async def _record_retrieval_source_latency(
         retrieval_latency_updated_at = _utc_now()
 
 
+async def _retrieval_latency_quantile(
+    source: str,
+    pct: float,
+    *,
+    window: str,
+    retrieval_mode: str | None = None,
+    min_samples: int = 1,
+) -> float | None:
+    """Windowed latency quantile for a source, preferring the mode's own sketch when warm."""
+    now = time.monotonic()
+    modes = [_normalize_retrieval_mode(retrieval_mode), "all"] if retrieval_mode else ["all"]
+    async with retrieval_latency_lock:
+        with retrieval_latency_sketch_lock:
+            for mode in modes:
+                sketch = (retrieval_latency_sketches.get((source, mode)) or {}).get(window)
+                if sketch is None:
+                    continue
+                if sketch.samples(now) >= max(1, min_samples):
+                    return sketch.quantile(pct, now)
+    return None
+
+
 async def _retrieval_latency_snapshot() -> dict[str, Any]:
+    now = time.monotonic()
+    sources: dict[str, Any] = {}
     async with retrieval_latency_lock:
-        samples_by_source = {
-            source: list(samples)
-            for source, samples in retrieval_source_latency_samples.items()
-        }
-        request_counts = dict(retrieval_source_request_counts)
-        error_counts = dict(retrieval_source_error_counts)
-        timeout_counts = dict(retrieval_source_timeout_counts)
+        with retrieval_latency_sketch_lock:
+            for (source, mode), windows in retrieval_latency_sketches.items():
+                if mode != "all":
+                    continue
+                primary = windows[RETRIEVAL_LATENCY_SNAPSHOT_WINDOW].summary(now)
+                if not primary.get("samples"):
+                    continue
+                # requests/errors/timeouts all describe the snapshot window, so rates derived
+                # from them are consistent; process-lifetime counters live under "lifetime".
+                entry = {
+                    **primary,
+                    "requests": int(primary.get("samples", 0) or 0),
+                    "lifetime": {
+                        "requests": int(retrieval_source_request_counts.get(source, 0) or 0),
+                        "errors": int(retrieval_source_error_counts.get(source, 0) or 0),
+                        "timeouts": int(retrieval_source_timeout_counts.get(source, 0) or 0),
+                    },
+                    "window": RETRIEVAL_LATENCY_SNAPSHOT_WINDOW,
+                    "windows": {label: sketch.summary(now) for label, sketch in windows.items()},
+                    "modes": {},
+                }
+                sources[source] = entry
+            for (source, mode), windows in retrieval_latency_sketches.items():
+                if mode == "all" or source not in sources:
+                    continue
+                summary = windows[RETRIEVAL_LATENCY_SNAPSHOT_WINDOW].summary(now)
+                if summary.get("samples"):
+                    sources[source]["modes"][mode] = summary
         mode_counts = dict(retrieval_latency_mode_counts)
         updated_at = retrieval_latency_updated_at
-    sources: dict[str, Any] = {}
-    for source, samples in samples_by_source.items():
-        sorted_samples = sorted(float(item) for item in samples)
-        if not sorted_samples:
-            continue
-        sources[source] = {
-            "samples": len(sorted_samples),
-            "requests": int(request_counts.get(source, 0) or 0),
-            "errors": int(error_counts.get(source, 0) or 0),
-            "timeouts": int(timeout_counts.get(source, 0) or 0),
-            "p50Ms": round(_percentile(sorted_samples, 0.50), 3),
-            "p95Ms": round(_percentile(sorted_samples, 0.95), 3),
-            "p99Ms": round(_percentile(sorted_samples, 0.99), 3),
-            "minMs": round(sorted_samples[0], 3),
-            "maxMs": round(sorted_samples[-1], 3),
-            "avgMs": round(sum(sorted_samples) / len(sorted_samples), 3),
-        }
     return {
         "updatedAt": updated_at,
-        "historyLimit": RETRIEVAL_LATENCY_HISTORY_LIMIT,
+        "sketchAccuracy": RETRIEVAL_LATENCY_SKETCH_ACCURACY,
+        "windows": list(RETRIEVAL_LATENCY_WINDOWS),
         "sources": sources,
         "modes": mode_counts,
     }
 
 
+class _RetrievalLatencyCollector:
+    """Prometheus collector exporting windowed retrieval latency quantiles from the sketches."""
+
+    def collect(self) -> Any:
+        family = GaugeMetricFamily(
+            "orchestrator_retrieval_source_latency_ms",
+            "Retrieval source latency quantiles over sliding windows",
+            labels=["source", "mode", "window", "quantile"],
+        )
+        now = time.monotonic()
+        # The metrics handler runs in the threadpool, concurrently with record() on the
+        # event loop; take the sketch lock and use the non-mutating quantile().
+        rows: list[tuple[list[str], float]] = []
+        with retrieval_latency_sketch_lock:
+            for (source, mode), windows in retrieval_latency_sketches.items():
+                for label, sketch in windows.items():
+                    for pct in (0.5, 0.95, 0.99):
+                        value = sketch.quantile(pct, now)
+                        if value is not None:
+                            rows.append(([source, mode, label, str(pct)], value))
+        for labels, value in rows:
+            family.add_metric(labels, value)
+        yield family
+
+
 def _degraded_timeout_cap_for_source(source: str) -> float | None:
     source_name = str(source or "").strip().lower()
     if source_name == RETRIEVAL_SOURCE_LETTA:
@@ -3949,6 +5322,8 @@ async def _retrieval_slow_source_runtime_policy(
             is_degraded = bool(in_cooldown)
             if not is_degraded:
                 continue
+            recent = (retrieval_latency_sketches.get((source_name, "all")) or {}).get("5m")
+            recent_p95 = recent.quantile(0.95, now) if recent is not None else None
             degraded[source_name] = {
                 "requests": requests,
                 "errors": errors,
@@ -3956,6 +5331,7 @@ async def _retrieval_slow_source_runtime_policy(
                 "timeout_rate": round(timeout_rate, 6),
                 "error_rate": round(error_rate, 6),
                 "cooldown_remaining_secs": round(max(0.0, cooldown_until - now), 3),
+                "recent_p95_ms": round(recent_p95, 3) if recent_p95 is not None else None,
             }
             cap = _degraded_timeout_cap_for_source(source_name)
             if cap is not None:
@@ -3965,7 +5341,171 @@ async def _retrieval_slow_source_runtime_policy(
     return policy
 
 
-async def _retrieval_source_quality_snapshot(*, sources: list[str]) -> dict[str, Any]:
+async def _retrieval_hedge_delays(
+    *,
+    sources: list[str],
+    degraded_sources: dict[str, Any],
+    retrieval_mode: str | None = None,
+) -> dict[str, float]:
+    """Per-source hedge delay (seconds) from the windowed latency sketch.
+
+    Sources without enough samples, or currently degraded, are not hedged: a second
+    attempt against a struggling backend only adds load.
+    """
+    if not RETRIEVAL_HEDGE_ENABLED or RETRIEVAL_HEDGE_MAX_EXTRA_LOAD <= 0:
+        return {}
+    candidates = [
+        source
+        for source in sources
+        if source in RETRIEVAL_HEDGE_SOURCES and source not in degraded_sources
+    ]
+    delays: dict[str, float] = {}
+    for source in candidates:
+        threshold_ms = await _retrieval_latency_quantile(
+            source,
+            RETRIEVAL_HEDGE_PERCENTILE,
+            window=RETRIEVAL_HEDGE_LATENCY_WINDOW,
+            retrieval_mode=retrieval_mode,
+            min_samples=RETRIEVAL_HEDGE_MIN_SAMPLES,
+        )
+        if threshold_ms is None:
+            continue
+        delays[source] = max(RETRIEVAL_HEDGE_MIN_DELAY_MS, threshold_ms) / 1000.0
+    return delays
+
+
+def _retrieval_hedge_stat_bump(source: str, field: str) -> None:
+    stats = retrieval_hedge_stats.setdefault(
+        source,
+        {"eligible": 0, "issued": 0, "wins": 0, "budgetDenied": 0},
+    )
+    stats[field] = int(stats.get(field, 0) or 0) + 1
+
+
+async def _retrieval_hedge_acquire(source: str) -> bool:
+    async with retrieval_hedge_lock:
+        tokens = float(retrieval_hedge_tokens.get(source, 0.0) or 0.0)
+        if tokens < 1.0:
+            _retrieval_hedge_stat_bump(source, "budgetDenied")
+            return False
+        retrieval_hedge_tokens[source] = tokens - 1.0
+        _retrieval_hedge_stat_bump(source, "issued")
+        return True
+
+
+async def _run_hedged_source(
+    source: str,
+    attempt_factory: Any,
+    hedge_delay_secs: float,
+    outcomes: dict[str, str],
+    *,
+    on_primary_settled: Any = None,
+    primary_timeout_secs: float | None = None,
+) -> list[dict[str, Any]]:
+    """Run a source attempt, racing a second attempt if the first outlives its p-target.
+
+    Each primary attempt earns RETRIEVAL_HEDGE_MAX_EXTRA_LOAD hedge tokens (capped at the
+    burst size) and each hedge spends one, so hedges never exceed that fraction of load.
+
+    When the hedge wins and on_primary_settled is given, the primary is left to finish
+    (up to primary_timeout_secs) and its own elapsed time is passed to
+    on_primary_settled(duration_ms, ok, timed_out). The caller's wall time would only be
+    a lower bound on it and would drag the latency percentiles down.
+    """
+    async with retrieval_hedge_lock:
+        retrieval_hedge_tokens[source] = min(
+            RETRIEVAL_HEDGE_BUDGET_BURST,
+            float(retrieval_hedge_tokens.get(source, 0.0) or 0.0) + RETRIEVAL_HEDGE_MAX_EXTRA_LOAD,
+        )
+        _retrieval_hedge_stat_bump(source, "eligible")
+    primary_started = time.monotonic()
+    primary = asyncio.create_task(attempt_factory())
+    attempts = [primary]
+    try:
+        done, _ = await asyncio.wait({primary}, timeout=hedge_delay_secs)
+        if done:
+            outcomes[source] = "primary"
+            return primary.result()
+        if not await _retrieval_hedge_acquire(source):
+            outcomes[source] = "budget_denied"
+            return await primary
+        hedge = asyncio.create_task(attempt_factory())
+        attempts.append(hedge)
+        pending: set[asyncio.Task[Any]] = {primary, hedge}
+        last_error: BaseException | None = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                error = task.exception()
+                if error is not None:
+                    last_error = error
+                    continue
+                if task is hedge:
+                    outcomes[source] = "hedge_won"
+                    async with retrieval_hedge_lock:
+                        _retrieval_hedge_stat_bump(source, "wins")
+                    if on_primary_settled is not None:
+                        attempts.remove(primary)
+                        _watch_hedged_primary(primary, primary_started, primary_timeout_secs, on_primary_settled)
+                else:
+                    outcomes[source] = "hedge_lost"
+                return task.result()
+        outcomes[source] = "hedge_failed"
+        raise last_error if last_error is not None else OrchestratorError(f"{source} hedged retrieval failed")
+    finally:
+        for task in attempts:
+            if not task.done():
+                task.cancel()
+
+
+def _watch_hedged_primary(
+    primary: asyncio.Task[Any],
+    started: float,
+    timeout_secs: float | None,
+    on_settled: Any,
+) -> None:
+    async def _watch() -> None:
+        remaining = None if timeout_secs is None else max(0.0, timeout_secs - (time.monotonic() - started))
+        done, _ = await asyncio.wait({primary}, timeout=remaining)
+        timed_out = not done
+        if timed_out:
+            primary.cancel()
+        ok = bool(done) and not primary.cancelled() and primary.exception() is None
+        try:
+            await on_settled((time.monotonic() - started) * 1000, ok, timed_out)
+        except Exception as exc:
+            logger.debug("Hedged primary latency callback failed: %s", exc)
+
+    task = asyncio.create_task(_watch())
+    retrieval_hedge_primary_tasks.add(task)
+    task.add_done_callback(retrieval_hedge_primary_tasks.discard)
+
+
+async def _retrieval_hedge_snapshot() -> dict[str, Any]:
+    async with retrieval_hedge_lock:
+        by_source = {source: dict(stats) for source, stats in retrieval_hedge_stats.items()}
+        tokens = {source: round(value, 3) for source, value in retrieval_hedge_tokens.items()}
+    for source, stats in by_source.items():
+        eligible = max(1, int(stats.get("eligible", 0) or 0))
+        issued = int(stats.get("issued", 0) or 0)
+        stats["extraLoad"] = round(issued / eligible, 6)
+        stats["winRate"] = round(int(stats.get("wins", 0) or 0) / issued, 6) if issued else 0.0
+        stats["budgetTokens"] = tokens.get(source, 0.0)
+    return {
+        "enabled": RETRIEVAL_HEDGE_ENABLED,
+        "sources": list(RETRIEVAL_HEDGE_SOURCES),
+        "percentile": RETRIEVAL_HEDGE_PERCENTILE,
+        "minSamples": RETRIEVAL_HEDGE_MIN_SAMPLES,
+        "minDelayMs": RETRIEVAL_HEDGE_MIN_DELAY_MS,
+        "maxExtraLoad": RETRIEVAL_HEDGE_MAX_EXTRA_LOAD,
+        "budgetBurst": RETRIEVAL_HEDGE_BUDGET_BURST,
+        "issued": sum(int(stats.get("issued", 0) or 0) for stats in by_source.values()),
+        "wins": sum(int(stats.get("wins", 0) or 0) for stats in by_source.values()),
+        "bySource": by_source,
+    }
+
+
+async def _retrieval_source_quality_snapshot(*, sources: list[str]) -> dict[str, Any]:
     unique_sources: list[str] = []
     seen: set[str] = set()
     for source in sources:
@@ -4041,6 +5581,235 @@ async def _retrieval_source_quality_snapshot(*, sources: list[str]) -> dict[str,
     return payload
 
 
+def _retrieval_query_shape(query: str) -> str:
+    """Coarse query class for routing: term-count bucket plus numeric/quoted markers."""
+    text = str(query or "")
+    term_count = len(_query_terms(text, max_terms=16))
+    if term_count <= 2:
+        shape = "short"
+    elif term_count <= 6:
+        shape = "medium"
+    else:
+        shape = "long"
+    if re.search(r"\d", text):
+        shape += "+num"
+    if '"' in text:
+        shape += "+quoted"
+    return shape
+
+
+def _retrieval_source_router_key(
+    *,
+    query: str,
+    project_filter: str | None,
+    topic_filter: str | None,
+    retrieval_mode: str,
+) -> str:
+    topic_prefix = str(topic_filter or "").strip().strip("/").split("/", 1)[0].lower()
+    return "|".join(
+        [
+            _normalize_retrieval_mode(retrieval_mode),
+            str(project_filter or "*"),
+            topic_prefix or "*",
+            _retrieval_query_shape(query),
+        ]
+    )
+
+
+async def _retrieval_source_router_decide(
+    route_key: str,
+    *,
+    sources: list[str],
+) -> dict[str, dict[str, Any]]:
+    """Per-source routing decision with the contribution estimate behind it.
+
+    Only sources in RETRIEVAL_SOURCE_ROUTER_SOURCES can be skipped, and only once the
+    route has enough observations; an exploration draw keeps a would-be skip running
+    so its estimate keeps updating.
+    """
+    async with retrieval_source_router_lock:
+        route = retrieval_source_router.get(route_key)
+        counts = {source: dict(route[source]) for source in sources if route and source in route}
+    decisions: dict[str, dict[str, Any]] = {}
+    skipped = 0
+    explored = 0
+    for source in sources:
+        stats = counts.get(source) or {}
+        observed = float(stats.get("observed", 0.0) or 0.0)
+        contributed = float(stats.get("contributed", 0.0) or 0.0)
+        # Laplace-smoothed so a handful of empty runs cannot pin the estimate at zero.
+        probability = (contributed + 1.0) / (observed + 2.0)
+        if source not in RETRIEVAL_SOURCE_ROUTER_SOURCES:
+            decision = "always"
+        elif observed < RETRIEVAL_SOURCE_ROUTER_MIN_OBSERVATIONS:
+            decision = "insufficient_data"
+        elif probability >= RETRIEVAL_SOURCE_ROUTER_MIN_PROBABILITY:
+            decision = "keep"
+        elif random.random() < RETRIEVAL_SOURCE_ROUTER_EXPLORATION_RATE:
+            decision = "explore"
+            explored += 1
+        else:
+            decision = "skip"
+            skipped += 1
+        decisions[source] = {
+            "decision": decision,
+            "contribution_probability": round(probability, 4),
+            "observations": round(observed, 3),
+        }
+    async with retrieval_source_router_lock:
+        retrieval_source_router_stats["decisions"] += 1
+        retrieval_source_router_stats["skipped"] += skipped
+        retrieval_source_router_stats["explored"] += explored
+    return decisions
+
+
+async def _record_retrieval_source_router_observation(
+    route_key: str,
+    *,
+    ran_sources: list[str],
+    results: list[dict[str, Any]],
+) -> None:
+    """Update contribution estimates for sources that completed this search.
+
+    A source contributes when a final top-k row was returned by it and no other source,
+    i.e. the answer would have changed without it.
+    """
+    if not ran_sources:
+        return
+    unique_sources: set[str] = set()
+    for row in results:
+        row_sources = row.get("sources") if isinstance(row.get("sources"), list) else [row.get("source")]
+        if len(row_sources) == 1:
+            unique_sources.add(str(row_sources[0]))
+    async with retrieval_source_router_lock:
+        route = retrieval_source_router.get(route_key)
+        if route is None:
+            route = {}
+        for source in ran_sources:
+            stats = route.setdefault(source, {"observed": 0.0, "contributed": 0.0})
+            stats["observed"] = stats["observed"] * RETRIEVAL_SOURCE_ROUTER_DECAY + 1.0
+            stats["contributed"] = stats["contributed"] * RETRIEVAL_SOURCE_ROUTER_DECAY + (
+                1.0 if source in unique_sources else 0.0
+            )
+        retrieval_source_router[route_key] = route
+        retrieval_source_router.move_to_end(route_key)
+        while len(retrieval_source_router) > RETRIEVAL_SOURCE_ROUTER_MAX_KEYS:
+            retrieval_source_router.popitem(last=False)
+        retrieval_source_router_stats["observations"] += 1
+
+
+async def _retrieval_source_router_snapshot() -> dict[str, Any]:
+    async with retrieval_source_router_lock:
+        stats = dict(retrieval_source_router_stats)
+        tracked_routes = len(retrieval_source_router)
+    return {
+        "enabled": RETRIEVAL_SOURCE_ROUTER_ENABLED,
+        "sources": list(RETRIEVAL_SOURCE_ROUTER_SOURCES),
+        "minObservations": RETRIEVAL_SOURCE_ROUTER_MIN_OBSERVATIONS,
+        "minProbability": RETRIEVAL_SOURCE_ROUTER_MIN_PROBABILITY,
+        "explorationRate": RETRIEVAL_SOURCE_ROUTER_EXPLORATION_RATE,
+        "decay": RETRIEVAL_SOURCE_ROUTER_DECAY,
+        "trackedRoutes": tracked_routes,
+        "maxRoutes": RETRIEVAL_SOURCE_ROUTER_MAX_KEYS,
+        **stats,
+    }
+
+
+class _IncompleteSourceRows(list):
+    """Rows from a retrieval source whose query did not complete.
+
+    Sources that swallow a failure (or run out of time budget) return these instead of a
+    plain list; callers treat them as ordinary rows, but an empty one is never remembered
+    by the empty-source cache.
+    """
+
+
+def _incomplete_source_rows(rows: Any = ()) -> list[dict[str, Any]]:
+    return _IncompleteSourceRows(rows)
+
+
+def _retrieval_empty_source_cache_key(
+    *,
+    source: str,
+    query: str,
+    source_limit: int,
+    project_filter: str | None,
+    topic_filter: str | None,
+    retrieval_mode: str,
+    generation_token: str,
+) -> str:
+    identity = "\n".join(
+        [
+            source,
+            _normalize_retrieval_mode(retrieval_mode),
+            str(generation_token or ""),
+            str(source_limit),
+            str(project_filter or ""),
+            str(topic_filter or ""),
+            re.sub(r"\s+", " ", str(query or "").strip().lower()),
+        ]
+    ).encode("utf-8")
+    return hashlib.sha1(identity).hexdigest()
+
+
+async def _retrieval_empty_source_cache_hits(keys: dict[str, str]) -> set[str]:
+    """Sources (from a source -> key map) whose last result for the key was empty."""
+    if RETRIEVAL_EMPTY_SOURCE_CACHE_TTL_SECS <= 0 or not keys:
+        return set()
+    now = time.monotonic()
+    hits: set[str] = set()
+    async with retrieval_empty_source_cache_lock:
+        for source, key in keys.items():
+            entry = retrieval_empty_source_cache.get(key)
+            if entry is None:
+                continue
+            if float(entry.get("expires_monotonic") or 0.0) <= now:
+                retrieval_empty_source_cache.pop(key, None)
+                continue
+            retrieval_empty_source_cache.move_to_end(key)
+            hits.add(source)
+        retrieval_empty_source_cache_stats["hits"] += len(hits)
+    return hits
+
+
+async def _retrieval_empty_source_cache_store(keys: list[str], scope: str) -> None:
+    if RETRIEVAL_EMPTY_SOURCE_CACHE_TTL_SECS <= 0 or RETRIEVAL_EMPTY_SOURCE_CACHE_MAX_KEYS <= 0 or not keys:
+        return
+    expires = time.monotonic() + RETRIEVAL_EMPTY_SOURCE_CACHE_TTL_SECS
+    async with retrieval_empty_source_cache_lock:
+        for key in keys:
+            retrieval_empty_source_cache[key] = {"expires_monotonic": expires, "scope": scope}
+            retrieval_empty_source_cache.move_to_end(key)
+            retrieval_empty_source_cache_stats["stores"] += 1
+        while len(retrieval_empty_source_cache) > RETRIEVAL_EMPTY_SOURCE_CACHE_MAX_KEYS:
+            retrieval_empty_source_cache.popitem(last=False)
+            retrieval_empty_source_cache_stats["evictions"] += 1
+
+
+async def _retrieval_empty_source_cache_invalidate(scopes: list[str]) -> None:
+    """Drop empty-result markers for every search scope a write can change."""
+    if not scopes:
+        return
+    wanted = set(scopes)
+    async with retrieval_empty_source_cache_lock:
+        stale = [key for key, entry in retrieval_empty_source_cache.items() if entry.get("scope") in wanted]
+        for key in stale:
+            retrieval_empty_source_cache.pop(key, None)
+        retrieval_empty_source_cache_stats["invalidations"] += len(stale)
+
+
+async def _retrieval_empty_source_cache_snapshot() -> dict[str, Any]:
+    async with retrieval_empty_source_cache_lock:
+        stats = dict(retrieval_empty_source_cache_stats)
+        current_keys = len(retrieval_empty_source_cache)
+    return {
+        "ttlSecs": RETRIEVAL_EMPTY_SOURCE_CACHE_TTL_SECS,
+        "maxKeys": RETRIEVAL_EMPTY_SOURCE_CACHE_MAX_KEYS,
+        "currentKeys": current_keys,
+        **stats,
+    }
+
+
 async def _retrieval_lifecycle_snapshot() -> dict[str, dict[str, Any]]:
     if not RETRIEVAL_LIFECYCLE_ENABLED:
         return {}
@@ -4124,13 +5893,12 @@ async def _record_retrieval_lifecycle_observation(
                     "first_seen_monotonic": now,
                 }
             summary = str(row.get("summary") or "").strip()
-            summary_hash = (
-                hashlib.sha1(summary.lower().encode("utf-8")).hexdigest()
-                if summary
-                else ""
-            )
+            summary_hash = str(row.get("content_fingerprint") or "") or _summary_fingerprint(summary)
+            stored_values = _row_numeric_values(row)
             row_numeric_values = set(
-                _extract_numeric_values_verbatim(summary, limit=16)
+                stored_values
+                if stored_values is not None
+                else _extract_numeric_values_verbatim(summary, limit=16)
             )
             contradiction = bool(
                 query_numeric_values
@@ -4294,6 +6062,19 @@ async def _build_retrieval_metrics_payload(top_limit: int) -> dict[str, Any]:
     top_limit = max(1, min(int(top_limit), 100))
     top_pathways = await _list_hot_retrieval_pathways(top_limit)
     latency = await _retrieval_latency_snapshot()
+    hedging = await _retrieval_hedge_snapshot()
+    source_router = await _retrieval_source_router_snapshot()
+    empty_source_cache = await _retrieval_empty_source_cache_snapshot()
+    preference_cache = await _preference_context_cache_snapshot()
+    mongo_text_search = {
+        key: value
+        for key, value in mongo_text_search_state.items()
+        if key != "retryAfterMonotonic"
+    }
+    mongo_text_search["enabled"] = RETRIEVAL_MONGO_TEXT_SEARCH_ENABLED
+    mindsdb_term_index = dict(mindsdb_term_index_state)
+    mindsdb_term_index["enabled"] = MINDSDB_TERM_INDEX_ENABLED
+    local_vector_index = await _qdrant_local_index_snapshot()
     recall_quality = await _recall_quality_snapshot()
     alerts = _build_retrieval_alerts(latency)
     recall_alerts = _build_recall_quality_alerts(recall_quality)
@@ -4305,16 +6086,28 @@ async def _build_retrieval_metrics_payload(top_limit: int) -> dict[str, Any]:
             alerts["count"] = len(active)
     async with retrieval_pathway_cache_lock:
         pathway_cache_size = len(retrieval_pathway_cache)
+    async with retrieval_pathway_inflight_lock:
+        pathway_inflight_size = len(retrieval_pathway_inflight)
+    async with retrieval_semantic_cache_lock:
+        semantic_cache_size = len(retrieval_semantic_cache_lru)
+        semantic_partition_count = len(retrieval_semantic_cache_partitions)
     async with retrieval_template_cache_lock:
         template_cache_size = len(retrieval_template_cache)
     async with retrieval_pathway_stats_lock:
         pathway_stats_size = len(retrieval_pathway_stats)
     async with memory_read_cache_lock:
         memory_read_cache_size = len(memory_read_cache)
+        memory_read_negative_size = len(memory_read_negative_cache)
+        memory_read_latency = {
+            tier: sketch.summary(time.monotonic())
+            for tier, sketch in memory_read_cache_tier_latency.items()
+        }
     async with memory_read_cache_refresh_lock:
         memory_read_refresh_inflight = len(memory_read_cache_refresh_inflight)
     async with letta_search_warm_lock:
         letta_warm_inflight = len(letta_search_warm_inflight)
+    async with letta_search_cache_lock:
+        letta_cache_size = len(letta_search_cache)
     lifecycle_state = await _retrieval_lifecycle_state_snapshot()
     return {
         "updatedAt": _utc_now(),
@@ -4328,6 +6121,34 @@ async def _build_retrieval_metrics_payload(top_limit: int) -> dict[str, Any]:
             "hits": retrieval_pathway_cache_hits,
             "misses": retrieval_pathway_cache_misses,
             "evictions": retrieval_pathway_cache_evictions,
+            "effectiveTtlSecs": _retrieval_pathway_cache_ttl_secs(),
+            "semantic": {
+                "enabled": bool(RETRIEVAL_SEMANTIC_CACHE_ENABLED and np is not None),
+                "minSimilarity": RETRIEVAL_SEMANTIC_CACHE_MIN_SIMILARITY,
+                "maxKeys": RETRIEVAL_SEMANTIC_CACHE_MAX_KEYS,
+                "currentKeys": semantic_cache_size,
+                "partitions": semantic_partition_count,
+                "hits": retrieval_semantic_cache_hits,
+                "misses": retrieval_semantic_cache_misses,
+                "stale": retrieval_semantic_cache_stale,
+                "evictions": retrieval_semantic_cache_evictions,
+            },
+            "singleflight": {
+                "enabled": RETRIEVAL_PATHWAY_SINGLEFLIGHT_ENABLED,
+                "inflight": pathway_inflight_size,
+                "leaders": retrieval_pathway_singleflight_leaders,
+                "coalesced": retrieval_pathway_singleflight_coalesced,
+            },
+            "invalidation": {
+                "enabled": RETRIEVAL_PATHWAY_INVALIDATION_ENABLED,
+                "ttlSecs": RETRIEVAL_PATHWAY_INVALIDATION_TTL_SECS,
+                "sharedGenerations": _retrieval_pathway_generation_backend_enabled(),
+                "trackedScopes": len(retrieval_pathway_generations),
+                "bumps": retrieval_pathway_generation_bumps,
+                "scopesBumped": retrieval_pathway_generation_scopes_bumped,
+                "backendErrors": retrieval_pathway_generation_backend_errors,
+                "lastBumpAt": retrieval_pathway_generation_last_bump_at,
+            },
             "backend": {
                 "configured": RETRIEVAL_PATHWAY_CACHE_BACKEND,
                 "active": _retrieval_pathway_cache_backend_enabled(),
@@ -4359,6 +6180,25 @@ async def _build_retrieval_metrics_payload(top_limit: int) -> dict[str, Any]:
             "refreshStarted": memory_read_cache_refresh_started,
             "refreshCompleted": memory_read_cache_refresh_completed,
             "refreshFailed": memory_read_cache_refresh_failed,
+            "tiers": {
+                "l1": {
+                    "hits": memory_read_cache_hits,
+                    "misses": memory_read_cache_misses,
+                    "latency": memory_read_latency.get("l1", {"samples": 0}),
+                },
+                "l2": {
+                    "enabled": _memory_read_cache_l2_enabled(),
+                    "revalidateSecs": MEMMCP_READ_CACHE_L2_REVALIDATE_SECS,
+                    **memory_read_cache_l2_stats,
+                    "latency": memory_read_latency.get("l2", {"samples": 0}),
+                },
+            },
+            "negative": {
+                "ttlSecs": MEMMCP_READ_NEGATIVE_CACHE_TTL_SECS,
+                "maxKeys": MEMMCP_READ_NEGATIVE_CACHE_MAX_KEYS,
+                "currentKeys": memory_read_negative_size,
+                **memory_read_negative_stats,
+            },
         },
         "templateCache": {
             "enabled": RETRIEVAL_PATHWAY_TEMPLATE_CACHE_ENABLED,
@@ -4381,6 +6221,11 @@ async def _build_retrieval_metrics_payload(top_limit: int) -> dict[str, Any]:
             "topQueries": RETRIEVAL_PATHWAY_WARMER_TOP_QUERIES,
             "limit": RETRIEVAL_PATHWAY_WARMER_LIMIT,
             "concurrency": RETRIEVAL_PATHWAY_WARMER_CONCURRENCY,
+            "halfLifeSecs": RETRIEVAL_PATHWAY_WARMER_HALFLIFE_SECS,
+            "minScore": RETRIEVAL_PATHWAY_WARMER_MIN_SCORE,
+            "refreshAheadSecs": RETRIEVAL_PATHWAY_WARMER_REFRESH_AHEAD_SECS,
+            "budgetMs": RETRIEVAL_PATHWAY_WARMER_BUDGET_MS,
+            "minSpacingSecs": RETRIEVAL_PATHWAY_WARMER_MIN_SPACING_SECS,
             "state": retrieval_pathway_warmer_state,
             "lettaAsyncWarm": {
                 "enabled": RETRIEVAL_LETTA_ASYNC_WARM_ENABLED,
@@ -4391,8 +6236,29 @@ async def _build_retrieval_metrics_payload(top_limit: int) -> dict[str, Any]:
                 "completed": letta_search_warm_completed,
                 "failed": letta_search_warm_failed,
             },
+            "lettaSearchCache": {
+                "enabled": RETRIEVAL_LETTA_CACHE_ENABLED,
+                "ttlSecs": RETRIEVAL_LETTA_CACHE_TTL_SECS,
+                "maxKeys": RETRIEVAL_LETTA_CACHE_MAX_KEYS,
+                "currentKeys": letta_cache_size,
+                "hits": letta_search_cache_hits,
+                "misses": letta_search_cache_misses,
+                "evictions": letta_search_cache_evictions,
+                "backend": {
+                    "configured": RETRIEVAL_LETTA_CACHE_BACKEND,
+                    "active": _letta_search_cache_backend_enabled(),
+                    **letta_search_cache_backend_stats,
+                },
+            },
         },
         "latency": latency,
+        "hedging": hedging,
+        "sourceRouter": source_router,
+        "emptySourceCache": empty_source_cache,
+        "preferenceContextCache": preference_cache,
+        "mongoTextSearch": mongo_text_search,
+        "mindsdbTermIndex": mindsdb_term_index,
+        "localVectorIndex": local_vector_index,
         "recallQuality": recall_quality,
         "lifecycle": lifecycle_state,
         "alerts": alerts,
@@ -4651,7 +6517,8 @@ async def _run_retrieval_pathway_warm_query(entry: dict[str, Any]) -> bool:
     sources = entry.get("sources") if isinstance(entry.get("sources"), list) else None
     source_weights = entry.get("source_weights") if isinstance(entry.get("source_weights"), dict) else None
     mode = _normalize_retrieval_mode(str(entry.get("retrieval_mode") or RETRIEVAL_MODE_BALANCED))
-    limit = max(1, min(RETRIEVAL_PATHWAY_WARMER_LIMIT, 20))
+    # Replay with the limit live traffic used so the refreshed entry is the one it reads.
+    limit = max(1, min(int(entry.get("limit") or RETRIEVAL_PATHWAY_WARMER_LIMIT), 100))
     await federated_search_memory(
         query,
         limit=limit,
@@ -4663,51 +6530,94 @@ async def _run_retrieval_pathway_warm_query(entry: dict[str, Any]) -> bool:
         rerank_with_learning=False,
         retrieval_mode=mode,
         record_pathway_usage=False,
+        refresh_pathway_cache=True,
     )
     return True
 
 
-async def _warm_retrieval_pathways_once() -> dict[str, Any]:
+def _retrieval_pathway_warm_due_in(entry: dict[str, Any], now: float) -> float:
+    """Seconds until a pathway needs re-warming; <= 0 means it is due now."""
+    if entry.get("invalidated"):
+        return 0.0
+    cached_until = float(entry.get("cached_until_monotonic") or 0.0)
+    return cached_until - RETRIEVAL_PATHWAY_WARMER_REFRESH_AHEAD_SECS - now
+
+
+async def _warm_retrieval_pathways_once(*, force: bool = False) -> dict[str, Any]:
+    """Re-run hot pathways that are about to expire or were invalidated by a write.
+
+    Pathways are ranked by decayed hit score; only those at or above
+    ORCH_RETRIEVAL_PATHWAY_WARMER_MIN_SCORE are considered. ``force`` warms every hot
+    pathway regardless of its expiry. Warms stop once their summed run time reaches
+    ORCH_RETRIEVAL_PATHWAY_WARMER_BUDGET_MS.
+    """
     if not RETRIEVAL_PATHWAY_WARMER_ENABLED:
         return {"enabled": False, "reason": "ORCH_RETRIEVAL_PATHWAY_WARMER_ENABLED=false"}
     started_at = time.monotonic()
-    top_queries = await _list_hot_retrieval_pathways(RETRIEVAL_PATHWAY_WARMER_TOP_QUERIES)
-    if not top_queries:
-        return {
-            "enabled": True,
-            "candidates": 0,
-            "warmed": 0,
-            "skipped": 0,
-            "errors": {},
-            "durationMs": round((time.monotonic() - started_at) * 1000, 2),
-        }
-    semaphore = asyncio.Semaphore(max(1, RETRIEVAL_PATHWAY_WARMER_CONCURRENCY))
+    hot = [
+        entry
+        for entry in await _list_hot_retrieval_pathways(RETRIEVAL_PATHWAY_STATS_MAX_KEYS)
+        if float(entry.get("score") or 0.0) >= RETRIEVAL_PATHWAY_WARMER_MIN_SCORE
+    ]
+    now = time.monotonic()
+    due: list[dict[str, Any]] = []
+    next_due_in: float | None = None
+    for entry in hot:
+        due_in = _retrieval_pathway_warm_due_in(entry, now)
+        if force or due_in <= 0:
+            if len(due) < RETRIEVAL_PATHWAY_WARMER_TOP_QUERIES:
+                due.append(entry)
+        elif next_due_in is None or due_in < next_due_in:
+            next_due_in = due_in
     warmed = 0
     skipped = 0
+    budget_skipped = 0
+    spent_ms = 0.0
     errors: dict[str, str] = {}
-
-    async def _warm(entry: dict[str, Any]) -> None:
-        nonlocal warmed, skipped
-        query = str(entry.get("query") or "").strip()
-        if not query:
-            skipped += 1
-            return
-        async with semaphore:
+    pending = deque(due)
+    cache_ttl = _retrieval_pathway_cache_ttl_secs() if RETRIEVAL_PATHWAY_CACHE_ENABLED else 0.0
+
+    async def _warm_worker() -> None:
+        nonlocal warmed, skipped, budget_skipped, spent_ms
+        while pending:
+            entry = pending.popleft()
+            query = str(entry.get("query") or "").strip()
+            if not query:
+                skipped += 1
+                continue
+            if spent_ms + float(entry.get("warm_cost_ms") or 0.0) > RETRIEVAL_PATHWAY_WARMER_BUDGET_MS:
+                budget_skipped += 1
+                continue
+            warm_started = time.monotonic()
             try:
                 warmed_now = await _run_retrieval_pathway_warm_query(entry)
-                if warmed_now:
-                    warmed += 1
-                else:
-                    skipped += 1
             except Exception as exc:
                 errors[query[:120]] = str(exc)[:240]
+                warmed_now = False
+            cost_ms = (time.monotonic() - warm_started) * 1000
+            spent_ms += cost_ms
+            if warmed_now:
+                warmed += 1
+                await _note_retrieval_pathway_warmed(entry["key"], cost_ms=cost_ms, cached_for_secs=cache_ttl)
+            elif query[:120] not in errors:
+                skipped += 1
 
-    await asyncio.gather(*[_warm(entry) for entry in top_queries], return_exceptions=False)
+    await asyncio.gather(
+        *[_warm_worker() for _ in range(max(1, min(RETRIEVAL_PATHWAY_WARMER_CONCURRENCY, len(due))))],
+        return_exceptions=False,
+    )
+    if budget_skipped:
+        # Whatever the budget pushed out is still due on the next cycle.
+        next_due_in = 0.0
     return {
         "enabled": True,
-        "candidates": len(top_queries),
+        "hot": len(hot),
+        "candidates": len(due),
         "warmed": warmed,
         "skipped": skipped,
+        "budgetSkipped": budget_skipped,
+        "spentMs": round(spent_ms, 2),
+        "nextDueInSecs": round(next_due_in, 2) if next_due_in is not None else None,
         "errors": errors,
         "durationMs": round((time.monotonic() - started_at) * 1000, 2),
     }
@@ -4727,12 +6637,15 @@ def _record_retrieval_pathway_warmer_run(
     if isinstance(result, dict):
         retrieval_pathway_warmer_state["lastWarmed"] = int(result.get("warmed", 0) or 0)
         retrieval_pathway_warmer_state["lastSkipped"] = int(result.get("skipped", 0) or 0)
+        retrieval_pathway_warmer_state["nextDueInSecs"] = result.get("nextDueInSecs")
 
 
 async def _retrieval_pathway_warmer_worker() -> None:
     interval = max(30.0, RETRIEVAL_PATHWAY_WARMER_INTERVAL_SECS)
     while True:
         started = time.monotonic()
+        retrieval_pathway_warmer_wakeup.clear()
+        result: dict[str, Any] = {}
         try:
             result = await _warm_retrieval_pathways_once()
             _record_retrieval_pathway_warmer_run(
@@ -4755,7 +6668,23 @@ async def _retrieval_pathway_warmer_worker() -> None:
                 duration_ms=(time.monotonic() - started) * 1000,
             )
             logger.warning("retrieval pathway warmer run failed: %s", exc)
-        await asyncio.sleep(interval)
+        # Sleep until the next pathway is due (at most the interval) or a write invalidates
+        # a hot one. Wakeups are ignored for the minimum spacing, so write bursts coalesce
+        # into one cycle instead of a busy loop.
+        next_due = result.get("nextDueInSecs")
+        sleep_secs = interval if next_due is None else min(interval, float(next_due))
+        spacing = RETRIEVAL_PATHWAY_WARMER_MIN_SPACING_SECS
+        hold_secs = max(min(1.0, spacing), min(sleep_secs, spacing))
+        await asyncio.sleep(hold_secs)
+        if retrieval_pathway_warmer_wakeup.is_set() and sleep_secs > hold_secs:
+            retrieval_pathway_warmer_state["debouncedWakeups"] = (
+                int(retrieval_pathway_warmer_state.get("debouncedWakeups") or 0) + 1
+            )
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(
+                retrieval_pathway_warmer_wakeup.wait(),
+                timeout=max(0.0, sleep_secs - hold_secs),
+            )
 
 
 def _should_log_http_request(status: int, duration_ms: float) -> bool:
@@ -4941,6 +6870,8 @@ def _configure_prometheus_metrics(app_instance: FastAPI) -> None:
             endpoint=ORCH_PROMETHEUS_ENDPOINT,
             include_in_schema=False,
         )
+        if PROMETHEUS_REGISTRY is not None and GaugeMetricFamily is not None:
+            PROMETHEUS_REGISTRY.register(_RetrievalLatencyCollector())
     except Exception as exc:  # pragma: no cover - optional observability path
         logger.warning("Prometheus instrumentation setup failed: %s", exc)
 
@@ -5039,6 +6970,7 @@ async def start_background_tasks() -> None:
     global memory_bank_queue_tasks, letta_write_queue_tasks, outbox_gc_task, hot_memory_rollup_task
     global topic_rollup_task
     global sink_retention_task, retrieval_pathway_warmer_task, recall_monitor_task, letta_auto_prune_task
+    global qdrant_local_index_task, project_registry_task
     if MONGO_RAW_ENABLED:
         await init_mongo_client()
     if _use_mongo_outbox():
@@ -5097,6 +7029,14 @@ async def start_background_tasks() -> None:
     if TOPIC_ROLLUP_ENABLED and topic_rollup_task is None:
         topic_rollup_task = asyncio.create_task(_topic_rollup_worker())
         asyncio.create_task(rebuild_topic_rollups_once())
+    if _qdrant_local_index_active() and qdrant_local_index_task is None:
+        qdrant_local_index_task = asyncio.create_task(_qdrant_local_index_worker())
+    if MONGO_RAW_ENABLED and RETRIEVAL_MONGO_TEXT_SEARCH_ENABLED:
+        _schedule_mongo_text_search_indexes()
+    if qdrant_models is not None:
+        asyncio.create_task(_apply_qdrant_collection_profile_best_effort())
+        if project_registry_task is None:
+            project_registry_task = asyncio.create_task(_project_registry_worker())
 
 
 @app.on_event("startup")
@@ -5119,7 +7059,7 @@ async def close_mcp_client() -> None:
     global MCP_CLIENT, MCP_SESSION_ID, MONGO_CLIENT, FANOUT_OUTBOX_MONGO_CLIENT, outbox_gc_task, hot_memory_rollup_task
     global topic_rollup_task
     global sink_retention_task, retrieval_pathway_warmer_task, recall_monitor_task, task_scheduler_task, agent_task_worker_tasks
-    global letta_auto_prune_task
+    global letta_auto_prune_task, qdrant_local_index_task, project_registry_task, project_registry_kick_task
     global QDRANT_CLIENT, QDRANT_CLOUD_CLIENT, MINDSDB_CLIENT, LETTA_CLIENT, LANGFUSE_CLIENT
     if task_scheduler_task is not None:
         task_scheduler_task.cancel()
@@ -5174,6 +7114,23 @@ async def close_mcp_client() -> None:
         with contextlib.suppress(asyncio.CancelledError):
             await recall_monitor_task
         recall_monitor_task = None
+    if qdrant_local_index_task is not None:
+        qdrant_local_index_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await qdrant_local_index_task
+        qdrant_local_index_task = None
+    if project_registry_task is not None:
+        project_registry_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await project_registry_task
+        project_registry_task = None
+    if project_registry_kick_task is not None:
+        project_registry_kick_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await project_registry_kick_task
+        project_registry_kick_task = None
+    if project_registry:
+        await _persist_project_registry()
     if MCP_CLIENT is not None:
         await MCP_CLIENT.aclose()
         MCP_CLIENT = None
@@ -5197,6 +7154,7 @@ async def close_mcp_client() -> None:
         await LANGFUSE_CLIENT.aclose()
         LANGFUSE_CLIENT = None
     qdrant_collection_dim_cache.clear()
+    qdrant_collection_profile_state.clear()
     MCP_SESSION_ID = None
     if FANOUT_OUTBOX_MONGO_CLIENT is not None and FANOUT_OUTBOX_MONGO_CLIENT is not MONGO_CLIENT:
         try:
@@ -5243,7 +7201,20 @@ hot_memory_rollup_health: dict[str, Any] = {
     "lastError": None,
 }
 topic_rollup_lock = asyncio.Lock()
+# Serializes snapshot rewrites and delta-log appends.
+topic_rollup_persist_lock = asyncio.Lock()
 topic_rollup_task: asyncio.Task[Any] | None = None
+# Incremental state, reset by every full rebuild: (project, path) pairs changed since
+# the last delta flush, full unique-file sets per topic, and recent write signatures
+# (bounded like the rebuild's history window) for de-duplication.
+topic_rollup_dirty: set[tuple[str, str]] = set()
+topic_rollup_unique_files: dict[tuple[str, str], set[str]] = {}
+topic_rollup_seen_signatures: OrderedDict[str, None] = OrderedDict()
+# Segmented backfill jobs by id (most recent last); checkpoints live in BACKFILL_CHECKPOINT_DIR.
+backfill_jobs_lock = asyncio.Lock()
+backfill_jobs: OrderedDict[str, dict[str, Any]] = OrderedDict()
+backfill_job_tasks: dict[str, asyncio.Task[Any]] = {}
+backfill_checkpoint_lock = asyncio.Lock()
 topic_rollup_backfill_hold_until_monotonic = 0.0
 topic_rollup_index: dict[str, Any] = {
     "generatedAt": None,
@@ -5270,9 +7241,31 @@ topic_rollup_health: dict[str, Any] = {
     "backfillHoldUntil": None,
     "backfillHoldRemainingSecs": 0.0,
     "skippedDueToBackfillHold": 0,
+    "incrementalEnabled": TOPIC_ROLLUP_INCREMENTAL_ENABLED,
+    "incrementalUpdates": 0,
+    "incrementalDuplicates": 0,
+    "deltaFlushes": 0,
+    "deltaLines": 0,
+    "deltaCompactions": 0,
+    "lastDeltaFlushAt": None,
+    "lastDeltaTopics": 0,
+    "lastRepairAt": None,
 }
 topic_tree: Dict[str, Any] = {}
 topic_tree_lock = asyncio.Lock()
+project_registry: dict[str, dict[str, Any]] = {}
+project_registry_lock = asyncio.Lock()
+project_registry_state: dict[str, Any] = {
+    "lastReconciledAt": None,
+    "lastReconcileMethod": None,
+    "lastReconcileError": None,
+    "consecutiveFailures": 0,
+    "lastPruned": 0,
+}
+project_registry_task: asyncio.Task[Any] | None = None
+# On-demand reconcile started by a listing before the first successful pass.
+project_registry_kick_task: asyncio.Task[Any] | None = None
+project_registry_retry_at = 0.0
 task_db_lock = asyncio.Lock()
 task_db_ready = False
 task_scheduler_task: asyncio.Task[Any] | None = None
@@ -5905,6 +7898,29 @@ def _load_topic_tree() -> None:
         logger.warning("Failed to load topic tree: %s", exc)
 
 
+def _load_project_registry() -> None:
+    if not PROJECT_REGISTRY_PATH.exists():
+        # Seed from the persisted topic tree so restarts do not need a Qdrant pass.
+        for project, node in topic_tree.items():
+            if isinstance(project, str) and project:
+                project_registry[project] = {"writes": int((node or {}).get("count", 0) or 0)}
+        return
+    try:
+        with PROJECT_REGISTRY_PATH.open("r", encoding="utf-8") as handle:
+            data = json.load(handle)
+        if isinstance(data, dict):
+            projects = data.get("projects")
+            if isinstance(projects, dict):
+                project_registry.update(
+                    {name: dict(entry) for name, entry in projects.items() if isinstance(entry, dict)}
+                )
+            for key in ("lastReconciledAt", "lastReconcileMethod"):
+                if data.get(key):
+                    project_registry_state[key] = data[key]
+    except Exception as exc:  # pragma: no cover
+        logger.warning("Failed to load project registry: %s", exc)
+
+
 def _topic_rollup_sanitize_text(value: str | None, max_chars: int = 260) -> str:
     text = " ".join(str(value or "").split())
     if max_chars > 0 and len(text) > max_chars:
@@ -5918,9 +7934,13 @@ def _topic_rollup_extract_numeric_facts(
     source_file: str,
     topic_path: str,
     timestamp: str | None,
+    numeric_values: list[str] | None = None,
 ) -> list[dict[str, Any]]:
     if not summary:
         return []
+    if numeric_values is not None and not numeric_values:
+        # Write-time extraction already found no numbers in this summary.
+        return []
     facts: list[dict[str, Any]] = []
     seen: set[str] = set()
     for match in re.finditer(r"(?<![A-Za-z0-9_])[-+]?\d[\d,]*(?:\.\d+)?%?", summary):
@@ -6015,17 +8035,7 @@ def _seed_topic_rollups_from_tree(tree_snapshot: dict[str, Any]) -> dict[str, di
     return seeded
 
 
-def _finalize_topic_rollup_entry(entry: dict[str, Any]) -> dict[str, Any]:
-    unique_files = sorted(
-        file_name
-        for file_name in entry.pop("_unique_files", set())
-        if isinstance(file_name, str) and file_name
-    )
-    entry.pop("_snippet_seen", None)
-    entry.pop("_fact_seen", None)
-    entry["uniqueFileCount"] = len(unique_files)
-    entry["uniqueFiles"] = unique_files[:TOPIC_ROLLUP_MAX_UNIQUE_FILES]
-
+def _topic_rollup_inferences(entry: dict[str, Any]) -> list[str]:
     inferences: list[str] = []
     if int(entry.get("recentEventCount") or 0) > int(entry.get("uniqueFileCount") or 0) and int(
         entry.get("uniqueFileCount") or 0
@@ -6036,7 +8046,26 @@ def _finalize_topic_rollup_entry(entry: dict[str, Any]) -> dict[str, Any]:
         inferences.append("Operational/telemetry topic; lower retrieval priority may reduce noise.")
     if not entry.get("summarySnippets"):
         inferences.append("No recent summary snippets observed for this topic in the local scan window.")
-    entry["inference"] = inferences[:3]
+    return inferences[:3]
+
+
+def _finalize_topic_rollup_entry(
+    entry: dict[str, Any],
+    unique_files_sink: dict[str, set[str]] | None = None,
+) -> dict[str, Any]:
+    file_set = {
+        file_name
+        for file_name in entry.pop("_unique_files", set())
+        if isinstance(file_name, str) and file_name
+    }
+    if unique_files_sink is not None:
+        unique_files_sink[str(entry.get("path") or "")] = file_set
+    unique_files = sorted(file_set)
+    entry.pop("_snippet_seen", None)
+    entry.pop("_fact_seen", None)
+    entry["uniqueFileCount"] = len(unique_files)
+    entry["uniqueFiles"] = unique_files[:TOPIC_ROLLUP_MAX_UNIQUE_FILES]
+    entry["inference"] = _topic_rollup_inferences(entry)
 
     facts = entry.get("numericFacts")
     if isinstance(facts, list) and len(facts) > TOPIC_ROLLUP_MAX_NUMERIC_FACTS:
@@ -6047,26 +8076,139 @@ def _finalize_topic_rollup_entry(entry: dict[str, Any]) -> dict[str, Any]:
     return entry
 
 
+def _topic_rollup_sort_topics(rows: list[dict[str, Any]]) -> None:
+    rows.sort(
+        key=lambda item: (
+            -int(item.get("eventCount") or 0),
+            -int(item.get("recentEventCount") or 0),
+            str(item.get("path") or ""),
+        )
+    )
+
+
+def _topic_rollup_row_signature(project_name: str, file_name: str, summary: str) -> str:
+    return hashlib.sha1(f"{project_name}\n{file_name}\n{summary}".encode("utf-8")).hexdigest()
+
+
+def _topic_rollup_delta_path() -> Path:
+    return TOPIC_ROLLUP_PATH.with_name(f"{TOPIC_ROLLUP_PATH.stem}.delta.jsonl")
+
+
+def _upsert_topic_rollup_entries(index: dict[str, Any], project_name: str, entries: list[dict[str, Any]]) -> None:
+    """Replace (or add) topic entries by path in one project of a rollup index."""
+    projects = index.setdefault("projects", {})
+    project_payload = projects.setdefault(project_name, {"topicCount": 0, "topics": []})
+    rows = project_payload.setdefault("topics", [])
+    positions = {str(item.get("path") or ""): idx for idx, item in enumerate(rows) if isinstance(item, dict)}
+    for entry in entries:
+        path = str(entry.get("path") or "")
+        if path in positions:
+            rows[positions[path]] = entry
+        else:
+            positions[path] = len(rows)
+            rows.append(entry)
+    _topic_rollup_sort_topics(rows)
+    project_payload["topicCount"] = len(rows)
+    index["projectsCount"] = len(projects)
+    index["topicsCount"] = sum(
+        int(payload.get("topicCount") or 0) for payload in projects.values() if isinstance(payload, dict)
+    )
+
+
+def _topic_rollup_delta_record_seq(line: str) -> int | None:
+    try:
+        record = json.loads(line)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(record, dict):
+        return None
+    try:
+        return int(record.get("seq"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _truncate_topic_rollup_deltas(through_seq: int) -> int:
+    """Drop delta records already folded into the snapshot at through_seq; returns records kept.
+
+    Records appended after the snapshot was taken stay in the log, so a snapshot that
+    reaches disk late cannot swallow them.
+    """
+    delta_path = _topic_rollup_delta_path()
+    if not delta_path.exists():
+        return 0
+    with delta_path.open("r", encoding="utf-8") as handle:
+        kept = [line for line in handle if (_topic_rollup_delta_record_seq(line) or 0) > through_seq]
+    if not kept:
+        delta_path.unlink(missing_ok=True)
+        return 0
+    tmp_path = delta_path.with_name(f"{delta_path.name}.tmp")
+    with tmp_path.open("w", encoding="utf-8") as handle:
+        handle.writelines(line if line.endswith("\n") else line + "\n" for line in kept)
+    tmp_path.replace(delta_path)
+    return len(kept)
+
+
+def _replay_topic_rollup_deltas() -> int:
+    """Apply delta-log records written since the last full snapshot; returns records applied."""
+    delta_path = _topic_rollup_delta_path()
+    if not delta_path.exists():
+        return 0
+    snapshot_seq = int(topic_rollup_index.get("deltaSeq") or 0)
+    last_seq = snapshot_seq
+    applied = 0
+    with delta_path.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A torn final line from a crash mid-append; everything before it is intact.
+                continue
+            if not isinstance(record, dict):
+                continue
+            seq = record.get("seq")
+            if isinstance(seq, int):
+                if seq <= snapshot_seq:
+                    # Already folded into the snapshot; the log was not truncated before a crash.
+                    continue
+                last_seq = max(last_seq, seq)
+            by_project: dict[str, list[dict[str, Any]]] = {}
+            for item in record.get("topics") or []:
+                if isinstance(item, dict) and isinstance(item.get("entry"), dict) and item.get("project"):
+                    by_project.setdefault(str(item["project"]), []).append(item["entry"])
+            for project_name, entries in by_project.items():
+                _upsert_topic_rollup_entries(topic_rollup_index, project_name, entries)
+            for key in ("historyEntriesScanned", "historyEntriesDeduped", "updatedAt"):
+                if key in record:
+                    topic_rollup_index[key] = record[key]
+            applied += 1
+    topic_rollup_index["deltaSeq"] = last_seq
+    topic_rollup_health["deltaLines"] = applied
+    return applied
+
+
 def _load_topic_rollup_index() -> None:
-    if not TOPIC_ROLLUP_PATH.exists():
-        return
     try:
-        with TOPIC_ROLLUP_PATH.open("r", encoding="utf-8") as handle:
-            payload = json.load(handle)
-        if isinstance(payload, dict):
-            topic_rollup_index.update(payload)
-            topic_rollup_health["lastGeneratedAt"] = payload.get("generatedAt")
+        if TOPIC_ROLLUP_PATH.exists():
+            with TOPIC_ROLLUP_PATH.open("r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+            if isinstance(payload, dict):
+                topic_rollup_index.update(payload)
+                topic_rollup_health["lastGeneratedAt"] = payload.get("generatedAt")
+        _replay_topic_rollup_deltas()
     except Exception as exc:  # pragma: no cover
         logger.warning("Failed to load topic rollup index: %s", exc)
 
 
 async def _persist_topic_rollup_index(snapshot: dict[str, Any]) -> None:
-    global topic_rollup_last_snapshot_for_delta
+    global topic_rollup_last_snapshot_for_delta, topic_rollup_persisted_delta_seq
 
-    def _write(path: Path, payload: dict[str, Any]) -> None:
+    def _write(path: Path, payload: dict[str, Any]) -> int:
         path.parent.mkdir(parents=True, exist_ok=True)
         with path.open("w", encoding="utf-8") as handle:
             json.dump(payload, handle, indent=2, sort_keys=True)
+        # The snapshot contains every delta up to its own sequence number, and no later.
+        return _truncate_topic_rollup_deltas(int(payload.get("deltaSeq") or 0))
 
     payload = dict(snapshot)
     runtime = await _get_migration_runtime()
@@ -6091,35 +8233,192 @@ async def _persist_topic_rollup_index(snapshot: dict[str, Any]) -> None:
             topic_rollup_last_snapshot_for_delta = runtime.state_delta.apply(previous, delta)
 
     try:
-        await asyncio.to_thread(_write, TOPIC_ROLLUP_PATH, payload)
+        async with topic_rollup_persist_lock:
+            snapshot_seq = int(payload.get("deltaSeq") or 0)
+            if snapshot_seq < topic_rollup_persisted_delta_seq:
+                # A newer snapshot already reached disk while this one waited for the lock.
+                return
+            topic_rollup_health["deltaLines"] = await asyncio.to_thread(_write, TOPIC_ROLLUP_PATH, payload)
+            topic_rollup_persisted_delta_seq = snapshot_seq
     except Exception as exc:  # pragma: no cover
         logger.warning("Failed to persist topic rollup index: %s", exc)
 
 
-def _topic_rollup_hold_remaining_secs(now_monotonic: float | None = None) -> float:
-    now = time.monotonic() if now_monotonic is None else float(now_monotonic)
-    hold_until = float(topic_rollup_backfill_hold_until_monotonic)
-    if hold_until <= 0:
-        return 0.0
-    return max(0.0, hold_until - now)
-
-
-def _topic_rollup_hold_until_iso(now_monotonic: float | None = None) -> str | None:
-    remaining = _topic_rollup_hold_remaining_secs(now_monotonic=now_monotonic)
-    if remaining <= 0:
-        return None
-    hold_until = datetime.now(timezone.utc) + timedelta(seconds=remaining)
-    return hold_until.isoformat().replace("+00:00", "Z")
-
-
-def _refresh_topic_rollup_hold_health(now_monotonic: float | None = None) -> float:
-    remaining = _topic_rollup_hold_remaining_secs(now_monotonic=now_monotonic)
-    topic_rollup_health["backfillHoldRemainingSecs"] = round(remaining, 3)
-    topic_rollup_health["backfillHoldUntil"] = _topic_rollup_hold_until_iso(now_monotonic=now_monotonic)
-    return remaining
-
+async def _apply_topic_rollup_write(row: dict[str, Any]) -> bool:
+    """Fold one persisted write into the rollup index, touching only its topic prefixes.
 
-def _set_topic_rollup_backfill_hold() -> None:
+    Mirrors what a rebuild does for the same row, so a rebuild over the same history
+    yields the same entries. Returns False for duplicates of a recent write.
+    """
+    if not TOPIC_ROLLUP_ENABLED or not TOPIC_ROLLUP_INCREMENTAL_ENABLED:
+        return False
+    project_name = str(row.get("project") or "").strip()
+    if not project_name:
+        return False
+    file_name = str(row.get("file") or "").strip()
+    summary = str(row.get("summary") or "")
+    signature = _topic_rollup_row_signature(project_name, file_name, summary)
+    topic_path = normalize_topic_path(str(row.get("topic_path") or "")) or derive_topic_path(file_name, None)
+    topic_paths = _topic_rollup_path_prefixes(topic_path)
+    timestamp = str(row.get("timestamp") or "").strip() or None
+    summary_snippet = _topic_rollup_sanitize_text(summary, max_chars=260)
+    numeric_facts = _topic_rollup_extract_numeric_facts(
+        summary,
+        source_file=file_name,
+        topic_path=topic_path,
+        timestamp=timestamp,
+        numeric_values=_row_numeric_values(row),
+    )
+    async with topic_rollup_lock:
+        topic_rollup_index["historyEntriesScanned"] = int(topic_rollup_index.get("historyEntriesScanned") or 0) + 1
+        if signature in topic_rollup_seen_signatures:
+            topic_rollup_seen_signatures.move_to_end(signature)
+            topic_rollup_health["incrementalDuplicates"] = int(topic_rollup_health.get("incrementalDuplicates") or 0) + 1
+            # The topic tree still counts a duplicate write, so eventCount keeps mirroring it.
+            project_topics = ((topic_rollup_index.get("projects") or {}).get(project_name) or {}).get("topics") or []
+            for entry in project_topics:
+                if isinstance(entry, dict) and str(entry.get("path") or "") in topic_paths:
+                    entry["eventCount"] = int(entry.get("eventCount") or 0) + 1
+                    topic_rollup_dirty.add((project_name, str(entry["path"])))
+            return False
+        topic_rollup_seen_signatures[signature] = None
+        while len(topic_rollup_seen_signatures) > TOPIC_ROLLUP_HISTORY_SCAN_LIMIT:
+            topic_rollup_seen_signatures.popitem(last=False)
+        topic_rollup_index["historyEntriesDeduped"] = int(topic_rollup_index.get("historyEntriesDeduped") or 0) + 1
+
+        project_payload = (topic_rollup_index.get("projects") or {}).get(project_name) or {}
+        existing = {
+            str(item.get("path") or ""): item
+            for item in (project_payload.get("topics") or [])
+            if isinstance(item, dict)
+        }
+        touched: list[dict[str, Any]] = []
+        for idx, path in enumerate(topic_paths):
+            entry = existing.get(path)
+            if entry is None:
+                entry = _finalize_topic_rollup_entry(_new_topic_rollup_entry(path, event_count=0))
+            if idx < len(topic_paths) - 1:
+                children = set(entry.get("children") or [])
+                children.add(topic_paths[idx + 1])
+                entry["children"] = sorted(children)
+            entry["recentEventCount"] = int(entry.get("recentEventCount") or 0) + 1
+            # The topic tree count this mirrors was bumped by the same write.
+            entry["eventCount"] = max(int(entry.get("eventCount") or 0) + 1, int(entry["recentEventCount"]))
+            if file_name:
+                file_set = topic_rollup_unique_files.setdefault(
+                    (project_name, path),
+                    set(entry.get("uniqueFiles") or []),
+                )
+                if file_name not in file_set:
+                    file_set.add(file_name)
+                    entry["uniqueFileCount"] = max(int(entry.get("uniqueFileCount") or 0) + 1, len(file_set))
+                    entry["uniqueFiles"] = sorted(file_set)[:TOPIC_ROLLUP_MAX_UNIQUE_FILES]
+            if timestamp and (not entry.get("latestTimestamp") or timestamp > str(entry.get("latestTimestamp"))):
+                entry["latestTimestamp"] = timestamp
+            snippets = entry.setdefault("summarySnippets", [])
+            if summary_snippet and summary_snippet not in snippets and len(snippets) < TOPIC_ROLLUP_MAX_SUMMARY_SNIPPETS:
+                snippets.append(summary_snippet)
+            facts = entry.setdefault("numericFacts", [])
+            fact_seen = {f"{fact.get('value')}|{fact.get('sourceFile')}|{fact.get('snippet')}" for fact in facts}
+            for fact in numeric_facts:
+                key = f"{fact.get('value')}|{fact.get('sourceFile')}|{fact.get('snippet')}"
+                if key in fact_seen:
+                    continue
+                if len(facts) >= TOPIC_ROLLUP_MAX_NUMERIC_FACTS:
+                    break
+                fact_seen.add(key)
+                facts.append(fact)
+            entry["inference"] = _topic_rollup_inferences(entry)
+            touched.append(entry)
+            topic_rollup_dirty.add((project_name, path))
+        _upsert_topic_rollup_entries(topic_rollup_index, project_name, touched)
+        topic_rollup_index["updatedAt"] = _utc_now()
+    topic_rollup_health["incrementalUpdates"] = int(topic_rollup_health.get("incrementalUpdates") or 0) + 1
+    return True
+
+
+async def _flush_topic_rollup_deltas() -> int:
+    """Append the entries of dirty topics to the delta log; returns the number flushed.
+
+    Once the log reaches TOPIC_ROLLUP_DELTA_COMPACT_LINES records, the full snapshot is
+    rewritten instead and the log starts over.
+    """
+    async with topic_rollup_lock:
+        if not topic_rollup_dirty:
+            return 0
+        dirty = sorted(topic_rollup_dirty)
+        topic_rollup_dirty.clear()
+        projects = topic_rollup_index.get("projects") or {}
+        by_path: dict[str, dict[str, dict[str, Any]]] = {}
+        topics: list[dict[str, Any]] = []
+        for project_name, path in dirty:
+            if project_name not in by_path:
+                by_path[project_name] = {
+                    str(item.get("path") or ""): item
+                    for item in ((projects.get(project_name) or {}).get("topics") or [])
+                    if isinstance(item, dict)
+                }
+            entry = by_path[project_name].get(path)
+            if entry is not None:
+                topics.append({"project": project_name, "entry": json.loads(json.dumps(entry))})
+        topic_rollup_index["deltaSeq"] = int(topic_rollup_index.get("deltaSeq") or 0) + 1
+        record = {
+            "at": _utc_now(),
+            "seq": topic_rollup_index["deltaSeq"],
+            "historyEntriesScanned": int(topic_rollup_index.get("historyEntriesScanned") or 0),
+            "historyEntriesDeduped": int(topic_rollup_index.get("historyEntriesDeduped") or 0),
+            "updatedAt": topic_rollup_index.get("updatedAt"),
+            "topics": topics,
+        }
+        compact = int(topic_rollup_health.get("deltaLines") or 0) + 1 >= TOPIC_ROLLUP_DELTA_COMPACT_LINES
+        snapshot = json.loads(json.dumps(topic_rollup_index)) if compact else None
+
+    if snapshot is not None:
+        await _persist_topic_rollup_index(snapshot)
+        topic_rollup_health["deltaCompactions"] = int(topic_rollup_health.get("deltaCompactions") or 0) + 1
+    else:
+
+        def _append(path: Path, line: str) -> None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("a", encoding="utf-8") as handle:
+                handle.write(line + "\n")
+
+        try:
+            async with topic_rollup_persist_lock:
+                await asyncio.to_thread(_append, _topic_rollup_delta_path(), json.dumps(record, sort_keys=True))
+                topic_rollup_health["deltaLines"] = int(topic_rollup_health.get("deltaLines") or 0) + 1
+        except Exception as exc:  # pragma: no cover
+            logger.warning("Failed to append topic rollup delta: %s", exc)
+    topic_rollup_health["deltaFlushes"] = int(topic_rollup_health.get("deltaFlushes") or 0) + 1
+    topic_rollup_health["lastDeltaFlushAt"] = _utc_now()
+    topic_rollup_health["lastDeltaTopics"] = len(topics)
+    return len(topics)
+
+
+def _topic_rollup_hold_remaining_secs(now_monotonic: float | None = None) -> float:
+    now = time.monotonic() if now_monotonic is None else float(now_monotonic)
+    hold_until = float(topic_rollup_backfill_hold_until_monotonic)
+    if hold_until <= 0:
+        return 0.0
+    return max(0.0, hold_until - now)
+
+
+def _topic_rollup_hold_until_iso(now_monotonic: float | None = None) -> str | None:
+    remaining = _topic_rollup_hold_remaining_secs(now_monotonic=now_monotonic)
+    if remaining <= 0:
+        return None
+    hold_until = datetime.now(timezone.utc) + timedelta(seconds=remaining)
+    return hold_until.isoformat().replace("+00:00", "Z")
+
+
+def _refresh_topic_rollup_hold_health(now_monotonic: float | None = None) -> float:
+    remaining = _topic_rollup_hold_remaining_secs(now_monotonic=now_monotonic)
+    topic_rollup_health["backfillHoldRemainingSecs"] = round(remaining, 3)
+    topic_rollup_health["backfillHoldUntil"] = _topic_rollup_hold_until_iso(now_monotonic=now_monotonic)
+    return remaining
+
+
+def _set_topic_rollup_backfill_hold() -> None:
     global topic_rollup_backfill_hold_until_monotonic
     if TOPIC_ROLLUP_BACKFILL_HOLD_SECS <= 0:
         topic_rollup_backfill_hold_until_monotonic = 0.0
@@ -6131,7 +8430,9 @@ def _set_topic_rollup_backfill_hold() -> None:
 
 def _topic_rollup_health_snapshot() -> dict[str, Any]:
     _refresh_topic_rollup_hold_health()
-    return dict(topic_rollup_health)
+    snapshot = dict(topic_rollup_health)
+    snapshot["dirtyTopics"] = len(topic_rollup_dirty)
+    return snapshot
 
 
 def _build_topic_rollup_snapshot_from_entries(
@@ -6139,7 +8440,13 @@ def _build_topic_rollup_snapshot_from_entries(
     *,
     tree_snapshot: dict[str, Any],
     scanned_count: int,
+    unique_files_sink: dict[tuple[str, str], set[str]] | None = None,
 ) -> dict[str, Any]:
+    """Rebuild every topic rollup from scratch.
+
+    ``unique_files_sink`` receives the full unique-file set per (project, path), which
+    the finalized entries truncate to TOPIC_ROLLUP_MAX_UNIQUE_FILES.
+    """
     per_project_topics = _seed_topic_rollups_from_tree(tree_snapshot if isinstance(tree_snapshot, dict) else {})
     history_entries_deduped = 0
     seen_history_rows: set[str] = set()
@@ -6150,7 +8457,7 @@ def _build_topic_rollup_snapshot_from_entries(
             continue
         file_name = str(row.get("file") or "").strip()
         summary = str(row.get("summary") or "")
-        signature = hashlib.sha1(f"{project_name}\n{file_name}\n{summary}".encode("utf-8")).hexdigest()
+        signature = _topic_rollup_row_signature(project_name, file_name, summary)
         if signature in seen_history_rows:
             continue
         seen_history_rows.add(signature)
@@ -6166,6 +8473,7 @@ def _build_topic_rollup_snapshot_from_entries(
             source_file=file_name,
             topic_path=topic_path,
             timestamp=timestamp,
+            numeric_values=_row_numeric_values(row),
         )
 
         for idx, path in enumerate(topic_paths):
@@ -6215,15 +8523,13 @@ def _build_topic_rollup_snapshot_from_entries(
     topics_total = 0
     for project_name, topics_by_path in per_project_topics.items():
         rows: list[dict[str, Any]] = []
+        file_sets: dict[str, set[str]] | None = {} if unique_files_sink is not None else None
         for _, entry in topics_by_path.items():
-            rows.append(_finalize_topic_rollup_entry(entry))
-        rows.sort(
-            key=lambda item: (
-                -int(item.get("eventCount") or 0),
-                -int(item.get("recentEventCount") or 0),
-                str(item.get("path") or ""),
-            )
-        )
+            rows.append(_finalize_topic_rollup_entry(entry, file_sets))
+        if unique_files_sink is not None and file_sets is not None:
+            for path, file_set in file_sets.items():
+                unique_files_sink[(project_name, path)] = file_set
+        _topic_rollup_sort_topics(rows)
         topics_total += len(rows)
         projects_payload[project_name] = {
             "topicCount": len(rows),
@@ -6245,10 +8551,28 @@ async def _set_topic_rollup_snapshot(
     *,
     started_at: float,
     source: str,
+    rows: list[dict[str, Any]] | None = None,
+    unique_files: dict[tuple[str, str], set[str]] | None = None,
 ) -> dict[str, Any]:
     async with topic_rollup_lock:
+        # The delta sequence outlives rebuilds so the log can still be truncated against it.
+        snapshot["deltaSeq"] = int(topic_rollup_index.get("deltaSeq") or 0)
         topic_rollup_index.clear()
         topic_rollup_index.update(snapshot)
+        # Incremental updates continue from the rebuilt state.
+        topic_rollup_dirty.clear()
+        topic_rollup_unique_files.clear()
+        topic_rollup_unique_files.update(unique_files or {})
+        topic_rollup_seen_signatures.clear()
+        for row in (rows or [])[-TOPIC_ROLLUP_HISTORY_SCAN_LIMIT:]:
+            project_name = str(row.get("project") or "").strip()
+            if project_name:
+                signature = _topic_rollup_row_signature(
+                    project_name,
+                    str(row.get("file") or "").strip(),
+                    str(row.get("summary") or ""),
+                )
+                topic_rollup_seen_signatures[signature] = None
 
     await _persist_topic_rollup_index(snapshot)
 
@@ -6282,52 +8606,45 @@ async def _topic_rollup_entries_from_qdrant(
     if qdrant_models is None:
         raise OrchestratorError("qdrant-client dependency is required for topic rollup backfill")
     rows: list[dict[str, Any]] = []
-    offset: Any = None
-    remaining = max(1, scan_limit)
-    scroll_filter = None
-    if project:
-        scroll_filter = qdrant_models.Filter(
-            must=[
-                qdrant_models.FieldCondition(
-                    key="project",
-                    match=qdrant_models.MatchValue(value=project),
-                )
-            ]
-        )
-    while remaining > 0:
-        page_limit = min(256, remaining)
-        points, next_offset = await _qdrant_call(
-            "topic_rollup_backfill_scroll",
-            lambda client, _: client.scroll(
-                collection_name=QDRANT_COLLECTION,
-                scroll_filter=scroll_filter,
-                limit=page_limit,
-                offset=offset,
-                with_payload=True,
-                with_vectors=False,
-            ),
-        )
-        if not points:
-            break
-        for point in points:
-            payload = getattr(point, "payload", None) or {}
-            project_name = str(payload.get("project") or "").strip()
-            if not project_name:
-                continue
-            summary = str(payload.get("summary") or "")
+    base_conditions = _qdrant_backfill_base_conditions(project)
+    # The snapshot is built from every row at the end, so there is nothing to resume from.
+    job, _ = await _open_backfill_job(
+        "topic_rollup_qdrant",
+        job_id=None,
+        params={"project": project, "collection": QDRANT_COLLECTION},
+        limit=max(1, scan_limit),
+        checkpoint=False,
+    )
+    job["segments"] = await _qdrant_backfill_segments(QDRANT_COLLECTION, base_conditions, BACKFILL_SEGMENTS)
+
+    async def _process(point: Any) -> bool:
+        payload = getattr(point, "payload", None) or {}
+        project_name = str(payload.get("project") or "").strip()
+        if project_name:
+            ts_value = payload.get("ts")
             rows.append(
                 {
                     "project": project_name,
                     "file": str(payload.get("file") or ""),
                     "topic_path": str(payload.get("topic_path") or ""),
-                    "summary": summary,
+                    "summary": str(payload.get("summary") or ""),
                     "timestamp": _epoch_to_iso_utc(payload.get("ts")),
+                    "numeric_values": payload.get("numeric_values"),
+                    "_ts": float(ts_value) if isinstance(ts_value, (int, float)) else 0.0,
                 }
             )
-        remaining -= len(points)
-        offset = next_offset
-        if offset is None:
-            break
+        return True
+
+    await _run_segmented_backfill(
+        job,
+        fetch_page=_qdrant_backfill_page_fetcher(QDRANT_COLLECTION, base_conditions, "topic_rollup_backfill_scroll"),
+        process_row=_process,
+    )
+    if job["status"] == "failed":
+        raise OrchestratorError(f"topic rollup backfill scroll failed: {'; '.join(job['errors'][:3])}")
+    # Segments finish in any order. Newest first, like the Mongo source, so the capped
+    # snippets and numeric facts of each topic come from its latest rows.
+    rows.sort(key=lambda row: row.pop("_ts"), reverse=True)
     return rows
 
 
@@ -6384,12 +8701,20 @@ async def rebuild_topic_rollups_once() -> dict[str, Any]:
         tree_snapshot = json.loads(json.dumps(topic_tree))
     async with memory_write_history_lock:
         history_snapshot = list(memory_write_history)[-TOPIC_ROLLUP_HISTORY_SCAN_LIMIT:]
+    unique_files: dict[tuple[str, str], set[str]] = {}
     snapshot = _build_topic_rollup_snapshot_from_entries(
         history_snapshot,
         tree_snapshot=tree_snapshot if isinstance(tree_snapshot, dict) else {},
         scanned_count=len(history_snapshot),
+        unique_files_sink=unique_files,
+    )
+    return await _set_topic_rollup_snapshot(
+        snapshot,
+        started_at=started,
+        source="history",
+        rows=history_snapshot,
+        unique_files=unique_files,
     )
-    return await _set_topic_rollup_snapshot(snapshot, started_at=started, source="history")
 
 
 async def backfill_topic_rollups_once(
@@ -6412,15 +8737,19 @@ async def backfill_topic_rollups_once(
             rows = list(memory_write_history)[-max(1, scan_limit):]
     else:
         raise HTTPException(400, "source must be one of: qdrant, mongo_raw, history")
+    unique_files: dict[tuple[str, str], set[str]] = {}
     snapshot = _build_topic_rollup_snapshot_from_entries(
         rows,
         tree_snapshot=tree_snapshot if isinstance(tree_snapshot, dict) else {},
         scanned_count=len(rows),
+        unique_files_sink=unique_files,
     )
     persisted = await _set_topic_rollup_snapshot(
         snapshot,
         started_at=started,
         source=f"backfill:{resolved_source}",
+        rows=rows,
+        unique_files=unique_files,
     )
     topic_rollup_health["lastBackfillAt"] = _utc_now()
     topic_rollup_health["lastBackfillSource"] = resolved_source
@@ -6438,9 +8767,19 @@ async def backfill_topic_rollups_once(
 
 async def _topic_rollup_worker() -> None:
     interval_secs = max(5.0, TOPIC_ROLLUP_FLUSH_SECS)
+    last_repair_monotonic: float | None = None
     while True:
         try:
             await asyncio.sleep(interval_secs)
+            if TOPIC_ROLLUP_INCREMENTAL_ENABLED:
+                await _flush_topic_rollup_deltas()
+                # The write path keeps the index current; rebuilds only repair drift
+                # (the first one also seeds the incremental state).
+                if (
+                    last_repair_monotonic is not None
+                    and time.monotonic() - last_repair_monotonic < TOPIC_ROLLUP_REPAIR_SECS
+                ):
+                    continue
             remaining = _refresh_topic_rollup_hold_health()
             if remaining > 0:
                 topic_rollup_health["skippedDueToBackfillHold"] = int(
@@ -6448,6 +8787,8 @@ async def _topic_rollup_worker() -> None:
                 ) + 1
                 continue
             await rebuild_topic_rollups_once()
+            last_repair_monotonic = time.monotonic()
+            topic_rollup_health["lastRepairAt"] = _utc_now()
         except asyncio.CancelledError:
             raise
         except Exception as exc:  # pragma: no cover
@@ -6469,6 +8810,229 @@ async def _persist_topic_tree() -> None:
         logger.warning("Failed to persist topic tree: %s", exc)
 
 
+async def _persist_project_registry() -> None:
+    def _write(path: Path, payload: dict[str, Any]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2, sort_keys=True)
+
+    async with project_registry_lock:
+        snapshot = {
+            "projects": json.loads(json.dumps(project_registry)),
+            "lastReconciledAt": project_registry_state.get("lastReconciledAt"),
+            "lastReconcileMethod": project_registry_state.get("lastReconcileMethod"),
+        }
+    try:
+        await asyncio.to_thread(_write, PROJECT_REGISTRY_PATH, snapshot)
+    except Exception as exc:  # pragma: no cover
+        logger.warning("Failed to persist project registry: %s", exc)
+
+
+async def _project_registry_touch(projects: list[Any], *, count_write: bool = False) -> None:
+    """Record projects seen on the write path; persists only when a new project appears."""
+    added = False
+    now = _utc_now()
+    async with project_registry_lock:
+        for project in projects:
+            if not isinstance(project, str) or not project:
+                continue
+            entry = project_registry.get(project)
+            if entry is None:
+                if len(project_registry) >= PROJECT_REGISTRY_MAX_PROJECTS:
+                    continue
+                entry = {"first_seen_at": now, "writes": 0}
+                project_registry[project] = entry
+                added = True
+            entry["last_seen_at"] = now
+            if count_write:
+                entry["writes"] = int(entry.get("writes", 0) or 0) + 1
+                entry["last_write_at"] = now
+    if added:
+        await _persist_project_registry()
+
+
+async def _qdrant_project_counts() -> tuple[dict[str, int], str]:
+    """Qdrant projects with point counts, via the facet API or per-project indexed counts."""
+    if qdrant_models is None:
+        raise RuntimeError("qdrant-client dependency is required for Qdrant operations")
+    try:
+        response = await _qdrant_call(
+            "project_facet",
+            lambda client, _: client.facet(
+                collection_name=QDRANT_COLLECTION,
+                key="project",
+                limit=PROJECT_REGISTRY_MAX_PROJECTS,
+                exact=False,
+            ),
+        )
+        counts = {
+            str(hit.value): int(hit.count or 0)
+            for hit in (getattr(response, "hits", None) or [])
+            if isinstance(hit.value, str) and hit.value
+        }
+        return counts, "facet"
+    except Exception as exc:
+        logger.info("Qdrant facet unavailable for project registry (%s); using per-project counts", str(exc)[:200])
+
+    # Without facets, count each known project on the project keyword index: O(projects)
+    # indexed counts rather than a pass over every point. Projects new to Qdrant are
+    # registered by writes until a facet-capable server is available.
+    async with project_registry_lock:
+        known = sorted(project_registry)
+    semaphore = asyncio.Semaphore(PROJECT_REGISTRY_COUNT_CONCURRENCY)
+
+    async def _count(project: str, exact: bool) -> int:
+        count_filter = qdrant_models.Filter(
+            must=[qdrant_models.FieldCondition(key="project", match=qdrant_models.MatchValue(value=project))]
+        )
+        async with semaphore:
+            response = await _qdrant_call(
+                "project_count",
+                lambda client, _: client.count(
+                    collection_name=QDRANT_COLLECTION,
+                    count_filter=count_filter,
+                    exact=exact,
+                ),
+            )
+        return int(getattr(response, "count", 0) or 0)
+
+    estimates = await asyncio.gather(*(_count(project, False) for project in known))
+    counts = dict(zip(known, estimates))
+    # Estimates can round a small project down to 0; confirm before it becomes a prune candidate.
+    empty = [project for project, points in counts.items() if points <= 0]
+    for project, points in zip(empty, await asyncio.gather(*(_count(project, True) for project in empty))):
+        counts[project] = points
+    return {project: points for project, points in counts.items() if points > 0}, "count"
+
+
+async def _project_registry_projects_elsewhere(projects: list[str]) -> set[str] | None:
+    """Which of ``projects`` still exist in the memory bank or Mongo raw.
+
+    None when a source could not be checked, so the caller does not prune on a guess.
+    """
+    if not projects:
+        return set()
+    found: set[str] = set()
+    try:
+        result = await asyncio.wait_for(
+            call_memory_tool("list_projects", {}),
+            timeout=MEMMCP_LIST_TIMEOUT_SECS,
+        )
+    except Exception as exc:
+        logger.info("Project registry prune skipped; memory bank unavailable: %s", exc)
+        return None
+    found.update(set(_parse_mcp_name_list(result)) & set(projects))
+    if MONGO_RAW_ENABLED:
+        if not await init_mongo_client():
+            return None
+        assert MONGO_CLIENT is not None
+        coll = MONGO_CLIENT[MONGO_RAW_DB][MONGO_RAW_COLLECTION]
+
+        def _present() -> set[str]:
+            # One indexed lookup per candidate on the (project, updated_at) index.
+            return {
+                project
+                for project in projects
+                if project not in found and coll.find_one({"project": project}, projection={"_id": 1})
+            }
+
+        try:
+            found.update(await asyncio.to_thread(_present))
+        except Exception as exc:
+            logger.info("Project registry prune skipped; Mongo raw unavailable: %s", exc)
+            return None
+    return found
+
+
+async def reconcile_project_registry_once() -> dict[str, Any]:
+    """Merge Qdrant's project list and point counts into the registry.
+
+    A project is pruned only when it has no Qdrant points, is absent from the memory
+    bank and Mongo raw, and no write registered it while the counts were collected.
+    """
+    global project_registry_retry_at
+    started = _utc_now()
+    try:
+        counts, method = await _qdrant_project_counts()
+    except Exception as exc:
+        failures = int(project_registry_state.get("consecutiveFailures", 0) or 0) + 1
+        project_registry_state["consecutiveFailures"] = failures
+        project_registry_state["lastReconcileError"] = str(exc)[:300]
+        project_registry_retry_at = time.monotonic() + _project_registry_retry_delay(failures)
+        raise
+    now = _utc_now()
+    # A capped facet response may have left projects out; only prune complete counts.
+    complete = len(counts) < PROJECT_REGISTRY_MAX_PROJECTS
+    candidates: list[str] = []
+    async with project_registry_lock:
+        added = [project for project in counts if project not in project_registry]
+        for project, points in counts.items():
+            entry = project_registry.setdefault(project, {"first_seen_at": now, "writes": 0})
+            entry["qdrant_points"] = points
+        for project, entry in project_registry.items():
+            if int(counts.get(project, 0) or 0) > 0:
+                continue
+            entry["qdrant_points"] = 0
+            touched_at = str(entry.get("last_seen_at") or entry.get("first_seen_at") or "")
+            if complete and touched_at < started:
+                candidates.append(project)
+    elsewhere = await _project_registry_projects_elsewhere(candidates)
+    pruned: list[str] = []
+    async with project_registry_lock:
+        if elsewhere is not None:
+            for project in candidates:
+                entry = project_registry.get(project)
+                if entry is None or project in elsewhere:
+                    continue
+                touched_at = str(entry.get("last_seen_at") or entry.get("first_seen_at") or "")
+                if touched_at < started:
+                    del project_registry[project]
+                    pruned.append(project)
+        project_registry_state["lastReconciledAt"] = now
+        project_registry_state["lastReconcileMethod"] = method
+        project_registry_state["lastReconcileError"] = None
+        project_registry_state["consecutiveFailures"] = 0
+        project_registry_state["lastPruned"] = len(pruned)
+        total = len(project_registry)
+    project_registry_retry_at = 0.0
+    await _persist_project_registry()
+    return {"ok": True, "method": method, "projects": total, "added": sorted(added), "pruned": sorted(pruned)}
+
+
+def _project_registry_retry_delay(failures: int) -> float:
+    return min(PROJECT_REGISTRY_RECONCILE_SECS, PROJECT_REGISTRY_RETRY_SECS * (2 ** max(0, min(failures, 16) - 1)))
+
+
+def _kick_project_registry_reconcile() -> None:
+    """Start a background reconcile unless one is running or the retry backoff is pending."""
+    global project_registry_kick_task
+    if project_registry_kick_task is not None and not project_registry_kick_task.done():
+        return
+    if time.monotonic() < project_registry_retry_at:
+        return
+
+    async def _run() -> None:
+        try:
+            await reconcile_project_registry_once()
+        except Exception as exc:
+            logger.warning("Project registry reconcile failed: %s", exc)
+
+    project_registry_kick_task = asyncio.create_task(_run())
+
+
+async def _project_registry_worker() -> None:
+    while True:
+        delay = PROJECT_REGISTRY_RECONCILE_SECS
+        try:
+            await reconcile_project_registry_once()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # pragma: no cover
+            logger.warning("Project registry reconcile failed: %s", exc)
+            delay = _project_registry_retry_delay(int(project_registry_state.get("consecutiveFailures", 0) or 1))
+        await asyncio.sleep(delay)
+
+
 async def _update_topic_tree(project: str, topic_path: str) -> None:
     segments = [seg for seg in topic_path.split("/") if seg]
     async with topic_tree_lock:
@@ -7114,7 +9678,7 @@ def build_raw_memory_event(
     source: str = "memory.write",
 ) -> dict[str, Any]:
     created_at = _utc_now()
-    return {
+    event = {
         "event_id": event_id,
         "source": source,
         "project": project,
@@ -7127,6 +9691,9 @@ def build_raw_memory_event(
         "created_at": created_at,
         "updated_at": created_at,
     }
+    # Features follow the text Mongo retrieval returns as the row summary.
+    event.update(_memory_text_features(summary or content[:RETRIEVAL_MONGO_SNIPPET_CHARS]))
+    return event
 
 
 async def init_mongo_client() -> bool:
@@ -8833,6 +11400,7 @@ async def _run_qdrant_low_value_retention_once() -> dict[str, Any]:
             )
         except Exception as exc:
             raise OrchestratorError(f"Qdrant retention delete failed: {exc}") from exc
+        await _qdrant_local_index_remove(QDRANT_COLLECTION, id_batch)
         deleted += len(id_batch)
     return {
         "enabled": True,
@@ -9291,6 +11859,78 @@ def _feedback_row_to_dict(row: sqlite3.Row) -> dict[str, Any]:
     }
 
 
+preference_context_cache_lock = asyncio.Lock()
+preference_context_cache: OrderedDict[tuple[str, str], dict[str, Any]] = OrderedDict()
+# Bumped by every invalidation so a fetch that raced a feedback write is not cached.
+preference_context_cache_generation = 0
+preference_context_cache_stats: dict[str, int] = {
+    "hits": 0,
+    "misses": 0,
+    "invalidations": 0,
+    "evictions": 0,
+    "overlapped": 0,
+}
+
+
+def _preference_context_cache_scopes(project: str | None, user_id: str | None) -> list[tuple[str, str]]:
+    """Cache keys whose feedback query would return a record for (project, user_id).
+
+    A blank project or user in a key means that filter was not applied.
+    """
+    projects = {"", project or ""}
+    users = {"", user_id or ""}
+    return [(project_key, user_key) for project_key in projects for user_key in users]
+
+
+async def _preference_context_cache_invalidate(project: str | None, user_id: str | None) -> None:
+    global preference_context_cache_generation
+    async with preference_context_cache_lock:
+        preference_context_cache_generation += 1
+        for key in _preference_context_cache_scopes(project, user_id):
+            if preference_context_cache.pop(key, None) is not None:
+                preference_context_cache_stats["invalidations"] += 1
+
+
+async def get_preference_context(project: str | None, user_id: str | None) -> dict[str, Any]:
+    """Preference context built from the latest PREFERENCE_MAX_ENTRIES feedback records."""
+    key = (project or "", user_id or "")
+    if PREFERENCE_CACHE_TTL_SECS > 0:
+        async with preference_context_cache_lock:
+            entry = preference_context_cache.get(key)
+            if entry is not None and entry["expires_monotonic"] > time.monotonic():
+                preference_context_cache.move_to_end(key)
+                preference_context_cache_stats["hits"] += 1
+                return entry["context"]
+            preference_context_cache_stats["misses"] += 1
+            generation = preference_context_cache_generation
+    records = await list_feedback_records(project, user_id, None, PREFERENCE_MAX_ENTRIES)
+    context = build_preference_context(records)
+    if PREFERENCE_CACHE_TTL_SECS > 0:
+        async with preference_context_cache_lock:
+            if generation == preference_context_cache_generation:
+                preference_context_cache[key] = {
+                    "context": context,
+                    "expires_monotonic": time.monotonic() + PREFERENCE_CACHE_TTL_SECS,
+                }
+                preference_context_cache.move_to_end(key)
+                while len(preference_context_cache) > PREFERENCE_CACHE_MAX_KEYS:
+                    preference_context_cache.popitem(last=False)
+                    preference_context_cache_stats["evictions"] += 1
+    return context
+
+
+async def _preference_context_cache_snapshot() -> dict[str, Any]:
+    async with preference_context_cache_lock:
+        stats = dict(preference_context_cache_stats)
+        current_keys = len(preference_context_cache)
+    return {
+        "ttlSecs": PREFERENCE_CACHE_TTL_SECS,
+        "maxKeys": PREFERENCE_CACHE_MAX_KEYS,
+        "currentKeys": current_keys,
+        **stats,
+    }
+
+
 async def create_feedback_record(
     project: str | None,
     user_id: str | None,
@@ -9338,7 +11978,9 @@ async def create_feedback_record(
         row = conn.execute("SELECT * FROM feedback WHERE id = ?", (feedback_id,)).fetchone()
         return _feedback_row_to_dict(row)
 
-    return await _task_db_exec(_create)
+    record = await _task_db_exec(_create)
+    await _preference_context_cache_invalidate(project, user_id)
+    return record
 
 
 async def list_feedback_records(
@@ -10350,6 +12992,7 @@ async def _task_scheduler_worker() -> None:
 _load_override_history()
 _load_memory_write_history()
 _load_topic_tree()
+_load_project_registry()
 _load_topic_rollup_index()
 _load_agent_memory_profiles()
 _load_recall_monitor_history()
@@ -10864,22 +13507,103 @@ def _query_terms(query: str, max_terms: int = 8) -> list[str]:
     return terms
 
 
+class CompiledQuery:
+    """Query-derived matching state built once per search and shared by every scorer.
+
+    Holds the normalized phrase, query terms, learning terms and numeric tokens so
+    per-row scoring only lowercases the row and runs substring scans.
+    """
+
+    __slots__ = (
+        "phrase",
+        "terms",
+        "numeric_values",
+        "positive_terms",
+        "negative_terms",
+        "_scan_terms",
+    )
+
+    def __init__(
+        self,
+        query: str,
+        *,
+        positive_terms: set[str] | None = None,
+        negative_terms: set[str] | None = None,
+    ) -> None:
+        self.phrase = re.sub(r"\s+", " ", str(query or "").strip().lower())
+        self.terms = tuple(_query_terms(self.phrase, max_terms=10)) if self.phrase else ()
+        self.numeric_values = frozenset(_extract_numeric_values_verbatim(self.phrase, limit=16))
+        self.positive_terms = frozenset(positive_terms or ())
+        self.negative_terms = frozenset(negative_terms or ())
+        # Query and learning terms overlap often; scan each distinct term once per row.
+        self._scan_terms = tuple(
+            dict.fromkeys([*self.terms, *sorted(self.positive_terms), *sorted(self.negative_terms)])
+        )
+
+    def term_hits(
+        self,
+        body: str,
+        *,
+        stored_terms: frozenset[str] | None = None,
+        header: str = "",
+    ) -> set[str]:
+        """Distinct query/learning terms present in an already-lowercased body.
+
+        With write-time ``stored_terms`` for the summary, terms are looked up in that
+        set and only the short lowercased ``header`` (project/file) is scanned.
+        """
+        if stored_terms is not None:
+            return {term for term in self._scan_terms if term in stored_terms or term in header}
+        return {term for term in self._scan_terms if term in body}
+
+    def match_score(self, text: str, *, lowered: bool = False, hits: set[str] | None = None) -> float:
+        body = text if lowered else (text or "").lower()
+        if not self.phrase or not body:
+            return 0.0
+        if self.phrase in body:
+            # Full phrase matches are strongly preferred.
+            return 1.0
+        if not self.terms:
+            return 0.0
+        if hits is None:
+            matched = sum(1 for term in self.terms if term in body)
+        else:
+            matched = sum(1 for term in self.terms if term in hits)
+        if matched <= 0:
+            return 0.0
+        density = min(1.0, len(body) / 4000.0)
+        return min(0.95, (matched / len(self.terms)) * (0.55 + 0.45 * density))
+
+    def learning_hits(self, hits: set[str]) -> tuple[int, int]:
+        return len(hits & self.positive_terms), len(hits & self.negative_terms)
+
+    def numeric_overlap(
+        self,
+        body: str,
+        *,
+        stored_values: list[str] | None = None,
+        header: str = "",
+    ) -> tuple[int, bool]:
+        """Return (query numeric tokens found in body, whether body has any numeric token).
+
+        With write-time ``stored_values`` for the summary, only the short ``header``
+        (project/file) part of the body is scanned.
+        """
+        if not self.numeric_values:
+            return 0, False
+        if stored_values is not None:
+            row_values = set(stored_values)
+            if header:
+                row_values.update(_NUMERIC_TOKEN_RE.findall(header))
+            return len(self.numeric_values & row_values), bool(row_values)
+        if any(value in body for value in self.numeric_values):
+            row_values = set(_NUMERIC_TOKEN_RE.findall(body))
+            return len(self.numeric_values & row_values), bool(row_values)
+        return 0, _NUMERIC_TOKEN_RE.search(body) is not None
+
+
 def _text_match_score(query: str, text: str) -> float:
-    query_text = (query or "").strip().lower()
-    body = (text or "").lower()
-    if not query_text or not body:
-        return 0.0
-    if query_text in body:
-        # Full phrase matches are strongly preferred.
-        return 1.0
-    terms = _query_terms(query_text, max_terms=10)
-    if not terms:
-        return 0.0
-    hits = sum(1 for term in terms if term in body)
-    if hits <= 0:
-        return 0.0
-    density = min(1.0, len(body) / 4000.0)
-    return min(0.95, (hits / max(1, len(terms))) * (0.55 + 0.45 * density))
+    return CompiledQuery(query).match_score(text)
 
 
 def _next_retrieval_mode(mode: str) -> str:
@@ -10947,10 +13671,13 @@ def _is_result_stale(row: dict[str, Any]) -> bool:
     return parsed < cutoff
 
 
+_NUMERIC_TOKEN_RE = re.compile(r"(?<![A-Za-z0-9_])[-+]?\$?\d[\d,]*(?:\.\d+)?%?")
+
+
 def _extract_numeric_values_verbatim(text: str, limit: int = RECALL_NUMERIC_FACTS_MAX) -> list[str]:
     values: list[str] = []
     seen: set[str] = set()
-    for match in re.finditer(r"(?<![A-Za-z0-9_])[-+]?\$?\d[\d,]*(?:\.\d+)?%?", str(text or "")):
+    for match in _NUMERIC_TOKEN_RE.finditer(str(text or "")):
         token = str(match.group(0) or "").strip()
         if not token or token in seen:
             continue
@@ -10961,6 +13688,47 @@ def _extract_numeric_values_verbatim(text: str, limit: int = RECALL_NUMERIC_FACT
     return values
 
 
+def _summary_fingerprint(summary: str) -> str:
+    normalized = str(summary or "").strip().lower()
+    if not normalized:
+        return ""
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+
+def _memory_text_features(summary: str) -> dict[str, Any]:
+    """Numeric tokens, normalized terms and a fingerprint for a stored summary.
+
+    Computed once on the write path and stored alongside the summary in sink payloads,
+    so retrieval reuses them instead of re-parsing result text.
+    """
+    text = str(summary or "")
+    return {
+        "numeric_values": _extract_numeric_values_verbatim(text, limit=RECALL_NUMERIC_FACTS_MAX),
+        "terms": _query_terms(text, max_terms=MEMORY_FEATURE_MAX_TERMS),
+        "content_fingerprint": _summary_fingerprint(text),
+    }
+
+
+def _row_numeric_values(row: dict[str, Any]) -> list[str] | None:
+    """Write-time numeric tokens carried by a result row, or None for legacy records."""
+    values = row.get("numeric_values")
+    if not isinstance(values, list):
+        return None
+    return [str(value) for value in values if value]
+
+
+def _row_terms(row: dict[str, Any]) -> frozenset[str] | None:
+    """Write-time normalized terms carried by a result row.
+
+    None for legacy records and for term lists that reached the cap, since those may
+    be missing terms from the tail of the summary.
+    """
+    terms = row.get("terms")
+    if not isinstance(terms, list) or len(terms) >= MEMORY_FEATURE_MAX_TERMS:
+        return None
+    return frozenset(str(term) for term in terms if term)
+
+
 def _build_grounding_payload(results: list[dict[str, Any]]) -> dict[str, Any]:
     facts: list[dict[str, Any]] = []
     numeric_facts: list[dict[str, Any]] = []
@@ -10980,7 +13748,12 @@ def _build_grounding_payload(results: list[dict[str, Any]]) -> dict[str, Any]:
             "topic_path": row.get("topic_path"),
             "timestamp": _result_timestamp_iso(row),
         }
-        numeric_values = _extract_numeric_values_verbatim(summary)
+        stored_values = _row_numeric_values(row)
+        if stored_values is None:
+            numeric_values = _extract_numeric_values_verbatim(summary)
+        else:
+            # Keep the verbatim guarantee: only values present in the (possibly truncated) snippet.
+            numeric_values = [value for value in stored_values if value in summary]
         fact = {
             "id": f"fact_{index}",
             "fact": summary,
@@ -11471,6 +14244,13 @@ async def call_memory_tool(name: str, arguments: dict[str, Any]) -> dict[str, An
     error_message = _mcp_result_error_message(result)
     if error_message:
         raise HTTPException(500, f"{name} failed: {error_message}")
+    if name == "memory_bank_write":
+        # Every write path funnels through here, so cached content and not-found
+        # markers for the file are dropped as soon as the write lands.
+        await _memory_read_cache_invalidate(
+            str(arguments.get("projectName") or ""),
+            str(arguments.get("fileName") or ""),
+        )
     return result
 
 
@@ -11570,33 +14350,17 @@ async def list_qdrant_files(project: str, limit: int = 1000) -> list[str]:
 
 
 async def list_qdrant_projects(limit: int = 5000) -> list[str]:
-    projects: set[str] = set()
-    offset: Any = None
-    remaining = max(0, limit)
-    if remaining == 0:
+    """Known project names from the project registry.
+
+    Never blocks on Qdrant: before the first successful reconcile the registry is served
+    as-is (seeded from writes and the topic tree) while a reconcile runs in the background.
+    """
+    if limit <= 0:
         return []
-    while remaining > 0:
-        page_limit = min(remaining, 256)
-        points, next_offset = await _qdrant_call(
-            "list_projects_scroll",
-            lambda client, _: client.scroll(
-                collection_name=QDRANT_COLLECTION,
-                limit=page_limit,
-                offset=offset,
-                with_payload=True,
-                with_vectors=False,
-            ),
-        )
-        for point in points:
-            payload_row = getattr(point, "payload", None) or {}
-            project_name = payload_row.get("project")
-            if isinstance(project_name, str) and project_name:
-                projects.add(project_name)
-        remaining -= len(points)
-        offset = next_offset
-        if not points or offset is None:
-            break
-    return sorted(projects)
+    if not project_registry_state.get("lastReconciledAt"):
+        _kick_project_registry_reconcile()
+    async with project_registry_lock:
+        return sorted(project_registry)[:limit]
 
 
 def _memory_read_cache_key(project: str, file_name: str) -> str:
@@ -11605,6 +14369,126 @@ def _memory_read_cache_key(project: str, file_name: str) -> str:
     return f"{project_token}::{file_token}"
 
 
+def _memory_read_cache_l2_enabled() -> bool:
+    return (
+        MEMMCP_READ_CACHE_L2_ENABLED
+        and bool(RETRIEVAL_PATHWAY_REDIS_URL)
+        and redis_async is not None
+    )
+
+
+def _memory_read_cache_l2_keys(key: str) -> tuple[str, str]:
+    """Redis keys for a cache entry: the compressed body and its content hash."""
+    return f"{MEMMCP_READ_CACHE_L2_PREFIX}c:{key}", f"{MEMMCP_READ_CACHE_L2_PREFIX}h:{key}"
+
+
+def _content_sha256(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _serialize_memory_read_cache_l2(content: str, digest: str) -> bytes:
+    payload = {"content": content, "sha256": digest, "fetched_at": time.time()}
+    if orjson is not None:
+        raw = orjson.dumps(payload)
+    else:
+        raw = json.dumps(payload).encode("utf-8")
+    return b"z:" + zlib.compress(raw, level=1)
+
+
+def _deserialize_memory_read_cache_l2(raw: Any) -> dict[str, Any] | None:
+    """Decoded L2 entry, or None if it is malformed or its body does not match its hash."""
+    if not isinstance(raw, (bytes, bytearray)) or not bytes(raw).startswith(b"z:"):
+        return None
+    try:
+        decoded = zlib.decompress(bytes(raw)[2:])
+        parsed = orjson.loads(decoded) if orjson is not None else json.loads(decoded.decode("utf-8"))
+    except Exception:
+        return None
+    if not isinstance(parsed, dict) or not isinstance(parsed.get("content"), str):
+        return None
+    if _content_sha256(parsed["content"]) != parsed.get("sha256"):
+        memory_read_cache_l2_stats["hashMismatches"] += 1
+        return None
+    return parsed
+
+
+def _memory_read_cache_record_latency(tier: str, started: float) -> None:
+    sketch = memory_read_cache_tier_latency.get(tier)
+    if sketch is None:
+        sketch = WindowedLatencySketch(RETRIEVAL_LATENCY_WINDOWS[RETRIEVAL_LATENCY_SNAPSHOT_WINDOW])
+        memory_read_cache_tier_latency[tier] = sketch
+    now = time.monotonic()
+    sketch.record((now - started) * 1000.0, now)
+
+
+async def _memory_read_cache_l2_fetch(
+    keys: list[str],
+    hash_keys: list[str],
+) -> tuple[dict[str, dict[str, Any]], dict[str, str | None] | None]:
+    """One Redis round trip: decoded bodies for ``keys`` and current hashes for ``hash_keys``.
+
+    Hashes are None when Redis failed, so callers keep what they already have.
+    """
+    if not keys and not hash_keys:
+        return {}, {}
+    client = await _get_retrieval_pathway_redis_client()
+    if client is None:
+        return {}, None
+    started = time.monotonic()
+    try:
+        pipe = client.pipeline(transaction=False)
+        if keys:
+            pipe.mget([_memory_read_cache_l2_keys(key)[0] for key in keys])
+        if hash_keys:
+            pipe.mget([_memory_read_cache_l2_keys(key)[1] for key in hash_keys])
+        replies = await asyncio.wait_for(pipe.execute(), timeout=RETRIEVAL_PATHWAY_REDIS_TIMEOUT_SECS)
+    except Exception as exc:
+        memory_read_cache_l2_stats["errors"] += 1
+        logger.debug("Memory read cache L2 get failed: %s", exc)
+        return {}, None
+    finally:
+        _memory_read_cache_record_latency("l2", started)
+    bodies: dict[str, dict[str, Any]] = {}
+    if keys:
+        for key, raw in zip(keys, replies[0] or []):
+            entry = _deserialize_memory_read_cache_l2(raw) if raw is not None else None
+            if entry is None:
+                memory_read_cache_l2_stats["misses"] += 1
+                continue
+            memory_read_cache_l2_stats["hits"] += 1
+            bodies[key] = entry
+    hashes: dict[str, str | None] = {}
+    if hash_keys:
+        for key, raw in zip(hash_keys, replies[-1] or []):
+            hashes[key] = bytes(raw).decode("ascii", errors="ignore") if raw is not None else None
+    return bodies, hashes
+
+
+def _memory_read_cache_l1_payload(content: str, digest: str, age_secs: float = 0.0) -> dict[str, Any]:
+    now = time.monotonic()
+    return {
+        "content": content,
+        "sha256": digest,
+        "fetched_at": _utc_now(),
+        "fetched_monotonic": now - max(0.0, age_secs),
+        "validated_monotonic": now,
+    }
+
+
+async def _memory_read_cache_l1_store(key: str, payload: dict[str, Any]) -> dict[str, Any] | None:
+    """Insert into the process tier; returns the entry it replaced."""
+    global memory_read_cache_evictions, memory_read_cache_writes
+    async with memory_read_cache_lock:
+        previous = memory_read_cache.get(key)
+        memory_read_cache[key] = payload
+        memory_read_cache.move_to_end(key)
+        memory_read_cache_writes += 1
+        while len(memory_read_cache) > MEMMCP_READ_CACHE_MAX_KEYS:
+            memory_read_cache.popitem(last=False)
+            memory_read_cache_evictions += 1
+    return previous if isinstance(previous, dict) else None
+
+
 async def _memory_read_cache_get(
     project: str,
     file_name: str,
@@ -11637,29 +14521,176 @@ async def _memory_read_cache_get(
         for stale_key in stale_keys:
             memory_read_cache.pop(stale_key, None)
     memory_read_cache_misses += 1
+    if _memory_read_cache_l2_enabled():
+        bodies, _ = await _memory_read_cache_l2_fetch([key], [])
+        entry = bodies.get(key)
+        if entry is not None:
+            age_secs = max(0.0, time.time() - float(entry.get("fetched_at") or 0.0))
+            is_fresh = age_secs <= MEMMCP_READ_CACHE_FRESH_TTL_SECS
+            if is_fresh or (allow_stale and age_secs <= MEMMCP_READ_CACHE_STALE_MAX_SECS):
+                await _memory_read_cache_l1_store(
+                    key,
+                    _memory_read_cache_l1_payload(entry["content"], entry["sha256"], age_secs),
+                )
+                return entry["content"], (not is_fresh)
     return None
 
 
+async def _memory_read_cache_get_many(
+    pairs: list[tuple[str, str]],
+) -> dict[tuple[str, str], str]:
+    """Fresh cached contents for several (project, file) pairs under one lock acquisition.
+
+    With the Redis L2 enabled, L1 misses are looked up there and L1 hits older than
+    the revalidation interval are checked against the L2 content hash, all in one
+    round trip. An L1 entry whose hash was invalidated or replaced elsewhere is
+    dropped, so the caller rereads it.
+    """
+    global memory_read_cache_hits, memory_read_cache_misses
+    if MEMMCP_READ_CACHE_MAX_KEYS <= 0 or not pairs:
+        return {}
+    started = time.monotonic()
+    now = started
+    l2_enabled = _memory_read_cache_l2_enabled()
+    found: dict[tuple[str, str], str] = {}
+    missing: dict[str, tuple[str, str]] = {}
+    revalidate: dict[str, tuple[tuple[str, str], str]] = {}
+    async with memory_read_cache_lock:
+        for project, file_name in pairs:
+            key = _memory_read_cache_key(project, file_name)
+            payload = memory_read_cache.get(key)
+            if isinstance(payload, dict):
+                content = payload.get("content")
+                fetched_monotonic = float(payload.get("fetched_monotonic") or 0.0)
+                if (
+                    isinstance(content, str)
+                    and fetched_monotonic > 0
+                    and now - fetched_monotonic <= MEMMCP_READ_CACHE_FRESH_TTL_SECS
+                ):
+                    memory_read_cache.move_to_end(key)
+                    memory_read_cache_hits += 1
+                    found[(project, file_name)] = content
+                    validated = float(payload.get("validated_monotonic") or fetched_monotonic)
+                    if l2_enabled and payload.get("sha256") and now - validated > MEMMCP_READ_CACHE_L2_REVALIDATE_SECS:
+                        revalidate[key] = ((project, file_name), str(payload["sha256"]))
+                    continue
+            memory_read_cache_misses += 1
+            missing[key] = (project, file_name)
+    _memory_read_cache_record_latency("l1", started)
+    if not l2_enabled or not (missing or revalidate):
+        return found
+    bodies, hashes = await _memory_read_cache_l2_fetch(list(missing), list(revalidate))
+    if hashes is not None:
+        for key, (pair, digest) in revalidate.items():
+            if hashes.get(key) == digest:
+                memory_read_cache_l2_stats["revalidated"] += 1
+                async with memory_read_cache_lock:
+                    payload = memory_read_cache.get(key)
+                    if isinstance(payload, dict):
+                        payload["validated_monotonic"] = time.monotonic()
+                continue
+            memory_read_cache_l2_stats["revalidationDrops"] += 1
+            found.pop(pair, None)
+            async with memory_read_cache_lock:
+                memory_read_cache.pop(key, None)
+    for key, entry in bodies.items():
+        age_secs = max(0.0, time.time() - float(entry.get("fetched_at") or 0.0))
+        if age_secs > MEMMCP_READ_CACHE_FRESH_TTL_SECS:
+            continue
+        found[missing[key]] = entry["content"]
+        await _memory_read_cache_l1_store(
+            key,
+            _memory_read_cache_l1_payload(entry["content"], entry["sha256"], age_secs),
+        )
+    return found
+
+
 async def _memory_read_cache_set(project: str, file_name: str, content: str) -> None:
-    global memory_read_cache_evictions, memory_read_cache_writes
     if MEMMCP_READ_CACHE_MAX_KEYS <= 0:
         return
     body = str(content or "")
     if not body:
         return
     key = _memory_read_cache_key(project, file_name)
-    payload = {
-        "content": body,
-        "fetched_at": _utc_now(),
-        "fetched_monotonic": time.monotonic(),
-    }
+    digest = _content_sha256(body)
+    previous = await _memory_read_cache_l1_store(key, _memory_read_cache_l1_payload(body, digest))
+    if not _memory_read_cache_l2_enabled():
+        return
+    if previous is not None and previous.get("sha256") == digest:
+        # Unchanged content: the shared tier already holds it (or lost it and will be
+        # refilled after the next revalidation drop).
+        return
+    client = await _get_retrieval_pathway_redis_client()
+    if client is None:
+        return
+    body_key, hash_key = _memory_read_cache_l2_keys(key)
+    ttl = max(1, int(math.ceil(MEMMCP_READ_CACHE_STALE_MAX_SECS)))
+    try:
+        pipe = client.pipeline(transaction=False)
+        pipe.set(body_key, _serialize_memory_read_cache_l2(body, digest), ex=ttl)
+        pipe.set(hash_key, digest.encode("ascii"), ex=ttl)
+        await asyncio.wait_for(pipe.execute(), timeout=RETRIEVAL_PATHWAY_REDIS_TIMEOUT_SECS)
+        memory_read_cache_l2_stats["writes"] += 1
+    except Exception as exc:
+        memory_read_cache_l2_stats["errors"] += 1
+        logger.debug("Memory read cache L2 set failed: %s", exc)
+
+
+async def _memory_read_cache_invalidate(project: str, file_name: str) -> None:
+    """Drop a file from both cache tiers and the negative cache after it was written."""
+    key = _memory_read_cache_key(project, file_name)
     async with memory_read_cache_lock:
-        memory_read_cache[key] = payload
-        memory_read_cache.move_to_end(key)
-        memory_read_cache_writes += 1
-        while len(memory_read_cache) > MEMMCP_READ_CACHE_MAX_KEYS:
-            memory_read_cache.popitem(last=False)
-            memory_read_cache_evictions += 1
+        memory_read_cache.pop(key, None)
+        if memory_read_negative_cache.pop(key, None) is not None:
+            memory_read_negative_stats["invalidations"] += 1
+    if not _memory_read_cache_l2_enabled():
+        return
+    client = await _get_retrieval_pathway_redis_client()
+    if client is None:
+        return
+    try:
+        await asyncio.wait_for(
+            client.delete(*_memory_read_cache_l2_keys(key)),
+            timeout=RETRIEVAL_PATHWAY_REDIS_TIMEOUT_SECS,
+        )
+        memory_read_cache_l2_stats["invalidations"] += 1
+    except Exception as exc:
+        memory_read_cache_l2_stats["errors"] += 1
+        logger.debug("Memory read cache L2 invalidate failed: %s", exc)
+
+
+async def _memory_read_negative_cache_get(project: str, file_name: str) -> HTTPException | None:
+    """The remembered not-found error for a file, if it is still within its TTL."""
+    if MEMMCP_READ_NEGATIVE_CACHE_TTL_SECS <= 0:
+        return None
+    key = _memory_read_cache_key(project, file_name)
+    async with memory_read_cache_lock:
+        entry = memory_read_negative_cache.get(key)
+        if entry is None:
+            return None
+        if float(entry.get("expires_monotonic") or 0.0) <= time.monotonic():
+            memory_read_negative_cache.pop(key, None)
+            return None
+        memory_read_negative_cache.move_to_end(key)
+        memory_read_negative_stats["hits"] += 1
+        return HTTPException(int(entry.get("status_code") or 404), entry.get("detail"))
+
+
+async def _memory_read_negative_cache_set(project: str, file_name: str, exc: HTTPException) -> None:
+    if MEMMCP_READ_NEGATIVE_CACHE_TTL_SECS <= 0 or MEMMCP_READ_NEGATIVE_CACHE_MAX_KEYS <= 0:
+        return
+    key = _memory_read_cache_key(project, file_name)
+    async with memory_read_cache_lock:
+        memory_read_negative_cache[key] = {
+            "expires_monotonic": time.monotonic() + MEMMCP_READ_NEGATIVE_CACHE_TTL_SECS,
+            "status_code": exc.status_code,
+            "detail": exc.detail,
+        }
+        memory_read_negative_cache.move_to_end(key)
+        memory_read_negative_stats["stores"] += 1
+        while len(memory_read_negative_cache) > MEMMCP_READ_NEGATIVE_CACHE_MAX_KEYS:
+            memory_read_negative_cache.popitem(last=False)
+            memory_read_negative_stats["evictions"] += 1
 
 
 def _is_transient_memory_read_http_error(exc: HTTPException) -> bool:
@@ -11821,6 +14852,19 @@ async def read_project_file(
     bootstrap_missing: bool = False,
 ) -> str:
     global memory_read_cache_stale_fallbacks
+    missing = await _memory_read_negative_cache_get(project, file_name)
+    if missing is not None:
+        # Known-missing file: answer the way the not-found path below would, without MCP.
+        # With bootstrap_missing a stub is only served once one is cached; otherwise the
+        # read goes through so the bootstrap can be retried.
+        if bootstrap_missing:
+            cached = await _memory_read_cache_get(project, file_name, allow_stale=True)
+            if cached is not None:
+                return cached[0]
+        elif allow_missing:
+            return ""
+        else:
+            raise missing
     try:
         content = await _read_project_file_remote(
             project,
@@ -11857,6 +14901,8 @@ async def read_project_file(
                 )
                 return cached[0]
         if _is_memory_not_found_http_error(exc):
+            # Recorded before bootstrapping: a successful stub write invalidates it again.
+            await _memory_read_negative_cache_set(project, file_name, exc)
             if bootstrap_missing:
                 fallback = await _bootstrap_missing_memory_file(project, file_name)
                 if fallback:
@@ -11872,6 +14918,121 @@ async def read_project_file(
     return ""
 
 
+def _qdrant_hnsw_config() -> Any:
+    if not QDRANT_HNSW_M and not QDRANT_HNSW_EF_CONSTRUCT:
+        return None
+    return qdrant_models.HnswConfigDiff(
+        m=QDRANT_HNSW_M or None,
+        ef_construct=QDRANT_HNSW_EF_CONSTRUCT or None,
+    )
+
+
+def _qdrant_quantization_config() -> Any:
+    if QDRANT_QUANTIZATION != "scalar":
+        return None
+    return qdrant_models.ScalarQuantization(
+        scalar=qdrant_models.ScalarQuantizationConfig(
+            type=qdrant_models.ScalarType.INT8,
+            quantile=QDRANT_QUANTIZATION_QUANTILE,
+            always_ram=QDRANT_QUANTIZATION_ALWAYS_RAM,
+        )
+    )
+
+
+def _qdrant_payload_schema_type(kind: str) -> Any:
+    if kind == "integer":
+        return qdrant_models.PayloadSchemaType.INTEGER
+    return qdrant_models.PayloadSchemaType.KEYWORD
+
+
+async def _apply_qdrant_collection_profile(client: Any, collection: str, info: Any) -> dict[str, Any]:
+    """Bring an existing collection in line with the configured profile.
+
+    Missing payload indexes are created; HNSW, quantization and on-disk vector settings
+    are only patched when they differ from the collection's current config.
+    """
+    created_indexes: list[str] = []
+    updated: list[str] = []
+    errors: list[str] = []
+    if QDRANT_PAYLOAD_INDEXES_ENABLED:
+        existing_schema = getattr(info, "payload_schema", None) or {}
+        for field_name, kind in QDRANT_PAYLOAD_INDEX_FIELDS.items():
+            if field_name in existing_schema:
+                continue
+            try:
+                await client.create_payload_index(
+                    collection_name=collection,
+                    field_name=field_name,
+                    field_schema=_qdrant_payload_schema_type(kind),
+                    wait=False,
+                )
+                created_indexes.append(field_name)
+            except Exception as exc:
+                errors.append(f"index:{field_name}:{str(exc)[:160]}")
+
+    config = getattr(info, "config", None)
+    update_kwargs: dict[str, Any] = {}
+    current_hnsw = getattr(config, "hnsw_config", None)
+    if (QDRANT_HNSW_M and getattr(current_hnsw, "m", None) != QDRANT_HNSW_M) or (
+        QDRANT_HNSW_EF_CONSTRUCT and getattr(current_hnsw, "ef_construct", None) != QDRANT_HNSW_EF_CONSTRUCT
+    ):
+        update_kwargs["hnsw_config"] = _qdrant_hnsw_config()
+        updated.append("hnsw_config")
+    if QDRANT_QUANTIZATION == "scalar" and getattr(config, "quantization_config", None) is None:
+        update_kwargs["quantization_config"] = _qdrant_quantization_config()
+        updated.append("quantization_config")
+    params = getattr(config, "params", None)
+    vectors = getattr(params, "vectors", None)
+    if QDRANT_ON_DISK_VECTORS and getattr(vectors, "size", None) and not getattr(vectors, "on_disk", False):
+        update_kwargs["vectors_config"] = {"": qdrant_models.VectorParamsDiff(on_disk=True)}
+        updated.append("on_disk_vectors")
+    if update_kwargs:
+        try:
+            await client.update_collection(collection_name=collection, **update_kwargs)
+        except Exception as exc:
+            errors.append(f"update:{str(exc)[:200]}")
+            updated = []
+    result = {
+        "collection": collection,
+        "created_indexes": created_indexes,
+        "updated": updated,
+        "errors": errors,
+        "applied_at": _utc_now(),
+    }
+    if created_indexes or updated:
+        logger.info(
+            "Applied Qdrant collection profile to %s (indexes=%s updated=%s)",
+            collection,
+            created_indexes,
+            updated,
+        )
+    for error in errors:
+        logger.warning("Qdrant collection profile for %s: %s", collection, error)
+    return result
+
+
+async def apply_qdrant_collection_profile(collection_name: str | None = None) -> dict[str, Any]:
+    """Apply the collection profile to an existing collection (no-op if it does not exist yet)."""
+    if qdrant_models is None:
+        raise RuntimeError("qdrant-client dependency is required for Qdrant operations")
+    collection = collection_name or QDRANT_COLLECTION
+
+    async def _apply_on_backend(client: AsyncQdrantClient, target: str) -> dict[str, Any]:
+        try:
+            info = await client.get_collection(collection_name=collection)
+        except Exception as exc:
+            error_text = str(exc).lower()
+            if "404" not in error_text and "not found" not in error_text:
+                raise
+            return {"collection": collection, "exists": False}
+        result = await _apply_qdrant_collection_profile(client, collection, info)
+        result["target"] = target
+        qdrant_collection_profile_state[collection] = result
+        return result
+
+    return await _qdrant_call("collection_profile", _apply_on_backend)
+
+
 async def ensure_qdrant_collection(vector_size: int, collection_name: str | None = None) -> None:
     collection = collection_name or QDRANT_COLLECTION
     cached_size = qdrant_collection_dim_cache.get(collection)
@@ -11914,6 +15075,10 @@ async def ensure_qdrant_collection(vector_size: int, collection_name: str | None
                 )
             if current_size:
                 qdrant_collection_dim_cache[collection] = int(current_size)
+            if collection not in qdrant_collection_profile_state:
+                result = await _apply_qdrant_collection_profile(client, collection, info)
+                result["target"] = target
+                qdrant_collection_profile_state[collection] = result
             return
         except Exception as exc:
             error_text = str(exc).lower()
@@ -11925,10 +15090,17 @@ async def ensure_qdrant_collection(vector_size: int, collection_name: str | None
             vectors_config=qdrant_models.VectorParams(
                 size=vector_size,
                 distance=qdrant_models.Distance.COSINE,
+                on_disk=True if QDRANT_ON_DISK_VECTORS else None,
             ),
+            hnsw_config=_qdrant_hnsw_config(),
+            quantization_config=_qdrant_quantization_config(),
         )
         qdrant_collection_dim_cache[collection] = vector_size
         logger.info("Created Qdrant collection %s on %s backend with dim=%s", collection, target, vector_size)
+        # A fresh collection has no payload schema; index creation is cheap while empty.
+        result = await _apply_qdrant_collection_profile(client, collection, None)
+        result["target"] = target
+        qdrant_collection_profile_state[collection] = result
 
     await _qdrant_call("ensure_collection", _ensure_on_backend)
 
@@ -11985,6 +15157,7 @@ def _qdrant_point_payload(
         # Epoch seconds for retention/cold-storage workflows
         "ts": int(datetime.utcnow().timestamp()),
     }
+    payload_meta.update(_memory_text_features(payload_meta["summary"]))
     if topic_path:
         payload_meta["topic_path"] = topic_path
     if topic_tags:
@@ -12054,6 +15227,9 @@ async def push_batch_to_qdrant(items: list[dict[str, Any]]) -> None:
 
         try:
             await _upsert(points)
+            await _qdrant_local_index_add(collection, points)
+            if collection == QDRANT_COLLECTION:
+                await _project_registry_touch([row.get("project") for row in rows])
             continue
         except Exception as exc:
             expected_dim = _qdrant_expected_dim(str(exc))
@@ -12076,6 +15252,9 @@ async def push_batch_to_qdrant(items: list[dict[str, Any]]) -> None:
             await _upsert(fallback_points)
         except Exception as exc:
             raise RuntimeError(f"Qdrant upsert failed after fallback: {exc}") from exc
+        await _qdrant_local_index_add(collection, fallback_points)
+        if collection == QDRANT_COLLECTION:
+            await _project_registry_touch([row.get("project") for row in rows])
 
 
 def _langfuse_trace_event(project: str, summary: str, payload: dict[str, Any]) -> dict[str, Any]:
@@ -12160,128 +15339,553 @@ async def summarize_content(content: str, max_length: int = 500) -> str:
     return content[:mid] + "..." + content[-mid:]
 
 
-async def search_qdrant(
-    query: str,
-    limit: int = 10,
-    project_filter: str | None = None,
-    topic_filter: str | None = None,
-) -> list[dict[str, Any]]:
-    """Search Qdrant for relevant notes."""
-    start_time = asyncio.get_event_loop().time()
-    try:
-        query_vector = await asyncio.wait_for(
-            embed_text(query),
-            timeout=max(1.0, QDRANT_EMBED_TIMEOUT_SECS),
-        )
-    except Exception as exc:
-        logger.warning(
-            "Qdrant embedding fallback activated (%s); using deterministic vector",
-            str(exc)[:200],
-        )
-        query_vector = _cheap_embedding(query, FALLBACK_EMBED_DIM)
+_QDRANT_LOCAL_INDEX_PAYLOAD_FIELDS = [
+    "project",
+    "file",
+    "summary",
+    "topic_tags",
+    "numeric_values",
+    "terms",
+    "content_fingerprint",
+]
 
-    if qdrant_models is None:
-        raise RuntimeError("qdrant-client dependency is required for Qdrant operations")
 
-    def _build_filter() -> Any:
-        must: list[Any] = []
-        if project_filter:
-            must.append(
-                qdrant_models.FieldCondition(
-                    key="project",
-                    match=qdrant_models.MatchValue(value=project_filter),
-                )
-            )
-        if topic_filter:
-            must.append(
-                qdrant_models.FieldCondition(
-                    key="topic_tags",
-                    match=qdrant_models.MatchValue(value=topic_filter),
-                )
-            )
-        if not must:
-            return None
-        return qdrant_models.Filter(must=must)
-
-    query_filter = _build_filter()
-
-    def _extract_points_from_query_response(response: Any) -> list[Any]:
-        if isinstance(response, list):
-            return response
-        points = getattr(response, "points", None)
-        if isinstance(points, list):
-            return points
-        if isinstance(response, dict):
-            candidate = response.get("points")
-            if isinstance(candidate, list):
-                return candidate
-        return []
+def _qdrant_local_index_active() -> bool:
+    return bool(QDRANT_LOCAL_INDEX_ENABLED and np is not None)
 
-    async def _run_search(vector: list[float]) -> Any:
-        async def _execute_search(client: Any, _: str) -> Any:
-            if hasattr(client, "search"):
-                return await client.search(
-                    collection_name=QDRANT_COLLECTION,
-                    query_vector=vector,
-                    query_filter=query_filter,
-                    limit=limit,
-                    with_payload=True,
-                )
-            if hasattr(client, "query_points"):
-                response = await client.query_points(
-                    collection_name=QDRANT_COLLECTION,
-                    query=vector,
-                    query_filter=query_filter,
-                    limit=limit,
-                    with_payload=True,
-                )
-                return _extract_points_from_query_response(response)
-            raise RuntimeError("Qdrant client does not expose search/query_points")
 
-        return await _qdrant_call("search", _execute_search)
+def _qdrant_local_index_bytes_locked() -> int:
+    return sum(int(partition.get("bytes") or 0) for partition in qdrant_local_index.values())
 
-    try:
-        hits = await _run_search(query_vector)
-    except Exception as exc:
-        expected_dim = _qdrant_expected_dim(str(exc))
-        if not expected_dim or expected_dim <= 0 or expected_dim == len(query_vector):
-            raise RuntimeError(f"Qdrant search failed: {exc}") from exc
-        fallback_vector = _cheap_embedding(query, expected_dim)
-        hits = await _run_search(fallback_vector)
 
-    results = []
-    for hit in hits:
-        payload = getattr(hit, "payload", None) or {}
-        results.append({
-            "project": payload.get("project"),
-            "file": payload.get("file"),
-            "summary": payload.get("summary"),
-            "score": getattr(hit, "score", None),
-        })
+def _qdrant_local_index_partition_bytes(points: int, dim: int) -> int:
+    return int(points) * (int(dim) * 4 + QDRANT_LOCAL_INDEX_PAYLOAD_BYTES)
 
-    latency_ms = (asyncio.get_event_loop().time() - start_time) * 1000
-    await trace_to_langfuse(
-        "search",
-        latency_ms,
-        {"query_length": len(query), "results": len(results)},
-    )
-    return results
 
+def _qdrant_local_index_normalized(vectors: list[list[float]]) -> Any:
+    matrix = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
 
-async def search_memory_bank_lexical(
-    query: str,
-    limit: int = 10,
-    project_filter: str | None = None,
-    topic_filter: str | None = None,
-    time_budget_secs: float | None = None,
-) -> list[dict[str, Any]]:
-    terms = _query_terms(query)
-    if not terms:
-        return []
-    started = time.monotonic()
-    budget_secs = max(
-        0.75,
-        float(time_budget_secs if time_budget_secs is not None else RETRIEVAL_MEMORY_TIMEOUT_SECS),
+
+def _qdrant_local_index_consolidate_locked(partition: dict[str, Any]) -> None:
+    pending = partition.get("pending_vectors") or []
+    if not pending:
+        return
+    appended = _qdrant_local_index_normalized(pending)
+    matrix = partition.get("matrix")
+    partition["matrix"] = appended if matrix is None or not len(matrix) else np.vstack([matrix, appended])
+    partition["pending_vectors"] = []
+
+
+async def _qdrant_local_index_hot_projects() -> list[str]:
+    """Projects to keep in the local index: configured ones first, then most-queried."""
+    ordered: list[str] = list(QDRANT_LOCAL_INDEX_PROJECTS)
+    hits_by_project: dict[str, int] = {}
+    async with retrieval_pathway_stats_lock:
+        for entry in retrieval_pathway_stats.values():
+            project = str(entry.get("project_filter") or "").strip()
+            if project:
+                hits_by_project[project] = hits_by_project.get(project, 0) + int(entry.get("hits", 0) or 0)
+    for project, _ in sorted(hits_by_project.items(), key=lambda item: item[1], reverse=True):
+        if project not in ordered:
+            ordered.append(project)
+    if not ordered:
+        ordered = await list_qdrant_projects()
+    return ordered[:QDRANT_LOCAL_INDEX_MAX_PROJECTS]
+
+
+async def _qdrant_local_index_load_project(project: str, budget_bytes: int) -> dict[str, Any] | None:
+    """Scroll one project's points with vectors; None if it does not fit the budget."""
+    project_filter = _qdrant_search_filter(project, None)
+    counted = await _qdrant_call(
+        "local_index_count",
+        lambda client, _: client.count(
+            collection_name=QDRANT_COLLECTION,
+            count_filter=project_filter,
+            exact=True,
+        ),
+    )
+    expected_points = int(getattr(counted, "count", 0) or 0)
+    estimate_dim = qdrant_collection_dim_cache.get(QDRANT_COLLECTION) or FALLBACK_EMBED_DIM
+    if expected_points <= 0 or _qdrant_local_index_partition_bytes(expected_points, estimate_dim) > budget_bytes:
+        return None
+    vectors: list[list[float]] = []
+    payloads: list[dict[str, Any]] = []
+    point_ids: list[str | None] = []
+    offset: Any = None
+    while True:
+        points, offset = await _qdrant_call(
+            "local_index_scroll",
+            lambda client, _: client.scroll(
+                collection_name=QDRANT_COLLECTION,
+                scroll_filter=project_filter,
+                limit=256,
+                offset=offset,
+                with_payload=_QDRANT_LOCAL_INDEX_PAYLOAD_FIELDS,
+                with_vectors=True,
+            ),
+        )
+        for point in points or []:
+            vector = getattr(point, "vector", None)
+            if not isinstance(vector, list) or not vector:
+                # Named or sparse vectors are not mirrored locally.
+                return None
+            vectors.append(vector)
+            payloads.append(dict(getattr(point, "payload", None) or {}))
+            point_ids.append(_qdrant_local_index_point_id(point))
+        if vectors and _qdrant_local_index_partition_bytes(len(vectors), len(vectors[0])) > budget_bytes:
+            return None
+        if not points or offset is None:
+            break
+    if not vectors:
+        return None
+    dim = len(vectors[0])
+    if any(len(vector) != dim for vector in vectors):
+        return None
+    return {
+        "matrix": _qdrant_local_index_normalized(vectors),
+        "pending_vectors": [],
+        "payloads": payloads,
+        "ids": point_ids,
+        "dim": dim,
+        "bytes": _qdrant_local_index_partition_bytes(len(vectors), dim),
+        "tag_masks": {},
+        "loaded_at": _utc_now(),
+    }
+
+
+async def load_qdrant_local_index_once() -> dict[str, Any]:
+    """(Re)load hot projects into the in-process vector index within the memory budget."""
+    global qdrant_local_index_loads_running
+    started = time.monotonic()
+    scrolled = False
+    loaded: dict[str, dict[str, Any]] = {}
+    skipped: list[str] = []
+    remaining = QDRANT_LOCAL_INDEX_MAX_BYTES
+    async with qdrant_local_index_lock:
+        qdrant_local_index_loads_running += 1
+        journal_start = len(qdrant_local_index_journal)
+    try:
+        for project in await _qdrant_local_index_hot_projects():
+            partition = await _qdrant_local_index_load_project(project, remaining)
+            if partition is None:
+                skipped.append(project)
+                continue
+            loaded[project] = partition
+            remaining -= int(partition["bytes"])
+        qdrant_local_index_stats["lastLoadError"] = None
+        scrolled = True
+    except Exception as exc:
+        qdrant_local_index_stats["lastLoadError"] = str(exc)[:300]
+        logger.warning("Qdrant local index load failed: %s", exc)
+        raise
+    finally:
+        qdrant_local_index_stats["lastLoadAt"] = _utc_now()
+        qdrant_local_index_stats["lastLoadDurationMs"] = round((time.monotonic() - started) * 1000, 3)
+        if not scrolled:
+            async with qdrant_local_index_lock:
+                _qdrant_local_index_end_load_locked()
+    async with qdrant_local_index_lock:
+        qdrant_local_index.clear()
+        qdrant_local_index.update(loaded)
+        # The scroll may predate these mutations; replaying them is idempotent either way.
+        for operation, items in qdrant_local_index_journal[journal_start:]:
+            if operation == "remove":
+                _qdrant_local_index_remove_locked(set(items))
+            else:
+                _qdrant_local_index_add_locked(items)
+        _qdrant_local_index_end_load_locked()
+        qdrant_local_index_stats["loads"] = int(qdrant_local_index_stats.get("loads", 0) or 0) + 1
+    return {"projects": sorted(loaded), "skipped": skipped, "bytes": QDRANT_LOCAL_INDEX_MAX_BYTES - remaining}
+
+
+def _qdrant_local_index_end_load_locked() -> None:
+    global qdrant_local_index_loads_running
+    qdrant_local_index_loads_running = max(0, qdrant_local_index_loads_running - 1)
+    if not qdrant_local_index_loads_running:
+        qdrant_local_index_journal.clear()
+
+
+async def _apply_qdrant_collection_profile_best_effort() -> None:
+    try:
+        await apply_qdrant_collection_profile()
+    except Exception as exc:
+        logger.warning("Qdrant collection profile not applied at startup: %s", str(exc)[:200])
+
+
+async def _qdrant_local_index_worker() -> None:
+    while True:
+        try:
+            await load_qdrant_local_index_once()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            pass
+        await asyncio.sleep(QDRANT_LOCAL_INDEX_REFRESH_SECS)
+
+
+def _qdrant_local_index_point_id(point: Any) -> str | None:
+    point_id = getattr(point, "id", None)
+    return None if point_id is None else str(point_id)
+
+
+def _qdrant_local_index_drop_ids_locked(partition: dict[str, Any], point_ids: set[str]) -> int:
+    """Remove rows whose point id is in ``point_ids``; returns how many were removed."""
+    ids = partition.get("ids") or []
+    keep = [index for index, point_id in enumerate(ids) if point_id not in point_ids]
+    removed = len(ids) - len(keep)
+    if not removed:
+        return 0
+    _qdrant_local_index_consolidate_locked(partition)
+    partition["matrix"] = partition["matrix"][keep]
+    partition["payloads"] = [partition["payloads"][index] for index in keep]
+    partition["ids"] = [ids[index] for index in keep]
+    partition["bytes"] = _qdrant_local_index_partition_bytes(len(keep), int(partition.get("dim") or 0))
+    partition["tag_masks"] = {}
+    return removed
+
+
+async def _qdrant_local_index_remove(collection: str, point_ids: list[Any]) -> None:
+    """Evict deleted Qdrant points from every loaded local partition."""
+    if not _qdrant_local_index_active() or collection != QDRANT_COLLECTION or not point_ids:
+        return
+    wanted = {str(point_id) for point_id in point_ids}
+    async with qdrant_local_index_lock:
+        if qdrant_local_index_loads_running:
+            qdrant_local_index_journal.append(("remove", sorted(wanted)))
+        _qdrant_local_index_remove_locked(wanted)
+
+
+def _qdrant_local_index_remove_locked(point_ids: set[str]) -> None:
+    for partition in qdrant_local_index.values():
+        qdrant_local_index_stats["deletes"] += _qdrant_local_index_drop_ids_locked(partition, point_ids)
+
+
+async def _qdrant_local_index_add(collection: str, points: list[Any]) -> None:
+    """Mirror successful fanout upserts into already-loaded local partitions."""
+    if not _qdrant_local_index_active() or collection != QDRANT_COLLECTION or not points:
+        return
+    async with qdrant_local_index_lock:
+        if qdrant_local_index_loads_running:
+            qdrant_local_index_journal.append(("add", list(points)))
+        _qdrant_local_index_add_locked(points)
+
+
+def _qdrant_local_index_add_locked(points: list[Any]) -> None:
+    # An upsert replaces the point, so drop any copy already mirrored (in any project).
+    replaced = {point_id for point_id in map(_qdrant_local_index_point_id, points) if point_id is not None}
+    for partition in qdrant_local_index.values():
+        _qdrant_local_index_drop_ids_locked(partition, replaced)
+    for point in points:
+        payload = dict(getattr(point, "payload", None) or {})
+        partition = qdrant_local_index.get(str(payload.get("project") or ""))
+        if partition is None:
+            continue
+        vector = getattr(point, "vector", None)
+        if not isinstance(vector, list) or len(vector) != int(partition.get("dim") or 0):
+            # A dimension change means the partition no longer mirrors the collection.
+            qdrant_local_index.pop(str(payload.get("project") or ""), None)
+            qdrant_local_index_stats["evictions"] += 1
+            continue
+        partition["pending_vectors"].append(vector)
+        partition["payloads"].append({key: payload.get(key) for key in _QDRANT_LOCAL_INDEX_PAYLOAD_FIELDS})
+        partition["ids"].append(_qdrant_local_index_point_id(point))
+        partition["bytes"] = int(partition["bytes"]) + _qdrant_local_index_partition_bytes(1, len(vector))
+        partition["tag_masks"] = {}
+        qdrant_local_index_stats["upserts"] += 1
+    while qdrant_local_index and _qdrant_local_index_bytes_locked() > QDRANT_LOCAL_INDEX_MAX_BYTES:
+        largest = max(qdrant_local_index, key=lambda name: int(qdrant_local_index[name].get("bytes") or 0))
+        qdrant_local_index.pop(largest, None)
+        qdrant_local_index_stats["evictions"] += 1
+
+
+async def _qdrant_local_index_search(
+    vector: list[float],
+    *,
+    limit: int,
+    project_filter: str | None,
+    topic_filter: str | None,
+    degraded: bool = False,
+) -> list[dict[str, Any]] | None:
+    """Cosine top-k over a fully loaded project partition; None when it cannot answer."""
+    if not _qdrant_local_index_active() or not project_filter:
+        return None
+    async with qdrant_local_index_lock:
+        partition = qdrant_local_index.get(project_filter)
+        if partition is None or int(partition.get("dim") or 0) != len(vector):
+            qdrant_local_index_stats["misses"] += 1
+            return None
+        _qdrant_local_index_consolidate_locked(partition)
+        matrix = partition["matrix"]
+        payloads = partition["payloads"]
+        mask = None
+        if topic_filter:
+            mask = partition["tag_masks"].get(topic_filter)
+            if mask is None:
+                mask = np.fromiter(
+                    (topic_filter in (payload.get("topic_tags") or ()) for payload in payloads),
+                    dtype=bool,
+                    count=len(payloads),
+                )
+                partition["tag_masks"][topic_filter] = mask
+        qdrant_local_index_stats["degradedServes" if degraded else "hits"] += 1
+    query = np.asarray(vector, dtype=np.float32)
+    norm = float(np.linalg.norm(query))
+    if norm == 0.0:
+        return []
+    scores = matrix @ (query / norm)
+    candidates = np.flatnonzero(mask) if mask is not None else np.arange(len(scores))
+    if not len(candidates):
+        return []
+    k = min(max(1, int(limit)), len(candidates))
+    candidate_scores = scores[candidates]
+    top = np.argpartition(-candidate_scores, k - 1)[:k]
+    top = top[np.argsort(-candidate_scores[top], kind="stable")]
+    return [
+        _qdrant_payload_row(payloads[int(candidates[index])], float(candidate_scores[index]))
+        for index in top
+    ]
+
+
+async def _qdrant_local_index_snapshot() -> dict[str, Any]:
+    async with qdrant_local_index_lock:
+        projects = {
+            name: {
+                "points": len(partition.get("payloads") or []),
+                "dim": partition.get("dim"),
+                "bytes": partition.get("bytes"),
+                "loadedAt": partition.get("loaded_at"),
+            }
+            for name, partition in qdrant_local_index.items()
+        }
+        stats = dict(qdrant_local_index_stats)
+    return {
+        "enabled": QDRANT_LOCAL_INDEX_ENABLED,
+        "available": np is not None,
+        "maxBytes": QDRANT_LOCAL_INDEX_MAX_BYTES,
+        "usedBytes": sum(int(item.get("bytes") or 0) for item in projects.values()),
+        "refreshSecs": QDRANT_LOCAL_INDEX_REFRESH_SECS,
+        "projects": projects,
+        **stats,
+    }
+
+
+def _qdrant_search_filter(project_filter: str | None, topic_filter: str | None) -> Any:
+    must: list[Any] = []
+    if project_filter:
+        must.append(
+            qdrant_models.FieldCondition(
+                key="project",
+                match=qdrant_models.MatchValue(value=project_filter),
+            )
+        )
+    if topic_filter:
+        must.append(
+            qdrant_models.FieldCondition(
+                key="topic_tags",
+                match=qdrant_models.MatchValue(value=topic_filter),
+            )
+        )
+    if not must:
+        return None
+    return qdrant_models.Filter(must=must)
+
+
+def _qdrant_points_from_response(response: Any) -> list[Any]:
+    if isinstance(response, list):
+        return response
+    points = getattr(response, "points", None)
+    if isinstance(points, list):
+        return points
+    if isinstance(response, dict):
+        candidate = response.get("points")
+        if isinstance(candidate, list):
+            return candidate
+    return []
+
+
+def _qdrant_hit_row(hit: Any) -> dict[str, Any]:
+    return _qdrant_payload_row(getattr(hit, "payload", None) or {}, getattr(hit, "score", None))
+
+
+def _qdrant_payload_row(payload: dict[str, Any], score: Any) -> dict[str, Any]:
+    row = {
+        "project": payload.get("project"),
+        "file": payload.get("file"),
+        "summary": payload.get("summary"),
+        "score": score,
+    }
+    if isinstance(payload.get("numeric_values"), list):
+        row["numeric_values"] = payload["numeric_values"]
+    if isinstance(payload.get("terms"), list):
+        row["terms"] = payload["terms"]
+    if payload.get("content_fingerprint"):
+        row["content_fingerprint"] = payload["content_fingerprint"]
+    return row
+
+
+async def search_qdrant(
+    query: str,
+    limit: int = 10,
+    project_filter: str | None = None,
+    topic_filter: str | None = None,
+    prefer_local: bool = False,
+) -> list[dict[str, Any]]:
+    """Search Qdrant for relevant notes.
+
+    With ``prefer_local`` a fully loaded local index partition answers directly; the
+    local index also serves (degraded) when Qdrant itself fails.
+    """
+    start_time = asyncio.get_event_loop().time()
+    try:
+        query_vector = await asyncio.wait_for(
+            embed_text(query),
+            timeout=max(1.0, QDRANT_EMBED_TIMEOUT_SECS),
+        )
+    except Exception as exc:
+        logger.warning(
+            "Qdrant embedding fallback activated (%s); using deterministic vector",
+            str(exc)[:200],
+        )
+        query_vector = _cheap_embedding(query, FALLBACK_EMBED_DIM)
+
+    if qdrant_models is None:
+        raise RuntimeError("qdrant-client dependency is required for Qdrant operations")
+
+    if prefer_local:
+        local_rows = await _qdrant_local_index_search(
+            query_vector,
+            limit=limit,
+            project_filter=project_filter,
+            topic_filter=topic_filter,
+        )
+        if local_rows is not None:
+            return local_rows
+
+    query_filter = _qdrant_search_filter(project_filter, topic_filter)
+
+    async def _run_search(vector: list[float]) -> Any:
+        async def _execute_search(client: Any, _: str) -> Any:
+            if hasattr(client, "search"):
+                return await client.search(
+                    collection_name=QDRANT_COLLECTION,
+                    query_vector=vector,
+                    query_filter=query_filter,
+                    limit=limit,
+                    with_payload=True,
+                )
+            if hasattr(client, "query_points"):
+                response = await client.query_points(
+                    collection_name=QDRANT_COLLECTION,
+                    query=vector,
+                    query_filter=query_filter,
+                    limit=limit,
+                    with_payload=True,
+                )
+                return _qdrant_points_from_response(response)
+            raise RuntimeError("Qdrant client does not expose search/query_points")
+
+        return await _qdrant_call("search", _execute_search)
+
+    try:
+        hits = await _run_search(query_vector)
+    except Exception as exc:
+        expected_dim = _qdrant_expected_dim(str(exc))
+        if not expected_dim or expected_dim <= 0 or expected_dim == len(query_vector):
+            local_rows = await _qdrant_local_index_search(
+                query_vector,
+                limit=limit,
+                project_filter=project_filter,
+                topic_filter=topic_filter,
+                degraded=True,
+            )
+            if local_rows is not None:
+                logger.warning("Qdrant search failed (%s); served from local index", str(exc)[:200])
+                return _incomplete_source_rows(local_rows)
+            raise RuntimeError(f"Qdrant search failed: {exc}") from exc
+        fallback_vector = _cheap_embedding(query, expected_dim)
+        hits = await _run_search(fallback_vector)
+
+    results = [_qdrant_hit_row(hit) for hit in hits]
+
+    latency_ms = (asyncio.get_event_loop().time() - start_time) * 1000
+    await trace_to_langfuse(
+        "search",
+        latency_ms,
+        {"query_length": len(query), "results": len(results)},
+    )
+    return results
+
+
+async def search_qdrant_batch(requests: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+    """Search Qdrant for several queries with one embedding call and one batch query.
+
+    Each request carries ``query``, ``limit``, ``project_filter`` and ``topic_filter``.
+    Any failure raises so callers can fall back to per-query search_qdrant, which also
+    handles collection dimension mismatches.
+    """
+    if not requests:
+        return []
+    if qdrant_models is None:
+        raise RuntimeError("qdrant-client dependency is required for Qdrant operations")
+    start_time = asyncio.get_event_loop().time()
+    vectors = await asyncio.wait_for(
+        embed_texts([str(item.get("query") or "") for item in requests]),
+        timeout=max(1.0, QDRANT_EMBED_TIMEOUT_SECS),
+    )
+    query_requests = [
+        qdrant_models.QueryRequest(
+            query=vector,
+            filter=_qdrant_search_filter(item.get("project_filter"), item.get("topic_filter")),
+            limit=max(1, int(item.get("limit") or 10)),
+            with_payload=True,
+        )
+        for item, vector in zip(requests, vectors)
+    ]
+
+    async def _execute_batch(client: Any, _: str) -> Any:
+        if not hasattr(client, "query_batch_points"):
+            raise RuntimeError("Qdrant client does not expose query_batch_points")
+        return await client.query_batch_points(
+            collection_name=QDRANT_COLLECTION,
+            requests=query_requests,
+        )
+
+    responses = await _qdrant_call("query_batch", _execute_batch)
+    if len(responses) != len(requests):
+        raise RuntimeError(
+            f"Qdrant batch query returned {len(responses)} responses for {len(requests)} requests"
+        )
+    results = [
+        [_qdrant_hit_row(hit) for hit in _qdrant_points_from_response(response)]
+        for response in responses
+    ]
+    latency_ms = (asyncio.get_event_loop().time() - start_time) * 1000
+    await trace_to_langfuse(
+        "search_batch",
+        latency_ms,
+        {"queries": len(requests), "results": sum(len(rows) for rows in results)},
+    )
+    return results
+
+
+async def search_memory_bank_lexical(
+    query: str,
+    limit: int = 10,
+    project_filter: str | None = None,
+    topic_filter: str | None = None,
+    time_budget_secs: float | None = None,
+) -> list[dict[str, Any]]:
+    terms = _query_terms(query)
+    if not terms:
+        return []
+    compiled_query = CompiledQuery(query)
+    started = time.monotonic()
+    budget_secs = max(
+        0.75,
+        float(time_budget_secs if time_budget_secs is not None else RETRIEVAL_MEMORY_TIMEOUT_SECS),
     )
 
     def _remaining_budget() -> float:
@@ -12305,13 +15909,17 @@ async def search_memory_bank_lexical(
         projects = await list_projects()
     projects = projects[:project_cap]
     candidates: list[tuple[float, str, str]] = []
+    # Set when a project or file was skipped (error or budget), so the answer is partial.
+    incomplete = False
     for project in projects:
         if _remaining_budget() <= 0.1:
+            incomplete = True
             break
         try:
             files = await list_files(project)
         except Exception as exc:
             logger.warning("Memory-bank lexical search skipped %s: %s", project, exc)
+            incomplete = True
             continue
         if topic_filter:
             files = [
@@ -12322,13 +15930,14 @@ async def search_memory_bank_lexical(
         files = files[:files_per_project]
         for file_name in files:
             if _remaining_budget() <= 0.05:
+                incomplete = True
                 break
-            name_score = _text_match_score(query, f"{project}\n{file_name}")
+            name_score = compiled_query.match_score(f"{project}\n{file_name}")
             if name_score <= 0:
                 continue
             candidates.append((name_score, project, file_name))
     if not candidates:
-        return []
+        return _incomplete_source_rows() if incomplete else []
     candidates.sort(key=lambda row: row[0], reverse=True)
     selected = candidates[:scan_limit]
     parallelism = max(2, min(8, int(math.ceil(budget_secs * 1.5))))
@@ -12336,9 +15945,11 @@ async def search_memory_bank_lexical(
     rows: list[dict[str, Any]] = []
 
     async def _inspect(name_score: float, project: str, file_name: str) -> None:
+        nonlocal incomplete
         async with semaphore:
             remaining = _remaining_budget()
             if remaining <= 0.05:
+                incomplete = True
                 return
             try:
                 content = await asyncio.wait_for(
@@ -12346,11 +15957,12 @@ async def search_memory_bank_lexical(
                     timeout=max(0.5, min(MEMMCP_READ_TIMEOUT_SECS, remaining)),
                 )
             except Exception:
+                incomplete = True
                 return
             if not content:
                 return
             summary = await summarize_content(content)
-            score = max(name_score, _text_match_score(query, f"{file_name}\n{summary}"))
+            score = max(name_score, compiled_query.match_score(f"{file_name}\n{summary}"))
             if score <= 0:
                 return
             rows.append(
@@ -12365,6 +15977,8 @@ async def search_memory_bank_lexical(
 
     await asyncio.gather(*[_inspect(score, project, file_name) for score, project, file_name in selected])
     rows.sort(key=lambda row: float(row.get("score") or 0.0), reverse=True)
+    if incomplete:
+        return _incomplete_source_rows(rows[:limit])
     return rows[:limit]
 
 
@@ -12379,6 +15993,7 @@ async def search_topic_rollups(
     projects = snapshot.get("projects") if isinstance(snapshot, dict) else {}
     if not isinstance(projects, dict):
         return []
+    compiled_query = CompiledQuery(query)
     rows: list[dict[str, Any]] = []
     for project_name, project_payload in projects.items():
         if not isinstance(project_name, str) or not isinstance(project_payload, dict):
@@ -12411,7 +16026,7 @@ async def search_topic_rollups(
                     *numeric_values,
                 ]
             )
-            score = _text_match_score(query, haystack)
+            score = compiled_query.match_score(haystack)
             if score <= 0:
                 continue
             summary = ""
@@ -12441,6 +16056,81 @@ async def search_topic_rollups(
     return rows[:limit]
 
 
+async def ensure_mongo_text_search_indexes() -> bool:
+    """Make sure the raw-event collection has the indexes ``search_mongo_raw`` relies on.
+
+    Creates the weighted text index plus ``(project, updated_at)`` and ``topic_path``
+    indexes. An existing text index under another name is reused, since MongoDB allows
+    only one per collection. Failures are retried after RETRIEVAL_MONGO_TEXT_INDEX_RETRY_SECS.
+    """
+    if not RETRIEVAL_MONGO_TEXT_SEARCH_ENABLED:
+        return False
+    if mongo_text_search_state.get("ready"):
+        return True
+    if time.monotonic() < float(mongo_text_search_state.get("retryAfterMonotonic") or 0.0):
+        return False
+    if not await init_mongo_client():
+        return False
+    async with mongo_text_index_lock:
+        if mongo_text_search_state.get("ready"):
+            return True
+        if time.monotonic() < float(mongo_text_search_state.get("retryAfterMonotonic") or 0.0):
+            return False
+
+        def _ensure() -> str:
+            assert MONGO_CLIENT is not None  # guarded by init_mongo_client
+            coll = MONGO_CLIENT[MONGO_RAW_DB][MONGO_RAW_COLLECTION]
+            coll.create_index([("project", 1), ("updated_at", -1)])
+            coll.create_index("topic_path")
+            for name, spec in (coll.index_information() or {}).items():
+                if any(key == "_fts" for key, _ in spec.get("key", [])):
+                    return str(name)
+            return str(
+                coll.create_index(
+                    [(field, "text") for field in MONGO_RAW_TEXT_INDEX_WEIGHTS],
+                    weights=dict(MONGO_RAW_TEXT_INDEX_WEIGHTS),
+                    default_language="english",
+                    name=MONGO_RAW_TEXT_INDEX_NAME,
+                )
+            )
+
+        mongo_text_search_state["lastCheckedAt"] = _utc_now()
+        try:
+            index_name = await asyncio.to_thread(_ensure)
+        except Exception as exc:
+            logger.warning("Mongo text index unavailable; retrieval will scan: %s", exc)
+            mongo_text_search_state["lastError"] = str(exc)
+            mongo_text_search_state["retryAfterMonotonic"] = (
+                time.monotonic() + RETRIEVAL_MONGO_TEXT_INDEX_RETRY_SECS
+            )
+            return False
+        mongo_text_search_state["ready"] = True
+        mongo_text_search_state["indexName"] = index_name
+        mongo_text_search_state["lastError"] = None
+        return True
+
+
+def _schedule_mongo_text_search_indexes() -> None:
+    global mongo_text_index_task
+    if mongo_text_index_task is not None and not mongo_text_index_task.done():
+        return
+    mongo_text_index_task = asyncio.create_task(ensure_mongo_text_search_indexes())
+
+
+def _mongo_text_search_ready() -> bool:
+    if mongo_text_search_state.get("ready"):
+        return True
+    # Text index builds can take minutes on a large collection, so queries never wait
+    # for one; they scan while the index is ensured in the background.
+    if (
+        RETRIEVAL_MONGO_TEXT_SEARCH_ENABLED
+        and not mongo_text_index_lock.locked()
+        and time.monotonic() >= float(mongo_text_search_state.get("retryAfterMonotonic") or 0.0)
+    ):
+        _schedule_mongo_text_search_indexes()
+    return False
+
+
 async def search_mongo_raw(
     query: str,
     limit: int = 10,
@@ -12448,18 +16138,56 @@ async def search_mongo_raw(
     topic_filter: str | None = None,
 ) -> list[dict[str, Any]]:
     if not await init_mongo_client():
-        return []
+        # Disabled, or the client failed to connect; either way nothing was searched.
+        return _incomplete_source_rows()
     assert MONGO_CLIENT is not None
     terms = _query_terms(query)
+    compiled_query = CompiledQuery(query)
     max_scan = max(limit * 12, RETRIEVAL_MONGO_SCAN_LIMIT)
+    query_filter: dict[str, Any] = {}
+    if project_filter:
+        query_filter["project"] = project_filter
+    if topic_filter:
+        query_filter["topic_path"] = {"$regex": f"^{re.escape(topic_filter)}"}
+
+    def _text_search() -> list[dict[str, Any]]:
+        coll = MONGO_CLIENT[MONGO_RAW_DB][MONGO_RAW_COLLECTION]
+        # Ranked server-side; only a content prefix leaves the server. The search string
+        # is built from the normalized terms (quotes dropped, leading "-" stripped), so the
+        # raw query cannot turn into $text phrase or negation operators.
+        pipeline = [
+            {"$match": {**query_filter, "$text": {"$search": text_search}}},
+            {"$sort": {"text_score": {"$meta": "textScore"}}},
+            {"$limit": max(limit * RETRIEVAL_MONGO_TEXT_CANDIDATE_FACTOR, limit)},
+            {
+                "$project": {
+                    "_id": 0,
+                    "event_id": 1,
+                    "project": 1,
+                    "file": 1,
+                    "summary": 1,
+                    "content_snippet": {
+                        "$substrCP": [
+                            {"$ifNull": ["$content_raw", ""]},
+                            0,
+                            RETRIEVAL_MONGO_SNIPPET_CHARS,
+                        ]
+                    },
+                    "topic_path": 1,
+                    "topic_tags": 1,
+                    "created_at": 1,
+                    "updated_at": 1,
+                    "numeric_values": 1,
+                    "terms": 1,
+                    "content_fingerprint": 1,
+                    "text_score": {"$meta": "textScore"},
+                }
+            },
+        ]
+        return list(coll.aggregate(pipeline))
 
     def _scan() -> list[dict[str, Any]]:
         coll = MONGO_CLIENT[MONGO_RAW_DB][MONGO_RAW_COLLECTION]
-        query_filter: dict[str, Any] = {}
-        if project_filter:
-            query_filter["project"] = project_filter
-        if topic_filter:
-            query_filter["topic_path"] = {"$regex": f"^{re.escape(topic_filter)}"}
         projection = {
             "_id": 0,
             "event_id": 1,
@@ -12471,6 +16199,9 @@ async def search_mongo_raw(
             "topic_tags": 1,
             "created_at": 1,
             "updated_at": 1,
+            "numeric_values": 1,
+            "terms": 1,
+            "content_fingerprint": 1,
         }
         docs = list(
             coll.find(query_filter, projection=projection)
@@ -12479,16 +16210,39 @@ async def search_mongo_raw(
         )
         return docs
 
-    try:
-        docs = await asyncio.to_thread(_scan)
-    except Exception as exc:
-        logger.warning("Mongo retrieval search failed: %s", exc)
-        return []
+    text_search = " ".join(dict.fromkeys(term.lstrip("-") for term in terms if term.lstrip("-")))
+    docs: list[dict[str, Any]] | None = None
+    if text_search and _mongo_text_search_ready():
+        try:
+            docs = await asyncio.to_thread(_text_search)
+            mongo_text_search_state["textQueries"] += 1
+        except Exception as exc:
+            # e.g. the text index was dropped; re-check it later and scan meanwhile.
+            logger.warning("Mongo text search failed; falling back to scan: %s", exc)
+            mongo_text_search_state["ready"] = False
+            mongo_text_search_state["lastError"] = str(exc)
+            mongo_text_search_state["retryAfterMonotonic"] = (
+                time.monotonic() + RETRIEVAL_MONGO_TEXT_INDEX_RETRY_SECS
+            )
+            mongo_text_search_state["textFallbacks"] += 1
+        if docs == []:
+            # $text matches whole stemmed words only; a scan still finds substrings
+            # (paths, identifiers, numbers) the index cannot.
+            docs = None
+            mongo_text_search_state["textEmptyFallbacks"] += 1
+    if docs is None:
+        try:
+            docs = await asyncio.to_thread(_scan)
+            mongo_text_search_state["scanQueries"] += 1
+        except Exception as exc:
+            logger.warning("Mongo retrieval search failed: %s", exc)
+            return _incomplete_source_rows()
+    max_text_score = max((float(doc.get("text_score") or 0.0) for doc in docs), default=0.0)
     rows: list[dict[str, Any]] = []
     for doc in docs:
-        content = str(doc.get("content_raw") or "")
+        content = str(doc.get("content_snippet") or doc.get("content_raw") or "")
         summary = str(doc.get("summary") or "")
-        snippet = summary or (content[:500] if content else "")
+        snippet = summary or (content[:RETRIEVAL_MONGO_SNIPPET_CHARS] if content else "")
         haystack = "\n".join(
             [
                 str(doc.get("project") or ""),
@@ -12497,21 +16251,30 @@ async def search_mongo_raw(
                 snippet,
             ]
         )
-        score = _text_match_score(query, haystack)
+        score = compiled_query.match_score(haystack)
+        text_score = float(doc.get("text_score") or 0.0)
+        if score <= 0 and text_score > 0 and max_text_score > 0:
+            # Matched through stemming or content_raw only: keep it, below literal matches.
+            score = round(0.25 * text_score / max_text_score, 6)
         if score <= 0 and terms:
             continue
-        rows.append(
-            {
-                "project": doc.get("project"),
-                "file": doc.get("file"),
-                "summary": snippet,
-                "score": score,
-                "source": RETRIEVAL_SOURCE_MONGO_RAW,
-                "event_id": doc.get("event_id"),
-                "topic_path": doc.get("topic_path"),
-                "created_at": doc.get("created_at"),
-            }
-        )
+        row = {
+            "project": doc.get("project"),
+            "file": doc.get("file"),
+            "summary": snippet,
+            "score": score,
+            "source": RETRIEVAL_SOURCE_MONGO_RAW,
+            "event_id": doc.get("event_id"),
+            "topic_path": doc.get("topic_path"),
+            "created_at": doc.get("created_at"),
+        }
+        if isinstance(doc.get("numeric_values"), list):
+            row["numeric_values"] = doc["numeric_values"]
+        if isinstance(doc.get("terms"), list):
+            row["terms"] = doc["terms"]
+        if doc.get("content_fingerprint"):
+            row["content_fingerprint"] = doc["content_fingerprint"]
+        rows.append(row)
     rows.sort(key=lambda row: float(row.get("score") or 0.0), reverse=True)
     return rows[:limit]
 
@@ -12528,7 +16291,7 @@ async def search_mindsdb_memory(
         await ensure_mindsdb_table()
     except Exception as exc:
         logger.warning("MindsDB retrieval bootstrap failed: %s", exc)
-        return []
+        return _incomplete_source_rows()
     table_name = mindsdb_target_table or MINDSDB_AUTOSYNC_TABLE
     clauses: list[str] = []
     if project_filter:
@@ -12537,36 +16300,66 @@ async def search_mindsdb_memory(
         escaped_topic = _escape_sql_literal(topic_filter)
         clauses.append(f"(file LIKE '{escaped_topic}/%' OR file LIKE '{escaped_topic}%')")
     terms = _query_terms(query, max_terms=6)
-    if terms:
-        term_predicates = [
-            f"LOWER(summary) LIKE '%{_escape_sql_literal(term.lower())}%'"
-            for term in terms
-        ]
-        term_predicates.extend(
-            [
-                f"LOWER(file) LIKE '%{_escape_sql_literal(term.lower())}%'"
+    compiled_query = CompiledQuery(query)
+    raw: dict[str, Any] | None = None
+    term_table = await _ensure_mindsdb_term_index(table_name) if terms else None
+    if term_table is not None and mindsdb_term_index_state.get("ready"):
+        # Equality lookups on the term table pick candidates; only those rows are read.
+        lookup_terms = ", ".join(
+            _sql_literal(term)
+            for term in _mindsdb_index_terms(" ".join(terms), max_terms=24)
+        )
+        term_clauses = [f"term IN ({lookup_terms})", *clauses]
+        candidate_limit = max(limit * 4, 20)
+        sql = (
+            "SELECT d.project AS project, d.file AS file, d.summary AS summary, "
+            "d.created_at AS created_at, t.hits AS hits "
+            f"FROM {MINDSDB_AUTOSYNC_DB}.{table_name} AS d "
+            "JOIN (SELECT project, file, COUNT(DISTINCT term) AS hits "
+            f"FROM {MINDSDB_AUTOSYNC_DB}.{term_table} "
+            f"WHERE {' AND '.join(term_clauses)} "
+            f"GROUP BY project, file ORDER BY hits DESC LIMIT {candidate_limit}) AS t "
+            "ON d.project = t.project AND d.file = t.file "
+            f"ORDER BY t.hits DESC, d.created_at DESC LIMIT {candidate_limit};"
+        )
+        try:
+            raw = await _mindsdb_execute(sql)
+            mindsdb_term_index_state["termQueries"] += 1
+        except Exception as exc:
+            logger.warning("MindsDB term lookup failed; falling back to LIKE scan: %s", exc)
+            mindsdb_term_index_state["termFallbacks"] += 1
+    if raw is None:
+        if terms:
+            term_predicates = [
+                f"LOWER(summary) LIKE '%{_escape_sql_literal(term.lower())}%'"
                 for term in terms
             ]
+            term_predicates.extend(
+                [
+                    f"LOWER(file) LIKE '%{_escape_sql_literal(term.lower())}%'"
+                    for term in terms
+                ]
+            )
+            clauses.append("(" + " OR ".join(term_predicates) + ")")
+        where_clause = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        scan_limit = max(limit * 12, RETRIEVAL_MINDSDB_SCAN_LIMIT)
+        sql = (
+            f"SELECT project, file, summary, created_at "
+            f"FROM {MINDSDB_AUTOSYNC_DB}.{table_name} "
+            f"{where_clause} ORDER BY created_at DESC LIMIT {scan_limit};"
         )
-        clauses.append("(" + " OR ".join(term_predicates) + ")")
-    where_clause = f"WHERE {' AND '.join(clauses)}" if clauses else ""
-    scan_limit = max(limit * 12, RETRIEVAL_MINDSDB_SCAN_LIMIT)
-    sql = (
-        f"SELECT project, file, summary, created_at "
-        f"FROM {MINDSDB_AUTOSYNC_DB}.{table_name} "
-        f"{where_clause} ORDER BY created_at DESC LIMIT {scan_limit};"
-    )
-    try:
-        raw = await _mindsdb_execute(sql)
-    except Exception as exc:
-        logger.warning("MindsDB retrieval query failed: %s", exc)
-        return []
+        try:
+            raw = await _mindsdb_execute(sql)
+            mindsdb_term_index_state["scanQueries"] += 1
+        except Exception as exc:
+            logger.warning("MindsDB retrieval query failed: %s", exc)
+            return _incomplete_source_rows()
     rows: list[dict[str, Any]] = []
     for row in _mindsdb_rows(raw):
         project = str(row.get("project") or "")
         file_name = str(row.get("file") or "")
         summary = str(row.get("summary") or "")
-        score = _text_match_score(query, f"{project}\n{file_name}\n{summary}")
+        score = compiled_query.match_score(f"{project}\n{file_name}\n{summary}")
         if score <= 0 and terms:
             continue
         rows.append(
@@ -12600,7 +16393,7 @@ async def search_letta_archival(
         agent_id = await _resolve_letta_agent_id(LETTA_AUTO_SESSION_ID, headers)
     except Exception as exc:
         logger.warning("Letta retrieval agent resolution failed: %s", exc)
-        return []
+        return _incomplete_source_rows()
     top_k = max(limit, int(limit * max(1.0, RETRIEVAL_LETTA_TOP_K_FACTOR)))
     top_k = min(top_k, RETRIEVAL_LETTA_TOP_K_CAP)
     cache_key = _letta_search_cache_key(
@@ -12654,7 +16447,7 @@ async def search_letta_archival(
                     prior_timeout_secs=effective_timeout,
                 )
         logger.warning("Letta retrieval query failed: %s", exc)
-        return []
+        return _incomplete_source_rows()
     rows = _letta_search_rows_from_payload(
         payload=data,
         query=query,
@@ -12666,6 +16459,23 @@ async def search_letta_archival(
     return rows
 
 
+def _fusion_top_k_order(scores: list[float], tiebreak: list[float], k: int | None) -> list[int]:
+    """Indices of the top ``k`` entries ordered by score, then tiebreak, then position."""
+    count = len(scores)
+    if k is None or k >= count:
+        return sorted(range(count), key=lambda index: (-scores[index], -tiebreak[index], index))
+    if k <= 0:
+        return []
+    if np is None:
+        return heapq.nsmallest(k, range(count), key=lambda index: (-scores[index], -tiebreak[index], index))
+    score_array = np.asarray(scores, dtype=np.float64)
+    threshold = np.partition(score_array, count - k)[count - k]
+    # Keep every entry tied with the k-th score so the tiebreak ordering stays exact.
+    candidates = np.flatnonzero(score_array >= threshold).tolist()
+    candidates.sort(key=lambda index: (-scores[index], -tiebreak[index], index))
+    return candidates[:k]
+
+
 def _merge_federated_rows(
     results_by_source: dict[str, list[dict[str, Any]]],
     source_weights: dict[str, float],
@@ -12676,109 +16486,259 @@ def _merge_federated_rows(
     query: str = "",
     source_quality_multipliers: dict[str, float] | None = None,
     lifecycle_snapshot: dict[str, dict[str, Any]] | None = None,
+    compiled_query: CompiledQuery | None = None,
+    top_k: int | None = None,
 ) -> list[dict[str, Any]]:
-    normalized_query = re.sub(r"\s+", " ", str(query or "").strip().lower())
-    query_numeric_values = set(
-        _extract_numeric_values_verbatim(normalized_query, limit=16)
+    """Fuse per-source rows into unique results ranked by score, then base score.
+
+    Score components are collected into columns and combined with NumPy when it is
+    available. Only the ``top_k`` returned rows (all rows when None) are copied and
+    annotated with their per-component debug fields.
+    """
+    compiled = compiled_query or CompiledQuery(
+        query,
+        positive_terms=positive_terms,
+        negative_terms=negative_terms,
+    )
+    fusion_active = bool(RETRIEVAL_FUSION_ENABLED and compiled.phrase)
+    query_numeric_count = len(compiled.numeric_values)
+    numeric_active = bool(
+        fusion_active and RETRIEVAL_FUSION_NUMERIC_MATCH_ENABLED and query_numeric_count
     )
+    scan_terms = bool(fusion_active or learning_enabled)
     quality_multipliers = {
         str(source).strip().lower(): float(multiplier)
         for source, multiplier in (source_quality_multipliers or {}).items()
     }
     lifecycle_records = lifecycle_snapshot if isinstance(lifecycle_snapshot, dict) else {}
-    now_monotonic = time.monotonic()
-    merged: dict[str, dict[str, Any]] = {}
+
+    row_refs: list[tuple[str, dict[str, Any]]] = []
+    row_groups: list[int] = []
+    group_keys: list[str] = []
+    group_by_key: dict[str, int] = {}
+    group_sources: list[set[str]] = []
+    base_col: list[float] = []
+    weight_col: list[float] = []
+    quality_col: list[float] = []
+    learning_col: list[float] = []
+    lexical_col: list[float] = []
+    numeric_col: list[float] = []
+    numeric_ratio_col: list[float] = []
     for source, rows in results_by_source.items():
         source_name = str(source or "").strip().lower()
+        source_label = source_name or source
         source_weight = float(source_weights.get(source_name, source_weights.get(source, 1.0)))
         quality_multiplier = float(quality_multipliers.get(source_name, 1.0))
         for row in rows:
             key = _result_identity(row)
-            summary = str(row.get("summary") or "")
-            file_name = str(row.get("file") or "")
-            project = str(row.get("project") or "")
-            text_blob = f"{project}\n{file_name}\n{summary}".lower()
-            base_score = float(row.get("score") or 0.0)
-            positive_hits = sum(1 for term in positive_terms if term in text_blob)
-            negative_hits = sum(1 for term in negative_terms if term in text_blob)
+            header = f"{row.get('project') or ''}\n{row.get('file') or ''}"
+            text_blob = f"{header}\n{row.get('summary') or ''}".lower()
+            term_hits = (
+                compiled.term_hits(text_blob, stored_terms=_row_terms(row), header=header.lower())
+                if scan_terms
+                else set()
+            )
             learning_adjustment = 0.0
             if learning_enabled:
+                positive_hits, negative_hits = compiled.learning_hits(term_hits)
                 learning_adjustment += positive_hits * RETRIEVAL_LEARNING_POSITIVE_BOOST
                 learning_adjustment -= negative_hits * RETRIEVAL_LEARNING_NEGATIVE_PENALTY
             lexical_adjustment = 0.0
             numeric_adjustment = 0.0
             numeric_match_ratio = 0.0
-            if RETRIEVAL_FUSION_ENABLED and normalized_query:
+            if fusion_active:
                 lexical_adjustment = (
-                    _text_match_score(normalized_query, text_blob)
+                    compiled.match_score(text_blob, lowered=True, hits=term_hits)
                     * RETRIEVAL_FUSION_LEXICAL_BOOST
                 )
-                if RETRIEVAL_FUSION_NUMERIC_MATCH_ENABLED and query_numeric_values:
-                    row_numeric_values = set(
-                        _extract_numeric_values_verbatim(text_blob, limit=16)
+                if numeric_active:
+                    numeric_matches, row_has_numeric = compiled.numeric_overlap(
+                        text_blob,
+                        stored_values=_row_numeric_values(row),
+                        header=header,
                     )
-                    if row_numeric_values:
-                        numeric_matches = len(query_numeric_values.intersection(row_numeric_values))
-                        numeric_misses = max(0, len(query_numeric_values) - numeric_matches)
-                        if len(query_numeric_values) > 0:
-                            numeric_match_ratio = numeric_matches / len(query_numeric_values)
-                            numeric_miss_ratio = numeric_misses / len(query_numeric_values)
-                        else:
-                            numeric_miss_ratio = 0.0
+                    if row_has_numeric:
+                        numeric_misses = max(0, query_numeric_count - numeric_matches)
+                        numeric_match_ratio = numeric_matches / query_numeric_count
+                        numeric_miss_ratio = numeric_misses / query_numeric_count
                         numeric_adjustment = (
                             numeric_match_ratio * RETRIEVAL_FUSION_NUMERIC_MATCH_BOOST
                             - numeric_miss_ratio * RETRIEVAL_FUSION_NUMERIC_MISS_PENALTY
                         )
                     else:
                         numeric_adjustment = -RETRIEVAL_FUSION_NUMERIC_MISS_PENALTY
-            lifecycle_adjustment = _retrieval_lifecycle_adjustment(
-                key=key,
-                lifecycle_snapshot=lifecycle_records,
-                now_monotonic=now_monotonic,
-            )
-            fusion_adjustment = lexical_adjustment + numeric_adjustment
-            weighted_base = base_score * source_weight * quality_multiplier
-            composite_score = (
-                weighted_base
-                + learning_adjustment
-                + fusion_adjustment
-                + lifecycle_adjustment
-            )
-            normalized = dict(row)
-            normalized["source"] = source_name or source
-            normalized["sources"] = [source_name or source]
-            normalized["base_score"] = round(base_score, 6)
-            normalized["source_weight"] = round(source_weight, 4)
-            normalized["quality_multiplier"] = round(quality_multiplier, 6)
-            normalized["learning_adjustment"] = round(learning_adjustment, 6)
-            normalized["fusion_adjustment"] = round(fusion_adjustment, 6)
-            normalized["lexical_adjustment"] = round(lexical_adjustment, 6)
-            normalized["numeric_adjustment"] = round(numeric_adjustment, 6)
-            normalized["numeric_match_ratio"] = round(numeric_match_ratio, 6)
-            normalized["lifecycle_adjustment"] = round(lifecycle_adjustment, 6)
-            normalized["pre_consensus_score"] = round(composite_score, 6)
-            normalized["score"] = round(composite_score, 6)
-            existing = merged.get(key)
-            if existing is None:
-                merged[key] = normalized
-                continue
-            sources = set(existing.get("sources") or [])
-            sources.add(source_name or source)
-            existing["sources"] = sorted(sources)
-            if composite_score > float(existing.get("pre_consensus_score") or existing.get("score") or 0.0):
-                normalized["sources"] = sorted(sources)
-                merged[key] = normalized
-    rows = list(merged.values())
-    for row in rows:
-        sources = sorted(set(row.get("sources") or []))
+            group = group_by_key.get(key)
+            if group is None:
+                group = len(group_keys)
+                group_by_key[key] = group
+                group_keys.append(key)
+                group_sources.append(set())
+            group_sources[group].add(source_label)
+            row_refs.append((source_label, row))
+            row_groups.append(group)
+            base_col.append(float(row.get("score") or 0.0))
+            weight_col.append(source_weight)
+            quality_col.append(quality_multiplier)
+            learning_col.append(learning_adjustment)
+            lexical_col.append(lexical_adjustment)
+            numeric_col.append(numeric_adjustment)
+            numeric_ratio_col.append(numeric_match_ratio)
+    if not row_refs:
+        return []
+
+    # Lifecycle boosts depend only on the result identity, so compute them per group.
+    now_monotonic = time.monotonic()
+    lifecycle_by_group = [
+        _retrieval_lifecycle_adjustment(
+            key=key,
+            lifecycle_snapshot=lifecycle_records,
+            now_monotonic=now_monotonic,
+        )
+        for key in group_keys
+    ]
+    if np is not None:
+        pre_scores = (
+            np.asarray(base_col, dtype=np.float64)
+            * np.asarray(weight_col, dtype=np.float64)
+            * np.asarray(quality_col, dtype=np.float64)
+            + np.asarray(learning_col, dtype=np.float64)
+            + np.asarray(lexical_col, dtype=np.float64)
+            + np.asarray(numeric_col, dtype=np.float64)
+            + np.asarray(lifecycle_by_group, dtype=np.float64)[np.asarray(row_groups, dtype=np.int64)]
+        ).tolist()
+    else:
+        pre_scores = [
+            base_col[index] * weight_col[index] * quality_col[index]
+            + learning_col[index]
+            + lexical_col[index]
+            + numeric_col[index]
+            + lifecycle_by_group[row_groups[index]]
+            for index in range(len(row_refs))
+        ]
+
+    best_row: list[int] = [-1] * len(group_keys)
+    for index, group in enumerate(row_groups):
+        current = best_row[group]
+        if current < 0 or pre_scores[index] > pre_scores[current]:
+            best_row[group] = index
+    group_scores: list[float] = []
+    group_base_scores: list[float] = []
+    group_consensus: list[float] = []
+    for group, index in enumerate(best_row):
         consensus_adjustment = 0.0
-        if RETRIEVAL_FUSION_ENABLED and len(sources) > 1:
-            consensus_adjustment = (len(sources) - 1) * RETRIEVAL_FUSION_CONSENSUS_BOOST
-        pre_consensus = float(row.get("pre_consensus_score") or row.get("score") or 0.0)
-        row["sources"] = sources
-        row["consensus_adjustment"] = round(consensus_adjustment, 6)
-        row["score"] = round(pre_consensus + consensus_adjustment, 6)
-    return rows
+        if RETRIEVAL_FUSION_ENABLED and len(group_sources[group]) > 1:
+            consensus_adjustment = (len(group_sources[group]) - 1) * RETRIEVAL_FUSION_CONSENSUS_BOOST
+        group_consensus.append(consensus_adjustment)
+        group_scores.append(round(round(pre_scores[index], 6) + consensus_adjustment, 6))
+        group_base_scores.append(round(base_col[index], 6))
+
+    merged: list[dict[str, Any]] = []
+    for group in _fusion_top_k_order(group_scores, group_base_scores, top_k):
+        index = best_row[group]
+        source_label, row = row_refs[index]
+        normalized = dict(row)
+        normalized["source"] = source_label
+        normalized["sources"] = sorted(group_sources[group])
+        normalized["base_score"] = group_base_scores[group]
+        normalized["source_weight"] = round(weight_col[index], 4)
+        normalized["quality_multiplier"] = round(quality_col[index], 6)
+        normalized["learning_adjustment"] = round(learning_col[index], 6)
+        normalized["fusion_adjustment"] = round(lexical_col[index] + numeric_col[index], 6)
+        normalized["lexical_adjustment"] = round(lexical_col[index], 6)
+        normalized["numeric_adjustment"] = round(numeric_col[index], 6)
+        normalized["numeric_match_ratio"] = round(numeric_ratio_col[index], 6)
+        normalized["lifecycle_adjustment"] = round(lifecycle_by_group[group], 6)
+        normalized["pre_consensus_score"] = round(pre_scores[index], 6)
+        normalized["score"] = group_scores[group]
+        normalized["consensus_adjustment"] = round(group_consensus[group], 6)
+        merged.append(normalized)
+    return merged
+
+
+class RetrievalDeadline:
+    """Total latency budget for one retrieval request, shared by every stage it reaches.
+
+    Stages call ``mark`` when they finish so ``debug()`` can report where the budget
+    went; sources cap their timeouts with ``cap``.
+    """
+
+    __slots__ = (
+        "budget_ms",
+        "started",
+        "expires_at",
+        "last_mark",
+        "stages",
+        "skipped_sources",
+        "skipped_hops",
+        "skipped_variants",
+        "truncated",
+    )
+
+    def __init__(self, budget_ms: float) -> None:
+        self.budget_ms = max(1.0, float(budget_ms))
+        self.started = time.monotonic()
+        self.expires_at = self.started + self.budget_ms / 1000.0
+        self.last_mark = self.started
+        self.stages: list[dict[str, Any]] = []
+        self.skipped_sources: list[str] = []
+        self.skipped_hops = 0
+        self.skipped_variants = 0
+        # Set when the budget cut a source short, so partial results are not cached.
+        self.truncated = False
+
+    def remaining_ms(self) -> float:
+        return max(0.0, (self.expires_at - time.monotonic()) * 1000.0)
+
+    def cap(self, timeout_secs: float) -> float:
+        """Shrink a per-source timeout to the budget left after the merge reserve."""
+        available_secs = max(0.0, self.remaining_ms() - RETRIEVAL_DEADLINE_RESERVE_MS) / 1000.0
+        return min(float(timeout_secs), available_secs)
+
+    def mark(self, stage: str) -> None:
+        now = time.monotonic()
+        self.stages.append(
+            {
+                "stage": stage,
+                "elapsed_ms": round((now - self.last_mark) * 1000.0, 3),
+                "remaining_ms": round(max(0.0, (self.expires_at - now) * 1000.0), 3),
+            }
+        )
+        self.last_mark = now
+
+    def debug(self) -> dict[str, Any]:
+        consumed_ms = (time.monotonic() - self.started) * 1000.0
+        return {
+            "budget_ms": round(self.budget_ms, 3),
+            "consumed_ms": round(consumed_ms, 3),
+            "remaining_ms": round(self.remaining_ms(), 3),
+            "exceeded": consumed_ms > self.budget_ms,
+            "truncated": self.truncated,
+            "stages": list(self.stages),
+            "skipped_sources": list(self.skipped_sources),
+            "skipped_hops": self.skipped_hops,
+            "skipped_variants": self.skipped_variants,
+        }
+
+
+def _resolve_retrieval_deadline(
+    deadline_ms: int | None,
+    request: Request | None = None,
+) -> RetrievalDeadline | None:
+    """Deadline from the body field and/or request header; the tighter one wins."""
+    budgets: list[float] = []
+    if deadline_ms:
+        budgets.append(float(deadline_ms))
+    if request is not None:
+        header_value = str(request.headers.get(RETRIEVAL_DEADLINE_HEADER) or "").strip()
+        if header_value:
+            try:
+                budgets.append(float(header_value))
+            except ValueError:
+                raise HTTPException(400, f"Invalid {RETRIEVAL_DEADLINE_HEADER} header")
+    budgets = [budget for budget in budgets if budget > 0]
+    if not budgets:
+        return None
+    return RetrievalDeadline(min(budgets))
 
 
 async def federated_search_memory(
@@ -12792,7 +16752,21 @@ async def federated_search_memory(
     rerank_with_learning: bool = True,
     retrieval_mode: str = RETRIEVAL_MODE_BALANCED,
     record_pathway_usage: bool = True,
+    on_source_complete: Any | None = None,
+    prefetched_source_rows: dict[str, list[dict[str, Any]]] | None = None,
+    deadline: RetrievalDeadline | None = None,
+    refresh_pathway_cache: bool = False,
 ) -> tuple[list[dict[str, Any]], dict[str, Any], list[str]]:
+    """Fan out to retrieval sources and fuse their rows into one ranked list.
+
+    ``on_source_complete(source, rows, error)`` is awaited as each source finishes
+    (streaming endpoints use it); cache hits and coalesced calls complete without it.
+    ``prefetched_source_rows`` supplies rows already fetched in bulk (batch queries)
+    for a source, fetched with that source's limit for this mode.
+    With a ``deadline``, source timeouts are capped to the remaining budget, sources
+    that cannot fit are skipped, and budget-truncated results are not cached.
+    ``refresh_pathway_cache`` skips cached bundles and re-runs the search (the warmer).
+    """
     normalized_mode = _normalize_retrieval_mode(retrieval_mode)
     resolved_sources = _resolve_retrieval_sources_for_mode(mode=normalized_mode, sources=sources)
     resolved_weights = _normalize_retrieval_weights(source_weights)
@@ -12844,39 +16818,75 @@ async def federated_search_memory(
             min(float(effective_source_timeouts[source_name]), float(capped_timeout)),
         )
 
+    async def _notify_source_complete(
+        source_name: str,
+        rows: list[dict[str, Any]] | None,
+        error: str | None,
+    ) -> None:
+        if on_source_complete is None:
+            return
+        try:
+            await on_source_complete(source_name, rows, error)
+        except Exception as exc:
+            logger.debug("Retrieval source completion callback failed: %s", exc)
+
     async def _timed_source(
         source_name: str,
         timeout_secs: float,
         coro: Any,
+        *,
+        latency_deferred: Any = None,
     ) -> list[dict[str, Any]]:
         started = time.monotonic()
         ok = False
         timed_out = False
+        rows: list[dict[str, Any]] | None = None
+        failure: Exception | None = None
         try:
-            rows = await asyncio.wait_for(coro, timeout=max(1.0, timeout_secs))
+            # The 1s floor protects configured timeouts; a request deadline is authoritative.
+            wait_secs = timeout_secs if deadline is not None else max(1.0, timeout_secs)
+            rows = await asyncio.wait_for(coro, timeout=wait_secs)
             ok = True
-            return rows
         except asyncio.TimeoutError as exc:
             timed_out = True
-            raise OrchestratorError(
-                f"{source_name} retrieval timed out after {timeout_secs:.1f}s"
-            ) from exc
+            failure = exc
+        except Exception as exc:
+            failure = exc
         finally:
-            await _record_retrieval_source_latency(
-                source=source_name,
-                duration_ms=(time.monotonic() - started) * 1000,
-                ok=ok,
-                timed_out=timed_out,
-                retrieval_mode=normalized_mode,
-            )
+            # A won hedge records the primary's own elapsed time once that attempt settles.
+            if not (ok and latency_deferred is not None and latency_deferred()):
+                await _record_retrieval_source_latency(
+                    source=source_name,
+                    duration_ms=(time.monotonic() - started) * 1000,
+                    ok=ok,
+                    timed_out=timed_out,
+                    retrieval_mode=normalized_mode,
+                )
+        # Listeners run after the latency is recorded, so they never count toward it.
+        if timed_out:
+            message = f"{source_name} retrieval timed out after {timeout_secs:.1f}s"
+            await _notify_source_complete(source_name, None, message)
+            raise OrchestratorError(message) from failure
+        if failure is not None:
+            await _notify_source_complete(source_name, None, str(failure))
+            raise failure
+        assert rows is not None
+        await _notify_source_complete(source_name, rows, None)
+        return rows
+
+    async def _prefetched_rows(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        return [dict(row) for row in rows]
 
     def _build_source_coro(source: str, timeout_secs: float) -> Any:
+        if prefetched_source_rows and source in prefetched_source_rows:
+            return _prefetched_rows(prefetched_source_rows[source])
         if source == RETRIEVAL_SOURCE_QDRANT:
             return search_qdrant(
                 query,
                 limit=source_limit,
                 project_filter=project_filter,
                 topic_filter=topic_filter,
+                prefer_local=normalized_mode == RETRIEVAL_MODE_FAST,
             )
         if source == RETRIEVAL_SOURCE_MONGO_RAW:
             return search_mongo_raw(
@@ -12922,27 +16932,103 @@ async def federated_search_memory(
         source_batch: list[str],
     ) -> tuple[dict[str, list[dict[str, Any]]], dict[str, str], list[str]]:
         tasks: dict[str, asyncio.Task[list[dict[str, Any]]]] = {}
+        batch_rows: dict[str, list[dict[str, Any]]] = {}
+        batch_errors: dict[str, str] = {}
+        batch_warnings: list[str] = []
+        deadline_capped: set[str] = set()
+        empty_keys = {
+            source: _retrieval_empty_source_cache_key(
+                source=source,
+                query=query,
+                source_limit=source_limit,
+                project_filter=project_filter,
+                topic_filter=topic_filter,
+                retrieval_mode=normalized_mode,
+                generation_token=pathway_generation_token,
+            )
+            for source in source_batch
+            if source not in routed_out and not (prefetched_source_rows and source in prefetched_source_rows)
+        }
+        known_empty = await _retrieval_empty_source_cache_hits(empty_keys)
         for source in source_batch:
+            if source in routed_out:
+                continue
+            if source in known_empty:
+                batch_rows[source] = []
+                empty_source_cache_hits.append(source)
+                continue
             timeout = float(effective_source_timeouts.get(source, RETRIEVAL_QDRANT_TIMEOUT_SECS))
+            if deadline is not None:
+                capped = deadline.cap(timeout)
+                if capped * 1000.0 < RETRIEVAL_DEADLINE_MIN_SOURCE_MS:
+                    deadline.skipped_sources.append(source)
+                    deadline.truncated = True
+                    batch_warnings.append(f"{source} retrieval skipped: request deadline exhausted")
+                    continue
+                if capped < timeout:
+                    deadline_capped.add(source)
+                    timeout = capped
+            hedge_delay = hedge_delays.get(source)
+            latency_deferred: Any = None
+            if hedge_delay is not None and hedge_delay < timeout:
+
+                async def _record_primary(duration_ms: float, ok: bool, timed_out: bool, source: str = source) -> None:
+                    await _record_retrieval_source_latency(
+                        source=source,
+                        duration_ms=duration_ms,
+                        ok=ok,
+                        timed_out=timed_out,
+                        retrieval_mode=normalized_mode,
+                    )
+
+                source_coro = _run_hedged_source(
+                    source,
+                    lambda source=source, timeout=timeout: _build_source_coro(source, timeout),
+                    hedge_delay,
+                    hedge_outcomes,
+                    on_primary_settled=_record_primary,
+                    primary_timeout_secs=timeout,
+                )
+
+                def _hedge_won(source: str = source) -> bool:
+                    return hedge_outcomes.get(source) == "hedge_won"
+
+                latency_deferred = _hedge_won
+            else:
+                source_coro = _build_source_coro(source, timeout)
             tasks[source] = asyncio.create_task(
                 _timed_source(
                     source,
                     timeout,
-                    _build_source_coro(source, timeout),
+                    source_coro,
+                    latency_deferred=latency_deferred,
                 )
             )
-        batch_rows: dict[str, list[dict[str, Any]]] = {}
-        batch_errors: dict[str, str] = {}
-        batch_warnings: list[str] = []
         if not tasks:
             return batch_rows, batch_errors, batch_warnings
         gathered = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        newly_empty: list[str] = []
         for source, outcome in zip(tasks.keys(), gathered):
             if isinstance(outcome, Exception):
                 batch_errors[source] = str(outcome)
                 batch_warnings.append(f"{source} retrieval failed: {outcome}")
+                if deadline is not None and source in deadline_capped:
+                    deadline.truncated = True
                 continue
             batch_rows[source] = outcome
+            # A deadline-capped source may have stopped early, and an incomplete one swallowed
+            # a failure, so neither empty answer is remembered.
+            if (
+                not outcome
+                and not isinstance(outcome, _IncompleteSourceRows)
+                and source in empty_keys
+                and source not in deadline_capped
+            ):
+                newly_empty.append(empty_keys[source])
+        await _retrieval_empty_source_cache_store(
+            newly_empty,
+            _retrieval_pathway_generation_scope(project_filter, topic_filter),
+        )
         return batch_rows, batch_errors, batch_warnings
 
     results_by_source: dict[str, list[dict[str, Any]]] = {}
@@ -12953,25 +17039,62 @@ async def federated_search_memory(
         and RETRIEVAL_ENABLE_LEARNING_RERANK
         and (positive_terms or negative_terms)
     )
-    pathway_cache_key = _retrieval_pathway_cache_key(
+    compiled_query = CompiledQuery(
+        query,
+        positive_terms=positive_terms,
+        negative_terms=negative_terms,
+    )
+    pathway_cache_key, pathway_generation_token = await _retrieval_search_pathway_cache_key(
         query=query,
         limit=limit,
         project_filter=project_filter,
         topic_filter=topic_filter,
-        sources=resolved_sources,
-        source_weights=resolved_weights,
-        retrieval_mode=normalized_mode,
-        learning_enabled=learning_enabled,
-        positive_terms=positive_terms,
-        negative_terms=negative_terms,
+        sources=sources,
+        source_weights=source_weights,
+        preferences=preferences,
+        rerank_with_learning=rerank_with_learning,
+        retrieval_mode=retrieval_mode,
     )
-    cached_bundle = await _retrieval_pathway_cache_get(pathway_cache_key)
+    cached_bundle = None if refresh_pathway_cache else await _retrieval_pathway_cache_get(pathway_cache_key)
+    semantic_partition: str | None = None
+    semantic_query_vector: Any = None
+    semantic_match: tuple[str, float] | None = None
+    if cached_bundle is None and not refresh_pathway_cache and _retrieval_semantic_cache_active(resolved_sources):
+        # Same identity as the pathway key minus the query text: filters, mode,
+        # sources, weights, learning terms and write generation must all agree, and
+        # so must the query's numbers ("stop loss 50" never reuses "stop loss 55").
+        semantic_partition = _retrieval_pathway_cache_key(
+            query="",
+            numeric_values=compiled_query.numeric_values,
+            limit=limit,
+            project_filter=project_filter,
+            topic_filter=topic_filter,
+            sources=resolved_sources,
+            source_weights=resolved_weights,
+            retrieval_mode=normalized_mode,
+            learning_enabled=learning_enabled,
+            positive_terms=positive_terms,
+            negative_terms=negative_terms,
+            generation_token=pathway_generation_token,
+        )
+        if await _retrieval_semantic_cache_has_partition(semantic_partition):
+            semantic_query_vector = await _retrieval_semantic_query_vector(query, compute=True)
+            if semantic_query_vector is not None:
+                semantic_match = await _retrieval_semantic_cache_lookup(semantic_partition, semantic_query_vector)
+        if semantic_match is not None:
+            cached_bundle = await _retrieval_pathway_cache_get(semantic_match[0])
+            if cached_bundle is None:
+                await _retrieval_semantic_cache_discard(semantic_match[0])
+                semantic_match = None
     if cached_bundle is not None:
         cached_results, cached_debug, cached_warnings = cached_bundle
         cached_debug = dict(cached_debug)
         cached_cache = cached_debug.get("cache") if isinstance(cached_debug.get("cache"), dict) else {}
         cached_cache["pathway_hit"] = True
         cached_cache["template_hit"] = True
+        cached_cache["semantic_hit"] = semantic_match is not None
+        if semantic_match is not None:
+            cached_cache["semantic_similarity"] = round(semantic_match[1], 4)
         cached_debug["cache"] = cached_cache
         cached_debug["retrieval_mode"] = normalized_mode
         if record_pathway_usage:
@@ -12982,32 +17105,129 @@ async def federated_search_memory(
                 sources=resolved_sources,
                 source_weights=resolved_weights,
                 retrieval_mode=normalized_mode,
+                limit=limit,
             )
+        if deadline is not None:
+            deadline.mark(f"{normalized_mode}:pathway_cache")
         return cached_results[:limit], cached_debug, cached_warnings
 
-    lifecycle_snapshot = await _retrieval_lifecycle_snapshot()
-    source_quality_snapshot: dict[str, Any] = {
-        "enabled": bool(RETRIEVAL_SOURCE_QUALITY_ADAPTIVE_ENABLED),
-        "sources": {},
-        "multipliers": {},
-    }
+    hedge_delays = await _retrieval_hedge_delays(
+        sources=resolved_sources,
+        degraded_sources=degraded_sources,
+        retrieval_mode=normalized_mode,
+    )
+    hedge_outcomes: dict[str, str] = {}
+    empty_source_cache_hits: list[str] = []
+    router_key: str | None = None
+    router_decisions: dict[str, dict[str, Any]] = {}
+    routed_out: set[str] = set()
+    # Explicit source lists and deep mode ask for every source, so they are never routed.
+    if (
+        RETRIEVAL_SOURCE_ROUTER_ENABLED
+        and not explicit_source_override
+        and normalized_mode != RETRIEVAL_MODE_DEEP
+        and not prefetched_source_rows
+    ):
+        router_key = _retrieval_source_router_key(
+            query=query,
+            project_filter=project_filter,
+            topic_filter=topic_filter,
+            retrieval_mode=normalized_mode,
+        )
+        router_decisions = await _retrieval_source_router_decide(router_key, sources=resolved_sources)
+        routed_out = {
+            source
+            for source, decision in router_decisions.items()
+            if decision.get("decision") == "skip"
+        }
+
+    async def _execute_search() -> tuple[list[dict[str, Any]], dict[str, Any], list[str]]:
+        lifecycle_snapshot = await _retrieval_lifecycle_snapshot()
+        source_quality_snapshot: dict[str, Any] = {
+            "enabled": bool(RETRIEVAL_SOURCE_QUALITY_ADAPTIVE_ENABLED),
+            "sources": {},
+            "multipliers": {},
+        }
+
+        slow_sources_skipped: list[str] = []
+        if staged_fetch_used:
+            fast_rows, fast_errors, fast_warnings = await _run_source_batch(staged_fast_sources)
+            if deadline is not None:
+                deadline.mark(f"{normalized_mode}:fast_sources")
+            results_by_source.update(fast_rows)
+            source_errors.update(fast_errors)
+            warnings.extend(fast_warnings)
+            source_quality_snapshot = await _retrieval_source_quality_snapshot(
+                sources=list(fast_rows.keys()) or list(staged_fast_sources)
+            )
+            source_quality_multipliers = (
+                source_quality_snapshot.get("multipliers")
+                if isinstance(source_quality_snapshot.get("multipliers"), dict)
+                else {}
+            )
+            min_results_for_skip = max(1, min(limit, RETRIEVAL_SLOW_SOURCE_MIN_RESULTS))
+            # The skip decision only needs the top score and whether the fast sources
+            # reached the volume threshold, so rank no more rows than that threshold.
+            fast_merged = _merge_federated_rows(
+                fast_rows,
+                resolved_weights,
+                positive_terms,
+                negative_terms,
+                learning_enabled=learning_enabled,
+                query=query,
+                source_quality_multipliers={
+                    str(name): float(value)
+                    for name, value in source_quality_multipliers.items()
+                },
+                lifecycle_snapshot=lifecycle_snapshot,
+                compiled_query=compiled_query,
+                top_k=max(min_results_for_skip, limit * 2),
+            )
+            top_fast_score = float(fast_merged[0].get("score") or 0.0) if fast_merged else 0.0
+            enough_fast_volume = len(fast_merged) >= max(min_results_for_skip, limit * 2)
+            fast_sources_with_hits = sum(
+                1
+                for source_name in staged_fast_sources
+                if len(fast_rows.get(source_name, [])) > 0
+            )
+            enough_fast_diversity = fast_sources_with_hits >= RETRIEVAL_SLOW_SOURCE_MIN_DIVERSITY
+            skip_slow = bool(
+                len(fast_merged) >= min_results_for_skip
+                and enough_fast_diversity
+                and (
+                    top_fast_score >= RETRIEVAL_SLOW_SOURCE_MIN_TOP_SCORE
+                    or enough_fast_volume
+                )
+            )
+            if force_include_slow:
+                skip_slow = False
+            if skip_slow and not explicit_source_override:
+                slow_sources_skipped = list(staged_slow_sources)
+            else:
+                slow_rows, slow_errors, slow_warnings = await _run_source_batch(staged_slow_sources)
+                if deadline is not None:
+                    deadline.mark(f"{normalized_mode}:slow_sources")
+                results_by_source.update(slow_rows)
+                source_errors.update(slow_errors)
+                warnings.extend(slow_warnings)
+        else:
+            batch_rows, batch_errors, batch_warnings = await _run_source_batch(resolved_sources)
+            if deadline is not None:
+                deadline.mark(f"{normalized_mode}:sources")
+            results_by_source.update(batch_rows)
+            source_errors.update(batch_errors)
+            warnings.extend(batch_warnings)
 
-    slow_sources_skipped: list[str] = []
-    if staged_fetch_used:
-        fast_rows, fast_errors, fast_warnings = await _run_source_batch(staged_fast_sources)
-        results_by_source.update(fast_rows)
-        source_errors.update(fast_errors)
-        warnings.extend(fast_warnings)
         source_quality_snapshot = await _retrieval_source_quality_snapshot(
-            sources=list(fast_rows.keys()) or list(staged_fast_sources)
+            sources=list(results_by_source.keys()) or list(resolved_sources)
         )
         source_quality_multipliers = (
             source_quality_snapshot.get("multipliers")
             if isinstance(source_quality_snapshot.get("multipliers"), dict)
             else {}
         )
-        fast_merged = _merge_federated_rows(
-            fast_rows,
+        merged = _merge_federated_rows(
+            results_by_source,
             resolved_weights,
             positive_terms,
             negative_terms,
@@ -13018,133 +17238,112 @@ async def federated_search_memory(
                 for name, value in source_quality_multipliers.items()
             },
             lifecycle_snapshot=lifecycle_snapshot,
+            compiled_query=compiled_query,
+            top_k=limit,
         )
-        fast_merged.sort(
-            key=lambda row: (
-                float(row.get("score") or 0.0),
-                float(row.get("base_score") or 0.0),
-            ),
-            reverse=True,
-        )
-        min_results_for_skip = max(1, min(limit, RETRIEVAL_SLOW_SOURCE_MIN_RESULTS))
-        top_fast_score = float(fast_merged[0].get("score") or 0.0) if fast_merged else 0.0
-        enough_fast_volume = len(fast_merged) >= max(min_results_for_skip, limit * 2)
-        fast_sources_with_hits = sum(
-            1
-            for source_name in staged_fast_sources
-            if len(fast_rows.get(source_name, [])) > 0
+        retrieval_debug = {
+            "retrieval_mode": normalized_mode,
+            "sources": resolved_sources,
+            "source_weights": resolved_weights,
+            "source_counts": {
+                source: len(results_by_source.get(source, []))
+                for source in resolved_sources
+            },
+            "source_errors": source_errors,
+            "cache": {
+                "pathway_hit": False,
+                "template_hit": template_cache_hit,
+                "semantic_hit": False,
+                "coalesced": False,
+            },
+            "staged_fetch": {
+                "enabled": staged_fetch_used,
+                "explicit_source_override": explicit_source_override,
+                "force_include_slow": force_include_slow,
+                "fast_sources": staged_fast_sources,
+                "slow_sources": staged_slow_sources,
+                "slow_sources_skipped": slow_sources_skipped,
+                "slow_source_min_results": RETRIEVAL_SLOW_SOURCE_MIN_RESULTS,
+                "slow_source_min_top_score": RETRIEVAL_SLOW_SOURCE_MIN_TOP_SCORE,
+                "slow_source_min_diversity": RETRIEVAL_SLOW_SOURCE_MIN_DIVERSITY,
+            },
+            "source_policy": {
+                "stability_enabled": bool(runtime_policy.get("enabled")),
+                "degraded_sources": degraded_sources,
+                "timeout_overrides": timeout_overrides,
+                "hedge_delays_ms": {
+                    source: round(delay * 1000.0, 3)
+                    for source, delay in hedge_delays.items()
+                },
+                "hedges": dict(hedge_outcomes),
+            },
+            "source_router": {
+                "enabled": router_key is not None,
+                "route": router_key,
+                "skipped": sorted(routed_out),
+                "decisions": router_decisions,
+            },
+            "empty_source_cache_hits": sorted(empty_source_cache_hits),
+            "learning_rerank": {
+                "enabled": learning_enabled,
+                "positive_terms": len(positive_terms),
+                "negative_terms": len(negative_terms),
+            },
+            "fusion": {
+                "enabled": bool(RETRIEVAL_FUSION_ENABLED),
+                "lexical_boost": RETRIEVAL_FUSION_LEXICAL_BOOST,
+                "consensus_boost": RETRIEVAL_FUSION_CONSENSUS_BOOST,
+                "numeric_match_enabled": bool(RETRIEVAL_FUSION_NUMERIC_MATCH_ENABLED),
+                "numeric_match_boost": RETRIEVAL_FUSION_NUMERIC_MATCH_BOOST,
+                "numeric_miss_penalty": RETRIEVAL_FUSION_NUMERIC_MISS_PENALTY,
+            },
+            "source_quality": source_quality_snapshot,
+            "lifecycle": {
+                "enabled": bool(RETRIEVAL_LIFECYCLE_ENABLED),
+                "tracked_keys": len(lifecycle_snapshot),
+                "max_keys": RETRIEVAL_LIFECYCLE_MAX_KEYS,
+                "half_life_hours": RETRIEVAL_LIFECYCLE_HALFLIFE_HOURS,
+            },
+        }
+        final_results = merged[:limit]
+        if deadline is not None:
+            deadline.mark(f"{normalized_mode}:merge")
+        if router_key is not None:
+            await _record_retrieval_source_router_observation(
+                router_key,
+                ran_sources=list(results_by_source.keys()),
+                results=final_results,
+            )
+        await _record_retrieval_lifecycle_observation(query=query, results=final_results)
+        if deadline is not None and deadline.truncated:
+            # Budget-truncated results must not be served to unconstrained callers.
+            return final_results, retrieval_debug, warnings
+        await _retrieval_pathway_cache_set(
+            pathway_cache_key,
+            results=final_results,
+            retrieval_debug=retrieval_debug,
+            warnings=warnings,
         )
-        enough_fast_diversity = fast_sources_with_hits >= RETRIEVAL_SLOW_SOURCE_MIN_DIVERSITY
-        skip_slow = bool(
-            len(fast_merged) >= min_results_for_skip
-            and enough_fast_diversity
-            and (
-                top_fast_score >= RETRIEVAL_SLOW_SOURCE_MIN_TOP_SCORE
-                or enough_fast_volume
+        if semantic_partition is not None:
+            await _retrieval_semantic_cache_store(
+                semantic_partition,
+                pathway_cache_key,
+                semantic_query_vector
+                if semantic_query_vector is not None
+                else await _retrieval_semantic_query_vector(query, compute=False),
             )
+        return final_results, retrieval_debug, warnings
+
+    # A request with its own budget neither waits on nor lends results to other flights.
+    if RETRIEVAL_PATHWAY_SINGLEFLIGHT_ENABLED and deadline is None:
+        final_results, retrieval_debug, warnings = await _retrieval_pathway_singleflight(
+            pathway_cache_key,
+            _execute_search,
         )
-        if force_include_slow:
-            skip_slow = False
-        if skip_slow and not explicit_source_override:
-            slow_sources_skipped = list(staged_slow_sources)
-        else:
-            slow_rows, slow_errors, slow_warnings = await _run_source_batch(staged_slow_sources)
-            results_by_source.update(slow_rows)
-            source_errors.update(slow_errors)
-            warnings.extend(slow_warnings)
     else:
-        batch_rows, batch_errors, batch_warnings = await _run_source_batch(resolved_sources)
-        results_by_source.update(batch_rows)
-        source_errors.update(batch_errors)
-        warnings.extend(batch_warnings)
-
-    source_quality_snapshot = await _retrieval_source_quality_snapshot(
-        sources=list(results_by_source.keys()) or list(resolved_sources)
-    )
-    source_quality_multipliers = (
-        source_quality_snapshot.get("multipliers")
-        if isinstance(source_quality_snapshot.get("multipliers"), dict)
-        else {}
-    )
-    merged = _merge_federated_rows(
-        results_by_source,
-        resolved_weights,
-        positive_terms,
-        negative_terms,
-        learning_enabled=learning_enabled,
-        query=query,
-        source_quality_multipliers={
-            str(name): float(value)
-            for name, value in source_quality_multipliers.items()
-        },
-        lifecycle_snapshot=lifecycle_snapshot,
-    )
-    merged.sort(
-        key=lambda row: (
-            float(row.get("score") or 0.0),
-            float(row.get("base_score") or 0.0),
-        ),
-        reverse=True,
-    )
-    retrieval_debug = {
-        "retrieval_mode": normalized_mode,
-        "sources": resolved_sources,
-        "source_weights": resolved_weights,
-        "source_counts": {
-            source: len(results_by_source.get(source, []))
-            for source in resolved_sources
-        },
-        "source_errors": source_errors,
-        "cache": {
-            "pathway_hit": False,
-            "template_hit": template_cache_hit,
-        },
-        "staged_fetch": {
-            "enabled": staged_fetch_used,
-            "explicit_source_override": explicit_source_override,
-            "force_include_slow": force_include_slow,
-            "fast_sources": staged_fast_sources,
-            "slow_sources": staged_slow_sources,
-            "slow_sources_skipped": slow_sources_skipped,
-            "slow_source_min_results": RETRIEVAL_SLOW_SOURCE_MIN_RESULTS,
-            "slow_source_min_top_score": RETRIEVAL_SLOW_SOURCE_MIN_TOP_SCORE,
-            "slow_source_min_diversity": RETRIEVAL_SLOW_SOURCE_MIN_DIVERSITY,
-        },
-        "source_policy": {
-            "stability_enabled": bool(runtime_policy.get("enabled")),
-            "degraded_sources": degraded_sources,
-            "timeout_overrides": timeout_overrides,
-        },
-        "learning_rerank": {
-            "enabled": learning_enabled,
-            "positive_terms": len(positive_terms),
-            "negative_terms": len(negative_terms),
-        },
-        "fusion": {
-            "enabled": bool(RETRIEVAL_FUSION_ENABLED),
-            "lexical_boost": RETRIEVAL_FUSION_LEXICAL_BOOST,
-            "consensus_boost": RETRIEVAL_FUSION_CONSENSUS_BOOST,
-            "numeric_match_enabled": bool(RETRIEVAL_FUSION_NUMERIC_MATCH_ENABLED),
-            "numeric_match_boost": RETRIEVAL_FUSION_NUMERIC_MATCH_BOOST,
-            "numeric_miss_penalty": RETRIEVAL_FUSION_NUMERIC_MISS_PENALTY,
-        },
-        "source_quality": source_quality_snapshot,
-        "lifecycle": {
-            "enabled": bool(RETRIEVAL_LIFECYCLE_ENABLED),
-            "tracked_keys": len(lifecycle_snapshot),
-            "max_keys": RETRIEVAL_LIFECYCLE_MAX_KEYS,
-            "half_life_hours": RETRIEVAL_LIFECYCLE_HALFLIFE_HOURS,
-        },
-    }
-    final_results = merged[:limit]
-    await _record_retrieval_lifecycle_observation(query=query, results=final_results)
-    await _retrieval_pathway_cache_set(
-        pathway_cache_key,
-        results=final_results,
-        retrieval_debug=retrieval_debug,
-        warnings=warnings,
-    )
+        final_results, retrieval_debug, warnings = await _execute_search()
     if record_pathway_usage:
+        filled_cache = RETRIEVAL_PATHWAY_CACHE_ENABLED and not (deadline is not None and deadline.truncated)
         await _record_retrieval_pathway_observation(
             query=query,
             project_filter=project_filter,
@@ -13152,6 +17351,8 @@ async def federated_search_memory(
             sources=resolved_sources,
             source_weights=resolved_weights,
             retrieval_mode=normalized_mode,
+            limit=limit,
+            cached_for_secs=_retrieval_pathway_cache_ttl_secs() if filled_cache else None,
         )
     return final_results, retrieval_debug, warnings
 
@@ -13170,6 +17371,8 @@ async def _run_memory_recall_pipeline(
     agent_profile: dict[str, Any] | None = None,
     auto_escalate: bool = False,
     query_expansion: bool = True,
+    on_source_complete: Any | None = None,
+    deadline: RetrievalDeadline | None = None,
 ) -> tuple[list[dict[str, Any]], dict[str, Any], list[str], dict[str, Any]]:
     normalized_mode = _normalize_retrieval_mode(retrieval_mode)
     profile = agent_profile if isinstance(agent_profile, dict) else {}
@@ -13193,7 +17396,13 @@ async def _run_memory_recall_pipeline(
     min_results = int(profile.get("escalate_min_results") or AGENT_RECALL_ESCALATE_MIN_RESULTS)
     min_top_score = float(profile.get("escalate_min_top_score") or AGENT_RECALL_ESCALATE_MIN_TOP_SCORE)
 
+    last_variant_ms = 0.0
     for variant_index, query_variant in enumerate(query_variants):
+        if deadline is not None and variant_index > 0 and deadline.remaining_ms() < last_variant_ms:
+            # Another variant would take about as long as the last one; it cannot fit.
+            deadline.skipped_variants += len(query_variants) - variant_index
+            break
+        variant_started = time.monotonic()
         hop_mode = normalized_mode
         hop_result_sets: list[list[dict[str, Any]]] = []
         hop_debugs: list[dict[str, Any]] = []
@@ -13201,6 +17410,7 @@ async def _run_memory_recall_pipeline(
         hop_count = 0
         while True:
             hop_count += 1
+            hop_started = time.monotonic()
             hop_results, hop_debug, hop_warn = await federated_search_memory(
                 query_variant,
                 limit=limit,
@@ -13211,6 +17421,8 @@ async def _run_memory_recall_pipeline(
                 preferences=preferences,
                 rerank_with_learning=rerank_with_learning,
                 retrieval_mode=hop_mode,
+                on_source_complete=on_source_complete,
+                deadline=deadline,
             )
             hop_result_sets.append(hop_results)
             hop_debugs.append(hop_debug)
@@ -13226,6 +17438,10 @@ async def _run_memory_recall_pipeline(
                 break
             if hop_count >= AGENT_RECALL_MAX_ESCALATION_STEPS:
                 break
+            # A deeper hop costs at least what this one did; skip it if the budget can't cover that.
+            if deadline is not None and deadline.remaining_ms() < (time.monotonic() - hop_started) * 1000.0:
+                deadline.skipped_hops += 1
+                break
             hop_mode = _next_retrieval_mode(hop_mode)
 
         merged_variant_results = _merge_ranked_result_sets(
@@ -13236,6 +17452,7 @@ async def _run_memory_recall_pipeline(
             row.setdefault("query_variant", query_variant)
             row.setdefault("retrieval_mode_used", hop_mode)
         variant_results_all.append(merged_variant_results)
+        last_variant_ms = (time.monotonic() - variant_started) * 1000.0
         last_debug = hop_debugs[-1] if hop_debugs else {}
         top_score = _top_result_score(merged_variant_results)
         variant_debug_records.append(
@@ -13320,6 +17537,9 @@ async def _run_memory_recall_pipeline(
     best_debug["source_counts"] = source_counts
     best_debug["pipeline"] = pipeline_debug
     grounding = _build_grounding_payload(merged_results)
+    if deadline is not None:
+        deadline.mark("grounding")
+        best_debug["deadline"] = deadline.debug()
     await _record_recall_quality_observation(results=merged_results, retrieval_debug=best_debug)
     deduped_warnings = []
     seen_warning: set[str] = set()
@@ -13663,9 +17883,166 @@ async def _insert_many_into_mindsdb(items: list[dict[str, Any]]) -> None:
             raise
         if not await _switch_mindsdb_to_fallback(str(exc), current_table=table_name):
             raise
-        fallback_table = mindsdb_target_table or _mindsdb_next_fallback_table(table_name)
-        fallback_query = _mindsdb_insert_many_query(items, fallback_table)
+        table_name = mindsdb_target_table or _mindsdb_next_fallback_table(table_name)
+        fallback_query = _mindsdb_insert_many_query(items, table_name)
         await _mindsdb_execute(fallback_query)
+    await _index_mindsdb_terms(items, table_name)
+
+
+async def _mindsdb_table_row_count(table_name: str) -> int:
+    raw = await _mindsdb_execute(f"SELECT COUNT(*) AS c FROM {MINDSDB_AUTOSYNC_DB}.{table_name};")
+    rows = _mindsdb_rows(raw)
+    return _safe_int(rows[0].get("c")) if rows else 0
+
+
+async def _ensure_mindsdb_term_index(table_name: str) -> str | None:
+    """Create the term side table for ``table_name``; returns its name once it exists.
+
+    A term table without a completion marker next to a populated autosync table starts
+    a background backfill, and retrieval keeps using LIKE scans until it completes.
+    """
+    if not MINDSDB_TERM_INDEX_ENABLED:
+        return None
+    term_table = _mindsdb_term_table_name(table_name)
+    if mindsdb_term_index_state.get("table") == term_table:
+        return term_table
+    async with mindsdb_term_index_lock:
+        if mindsdb_term_index_state.get("table") == term_table:
+            return term_table
+        create_query = (
+            f"CREATE TABLE IF NOT EXISTS {MINDSDB_AUTOSYNC_DB}.{term_table} "
+            "(term TEXT, project TEXT, file TEXT, created_at TEXT);"
+        )
+        try:
+            await _mindsdb_execute(create_query)
+        except Exception as exc:
+            if not _looks_like_mindsdb_table_exists(str(exc)):
+                mindsdb_term_index_state["lastError"] = str(exc)[:300]
+                logger.warning("MindsDB term table init failed: %s", exc)
+                return None
+        try:
+            # Only a completion marker proves the term table covers the autosync table;
+            # rows alone may be a partial backfill or miss a failed incremental write.
+            complete = await _mindsdb_term_index_complete(term_table)
+            row_count = 0 if complete else await _mindsdb_table_row_count(table_name)
+            if not complete and row_count <= 0:
+                await _mark_mindsdb_term_index_complete(term_table)
+        except Exception as exc:
+            mindsdb_term_index_state["lastError"] = str(exc)[:300]
+            logger.warning("MindsDB term table check failed: %s", exc)
+            return None
+        mindsdb_term_index_state["table"] = term_table
+        mindsdb_term_index_state["ready"] = complete or row_count <= 0
+        if not mindsdb_term_index_state["ready"]:
+            _schedule_mindsdb_term_index_backfill(table_name)
+        return term_table
+
+
+async def _mindsdb_term_index_complete(term_table: str) -> bool:
+    raw = await _mindsdb_execute(
+        f"SELECT COUNT(*) AS c FROM {MINDSDB_AUTOSYNC_DB}.{term_table} "
+        f"WHERE term = {_sql_literal(_MINDSDB_TERM_INDEX_COMPLETE_TERM)};"
+    )
+    rows = _mindsdb_rows(raw)
+    return bool(rows) and _safe_int(rows[0].get("c")) > 0
+
+
+async def _mark_mindsdb_term_index_complete(term_table: str) -> None:
+    await _mindsdb_execute(
+        f"INSERT INTO {MINDSDB_AUTOSYNC_DB}.{term_table} (term, project, file, created_at) VALUES "
+        f"({_sql_literal(_MINDSDB_TERM_INDEX_COMPLETE_TERM)}, '', '', {_sql_literal(_utc_now())});"
+    )
+
+
+async def _clear_mindsdb_term_index_complete(term_table: str) -> None:
+    await _mindsdb_execute(
+        f"DELETE FROM {MINDSDB_AUTOSYNC_DB}.{term_table} "
+        f"WHERE term = {_sql_literal(_MINDSDB_TERM_INDEX_COMPLETE_TERM)};"
+    )
+
+
+def _schedule_mindsdb_term_index_backfill(table_name: str) -> None:
+    """Start the background backfill, or flag a rerun if one is already in flight."""
+    global mindsdb_term_index_task
+    if mindsdb_term_index_task is not None and not mindsdb_term_index_task.done():
+        mindsdb_term_index_state["repairPending"] = True
+        return
+    mindsdb_term_index_task = asyncio.create_task(_run_mindsdb_term_index_backfill(table_name))
+
+
+async def _run_mindsdb_term_index_backfill(table_name: str) -> None:
+    # A write that fails while a pass is running may land behind its offset, so any
+    # repair requested meanwhile gets another full pass.
+    while True:
+        mindsdb_term_index_state["repairPending"] = False
+        try:
+            await backfill_mindsdb_term_index(table_name)
+        except Exception:
+            return
+        if not mindsdb_term_index_state.get("repairPending"):
+            return
+
+
+async def backfill_mindsdb_term_index(table_name: str | None = None) -> dict[str, Any]:
+    """Index every autosync row into the term side table, then mark it ready for retrieval."""
+    table_name = table_name or mindsdb_target_table or MINDSDB_AUTOSYNC_TABLE
+    term_table = _mindsdb_term_table_name(table_name)
+    started = time.monotonic()
+    mindsdb_term_index_state["backfillRunning"] = True
+    indexed = 0
+    try:
+        # A stale marker must not outlive a restart mid-backfill.
+        await _clear_mindsdb_term_index_complete(term_table)
+        offset = 0
+        while True:
+            raw = await _mindsdb_execute(
+                f"SELECT project, file, summary, created_at FROM {MINDSDB_AUTOSYNC_DB}.{table_name} "
+                f"ORDER BY created_at LIMIT {MINDSDB_TERM_INDEX_BACKFILL_BATCH} OFFSET {offset};"
+            )
+            rows = _mindsdb_rows(raw)
+            if not rows:
+                break
+            await _mindsdb_replace_terms(rows, term_table)
+            indexed += len(rows)
+            offset += len(rows)
+            if len(rows) < MINDSDB_TERM_INDEX_BACKFILL_BATCH:
+                break
+        if not mindsdb_term_index_state.get("repairPending"):
+            await _mark_mindsdb_term_index_complete(term_table)
+    except Exception as exc:
+        mindsdb_term_index_state["lastError"] = str(exc)[:300]
+        logger.warning("MindsDB term index backfill failed after %s rows: %s", indexed, exc)
+        raise
+    finally:
+        mindsdb_term_index_state["backfillRunning"] = False
+        mindsdb_term_index_state["backfilledRows"] = indexed
+    mindsdb_term_index_state["lastBackfillAt"] = _utc_now()
+    if mindsdb_term_index_state.get("table") == term_table and not mindsdb_term_index_state.get("repairPending"):
+        mindsdb_term_index_state["ready"] = True
+    return {
+        "table": term_table,
+        "rows": indexed,
+        "durationMs": round((time.monotonic() - started) * 1000.0, 3),
+    }
+
+
+async def _index_mindsdb_terms(items: list[dict[str, Any]], table_name: str) -> None:
+    # The event rows are already written, so a failure here must not re-queue them.
+    # Instead the index drops back to LIKE scans and a repair backfill is queued.
+    term_table = await _ensure_mindsdb_term_index(table_name)
+    if term_table is None:
+        return
+    try:
+        await _mindsdb_replace_terms(items, term_table)
+        mindsdb_term_index_state["indexedRows"] += len(items)
+    except Exception as exc:
+        mindsdb_term_index_state["indexErrors"] += 1
+        mindsdb_term_index_state["lastError"] = str(exc)[:300]
+        mindsdb_term_index_state["ready"] = False
+        logger.warning("MindsDB term index write failed; queueing repair backfill: %s", exc)
+        with contextlib.suppress(Exception):
+            await _clear_mindsdb_term_index_complete(term_table)
+        _schedule_mindsdb_term_index_backfill(table_name)
 
 
 async def push_to_mindsdb(
@@ -14706,7 +19083,7 @@ async def get_recall_tuning(
 @app.post("/telemetry/retrieval/warm")
 async def trigger_retrieval_pathway_warm():
     started = time.monotonic()
-    result = await _warm_retrieval_pathways_once()
+    result = await _warm_retrieval_pathways_once(force=True)
     _record_retrieval_pathway_warmer_run(
         result=result,
         duration_ms=(time.monotonic() - started) * 1000,
@@ -14991,11 +19368,91 @@ async def get_memory_file(project: str, file_path: str):
     return JSONResponse(data)
 
 
+def _truncate_utf8(text: str, max_bytes: int) -> tuple[str, bool]:
+    encoded = text.encode("utf-8")
+    if len(encoded) <= max_bytes:
+        return text, False
+    return encoded[:max_bytes].decode("utf-8", errors="ignore"), True
+
+
+async def _fetch_search_result_contents(
+    results: list[dict[str, Any]],
+    *,
+    max_content_bytes: int | None = None,
+    deadline_secs: float | None = None,
+) -> list[str]:
+    """Attach full file content to search results; returns warnings.
+
+    Fresh read-cache entries are served in one pass, the rest are read concurrently
+    (bounded by MEMMCP_SEARCH_FETCH_CONCURRENCY) until the fetch deadline, after which
+    unfinished reads leave ``content`` as None.
+    """
+    pairs: list[tuple[str, str]] = []
+    for result in results:
+        project = result.get("project")
+        file_name = result.get("file")
+        if isinstance(project, str) and isinstance(file_name, str) and project and file_name:
+            pair = (project, file_name)
+            if pair not in pairs:
+                pairs.append(pair)
+    contents = await _memory_read_cache_get_many(pairs)
+    missing = [pair for pair in pairs if pair not in contents]
+    timed_out = 0
+    if missing:
+        runtime = await _get_migration_runtime()
+        limiter = asyncio.Semaphore(MEMMCP_SEARCH_FETCH_CONCURRENCY)
+
+        async def _fetch(project: str, file_name: str) -> None:
+            async with limiter:
+                try:
+                    content = ""
+                    if runtime is not None:
+                        memory_payload = await runtime.memory_store.get_memory(f"{project}::{file_name}")
+                        if isinstance(memory_payload, dict):
+                            content = str(memory_payload.get("content") or "")
+                    if not content:
+                        content = await read_project_file(project, file_name)
+                    contents[(project, file_name)] = content
+                except Exception as exc:
+                    logger.warning(
+                        "Failed to fetch content for %s/%s: %s",
+                        project,
+                        file_name,
+                        exc,
+                    )
+
+        tasks = [asyncio.create_task(_fetch(project, file_name)) for project, file_name in missing]
+        _, pending = await asyncio.wait(
+            tasks,
+            timeout=deadline_secs if deadline_secs is not None else MEMMCP_SEARCH_FETCH_DEADLINE_SECS,
+        )
+        for task in pending:
+            task.cancel()
+        if pending:
+            timed_out = len(pending)
+            await asyncio.gather(*pending, return_exceptions=True)
+    for result in results:
+        content = contents.get((result.get("project"), result.get("file")))
+        if content is not None and max_content_bytes:
+            content, truncated = _truncate_utf8(content, max_content_bytes)
+            if truncated:
+                result["content_truncated"] = True
+        result["content"] = content
+    if timed_out:
+        return [f"Content fetch deadline exceeded; {timed_out} file(s) returned without content."]
+    return []
+
+
 class MemorySearch(BaseModel):
     query: str = Field(..., description="Search query")
     limit: int = Field(10, ge=1, le=100)
     project: str | None = Field(None, description="Filter by project")
     fetch_content: bool = Field(False, description="Fetch full file content")
+    max_content_bytes: int | None = Field(
+        None,
+        ge=1,
+        description="Truncate fetched content to this many UTF-8 bytes",
+    )
     topic_path: str | None = Field(None, description="Filter by topic path")
     retrieval_mode: str | None = Field(
         None,
@@ -15038,6 +19495,12 @@ class MemorySearch(BaseModel):
         None,
         description="Override profile query-expansion policy",
     )
+    deadline_ms: int | None = Field(
+        None,
+        ge=1,
+        le=600000,
+        description="Total latency budget for the search (also accepted as X-Retrieval-Deadline-Ms)",
+    )
 
 
 class ContextPackRequest(BaseModel):
@@ -15447,6 +19910,142 @@ async def _scheduler_retry_via_runtime(
     return await runtime.scheduler.retry(task_id=task_id, error=error, worker=worker)
 
 
+async def _stream_retrieval_frames(
+    *,
+    query: str,
+    limit: int,
+    source_weights: dict[str, float] | None,
+    execute: Any,
+    preferences: dict[str, Any] | None = None,
+):
+    """Yield ``partial`` frames as sources complete, then one ``final`` (or ``error``) frame.
+
+    Partial frames re-fuse every row seen so far without quality multipliers or
+    lifecycle boosts, so their ranking is provisional; the final frame is the exact
+    response of the non-streaming endpoint.
+    """
+    completions: asyncio.Queue[tuple[str, list[dict[str, Any]] | None, str | None, float]] = asyncio.Queue()
+    rows_by_source: dict[str, list[dict[str, Any]]] = {}
+    positions_by_source: dict[str, dict[str, int]] = {}
+    completed_sources: list[str] = []
+    resolved_weights = _normalize_retrieval_weights(source_weights)
+    positive_terms, negative_terms = _extract_learning_terms(preferences)
+    learning_enabled = bool(RETRIEVAL_ENABLE_LEARNING_RERANK and (positive_terms or negative_terms))
+    compiled_query = CompiledQuery(
+        query,
+        positive_terms=positive_terms,
+        negative_terms=negative_terms,
+    )
+    started = time.monotonic()
+
+    async def _on_source_complete(
+        source: str,
+        rows: list[dict[str, Any]] | None,
+        error: str | None,
+    ) -> None:
+        # Hand off only; the merge runs in the consumer, off the search task.
+        completions.put_nowait((source, rows, error, round((time.monotonic() - started) * 1000, 3)))
+
+    def _partial_frame(
+        source: str,
+        rows: list[dict[str, Any]] | None,
+        error: str | None,
+        elapsed_ms: float,
+    ) -> dict[str, Any]:
+        if rows:
+            # Escalation hops and query variants report the same source again; like
+            # _merge_ranked_result_sets, a repeated row keeps only its best-scoring copy.
+            positions = positions_by_source.setdefault(source, {})
+            source_rows = rows_by_source.setdefault(source, [])
+            for row in rows:
+                key = _result_identity(row)
+                position = positions.get(key)
+                if position is None:
+                    positions[key] = len(source_rows)
+                    source_rows.append(row)
+                elif float(row.get("score") or 0.0) > float(source_rows[position].get("score") or 0.0):
+                    source_rows[position] = row
+        if source not in completed_sources:
+            completed_sources.append(source)
+        merged = _merge_federated_rows(
+            rows_by_source,
+            resolved_weights,
+            positive_terms,
+            negative_terms,
+            learning_enabled=learning_enabled,
+            query=query,
+            compiled_query=compiled_query,
+            top_k=limit,
+        )
+        top_rows = merged[:limit]
+        contributing = sorted({str(name) for row in top_rows for name in (row.get("sources") or [])})
+        return {
+            "event": "partial",
+            "source": source,
+            "error": error,
+            "elapsed_ms": elapsed_ms,
+            "sources_completed": list(completed_sources),
+            "sources_contributing": contributing,
+            "results": top_rows,
+        }
+
+    task = asyncio.create_task(execute(_on_source_complete))
+    try:
+        while True:
+            next_completion = asyncio.create_task(completions.get())
+            done, _ = await asyncio.wait({next_completion, task}, return_when=asyncio.FIRST_COMPLETED)
+            if next_completion in done:
+                yield _partial_frame(*next_completion.result())
+                continue
+            next_completion.cancel()
+            while not completions.empty():
+                yield _partial_frame(*completions.get_nowait())
+            break
+        try:
+            final_payload = task.result()
+        except HTTPException as exc:
+            yield {"event": "error", "status_code": exc.status_code, "error": str(exc.detail)}
+            return
+        except Exception as exc:
+            yield {"event": "error", "status_code": 500, "error": str(exc)}
+            return
+        final_frame = {"event": "final", "elapsed_ms": round((time.monotonic() - started) * 1000, 3)}
+        final_frame.update(final_payload)
+        yield final_frame
+    finally:
+        if not task.done():
+            task.cancel()
+
+
+def _encode_retrieval_stream_frame(frame: dict[str, Any], sse: bool) -> bytes:
+    if orjson is not None:
+        body = orjson.dumps(frame, default=str)
+    else:
+        body = json.dumps(frame, default=str).encode("utf-8")
+    if sse:
+        event = str(frame.get("event") or "message")
+        return b"event: " + event.encode("utf-8") + b"\ndata: " + body + b"\n\n"
+    return body + b"\n"
+
+
+def _retrieval_stream_response(request: Request, format: str | None, frames: Any) -> StreamingResponse:
+    requested = str(format or "").strip().lower()
+    if requested in ("sse", "ndjson"):
+        sse = requested == "sse"
+    else:
+        sse = "text/event-stream" in str(request.headers.get("accept") or "").lower()
+
+    async def _body():
+        async for frame in frames:
+            yield _encode_retrieval_stream_frame(frame, sse)
+
+    return StreamingResponse(
+        _body(),
+        media_type="text/event-stream" if sse else "application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 async def _retriever_search_with_grounding_via_runtime(
     *,
     query: str,
@@ -15461,6 +20060,8 @@ async def _retriever_search_with_grounding_via_runtime(
     agent_profile: dict[str, Any] | None,
     auto_escalate: bool,
     query_expansion: bool,
+    on_source_complete: Any | None = None,
+    deadline: RetrievalDeadline | None = None,
 ) -> tuple[list[dict[str, Any]], dict[str, Any], list[str], dict[str, Any]]:
     runtime = await _get_migration_runtime()
     if runtime is None:
@@ -15477,6 +20078,8 @@ async def _retriever_search_with_grounding_via_runtime(
             agent_profile=agent_profile,
             auto_escalate=auto_escalate,
             query_expansion=query_expansion,
+            on_source_complete=on_source_complete,
+            deadline=deadline,
         )
     request = RuntimeRetrievalRequest(
         query=query,
@@ -15492,7 +20095,17 @@ async def _retriever_search_with_grounding_via_runtime(
         auto_escalate=auto_escalate,
         query_expansion=query_expansion,
     )
-    response = await runtime.retriever.search_with_grounding(request)
+    if deadline is None:
+        response = await runtime.retriever.search_with_grounding(request)
+    else:
+        # The runtime retriever has no budget hooks; bound it as a whole.
+        try:
+            response = await asyncio.wait_for(
+                runtime.retriever.search_with_grounding(request),
+                timeout=max(0.001, deadline.remaining_ms() / 1000.0),
+            )
+        except asyncio.TimeoutError as exc:
+            raise HTTPException(504, "Retrieval deadline exceeded") from exc
     results = list(getattr(response, "results", []) or [])
     retrieval_debug = dict(getattr(response, "retrieval_debug", {}) or {})
     warnings = list(getattr(response, "warnings", []) or [])
@@ -16109,8 +20722,45 @@ async def _execute_messaging_command(
 
 
 @app.post("/memory/search")
-async def search_memory(payload: MemorySearch):
+async def search_memory(payload: MemorySearch, request: Request = None):
     """Federated retrieval across memory services with preference-aware reranking."""
+    return await _execute_memory_search(
+        payload,
+        deadline=_resolve_retrieval_deadline(payload.deadline_ms, request),
+    )
+
+
+@app.post("/memory/search/stream")
+async def search_memory_stream(payload: MemorySearch, request: Request, format: str | None = None):
+    """Streaming /memory/search: provisional merged top-k per completed source, then the full response."""
+    final_payload = payload.model_copy(update={"include_grounding": True, "include_retrieval_debug": True})
+    deadline = _resolve_retrieval_deadline(payload.deadline_ms, request)
+
+    async def _execute(on_source_complete: Any) -> dict[str, Any]:
+        return await _execute_memory_search(
+            final_payload,
+            on_source_complete=on_source_complete,
+            deadline=deadline,
+        )
+
+    return _retrieval_stream_response(
+        request,
+        format,
+        _stream_retrieval_frames(
+            query=payload.query,
+            limit=payload.limit,
+            source_weights=payload.source_weights,
+            execute=_execute,
+        ),
+    )
+
+
+async def _execute_memory_search(
+    payload: MemorySearch,
+    *,
+    on_source_complete: Any | None = None,
+    deadline: RetrievalDeadline | None = None,
+) -> dict[str, Any]:
     topic_filter = normalize_topic_path(payload.topic_path) if payload.topic_path else None
     profile_id = _normalize_agent_memory_profile_id(payload.agent_id)
     async with agent_memory_profile_lock:
@@ -16144,68 +20794,69 @@ async def search_memory(payload: MemorySearch):
         pre_warnings.append(
             f"Agent profile '{profile_id}' has multiple topic prefixes; using '{topic_filter}' by default."
         )
-    if LEARNING_LOOP_ENABLED and payload.include_preferences:
-        try:
-            feedback_records = await list_feedback_records(
-                project_filter,
-                payload.user_id,
-                None,
-                PREFERENCE_MAX_ENTRIES,
-            )
-            preferences = build_preference_context(feedback_records)
+
+    async def _await_preferences(task: asyncio.Task[Any]) -> dict[str, Any] | None:
+        try:
+            return await task
         except Exception as exc:
             logger.warning(
                 "Preference context unavailable; continuing without rerank context: %s",
                 exc,
             )
             pre_warnings.append("Preference context unavailable; results were not learning-reranked.")
+            return None
 
-    results, retrieval_debug, warnings, grounding = await _retriever_search_with_grounding_via_runtime(
-        query=payload.query,
-        limit=payload.limit,
-        project_filter=project_filter,
-        topic_filter=topic_filter,
-        sources=payload.sources,
-        source_weights=payload.source_weights,
-        preferences=preferences,
-        rerank_with_learning=payload.rerank_with_learning,
-        retrieval_mode=retrieval_mode,
-        agent_profile=agent_profile,
-        auto_escalate=auto_escalate,
-        query_expansion=query_expansion,
-    )
+    preferences_task: asyncio.Task[Any] | None = None
+    if LEARNING_LOOP_ENABLED and payload.include_preferences:
+        preferences_task = asyncio.create_task(get_preference_context(project_filter, payload.user_id))
+        if payload.rerank_with_learning and RETRIEVAL_ENABLE_LEARNING_RERANK:
+            # Learning terms shape fusion scores and the pathway cache key, so retrieval waits.
+            preferences = await _await_preferences(preferences_task)
+            preferences_task = None
+    if deadline is not None:
+        deadline.mark("preferences")
+
+    try:
+        results, retrieval_debug, warnings, grounding = await _retriever_search_with_grounding_via_runtime(
+            query=payload.query,
+            limit=payload.limit,
+            project_filter=project_filter,
+            topic_filter=topic_filter,
+            sources=payload.sources,
+            source_weights=payload.source_weights,
+            preferences=preferences,
+            rerank_with_learning=payload.rerank_with_learning,
+            retrieval_mode=retrieval_mode,
+            agent_profile=agent_profile,
+            auto_escalate=auto_escalate,
+            query_expansion=query_expansion,
+            on_source_complete=on_source_complete,
+            deadline=deadline,
+        )
+    except BaseException:
+        if preferences_task is not None:
+            preferences_task.cancel()
+        raise
+    if preferences_task is not None:
+        # Only reported in the response; fetched while the sources ran.
+        preference_context_cache_stats["overlapped"] += 1
+        preferences = await _await_preferences(preferences_task)
     if pre_warnings:
         warnings = pre_warnings + warnings
 
     if payload.fetch_content:
-        runtime = await _get_migration_runtime()
-        # Fetch full content for each result
-        for result in results:
-            project = result.get("project")
-            file_name = result.get("file")
-            if not isinstance(project, str) or not isinstance(file_name, str) or not project or not file_name:
-                result["content"] = None
-                continue
-            try:
-                content = ""
-                if runtime is not None:
-                    memory_payload = await runtime.memory_store.get_memory(f"{project}::{file_name}")
-                    if isinstance(memory_payload, dict):
-                        content = str(memory_payload.get("content") or "")
-                if not content:
-                    content = await read_project_file(
-                        project,
-                        file_name,
-                    )
-                result["content"] = content
-            except Exception as exc:
-                logger.warning(
-                    "Failed to fetch content for %s/%s: %s",
-                    project,
-                    file_name,
-                    exc,
-                )
-                result["content"] = None
+        warnings = warnings + await _fetch_search_result_contents(
+            results,
+            max_content_bytes=payload.max_content_bytes,
+            deadline_secs=(
+                min(MEMMCP_SEARCH_FETCH_DEADLINE_SECS, deadline.remaining_ms() / 1000.0)
+                if deadline is not None
+                else None
+            ),
+        )
+        if deadline is not None and isinstance(retrieval_debug.get("deadline"), dict):
+            deadline.mark("fetch_content")
+            retrieval_debug["deadline"] = deadline.debug()
 
     response: dict[str, Any] = {
         "results": results,
@@ -16281,8 +20932,7 @@ async def get_memory_context_pack(payload: ContextPackRequest):
     return response
 
 
-@app.post("/v1/retrieval/query")
-async def engine_retrieval_query(payload: dict[str, Any]):
+def _engine_retrieval_query_args(payload: dict[str, Any]) -> dict[str, Any]:
     request_payload = payload.get("request") if isinstance(payload.get("request"), dict) else payload
     request_payload = request_payload if isinstance(request_payload, dict) else {}
     query = str(request_payload.get("query") or "").strip()
@@ -16312,16 +20962,25 @@ async def engine_retrieval_query(payload: dict[str, Any]):
     )
     rerank_with_learning = bool(request_payload.get("rerank_with_learning", True))
     retrieval_mode = str(request_payload.get("retrieval_mode") or RETRIEVAL_MODE_BALANCED)
+    return {
+        "query": query,
+        "limit": limit,
+        "project_filter": project_filter,
+        "topic_filter": topic_filter,
+        "sources": sources,
+        "source_weights": source_weights,
+        "preferences": preferences,
+        "rerank_with_learning": rerank_with_learning,
+        "retrieval_mode": retrieval_mode,
+    }
+
+
+@app.post("/v1/retrieval/query")
+async def engine_retrieval_query(payload: dict[str, Any]):
+    args = _engine_retrieval_query_args(payload)
     results, retrieval_debug, warnings = await federated_search_memory(
-        query,
-        limit=limit,
-        project_filter=project_filter,
-        topic_filter=topic_filter,
-        sources=sources,
-        source_weights=source_weights,
-        preferences=preferences,
-        rerank_with_learning=rerank_with_learning,
-        retrieval_mode=retrieval_mode,
+        args.pop("query"),
+        **args,
         record_pathway_usage=False,
     )
     return {
@@ -16331,8 +20990,41 @@ async def engine_retrieval_query(payload: dict[str, Any]):
     }
 
 
+@app.post("/v1/retrieval/query/stream")
+async def engine_retrieval_query_stream(payload: dict[str, Any], request: Request, format: str | None = None):
+    args = _engine_retrieval_query_args(payload)
+
+    async def _execute(on_source_complete: Any) -> dict[str, Any]:
+        call_args = dict(args)
+        results, retrieval_debug, warnings = await federated_search_memory(
+            call_args.pop("query"),
+            **call_args,
+            record_pathway_usage=False,
+            on_source_complete=on_source_complete,
+        )
+        return {
+            "results": results,
+            "retrieval_debug": retrieval_debug,
+            "warnings": warnings,
+            "grounding": _build_grounding_payload(results),
+        }
+
+    learning_preferences = args["preferences"] if args["rerank_with_learning"] else None
+    return _retrieval_stream_response(
+        request,
+        format,
+        _stream_retrieval_frames(
+            query=args["query"],
+            limit=args["limit"],
+            source_weights=args["source_weights"],
+            preferences=learning_preferences,
+            execute=_execute,
+        ),
+    )
+
+
 @app.post("/v1/retrieval/query-with-grounding")
-async def engine_retrieval_query_with_grounding(payload: dict[str, Any]):
+async def engine_retrieval_query_with_grounding(payload: dict[str, Any], request: Request = None):
     request_payload = payload.get("request") if isinstance(payload.get("request"), dict) else payload
     request_payload = request_payload if isinstance(request_payload, dict) else {}
     query = str(request_payload.get("query") or "").strip()
@@ -16369,6 +21061,10 @@ async def engine_retrieval_query_with_grounding(payload: dict[str, Any]):
     )
     auto_escalate = bool(request_payload.get("auto_escalate", False))
     query_expansion = bool(request_payload.get("query_expansion", True))
+    try:
+        deadline_ms = int(request_payload.get("deadline_ms") or 0) or None
+    except (TypeError, ValueError):
+        raise HTTPException(422, "deadline_ms must be an integer")
     results, retrieval_debug, warnings, grounding = await _run_memory_recall_pipeline(
         query=query,
         limit=limit,
@@ -16382,6 +21078,7 @@ async def engine_retrieval_query_with_grounding(payload: dict[str, Any]):
         agent_profile=agent_profile,
         auto_escalate=auto_escalate,
         query_expansion=query_expansion,
+        deadline=_resolve_retrieval_deadline(deadline_ms, request),
     )
     return {
         "results": results,
@@ -16391,15 +21088,211 @@ async def engine_retrieval_query_with_grounding(payload: dict[str, Any]):
     }
 
 
+async def _batch_job_pathway_cache_key(args: dict[str, Any]) -> str:
+    """The pathway cache key federated_search_memory will look up for a batch job."""
+    key, _ = await _retrieval_search_pathway_cache_key(
+        query=args["query"],
+        limit=args["limit"],
+        project_filter=args.get("project_filter"),
+        topic_filter=args.get("topic_filter"),
+        sources=args.get("sources"),
+        source_weights=args.get("source_weights"),
+        preferences=args.get("preferences"),
+        rerank_with_learning=args.get("rerank_with_learning", True),
+        retrieval_mode=args.get("retrieval_mode"),
+    )
+    return key
+
+
+async def _prefetch_batch_qdrant_rows(
+    jobs: list[dict[str, Any]],
+) -> tuple[dict[int, list[dict[str, Any]]], dict[str, Any]]:
+    """Run the Qdrant leg of every batch job in one embedding call and one batch search.
+
+    Jobs already answered by the process pathway cache are left out.
+    """
+    eligible: list[tuple[int, dict[str, Any]]] = []
+    cached = 0
+    for index, args in enumerate(jobs):
+        mode = _normalize_retrieval_mode(args.get("retrieval_mode"))
+        resolved_sources = _resolve_retrieval_sources_for_mode(mode=mode, sources=args.get("sources"))
+        if RETRIEVAL_SOURCE_QDRANT not in resolved_sources:
+            continue
+        if _retrieval_pathway_cache_contains(await _batch_job_pathway_cache_key(args)):
+            cached += 1
+            continue
+        eligible.append(
+            (
+                index,
+                {
+                    "query": args["query"],
+                    "limit": _retrieval_mode_source_limit(args["limit"], mode),
+                    "project_filter": args.get("project_filter"),
+                    "topic_filter": args.get("topic_filter"),
+                },
+            )
+        )
+    info: dict[str, Any] = {
+        "requested": len(eligible),
+        "cached": cached,
+        "used": False,
+        "timed_out": False,
+        "error": None,
+        "elapsed_ms": 0.0,
+    }
+    if len(eligible) < 2:
+        return {}, info
+    started = time.monotonic()
+    try:
+        batches = await search_qdrant_batch([item for _, item in eligible])
+    except Exception as exc:
+        info["error"] = str(exc)[:300]
+        logger.warning("Batch Qdrant prefetch failed; falling back to per-query search: %s", str(exc)[:300])
+        return {}, info
+    finally:
+        info["elapsed_ms"] = round((time.monotonic() - started) * 1000, 3)
+    info["used"] = True
+    return {index: rows for (index, _), rows in zip(eligible, batches)}, info
+
+
 @app.post("/v1/retrieval/batch-query")
 async def engine_retrieval_batch_query(payload: dict[str, Any]):
+    started = time.monotonic()
     requests = payload.get("requests") if isinstance(payload.get("requests"), list) else []
-    rows: list[dict[str, Any]] = []
+    if len(requests) > RETRIEVAL_BATCH_QUERY_MAX_REQUESTS:
+        raise HTTPException(413, f"batch exceeds {RETRIEVAL_BATCH_QUERY_MAX_REQUESTS} requests")
+    try:
+        concurrency = int(payload.get("concurrency") or RETRIEVAL_BATCH_QUERY_CONCURRENCY)
+    except (TypeError, ValueError):
+        concurrency = RETRIEVAL_BATCH_QUERY_CONCURRENCY
+    concurrency = max(1, min(concurrency, RETRIEVAL_BATCH_QUERY_CONCURRENCY))
+    try:
+        deadline_secs = float(payload.get("deadline_ms") or 0.0) / 1000.0
+    except (TypeError, ValueError):
+        deadline_secs = 0.0
+    if deadline_secs <= 0:
+        deadline_secs = RETRIEVAL_BATCH_QUERY_DEADLINE_SECS
+    deadline_secs = min(deadline_secs, RETRIEVAL_BATCH_QUERY_DEADLINE_SECS)
+    deadline_at = started + deadline_secs
+
+    # Collapse identical requests so each distinct query runs once.
+    job_index_by_key: dict[str, int] = {}
+    jobs: list[dict[str, Any]] = []
+    slots: list[dict[str, Any]] = []
     for request_payload in requests:
         if not isinstance(request_payload, dict):
+            slots.append({"error": "request must be an object"})
             continue
-        rows.append(await engine_retrieval_query({"request": request_payload}))
-    return {"results": rows}
+        try:
+            args = _engine_retrieval_query_args({"request": request_payload})
+        except HTTPException as exc:
+            slots.append({"error": str(exc.detail)})
+            continue
+        identity = json.dumps(args, sort_keys=True, default=str)
+        job_index = job_index_by_key.get(identity)
+        duplicate = job_index is not None
+        if job_index is None:
+            job_index = len(jobs)
+            job_index_by_key[identity] = job_index
+            jobs.append(args)
+        slots.append({"job": job_index, "deduplicated": duplicate})
+
+    # The prefetch shares the batch deadline; if it overruns, jobs search Qdrant themselves.
+    prefetch_started = time.monotonic()
+    try:
+        prefetched, qdrant_batch_info = await asyncio.wait_for(
+            _prefetch_batch_qdrant_rows(jobs),
+            timeout=max(0.0, deadline_at - prefetch_started),
+        )
+    except asyncio.TimeoutError:
+        prefetched = {}
+        qdrant_batch_info = {
+            "used": False,
+            "timed_out": True,
+            "error": "batch deadline exceeded during prefetch",
+            "elapsed_ms": round((time.monotonic() - prefetch_started) * 1000, 3),
+        }
+    limiter = asyncio.Semaphore(concurrency)
+    outcomes: dict[int, dict[str, Any]] = {}
+
+    async def _run_job(job_index: int) -> None:
+        args = dict(jobs[job_index])
+        async with limiter:
+            job_started = time.monotonic()
+            try:
+                results, retrieval_debug, warnings = await federated_search_memory(
+                    args.pop("query"),
+                    **args,
+                    record_pathway_usage=False,
+                    prefetched_source_rows=(
+                        {RETRIEVAL_SOURCE_QDRANT: prefetched[job_index]}
+                        if job_index in prefetched
+                        else None
+                    ),
+                )
+                outcomes[job_index] = {
+                    "results": results,
+                    "retrieval_debug": retrieval_debug,
+                    "warnings": warnings,
+                    "ok": True,
+                    "error": None,
+                }
+            except Exception as exc:
+                outcomes[job_index] = {"ok": False, "error": str(exc) or exc.__class__.__name__}
+            outcomes[job_index]["timing_ms"] = round((time.monotonic() - job_started) * 1000, 3)
+
+    tasks = [asyncio.create_task(_run_job(job_index)) for job_index in range(len(jobs))]
+    timed_out = 0
+    if tasks:
+        _, pending = await asyncio.wait(tasks, timeout=max(0.0, deadline_at - time.monotonic()))
+        for task in pending:
+            task.cancel()
+        timed_out = len(pending)
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    rows: list[dict[str, Any]] = []
+    for slot in slots:
+        job_index = slot.get("job")
+        outcome = outcomes.get(job_index) if job_index is not None else None
+        if outcome is None:
+            error = slot.get("error") or f"batch deadline of {deadline_secs:.1f}s exceeded"
+            rows.append(
+                {
+                    "results": [],
+                    "retrieval_debug": {},
+                    "warnings": [],
+                    "ok": False,
+                    "error": error,
+                    "timing_ms": None,
+                    "deduplicated": bool(slot.get("deduplicated")),
+                }
+            )
+            continue
+        row = {
+            "results": [],
+            "retrieval_debug": {},
+            "warnings": [],
+        }
+        row.update(outcome)
+        if slot.get("deduplicated"):
+            row = _json_clone(row)
+        row["deduplicated"] = bool(slot.get("deduplicated"))
+        rows.append(row)
+    return {
+        "results": rows,
+        "batch": {
+            "requests": len(requests),
+            "unique": len(jobs),
+            "deduplicated": sum(1 for slot in slots if slot.get("deduplicated")),
+            "errors": sum(1 for row in rows if not row.get("ok")),
+            "timed_out": timed_out,
+            "concurrency": concurrency,
+            "deadline_ms": round(deadline_secs * 1000, 3),
+            "elapsed_ms": round((time.monotonic() - started) * 1000, 3),
+            "qdrant_batch": qdrant_batch_info,
+        },
+    }
 
 
 @app.get("/v1/retrieval/health")
@@ -17051,6 +21944,8 @@ async def get_preferences(
 ):
     if not LEARNING_LOOP_ENABLED:
         return {"enabled": False, "preferences": None}
+    if limit == PREFERENCE_MAX_ENTRIES:
+        return {"enabled": True, "preferences": await get_preference_context(project, user_id)}
     records = await list_feedback_records(project, user_id, None, limit)
     return {"enabled": True, "preferences": build_preference_context(records)}
 
@@ -17128,6 +22023,14 @@ class QdrantBackfillRequest(BaseModel):
         False,
         description="Also enqueue qdrant target (normally skipped for qdrant-source backfill)",
     )
+    segments: int | None = Field(
+        None,
+        ge=1,
+        le=32,
+        description="Concurrent ts-range scroll cursors (defaults to ORCH_BACKFILL_SEGMENTS)",
+    )
+    job_id: str | None = Field(None, description="Resume this checkpointed job, or start it under this id")
+    background: bool = Field(False, description="Return immediately and report progress via the job endpoint")
 
 
 class MongoRawBackfillRequest(BaseModel):
@@ -17151,6 +22054,14 @@ class MongoRawBackfillRequest(BaseModel):
         le=5000,
         description="How often to evaluate queue pressure while scanning mongo rows",
     )
+    segments: int | None = Field(
+        None,
+        ge=1,
+        le=32,
+        description="Concurrent _id-range cursors (defaults to ORCH_BACKFILL_SEGMENTS)",
+    )
+    job_id: str | None = Field(None, description="Resume this checkpointed job, or start it under this id")
+    background: bool = Field(False, description="Return immediately and report progress via the job endpoint")
 
 
 class TopicRollupBackfillRequest(BaseModel):
@@ -17162,6 +22073,10 @@ class TopicRollupBackfillRequest(BaseModel):
     project: str | None = Field(None, description="Optional single project scope")
 
 
+class QdrantCollectionProfileRequest(BaseModel):
+    collection: str | None = Field(None, description="Collection to profile (defaults to ORCH_QDRANT_COLLECTION)")
+
+
 @app.post("/memory/letta/session")
 async def save_letta_session(payload: LettaSession):
     """Save session state to Letta for working memory."""
@@ -17186,6 +22101,41 @@ async def backfill_topic_rollups(payload: TopicRollupBackfillRequest):
     return result
 
 
+@app.post("/maintenance/qdrant/collection-profile")
+async def apply_qdrant_collection_profile_endpoint(payload: QdrantCollectionProfileRequest):
+    collection = payload.collection or QDRANT_COLLECTION
+    qdrant_collection_profile_state.pop(collection, None)
+    try:
+        result = await apply_qdrant_collection_profile(collection)
+    except Exception as exc:
+        raise HTTPException(502, f"Qdrant collection profile failed: {exc}") from exc
+    return {"ok": not result.get("errors"), **result}
+
+
+@app.post("/maintenance/projects/reconcile")
+async def reconcile_project_registry():
+    try:
+        return await reconcile_project_registry_once()
+    except Exception as exc:
+        raise HTTPException(502, f"Project registry reconcile failed: {exc}") from exc
+
+
+@app.post("/maintenance/mindsdb/term-index/backfill")
+async def backfill_mindsdb_term_index_endpoint():
+    if not MINDSDB_ENABLED or not MINDSDB_AUTOSYNC or not MINDSDB_TERM_INDEX_ENABLED:
+        raise HTTPException(400, "MindsDB term index is disabled")
+    if mindsdb_term_index_state.get("backfillRunning"):
+        raise HTTPException(409, "MindsDB term index backfill already running")
+    try:
+        await ensure_mindsdb_table()
+        table_name = mindsdb_target_table or MINDSDB_AUTOSYNC_TABLE
+        if await _ensure_mindsdb_term_index(table_name) is None:
+            raise OrchestratorError(str(mindsdb_term_index_state.get("lastError") or "term table unavailable"))
+        return await backfill_mindsdb_term_index(table_name)
+    except Exception as exc:
+        raise HTTPException(502, f"MindsDB term index backfill failed: {exc}") from exc
+
+
 @app.post("/maintenance/fanout/rehydrate")
 async def rehydrate_fanout(payload: FanoutRehydrateRequest):
     global memory_write_queue_dropped
@@ -17283,24 +22233,439 @@ async def rehydrate_fanout(payload: FanoutRehydrateRequest):
             existing += result["existing"]
             scanned += 1
 
-    if inserted > 0 or requeued > 0:
-        if memory_write_queue.full():
-            memory_write_queue_dropped += 1
-        else:
-            await memory_write_queue.put("rehydrate")
+    if inserted > 0 or requeued > 0:
+        if memory_write_queue.full():
+            memory_write_queue_dropped += 1
+        else:
+            await memory_write_queue.put("rehydrate")
+
+    return {
+        "ok": True,
+        "projects": projects,
+        "targets": targets,
+        "scanned_files": scanned,
+        "outbox_inserted": inserted,
+        "outbox_requeued": requeued,
+        "outbox_existing": existing,
+        "mongo_immediate_success": mongo_immediate_success,
+        "mongo_deferred": deferred_mongo,
+        "errors": errors[:50],
+    }
+
+
+def _backfill_job_checkpoint_path(job_id: str) -> Path:
+    return BACKFILL_CHECKPOINT_DIR / f"{job_id}.json"
+
+
+def _load_backfill_job(job_id: str) -> dict[str, Any] | None:
+    job = backfill_jobs.get(job_id)
+    if job is not None:
+        return job
+    path = _backfill_job_checkpoint_path(job_id)
+    if not path.exists():
+        return None
+    try:
+        with path.open("r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+    except Exception as exc:
+        logger.warning("Failed to load backfill checkpoint %s: %s", path, exc)
+        return None
+    if not isinstance(payload, dict):
+        return None
+    if payload.get("status") == "running":
+        # The process running it exited before the job finished.
+        payload["status"] = "interrupted"
+    return payload
+
+
+def _backfill_job_summary(job: dict[str, Any]) -> dict[str, Any]:
+    segments = job.get("segments") or []
+    scanned = int(job.get("scanned") or 0)
+    limit = int(job.get("limit") or 0)
+    rows_per_sec = None
+    started = job.get("_runStartedMonotonic")
+    if isinstance(started, float):
+        elapsed = max(1e-6, (job.get("_runFinishedMonotonic") or time.monotonic()) - started)
+        rows_per_sec = round((scanned - int(job.get("_runStartScanned") or 0)) / elapsed, 2)
+    return {
+        "jobId": job.get("jobId"),
+        "kind": job.get("kind"),
+        "status": job.get("status"),
+        "params": job.get("params"),
+        "scanned": scanned,
+        "limit": limit,
+        "progress": round(min(1.0, scanned / limit), 4) if limit else None,
+        "segments": len(segments),
+        "segmentsDone": sum(1 for segment in segments if segment.get("done")),
+        "rowsPerSec": rows_per_sec,
+        "runs": int(job.get("runs") or 0),
+        "counters": dict(job.get("counters") or {}),
+        "stopReason": job.get("stopReason"),
+        "errors": list(job.get("errors") or [])[:10],
+        "checkpointed": bool(job.get("checkpoint")),
+        "createdAt": job.get("createdAt"),
+        "updatedAt": job.get("updatedAt"),
+        "finishedAt": job.get("finishedAt"),
+    }
+
+
+async def _checkpoint_backfill_job(job: dict[str, Any]) -> None:
+    job["updatedAt"] = _utc_now()
+    if not job.get("checkpoint"):
+        return
+    path = _backfill_job_checkpoint_path(str(job["jobId"]))
+    # In-memory run bookkeeping (underscore keys) is not persisted.
+    snapshot = json.dumps({key: value for key, value in job.items() if not key.startswith("_")}, default=str)
+
+    def _write() -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".json.tmp")
+        tmp_path.write_text(snapshot, encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    try:
+        async with backfill_checkpoint_lock:
+            await asyncio.to_thread(_write)
+    except Exception as exc:  # pragma: no cover
+        logger.warning("Failed to checkpoint backfill job %s: %s", job.get("jobId"), exc)
+
+
+async def _open_backfill_job(
+    kind: str,
+    *,
+    job_id: str | None,
+    params: dict[str, Any],
+    limit: int,
+    checkpoint: bool = True,
+) -> tuple[dict[str, Any], bool]:
+    """Resume the checkpointed job ``job_id`` or register a new one; returns (job, resumed).
+
+    A resumed job keeps its segments and cursors; ``limit`` caps the rows scanned over
+    all of its runs. Only jobs the caller named are checkpointed to disk: an ad-hoc job
+    lives in the in-memory registry alone, so its file would never be resumed or removed.
+    """
+    if job_id is not None and not BACKFILL_JOB_ID_PATTERN.match(job_id):
+        raise HTTPException(400, "job_id must be 1-64 characters from [A-Za-z0-9_.-]")
+    now = _utc_now()
+    async with backfill_jobs_lock:
+        existing = _load_backfill_job(job_id) if job_id else None
+        if existing is not None:
+            if existing.get("status") == "running":
+                raise HTTPException(409, f"Backfill job {job_id} is already running")
+            if existing.get("kind") != kind or existing.get("params") != params:
+                raise HTTPException(409, f"Backfill job {job_id} was started with different parameters")
+            existing.update(
+                {
+                    "status": "running",
+                    "limit": limit,
+                    "stopReason": None,
+                    "finishedAt": None,
+                    "updatedAt": now,
+                }
+            )
+            job = existing
+        else:
+            job = {
+                "jobId": job_id or uuid.uuid4().hex[:16],
+                "kind": kind,
+                "params": params,
+                "status": "running",
+                "limit": limit,
+                "scanned": 0,
+                "runs": 0,
+                "segments": [],
+                "counters": {},
+                "errors": [],
+                "stopReason": None,
+                "checkpoint": checkpoint and job_id is not None,
+                "createdAt": now,
+                "updatedAt": now,
+                "finishedAt": None,
+            }
+        backfill_jobs[str(job["jobId"])] = job
+        backfill_jobs.move_to_end(str(job["jobId"]))
+        for stale_id in [key for key, item in backfill_jobs.items() if item.get("status") != "running"]:
+            if len(backfill_jobs) <= BACKFILL_JOBS_MAX:
+                break
+            backfill_jobs.pop(stale_id, None)
+    return job, existing is not None
+
+
+async def _run_segmented_backfill(
+    job: dict[str, Any],
+    *,
+    fetch_page: Any,
+    process_row: Any,
+) -> dict[str, Any]:
+    """Scan every unfinished segment of ``job`` with one cursor each, concurrently.
+
+    ``fetch_page(segment, cursor, page_limit)`` returns ``(rows, next_cursor)``, with a
+    None cursor once the segment is exhausted; ``process_row(row)`` returns whether the
+    row counts toward the job limit. Each segment fetches its next page while the current
+    one is processed and checkpoints its cursor after every fully processed page, so a
+    resumed job re-reads at most one page per segment. A processor can set
+    ``job["stopReason"]`` to stop all segments.
+    """
+    limit = int(job.get("limit") or 0)
+    job["runs"] = int(job.get("runs") or 0) + 1
+    job["_runStartedMonotonic"] = time.monotonic()
+    job["_runFinishedMonotonic"] = None
+    job["_runStartScanned"] = int(job.get("scanned") or 0)
+    errors: list[str] = job.setdefault("errors", [])
+
+    def _page_limit() -> int:
+        return max(0, min(BACKFILL_PAGE_SIZE, limit - int(job.get("scanned") or 0)))
+
+    async def _scan_segment(segment: dict[str, Any]) -> None:
+        if _page_limit() <= 0 or job.get("stopReason"):
+            return
+        next_page: asyncio.Task[Any] | None = asyncio.create_task(
+            fetch_page(segment, segment.get("cursor"), _page_limit())
+        )
+        try:
+            while next_page is not None:
+                rows, next_cursor = await next_page
+                next_page = None
+                if not rows:
+                    segment["done"] = True
+                    break
+                remaining_after_page = limit - int(job.get("scanned") or 0) - len(rows)
+                if next_cursor is not None and remaining_after_page > 0 and not job.get("stopReason"):
+                    next_page = asyncio.create_task(
+                        fetch_page(segment, next_cursor, min(BACKFILL_PAGE_SIZE, remaining_after_page))
+                    )
+                for row in rows:
+                    if job.get("stopReason") or _page_limit() <= 0:
+                        # Leave the cursor at this page; a resume re-reads it.
+                        return
+                    if await process_row(row):
+                        job["scanned"] = int(job.get("scanned") or 0) + 1
+                        segment["scanned"] = int(segment.get("scanned") or 0) + 1
+                segment["cursor"] = next_cursor
+                segment["pages"] = int(segment.get("pages") or 0) + 1
+                segment["done"] = next_cursor is None
+                await _checkpoint_backfill_job(job)
+                if next_page is None and not segment["done"] and _page_limit() > 0 and not job.get("stopReason"):
+                    # Skipped rows left budget the prefetch did not account for.
+                    next_page = asyncio.create_task(fetch_page(segment, next_cursor, _page_limit()))
+        except Exception as exc:
+            if len(errors) < 50:
+                errors.append(f"segment {segment.get('index')}: {exc}")
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+                await asyncio.gather(next_page, return_exceptions=True)
+
+    segments = [segment for segment in job.get("segments") or [] if not segment.get("done")]
+    status = "interrupted"
+    try:
+        await asyncio.gather(*(_scan_segment(segment) for segment in segments))
+        if all(segment.get("done") for segment in job.get("segments") or []):
+            status = "completed"
+        elif job.get("stopReason"):
+            status = "stopped"
+        elif int(job.get("scanned") or 0) >= limit:
+            status = "limit_reached"
+        elif errors:
+            status = "failed"
+    finally:
+        job["status"] = status
+        job["finishedAt"] = _utc_now()
+        job["_runFinishedMonotonic"] = time.monotonic()
+        await _checkpoint_backfill_job(job)
+    return job
+
+
+def _spawn_backfill_job(job: dict[str, Any], run: Any) -> dict[str, Any]:
+    job_id = str(job["jobId"])
+    task = asyncio.create_task(run)
+    backfill_job_tasks[job_id] = task
+    task.add_done_callback(lambda _: backfill_job_tasks.pop(job_id, None))
+    return {
+        "ok": True,
+        "job_id": job_id,
+        "status": "running",
+        "status_url": f"/maintenance/backfill/jobs/{job_id}",
+    }
+
+
+def _qdrant_backfill_base_conditions(project: str | None) -> list[Any]:
+    if not project or qdrant_models is None:
+        return []
+    return [qdrant_models.FieldCondition(key="project", match=qdrant_models.MatchValue(value=project))]
+
+
+def _qdrant_backfill_segment_filter(base_conditions: list[Any], segment: dict[str, Any]) -> Any:
+    must = list(base_conditions)
+    if segment.get("missingTs"):
+        must.append(qdrant_models.IsEmptyCondition(is_empty=qdrant_models.PayloadField(key="ts")))
+    elif segment.get("tsFrom") is not None or segment.get("tsTo") is not None:
+        must.append(
+            qdrant_models.FieldCondition(
+                key="ts",
+                range=qdrant_models.Range(gte=segment.get("tsFrom"), lt=segment.get("tsTo")),
+            )
+        )
+    return qdrant_models.Filter(must=must) if must else None
+
+
+async def _qdrant_backfill_segments(
+    collection: str,
+    base_conditions: list[Any],
+    count: int,
+) -> list[dict[str, Any]]:
+    """Split a collection into ``count`` equal-width ``ts`` ranges plus one for points without ts.
+
+    The bounds come from two ordered single-point scrolls on the ts payload index; without
+    them (no index, old server, empty scope) the collection is scanned as one segment.
+    """
+    if count <= 1 or qdrant_models is None:
+        return [{"index": 0}]
+    scroll_filter = qdrant_models.Filter(must=list(base_conditions)) if base_conditions else None
+    bounds: list[int] = []
+    for direction in ("asc", "desc"):
+        try:
+            points, _ = await _qdrant_call(
+                "backfill_ts_bounds",
+                lambda client, _, direction=direction: client.scroll(
+                    collection_name=collection,
+                    scroll_filter=scroll_filter,
+                    limit=1,
+                    order_by=qdrant_models.OrderBy(key="ts", direction=direction),
+                    with_payload=["ts"],
+                    with_vectors=False,
+                ),
+            )
+        except Exception as exc:
+            logger.info("Qdrant backfill ts bounds unavailable for %s; scanning one segment: %s", collection, exc)
+            return [{"index": 0}]
+        ts_value = (getattr(points[0], "payload", None) or {}).get("ts") if points else None
+        if not isinstance(ts_value, (int, float)):
+            return [{"index": 0}]
+        bounds.append(int(ts_value))
+    low, high = bounds
+    if high <= low:
+        return [{"index": 0}]
+    width = max(1, -(-(high + 1 - low) // count))
+    segments: list[dict[str, Any]] = []
+    for index in range(count):
+        lower = low + index * width
+        if lower > high:
+            break
+        upper = lower + width
+        segments.append(
+            {
+                "index": index,
+                # Open-ended outer ranges also pick up points written during the scan.
+                "tsFrom": lower if index else None,
+                "tsTo": upper if upper <= high else None,
+            }
+        )
+    segments.append({"index": len(segments), "missingTs": True})
+    return segments
+
+
+def _qdrant_backfill_page_fetcher(collection: str, base_conditions: list[Any], operation: str) -> Any:
+    async def _fetch(segment: dict[str, Any], cursor: Any, page_limit: int) -> tuple[list[Any], Any]:
+        scroll_filter = _qdrant_backfill_segment_filter(base_conditions, segment)
+        points, next_offset = await _qdrant_call(
+            operation,
+            lambda client, _: client.scroll(
+                collection_name=collection,
+                scroll_filter=scroll_filter,
+                limit=page_limit,
+                offset=cursor,
+                with_payload=True,
+                with_vectors=False,
+            ),
+        )
+        return list(points or []), next_offset
+
+    return _fetch
+
+
+def _mongo_backfill_encode_id(value: Any) -> Any:
+    if ObjectId is not None and isinstance(value, ObjectId):
+        return {"$oid": str(value)}
+    return value
+
+
+def _mongo_backfill_decode_id(value: Any) -> Any:
+    if isinstance(value, dict) and "$oid" in value and ObjectId is not None:
+        return ObjectId(str(value["$oid"]))
+    return value
+
+
+def _mongo_backfill_encode_updated_at(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"$date": value.isoformat()}
+    return value
+
+
+def _mongo_backfill_decode_updated_at(value: Any) -> Any:
+    if isinstance(value, dict) and "$date" in value:
+        return datetime.fromisoformat(str(value["$date"]))
+    return value
 
-    return {
-        "ok": True,
-        "projects": projects,
-        "targets": targets,
-        "scanned_files": scanned,
-        "outbox_inserted": inserted,
-        "outbox_requeued": requeued,
-        "outbox_existing": existing,
-        "mongo_immediate_success": mongo_immediate_success,
-        "mongo_deferred": deferred_mongo,
-        "errors": errors[:50],
-    }
+
+def _mongo_backfill_newest_filter(query_filter: dict[str, Any], cursor: Any) -> dict[str, Any]:
+    """Keyset filter for the rows after ``cursor`` in ``updated_at`` desc, ``_id`` desc order."""
+    if not isinstance(cursor, dict):
+        return dict(query_filter)
+    updated_at = _mongo_backfill_decode_updated_at(cursor.get("updatedAt"))
+    last_id = _mongo_backfill_decode_id(cursor.get("id"))
+    if updated_at is None:
+        # Missing updated_at sorts last, so only the tail of that group remains.
+        after: dict[str, Any] = {"updated_at": None, "_id": {"$lt": last_id}}
+    else:
+        branches: list[dict[str, Any]] = [
+            {"updated_at": {"$lt": updated_at}},
+            {"updated_at": updated_at, "_id": {"$lt": last_id}},
+            {"updated_at": None},
+        ]
+        if isinstance(updated_at, datetime):
+            # Dates sort above strings, and $lt does not compare across BSON types.
+            branches.append({"updated_at": {"$type": "string"}})
+        after = {"$or": branches}
+    return {"$and": [dict(query_filter), after]} if query_filter else after
+
+
+def _mongo_backfill_segments(
+    coll: Any,
+    query_filter: dict[str, Any],
+    count: int,
+    limit: int,
+) -> list[dict[str, Any]]:
+    """Split a Mongo scan into ``count`` ``_id`` ranges of equal ObjectId creation time.
+
+    When ``limit`` caps the scan below the matching rows, the scan stays one segment read
+    newest ``updated_at`` first, so the capped job covers the most recently updated rows.
+    """
+    if coll.count_documents(query_filter, limit=limit + 1) > limit:
+        return [{"index": 0, "order": "updated_at"}]
+    if count <= 1 or ObjectId is None:
+        return [{"index": 0}]
+    first = coll.find_one(query_filter, projection={"_id": 1}, sort=[("_id", 1)])
+    last = coll.find_one(query_filter, projection={"_id": 1}, sort=[("_id", -1)])
+    if not first or not last or not isinstance(first.get("_id"), ObjectId) or not isinstance(last.get("_id"), ObjectId):
+        return [{"index": 0}]
+    low = first["_id"].generation_time.timestamp()
+    high = last["_id"].generation_time.timestamp()
+    if high - low < count:
+        return [{"index": 0}]
+    step = (high - low) / count
+    boundaries = [
+        _mongo_backfill_encode_id(ObjectId.from_datetime(datetime.fromtimestamp(low + step * index, tz=timezone.utc)))
+        for index in range(1, count)
+    ]
+    return [
+        {
+            "index": index,
+            "idFrom": boundaries[index - 1] if index else None,
+            "idTo": boundaries[index] if index < count - 1 else None,
+        }
+        for index in range(count)
+    ]
 
 
 @app.post("/maintenance/fanout/backfill/qdrant")
@@ -17311,7 +22676,6 @@ async def backfill_fanout_from_qdrant(payload: QdrantBackfillRequest):
     This is intended for onboarding/import scenarios where Qdrant already has
     project/file/summary entries but other sinks need hydration.
     """
-    global memory_write_queue_dropped
     requested_targets = [t.lower() for t in (payload.targets or [])]
     if requested_targets:
         targets = [t for t in requested_targets if t in FANOUT_TARGETS]
@@ -17327,158 +22691,142 @@ async def backfill_fanout_from_qdrant(payload: QdrantBackfillRequest):
         raise HTTPException(400, "No valid targets selected for qdrant backfill")
 
     collection = payload.qdrant_collection or QDRANT_COLLECTION
-    scanned = 0
-    inserted = 0
-    requeued = 0
-    existing = 0
-    skipped = 0
-    errors: list[str] = []
-    deferred_mongo = 0
-    mongo_immediate_success = 0
-    offset: Any = None
-    seen_rows: set[str] = set()
-    scroll_filter = None
-    if payload.project and qdrant_models is not None:
-        scroll_filter = qdrant_models.Filter(
-            must=[
-                qdrant_models.FieldCondition(
-                    key="project",
-                    match=qdrant_models.MatchValue(value=payload.project),
-                )
-            ]
+    base_conditions = _qdrant_backfill_base_conditions(payload.project)
+    job, _ = await _open_backfill_job(
+        "fanout_qdrant",
+        job_id=payload.job_id,
+        params={"project": payload.project, "collection": collection, "targets": targets},
+        limit=payload.limit,
+    )
+    if not job["segments"]:
+        job["segments"] = await _qdrant_backfill_segments(
+            collection,
+            base_conditions,
+            payload.segments or BACKFILL_SEGMENTS,
         )
+    counters: dict[str, int] = job["counters"]
+    for key in ("inserted", "requeued", "existing", "skipped", "mongoImmediateSuccess", "mongoDeferred"):
+        counters.setdefault(key, 0)
+    seen_rows: set[str] = set()
 
-    while scanned < payload.limit:
-        page_limit = min(256, payload.limit - scanned)
-        try:
-            points, next_offset = await _qdrant_call(
-                "backfill_scroll",
-                lambda client, _: client.scroll(
-                    collection_name=collection,
-                    scroll_filter=scroll_filter,
-                    limit=page_limit,
-                    offset=offset,
-                    with_payload=True,
-                    with_vectors=False,
-                ),
-            )
-            offset = next_offset
-        except Exception as exc:
-            errors.append(f"scroll failed ({exc})")
-            break
-
-        if not points:
-            break
-
-        for point in points:
-            if scanned >= payload.limit:
-                break
-            row_payload = getattr(point, "payload", None) or {}
-            project = str(row_payload.get("project") or "").strip()
-            file_name = str(row_payload.get("file") or "").strip()
-            summary = str(row_payload.get("summary") or "").strip()
-            if not project or not file_name or not summary:
-                skipped += 1
-                continue
-            dedupe_row_key = f"{project}::{file_name}::{summary[:200]}"
-            if dedupe_row_key in seen_rows:
-                skipped += 1
-                continue
-            seen_rows.add(dedupe_row_key)
+    async def _process(point: Any) -> bool:
+        row_payload = getattr(point, "payload", None) or {}
+        project = str(row_payload.get("project") or "").strip()
+        file_name = str(row_payload.get("file") or "").strip()
+        summary = str(row_payload.get("summary") or "").strip()
+        if not project or not file_name or not summary:
+            counters["skipped"] += 1
+            return False
+        dedupe_row_key = f"{project}::{file_name}::{summary[:200]}"
+        if dedupe_row_key in seen_rows:
+            counters["skipped"] += 1
+            return False
+        seen_rows.add(dedupe_row_key)
 
-            topic_path = str(row_payload.get("topic_path") or derive_topic_path(file_name, None))
-            raw_topic_tags = row_payload.get("topic_tags")
-            if isinstance(raw_topic_tags, list):
-                topic_tags = [str(tag).strip() for tag in raw_topic_tags if str(tag).strip()]
-            else:
-                topic_tags = topic_tags_for_path(topic_path)
+        topic_path = str(row_payload.get("topic_path") or derive_topic_path(file_name, None))
+        raw_topic_tags = row_payload.get("topic_tags")
+        if isinstance(raw_topic_tags, list):
+            topic_tags = [str(tag).strip() for tag in raw_topic_tags if str(tag).strip()]
+        else:
+            topic_tags = topic_tags_for_path(topic_path)
 
-            # For Qdrant-only imports we may not have original full content.
-            synthetic_content = "\n".join(
-                [
-                    "[backfill:qdrant]",
-                    f"project: {project}",
-                    f"file: {file_name}",
-                    f"summary: {summary}",
-                ]
-            )
-            event_id = build_event_id(project, file_name, f"qdrant:{summary}")
-            raw_event = build_raw_memory_event(
-                event_id=event_id,
-                project=project,
-                file_name=file_name,
-                content=synthetic_content,
-                summary=summary,
-                topic_path=topic_path,
-                topic_tags=topic_tags,
-                request_id="rehydrate-qdrant",
-                source="maintenance.rehydrate_qdrant",
-            )
-            event_payload = {
-                "event_id": event_id,
+        # For Qdrant-only imports we may not have original full content.
+        synthetic_content = "\n".join(
+            [
+                "[backfill:qdrant]",
+                f"project: {project}",
+                f"file: {file_name}",
+                f"summary: {summary}",
+            ]
+        )
+        event_id = build_event_id(project, file_name, f"qdrant:{summary}")
+        raw_event = build_raw_memory_event(
+            event_id=event_id,
+            project=project,
+            file_name=file_name,
+            content=synthetic_content,
+            summary=summary,
+            topic_path=topic_path,
+            topic_tags=topic_tags,
+            request_id="rehydrate-qdrant",
+            source="maintenance.rehydrate_qdrant",
+        )
+        event_payload = {
+            "event_id": event_id,
+            "project": project,
+            "file": file_name,
+            "summary": summary,
+            "payload": {
+                "projectName": project,
+                "fileName": file_name,
+                "content": synthetic_content,
+                "source": "qdrant_backfill",
+            },
+            "topic_path": topic_path,
+            "topic_tags": topic_tags,
+            "letta_session": LETTA_AUTO_SESSION_ID if _letta_config_enabled() else None,
+            "letta_context": {
                 "project": project,
                 "file": file_name,
                 "summary": summary,
-                "payload": {
-                    "projectName": project,
-                    "fileName": file_name,
-                    "content": synthetic_content,
-                    "source": "qdrant_backfill",
-                },
                 "topic_path": topic_path,
-                "topic_tags": topic_tags,
-                "letta_session": LETTA_AUTO_SESSION_ID if _letta_config_enabled() else None,
-                "letta_context": {
-                    "project": project,
-                    "file": file_name,
-                    "summary": summary,
-                    "topic_path": topic_path,
-                    "source": "qdrant_backfill",
-                },
-                "qdrant_collection": collection,
-                "raw_event": raw_event,
-            }
-            event_targets = list(targets)
-            if FANOUT_TARGET_MONGO_RAW in event_targets and not payload.force_requeue:
-                ok, _ = await persist_raw_event_to_mongo(raw_event)
-                if ok:
-                    event_targets = [t for t in event_targets if t != FANOUT_TARGET_MONGO_RAW]
-                    mongo_immediate_success += 1
-                else:
-                    deferred_mongo += 1
-            result = await enqueue_fanout_outbox(
-                event_payload,
-                event_targets,
-                force_requeue=payload.force_requeue,
-            )
-            inserted += result["inserted"]
-            requeued += result["requeued"]
-            existing += result["existing"]
-            scanned += 1
+                "source": "qdrant_backfill",
+            },
+            "qdrant_collection": collection,
+            "raw_event": raw_event,
+        }
+        event_targets = list(targets)
+        if FANOUT_TARGET_MONGO_RAW in event_targets and not payload.force_requeue:
+            ok, _ = await persist_raw_event_to_mongo(raw_event)
+            if ok:
+                event_targets = [t for t in event_targets if t != FANOUT_TARGET_MONGO_RAW]
+                counters["mongoImmediateSuccess"] += 1
+            else:
+                counters["mongoDeferred"] += 1
+        result = await enqueue_fanout_outbox(
+            event_payload,
+            event_targets,
+            force_requeue=payload.force_requeue,
+        )
+        counters["inserted"] += result["inserted"]
+        counters["requeued"] += result["requeued"]
+        counters["existing"] += result["existing"]
+        return True
 
-        if offset is None:
-            break
+    async def _run() -> dict[str, Any]:
+        global memory_write_queue_dropped
+        await _run_segmented_backfill(
+            job,
+            fetch_page=_qdrant_backfill_page_fetcher(collection, base_conditions, "backfill_scroll"),
+            process_row=_process,
+        )
+        if counters["inserted"] > 0 or counters["requeued"] > 0:
+            if memory_write_queue.full():
+                memory_write_queue_dropped += 1
+            else:
+                await memory_write_queue.put("rehydrate-qdrant")
 
-    if inserted > 0 or requeued > 0:
-        if memory_write_queue.full():
-            memory_write_queue_dropped += 1
-        else:
-            await memory_write_queue.put("rehydrate-qdrant")
+        return {
+            "ok": True,
+            "job_id": job["jobId"],
+            "job_status": job["status"],
+            "segments": len(job["segments"]),
+            "source_collection": collection,
+            "project": payload.project,
+            "targets": targets,
+            "scanned_rows": job["scanned"],
+            "skipped_rows": counters["skipped"],
+            "outbox_inserted": counters["inserted"],
+            "outbox_requeued": counters["requeued"],
+            "outbox_existing": counters["existing"],
+            "mongo_immediate_success": counters["mongoImmediateSuccess"],
+            "mongo_deferred": counters["mongoDeferred"],
+            "errors": list(job["errors"])[:50],
+        }
 
-    return {
-        "ok": True,
-        "source_collection": collection,
-        "project": payload.project,
-        "targets": targets,
-        "scanned_rows": scanned,
-        "skipped_rows": skipped,
-        "outbox_inserted": inserted,
-        "outbox_requeued": requeued,
-        "outbox_existing": existing,
-        "mongo_immediate_success": mongo_immediate_success,
-        "mongo_deferred": deferred_mongo,
-        "errors": errors[:50],
-    }
+    if payload.background:
+        return _spawn_backfill_job(job, _run())
+    return await _run()
 
 
 def _mongo_timestamp_iso(value: Any) -> str:
@@ -17511,7 +22859,6 @@ async def backfill_fanout_from_mongo_raw(payload: MongoRawBackfillRequest):
     Qdrant with a new vector dimension or rehydrating MindsDB after a table/db
     rotation) while preserving durable write history.
     """
-    global memory_write_queue_dropped
     if not await init_mongo_client():
         raise HTTPException(503, "Mongo raw store is unavailable")
     assert MONGO_CLIENT is not None
@@ -17532,7 +22879,7 @@ async def backfill_fanout_from_mongo_raw(payload: MongoRawBackfillRequest):
     if payload.project:
         query_filter["project"] = payload.project
     projection = {
-        "_id": 0,
+        "_id": 1,
         "event_id": 1,
         "source": 1,
         "project": 1,
@@ -17545,43 +22892,77 @@ async def backfill_fanout_from_mongo_raw(payload: MongoRawBackfillRequest):
         "created_at": 1,
         "updated_at": 1,
     }
-
-    def _scan_docs() -> list[dict[str, Any]]:
-        coll = MONGO_CLIENT[MONGO_RAW_DB][MONGO_RAW_COLLECTION]
-        return list(
-            coll.find(query_filter, projection=projection)
-            .sort("updated_at", -1)
-            .limit(payload.limit)
-        )
-
-    try:
-        docs = await asyncio.to_thread(_scan_docs)
-    except Exception as exc:
-        raise HTTPException(500, f"Mongo raw scan failed: {exc}") from exc
+    coll = MONGO_CLIENT[MONGO_RAW_DB][MONGO_RAW_COLLECTION]
+
+    def _fetch_page_sync(segment: dict[str, Any], cursor: Any, page_limit: int) -> tuple[list[Any], Any]:
+        if segment.get("order") == "updated_at":
+            # Capped scan: global newest-first order; the cursor is the last (updated_at, _id).
+            docs = list(
+                coll.find(_mongo_backfill_newest_filter(query_filter, cursor), projection=projection)
+                .sort([("updated_at", -1), ("_id", -1)])
+                .limit(page_limit)
+            )
+            if len(docs) < page_limit:
+                return docs, None
+            return docs, {
+                "updatedAt": _mongo_backfill_encode_updated_at(docs[-1].get("updated_at")),
+                "id": _mongo_backfill_encode_id(docs[-1].get("_id")),
+            }
+        # Newest first within each segment; the cursor is the last _id processed.
+        id_range: dict[str, Any] = {}
+        if segment.get("idFrom") is not None:
+            id_range["$gte"] = _mongo_backfill_decode_id(segment["idFrom"])
+        upper = cursor if cursor is not None else segment.get("idTo")
+        if upper is not None:
+            id_range["$lt"] = _mongo_backfill_decode_id(upper)
+        segment_filter = dict(query_filter)
+        if id_range:
+            segment_filter["_id"] = id_range
+        docs = list(coll.find(segment_filter, projection=projection).sort("_id", -1).limit(page_limit))
+        next_cursor = _mongo_backfill_encode_id(docs[-1].get("_id")) if len(docs) >= page_limit else None
+        return docs, next_cursor
+
+    async def _fetch_page(segment: dict[str, Any], cursor: Any, page_limit: int) -> tuple[list[Any], Any]:
+        return await asyncio.to_thread(_fetch_page_sync, segment, cursor, page_limit)
 
     collection = payload.qdrant_collection or QDRANT_COLLECTION
-    scanned = 0
-    inserted = 0
-    requeued = 0
-    existing = 0
-    skipped = 0
-    deferred_mongo = 0
-    mongo_immediate_success = 0
-    errors: list[str] = []
+    job, _ = await _open_backfill_job(
+        "fanout_mongo",
+        job_id=payload.job_id,
+        params={"project": payload.project, "collection": collection, "targets": targets},
+        limit=payload.limit,
+    )
+    if not job["segments"]:
+        try:
+            job["segments"] = await asyncio.to_thread(
+                _mongo_backfill_segments,
+                coll,
+                query_filter,
+                payload.segments or BACKFILL_SEGMENTS,
+                payload.limit,
+            )
+        except Exception as exc:
+            job["status"] = "failed"
+            raise HTTPException(500, f"Mongo raw scan failed: {exc}") from exc
+
+    counters: dict[str, int] = job["counters"]
+    for key in ("inserted", "requeued", "existing", "skipped", "mongoImmediateSuccess", "mongoDeferred"):
+        counters.setdefault(key, 0)
+    errors: list[str] = job["errors"]
     seen_events: set[str] = set()
-    throttled = False
-    outstanding_at_stop = 0
+    pressure = {"sinceCheck": 0, "outstanding": 0}
 
-    for doc in docs:
-        if payload.max_pending_jobs > 0 and scanned > 0 and scanned % payload.check_interval == 0:
+    async def _process(doc: Any) -> bool:
+        if payload.max_pending_jobs > 0 and pressure["sinceCheck"] >= payload.check_interval:
+            pressure["sinceCheck"] = 0
             try:
-                summary = await _query_fanout_summary_uncached()
+                fanout_summary = await _query_fanout_summary_uncached()
             except Exception:
-                summary = await get_fanout_summary()
-            outstanding_at_stop = _fanout_outstanding(summary)
-            if outstanding_at_stop >= payload.max_pending_jobs:
-                throttled = True
-                break
+                fanout_summary = await get_fanout_summary()
+            pressure["outstanding"] = _fanout_outstanding(fanout_summary)
+            if pressure["outstanding"] >= payload.max_pending_jobs:
+                job["stopReason"] = "throttled"
+                return False
 
         project = str(doc.get("project") or "").strip()
         file_name = str(doc.get("file") or "").strip()
@@ -17590,8 +22971,8 @@ async def backfill_fanout_from_mongo_raw(payload: MongoRawBackfillRequest):
         if not summary:
             summary = (content[:600] if content else f"{project}/{file_name}").strip()
         if not project or not file_name or not summary:
-            skipped += 1
-            continue
+            counters["skipped"] += 1
+            return False
 
         topic_path = str(doc.get("topic_path") or derive_topic_path(file_name, None))
         raw_topic_tags = doc.get("topic_tags")
@@ -17605,8 +22986,8 @@ async def backfill_fanout_from_mongo_raw(payload: MongoRawBackfillRequest):
         if not event_id:
             event_id = build_event_id(project, file_name, content or summary)
         if event_id in seen_events:
-            skipped += 1
-            continue
+            counters["skipped"] += 1
+            return False
         seen_events.add(event_id)
 
         raw_event = {
@@ -17651,9 +23032,9 @@ async def backfill_fanout_from_mongo_raw(payload: MongoRawBackfillRequest):
             ok, _ = await persist_raw_event_to_mongo(raw_event)
             if ok:
                 event_targets = [t for t in event_targets if t != FANOUT_TARGET_MONGO_RAW]
-                mongo_immediate_success += 1
+                counters["mongoImmediateSuccess"] += 1
             else:
-                deferred_mongo += 1
+                counters["mongoDeferred"] += 1
         try:
             result = await enqueue_fanout_outbox(
                 event_payload,
@@ -17661,41 +23042,75 @@ async def backfill_fanout_from_mongo_raw(payload: MongoRawBackfillRequest):
                 force_requeue=payload.force_requeue,
             )
         except Exception as exc:
-            errors.append(f"{project}/{file_name}: enqueue failed ({exc})")
-            continue
-        inserted += result["inserted"]
-        requeued += result["requeued"]
-        existing += result["existing"]
-        scanned += 1
+            if len(errors) < 50:
+                errors.append(f"{project}/{file_name}: enqueue failed ({exc})")
+            return False
+        counters["inserted"] += result["inserted"]
+        counters["requeued"] += result["requeued"]
+        counters["existing"] += result["existing"]
+        pressure["sinceCheck"] += 1
+        return True
 
-    if inserted > 0 or requeued > 0:
-        if memory_write_queue.full():
-            memory_write_queue_dropped += 1
-        else:
-            await memory_write_queue.put("rehydrate-mongo")
+    async def _run() -> dict[str, Any]:
+        global memory_write_queue_dropped
+        await _run_segmented_backfill(job, fetch_page=_fetch_page, process_row=_process)
+        if counters["inserted"] > 0 or counters["requeued"] > 0:
+            if memory_write_queue.full():
+                memory_write_queue_dropped += 1
+            else:
+                await memory_write_queue.put("rehydrate-mongo")
 
-    if outstanding_at_stop == 0 and payload.max_pending_jobs > 0:
-        try:
-            summary = await get_fanout_summary()
-            outstanding_at_stop = _fanout_outstanding(summary)
-        except Exception:
-            outstanding_at_stop = 0
+        outstanding_at_stop = pressure["outstanding"]
+        if outstanding_at_stop == 0 and payload.max_pending_jobs > 0:
+            try:
+                fanout_summary = await get_fanout_summary()
+                outstanding_at_stop = _fanout_outstanding(fanout_summary)
+            except Exception:
+                outstanding_at_stop = 0
 
-    return {
-        "ok": True,
-        "source": "mongo_raw",
-        "project": payload.project,
-        "qdrant_collection": collection,
-        "targets": targets,
-        "scanned_rows": scanned,
-        "skipped_rows": skipped,
-        "outbox_inserted": inserted,
-        "outbox_requeued": requeued,
-        "outbox_existing": existing,
-        "throttled": throttled,
-        "outstanding_jobs": outstanding_at_stop,
-        "max_pending_jobs": payload.max_pending_jobs,
-        "mongo_immediate_success": mongo_immediate_success,
-        "mongo_deferred": deferred_mongo,
-        "errors": errors[:50],
-    }
+        return {
+            "ok": True,
+            "job_id": job["jobId"],
+            "job_status": job["status"],
+            "segments": len(job["segments"]),
+            "source": "mongo_raw",
+            "project": payload.project,
+            "qdrant_collection": collection,
+            "targets": targets,
+            "scanned_rows": job["scanned"],
+            "skipped_rows": counters["skipped"],
+            "outbox_inserted": counters["inserted"],
+            "outbox_requeued": counters["requeued"],
+            "outbox_existing": counters["existing"],
+            "throttled": job.get("stopReason") == "throttled",
+            "outstanding_jobs": outstanding_at_stop,
+            "max_pending_jobs": payload.max_pending_jobs,
+            "mongo_immediate_success": counters["mongoImmediateSuccess"],
+            "mongo_deferred": counters["mongoDeferred"],
+            "errors": list(errors)[:50],
+        }
+
+    if payload.background:
+        return _spawn_backfill_job(job, _run())
+    return await _run()
+
+
+@app.get("/maintenance/backfill/jobs")
+async def list_backfill_jobs():
+    async with backfill_jobs_lock:
+        jobs = [_backfill_job_summary(job) for job in reversed(backfill_jobs.values())]
+    return {"ok": True, "jobs": jobs}
+
+
+@app.get("/maintenance/backfill/jobs/{job_id}")
+async def get_backfill_job(job_id: str):
+    """Progress of a running or checkpointed backfill job, including per-segment cursors."""
+    if not BACKFILL_JOB_ID_PATTERN.match(job_id):
+        raise HTTPException(400, "job_id must be 1-64 characters from [A-Za-z0-9_.-]")
+    async with backfill_jobs_lock:
+        job = _load_backfill_job(job_id)
+        if job is None:
+            raise HTTPException(404, f"Unknown backfill job {job_id}")
+        summary = _backfill_job_summary(job)
+        summary["segmentsDetail"] = json.loads(json.dumps(job.get("segments") or [], default=str))
+    return {"ok": True, "job": summary}
@@ -3,10 +3,11 @@ from __future__ import annotations
 import asyncio
 import importlib.util
 import json
+import random
 import sys
 import time
 from types import SimpleNamespace
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
@@ -134,6 +135,99 @@ def test_merge_federated_rows_applies_fusion_quality_and_lifecycle_adjustments(m
     assert sorted(row["sources"]) == ["letta", "qdrant"]
 
 
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_merge_federated_rows_top_k_matches_full_ranking(monkeypatch: pytest.MonkeyPatch, use_numpy: bool):
+    if not use_numpy:
+        monkeypatch.setattr(orchestrator, "np", None)
+    rows = {
+        "qdrant": [
+            {"project": "alpha", "file": f"notes/{index % 7}.md", "summary": f"stop loss {index}", "score": (index % 5) / 5}
+            for index in range(20)
+        ],
+        "mongo_raw": [
+            {"project": "alpha", "file": f"notes/{index}.md", "summary": "rpc provider", "score": 0.4}
+            for index in range(12)
+        ],
+    }
+    kwargs = {"learning_enabled": False, "query": "stop loss"}
+    full = orchestrator._merge_federated_rows(rows, {"qdrant": 1.0, "mongo_raw": 1.0}, set(), set(), **kwargs)
+    top = orchestrator._merge_federated_rows(rows, {"qdrant": 1.0, "mongo_raw": 1.0}, set(), set(), top_k=4, **kwargs)
+
+    assert len(full) == 12
+    assert [row["score"] for row in full] == sorted((row["score"] for row in full), reverse=True)
+    assert [row["file"] for row in top] == [row["file"] for row in full[:4]]
+    assert top[0]["sources"] == ["mongo_raw", "qdrant"]
+    assert top[0]["consensus_adjustment"] > 0
+
+
+def test_write_time_text_features_are_reused_at_query_time(monkeypatch: pytest.MonkeyPatch):
+    event = orchestrator.build_raw_memory_event(
+        "evt-1",
+        "alpha",
+        "notes/risk.md",
+        "full content",
+        "Stop loss moved to $61,200 after 3 fills",
+        "risk",
+        ["risk"],
+        None,
+    )
+    assert event["numeric_values"] == ["$61,200", "3"]
+    assert event["terms"] == ["stop", "loss", "moved", "200", "after", "fills"]
+    assert event["content_fingerprint"] == orchestrator._summary_fingerprint(event["summary"])
+
+    # Without a summary the features follow the snippet Mongo retrieval would return.
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_MONGO_SNIPPET_CHARS", 8)
+    bare = orchestrator.build_raw_memory_event("evt-2", "alpha", "notes/raw.md", "limit 42 then 9000", "", "risk", ["risk"], None)
+    assert bare["numeric_values"] == ["42"]
+    assert bare["content_fingerprint"] == orchestrator._summary_fingerprint("limit 42")
+
+    compiled = orchestrator.CompiledQuery("stop loss $61,200")
+
+    def _fail_extract(*args, **kwargs):
+        raise AssertionError("stored numeric values should be reused")
+
+    monkeypatch.setattr(orchestrator, "_extract_numeric_values_verbatim", _fail_extract)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_FUSION_ENABLED", True)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_FUSION_NUMERIC_MATCH_ENABLED", True)
+    row = {
+        "project": "alpha",
+        "file": "notes/risk.md",
+        "summary": event["summary"],
+        "score": 0.5,
+        "numeric_values": event["numeric_values"],
+        "terms": event["terms"],
+    }
+    # Stored terms answer term lookups; only the project/file header is scanned.
+    stored_terms = orchestrator._row_terms(row)
+    assert compiled.term_hits("", stored_terms=stored_terms, header="alpha\nnotes/risk.md") == {"stop", "loss", "200"}
+    assert compiled.term_hits("", stored_terms=stored_terms, header="alpha\nnotes/stop.md") == {"stop", "loss", "200"}
+    assert compiled.term_hits("stop loss 200") == {"stop", "loss", "200"}
+    monkeypatch.setattr(orchestrator, "MEMORY_FEATURE_MAX_TERMS", 6)
+    assert orchestrator._row_terms(row) is None
+    monkeypatch.setattr(orchestrator, "MEMORY_FEATURE_MAX_TERMS", 128)
+    merged = orchestrator._merge_federated_rows(
+        {"mongo_raw": [row]},
+        {"mongo_raw": 1.0},
+        set(),
+        set(),
+        learning_enabled=False,
+        compiled_query=compiled,
+    )
+    assert merged[0]["numeric_match_ratio"] == 1.0
+    legacy = orchestrator._merge_federated_rows(
+        {"mongo_raw": [{key: value for key, value in row.items() if key != "terms"}]},
+        {"mongo_raw": 1.0},
+        set(),
+        set(),
+        learning_enabled=False,
+        compiled_query=compiled,
+    )
+    assert legacy[0]["score"] == merged[0]["score"]
+
+    grounding = orchestrator._build_grounding_payload([dict(row, numeric_values=["$61,200", "999"])])
+    assert grounding["facts"][0]["numeric_values"] == ["$61,200"]
+
+
 @pytest.mark.asyncio
 async def test_retrieval_source_quality_snapshot_penalizes_unstable_sources(monkeypatch: pytest.MonkeyPatch):
     monkeypatch.setattr(orchestrator, "RETRIEVAL_SOURCE_QUALITY_ADAPTIVE_ENABLED", True)
@@ -236,6 +330,37 @@ async def test_federated_search_degrades_when_qdrant_fails(monkeypatch: pytest.M
     assert any("qdrant retrieval failed" in item for item in warnings)
 
 
+@pytest.mark.asyncio
+async def test_federated_search_records_source_latency_before_completion_callback(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    events: list[str] = []
+
+    async def _qdrant(*args, **kwargs):
+        return [{"project": "alpha", "file": "notes/a.md", "summary": "alpha", "score": 0.5}]
+
+    async def _record(*, source, duration_ms, ok, timed_out, retrieval_mode):
+        events.append(f"latency:{source}")
+
+    async def _on_source_complete(source, rows, error):
+        events.append(f"complete:{source}")
+        # A slow listener must not inflate the recorded source latency.
+        await asyncio.sleep(0.01)
+
+    monkeypatch.setattr(orchestrator, "search_qdrant", _qdrant)
+    monkeypatch.setattr(orchestrator, "_record_retrieval_source_latency", _record)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_CACHE_ENABLED", False)
+
+    results, _, _ = await orchestrator.federated_search_memory(
+        "alpha",
+        limit=5,
+        sources=["qdrant"],
+        on_source_complete=_on_source_complete,
+    )
+    assert [row["file"] for row in results] == ["notes/a.md"]
+    assert events == ["latency:qdrant", "complete:qdrant"]
+
+
 @pytest.mark.asyncio
 async def test_federated_search_explicit_sources_do_not_skip_slow_batch(monkeypatch: pytest.MonkeyPatch):
     async def _qdrant(*args, **kwargs):
@@ -612,125 +737,1616 @@ async def test_federated_search_deep_mode_does_not_force_degraded_slow_sources(
 
     async def _letta(*args, **kwargs):
         calls["letta"] += 1
-        return [{"project": "alpha", "file": "slow/letta.md", "summary": "slow row", "score": 0.4, "source": "letta"}]
-
-    async def _memory_bank(*args, **kwargs):
-        calls["memory_bank"] += 1
+        return [{"project": "alpha", "file": "slow/letta.md", "summary": "slow row", "score": 0.4, "source": "letta"}]
+
+    async def _memory_bank(*args, **kwargs):
+        calls["memory_bank"] += 1
+        return []
+
+    async def _empty(*args, **kwargs):
+        return []
+
+    monkeypatch.setattr(orchestrator, "search_qdrant", _qdrant)
+    monkeypatch.setattr(orchestrator, "search_mongo_raw", _empty)
+    monkeypatch.setattr(orchestrator, "search_mindsdb_memory", _empty)
+    monkeypatch.setattr(orchestrator, "search_topic_rollups", _empty)
+    monkeypatch.setattr(orchestrator, "search_letta_archival", _letta)
+    monkeypatch.setattr(orchestrator, "search_memory_bank_lexical", _memory_bank)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_ENABLE_STAGED_FETCH", True)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_SLOW_SOURCE_MIN_RESULTS", 1)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_SLOW_SOURCE_MIN_TOP_SCORE", 0.4)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_SLOW_SOURCE_MIN_DIVERSITY", 1)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_CACHE_ENABLED", False)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_SLOW_SOURCE_STABILITY_ENABLED", True)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_SLOW_SOURCE_STABILITY_MIN_REQUESTS", 10)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_SLOW_SOURCE_TIMEOUT_RATE_THRESHOLD", 0.5)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_SLOW_SOURCE_ERROR_RATE_THRESHOLD", 0.6)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_SLOW_SOURCE_COOLDOWN_SECS", 180.0)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_LETTA_DEGRADED_TIMEOUT_SECS", 12.0)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_MEMORY_DEGRADED_TIMEOUT_SECS", 2.5)
+    monkeypatch.setattr(
+        orchestrator,
+        "RETRIEVAL_SOURCES_ENV",
+        ",".join(
+            [
+                orchestrator.RETRIEVAL_SOURCE_QDRANT,
+                orchestrator.RETRIEVAL_SOURCE_LETTA,
+                orchestrator.RETRIEVAL_SOURCE_MEMORY_BANK,
+            ]
+        ),
+    )
+    monkeypatch.setattr(
+        orchestrator,
+        "DEFAULT_RETRIEVAL_FAST_SOURCES",
+        [orchestrator.RETRIEVAL_SOURCE_QDRANT],
+    )
+    monkeypatch.setattr(
+        orchestrator,
+        "DEFAULT_RETRIEVAL_SLOW_SOURCES",
+        [orchestrator.RETRIEVAL_SOURCE_LETTA, orchestrator.RETRIEVAL_SOURCE_MEMORY_BANK],
+    )
+    async with orchestrator.retrieval_latency_lock:
+        orchestrator.retrieval_source_request_counts.clear()
+        orchestrator.retrieval_source_error_counts.clear()
+        orchestrator.retrieval_source_timeout_counts.clear()
+        orchestrator.retrieval_slow_source_cooldown_until.clear()
+        orchestrator.retrieval_source_request_counts[orchestrator.RETRIEVAL_SOURCE_LETTA] = 20
+        orchestrator.retrieval_source_timeout_counts[orchestrator.RETRIEVAL_SOURCE_LETTA] = 16
+        orchestrator.retrieval_source_request_counts[orchestrator.RETRIEVAL_SOURCE_MEMORY_BANK] = 20
+        orchestrator.retrieval_source_timeout_counts[orchestrator.RETRIEVAL_SOURCE_MEMORY_BANK] = 12
+
+    results, debug, _ = await orchestrator.federated_search_memory(
+        "alpha",
+        limit=5,
+        sources=None,
+        rerank_with_learning=False,
+        retrieval_mode="deep",
+    )
+
+    assert results
+    assert calls["qdrant"] == 1
+    assert calls["letta"] == 0
+    assert calls["memory_bank"] == 0
+    assert debug["retrieval_mode"] == "deep"
+    assert debug["staged_fetch"]["force_include_slow"] is False
+    assert debug["staged_fetch"]["slow_sources_skipped"] == [
+        orchestrator.RETRIEVAL_SOURCE_LETTA,
+        orchestrator.RETRIEVAL_SOURCE_MEMORY_BANK,
+    ]
+    assert orchestrator.RETRIEVAL_SOURCE_LETTA in debug["source_policy"]["degraded_sources"]
+    assert orchestrator.RETRIEVAL_SOURCE_MEMORY_BANK in debug["source_policy"]["degraded_sources"]
+
+
+@pytest.mark.asyncio
+async def test_federated_search_pathway_cache_hits(monkeypatch: pytest.MonkeyPatch):
+    calls = {"qdrant": 0}
+
+    async def _qdrant(*args, **kwargs):
+        calls["qdrant"] += 1
+        return [{"project": "alpha", "file": "notes/a.md", "summary": "cached result", "score": 0.8, "source": "qdrant"}]
+
+    monkeypatch.setattr(orchestrator, "search_qdrant", _qdrant)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_CACHE_ENABLED", True)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_CACHE_TTL_SECS", 120.0)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_CACHE_MAX_KEYS", 128)
+    monkeypatch.setattr(orchestrator, "retrieval_pathway_cache_hits", 0)
+    monkeypatch.setattr(orchestrator, "retrieval_pathway_cache_misses", 0)
+    monkeypatch.setattr(orchestrator, "retrieval_pathway_cache_evictions", 0)
+    async with orchestrator.retrieval_pathway_cache_lock:
+        orchestrator.retrieval_pathway_cache.clear()
+
+    first, debug_first, _ = await orchestrator.federated_search_memory(
+        "alpha",
+        limit=5,
+        sources=[orchestrator.RETRIEVAL_SOURCE_QDRANT],
+        rerank_with_learning=False,
+        retrieval_mode="balanced",
+    )
+    second, debug_second, _ = await orchestrator.federated_search_memory(
+        "alpha",
+        limit=5,
+        sources=[orchestrator.RETRIEVAL_SOURCE_QDRANT],
+        rerank_with_learning=False,
+        retrieval_mode="balanced",
+    )
+
+    assert first
+    assert second
+    assert calls["qdrant"] == 1
+    assert debug_first["cache"]["pathway_hit"] is False
+    assert debug_second["cache"]["pathway_hit"] is True
+    assert orchestrator.retrieval_pathway_cache_hits >= 1
+
+
+@pytest.mark.asyncio
+async def test_federated_search_pathway_cache_invalidated_by_write_generation(monkeypatch: pytest.MonkeyPatch):
+    calls = {"qdrant": 0}
+
+    async def _qdrant(*args, **kwargs):
+        calls["qdrant"] += 1
+        return [{"project": "alpha", "file": "notes/a.md", "summary": "fresh result", "score": 0.8, "source": "qdrant"}]
+
+    monkeypatch.setattr(orchestrator, "search_qdrant", _qdrant)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_CACHE_ENABLED", True)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_INVALIDATION_ENABLED", True)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_REDIS_URL", "")
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_CACHE_TTL_SECS", 120.0)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_CACHE_MAX_KEYS", 128)
+    monkeypatch.setattr(orchestrator, "retrieval_pathway_generations", {})
+    async with orchestrator.retrieval_pathway_cache_lock:
+        orchestrator.retrieval_pathway_cache.clear()
+
+    async def _search(project: str):
+        return await orchestrator.federated_search_memory(
+            "alpha",
+            limit=5,
+            project_filter=project,
+            topic_filter="agents",
+            sources=[orchestrator.RETRIEVAL_SOURCE_QDRANT],
+            rerank_with_learning=False,
+            retrieval_mode="balanced",
+        )
+
+    await _search("alpha")
+    await _search("beta")
+    await _search("alpha")
+    assert calls["qdrant"] == 2
+
+    # A write elsewhere in the project tree leaves the cached topic pathway intact.
+    await orchestrator._bump_retrieval_pathway_generations([("alpha", "research/papers")])
+    await _search("alpha")
+    assert calls["qdrant"] == 2
+
+    await orchestrator._bump_retrieval_pathway_generations([("alpha", "agents/protocols")])
+    _, debug, _ = await _search("alpha")
+    await _search("beta")
+    assert calls["qdrant"] == 3
+    assert debug["cache"]["pathway_hit"] is False
+    assert orchestrator._retrieval_pathway_cache_ttl_secs() >= orchestrator.RETRIEVAL_PATHWAY_INVALIDATION_TTL_SECS
+
+
+@pytest.mark.asyncio
+async def test_federated_search_coalesces_identical_inflight_requests(monkeypatch: pytest.MonkeyPatch):
+    calls = {"qdrant": 0}
+
+    async def _qdrant(*args, **kwargs):
+        calls["qdrant"] += 1
+        await asyncio.sleep(0.05)
+        return [{"project": "alpha", "file": "notes/a.md", "summary": "shared result", "score": 0.8, "source": "qdrant"}]
+
+    monkeypatch.setattr(orchestrator, "search_qdrant", _qdrant)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_CACHE_ENABLED", False)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_SINGLEFLIGHT_ENABLED", True)
+    monkeypatch.setattr(orchestrator, "retrieval_pathway_singleflight_coalesced", 0)
+
+    outcomes = await asyncio.gather(
+        *[
+            orchestrator.federated_search_memory(
+                "alpha",
+                limit=5,
+                sources=[orchestrator.RETRIEVAL_SOURCE_QDRANT],
+                rerank_with_learning=False,
+                retrieval_mode="balanced",
+            )
+            for _ in range(3)
+        ]
+    )
+
+    assert calls["qdrant"] == 1
+    assert orchestrator.retrieval_pathway_singleflight_coalesced == 2
+    assert sum(1 for _, debug, _ in outcomes if debug["cache"]["coalesced"]) == 2
+    outcomes[0][0][0]["summary"] = "mutated"
+    assert outcomes[1][0][0]["summary"] == "shared result"
+    assert not orchestrator.retrieval_pathway_inflight
+
+
+@pytest.mark.asyncio
+async def test_federated_search_semantic_cache_serves_near_duplicate_query(monkeypatch: pytest.MonkeyPatch):
+    if orchestrator.np is None:
+        pytest.skip("numpy not installed")
+    calls = {"qdrant": 0}
+
+    async def _qdrant(*args, **kwargs):
+        calls["qdrant"] += 1
+        return [{"project": "alpha", "file": "notes/stops.md", "summary": "btc stop loss 61200", "score": 0.8}]
+
+    monkeypatch.setattr(orchestrator, "search_qdrant", _qdrant)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_CACHE_ENABLED", True)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_CACHE_TTL_SECS", 120.0)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_SEMANTIC_CACHE_ENABLED", True)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_SEMANTIC_CACHE_MIN_SIMILARITY", 0.95)
+    monkeypatch.setattr(orchestrator, "EMBEDDING_CACHE_ENABLED", True)
+    monkeypatch.setattr(orchestrator, "retrieval_semantic_cache_partitions", {})
+    monkeypatch.setattr(orchestrator, "retrieval_semantic_cache_lru", orchestrator.OrderedDict())
+    async with orchestrator.retrieval_pathway_cache_lock:
+        orchestrator.retrieval_pathway_cache.clear()
+    vectors = {
+        "what is the btc stop loss": [1.0, 0.0, 0.10],
+        "btc stop-loss value?": [1.0, 0.0, 0.12],
+        "eth funding schedule": [0.0, 1.0, 0.0],
+        "stop loss 50": [0.0, 0.0, 1.0],
+        "stop loss 55": [0.0, 0.0, 1.0],
+        "stop-loss 50?": [0.0, 0.01, 1.0],
+    }
+    for text, vector in vectors.items():
+        await orchestrator._embedding_cache_set(orchestrator._embedding_cache_key(text), vector)
+
+    async def _search(text: str):
+        return await orchestrator.federated_search_memory(
+            text,
+            limit=5,
+            project_filter="alpha",
+            sources=[orchestrator.RETRIEVAL_SOURCE_QDRANT],
+            rerank_with_learning=False,
+            retrieval_mode="balanced",
+        )
+
+    await _search("what is the btc stop loss")
+    near, near_debug, _ = await _search("btc stop-loss value?")
+    _, far_debug, _ = await _search("eth funding schedule")
+
+    assert calls["qdrant"] == 2
+    assert near[0]["file"] == "notes/stops.md"
+    assert near_debug["cache"]["semantic_hit"] is True
+    assert near_debug["cache"]["semantic_similarity"] >= 0.95
+    assert far_debug["cache"]["pathway_hit"] is False
+
+    # Near-identical vectors never bridge different numbers in the query.
+    await _search("stop loss 50")
+    _, other_number_debug, _ = await _search("stop loss 55")
+    _, same_number_debug, _ = await _search("stop-loss 50?")
+    assert calls["qdrant"] == 4
+    assert other_number_debug["cache"]["pathway_hit"] is False
+    assert same_number_debug["cache"]["semantic_hit"] is True
+
+
+@pytest.mark.asyncio
+async def test_run_hedged_source_races_second_attempt_within_budget(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_HEDGE_MAX_EXTRA_LOAD", 0.5)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_HEDGE_BUDGET_BURST", 1.0)
+    monkeypatch.setattr(orchestrator, "retrieval_hedge_tokens", {})
+    monkeypatch.setattr(orchestrator, "retrieval_hedge_stats", {})
+    attempts = {"count": 0}
+
+    async def _attempt():
+        attempts["count"] += 1
+        # The first attempt of each pair stalls; the hedge answers immediately.
+        if attempts["count"] % 2 == 1:
+            await asyncio.sleep(0.2)
+            return [{"file": "slow.md"}]
+        return [{"file": "fast.md"}]
+
+    outcomes: dict[str, str] = {}
+    rows = await orchestrator._run_hedged_source("letta", _attempt, 0.01, outcomes)
+    # Half a token per primary: the first stalled call cannot afford a hedge yet.
+    assert rows == [{"file": "slow.md"}]
+    assert outcomes["letta"] == "budget_denied"
+
+    attempts["count"] = 0
+    settled: list[tuple[float, bool, bool]] = []
+
+    async def _on_primary_settled(duration_ms: float, ok: bool, timed_out: bool) -> None:
+        settled.append((duration_ms, ok, timed_out))
+
+    rows = await orchestrator._run_hedged_source(
+        "letta",
+        _attempt,
+        0.01,
+        outcomes,
+        on_primary_settled=_on_primary_settled,
+        primary_timeout_secs=1.0,
+    )
+    assert rows == [{"file": "fast.md"}]
+    assert outcomes["letta"] == "hedge_won"
+    # The losing primary still reports its own elapsed time, not the hedge's.
+    assert settled == []
+    await asyncio.gather(*list(orchestrator.retrieval_hedge_primary_tasks))
+    assert len(settled) == 1
+    assert settled[0][0] >= 190.0
+    assert settled[0][1:] == (True, False)
+
+    snapshot = await orchestrator._retrieval_hedge_snapshot()
+    letta = snapshot["bySource"]["letta"]
+    assert letta["eligible"] == 2
+    assert letta["issued"] == 1
+    assert letta["wins"] == 1
+    assert letta["budgetDenied"] == 1
+    assert letta["extraLoad"] <= 0.5
+
+
+@pytest.mark.asyncio
+async def test_retrieval_hedge_delays_use_rolling_percentile(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_HEDGE_ENABLED", True)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_HEDGE_SOURCES", ["letta", "memory_bank"])
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_HEDGE_MIN_SAMPLES", 10)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_HEDGE_PERCENTILE", 0.9)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_HEDGE_MIN_DELAY_MS", 1.0)
+    monkeypatch.setattr(orchestrator, "retrieval_latency_sketches", {})
+    samples = [("letta", float(value)) for value in range(100, 1100, 100)]
+    samples += [("memory_bank", 50.0), ("memory_bank", 60.0)]
+    for source, duration_ms in samples:
+        await orchestrator._record_retrieval_source_latency(
+            source=source,
+            duration_ms=duration_ms,
+            ok=True,
+            timed_out=False,
+            retrieval_mode="balanced",
+        )
+
+    delays = await orchestrator._retrieval_hedge_delays(
+        sources=["qdrant", "letta", "memory_bank"],
+        degraded_sources={},
+    )
+    assert set(delays) == {"letta"}
+    # Sketch quantiles are rank-based with bounded relative error.
+    assert delays["letta"] == pytest.approx(0.9, rel=orchestrator.RETRIEVAL_LATENCY_SKETCH_ACCURACY)
+    degraded = await orchestrator._retrieval_hedge_delays(
+        sources=["letta"],
+        degraded_sources={"letta": {}},
+    )
+    assert degraded == {}
+
+
+@pytest.mark.asyncio
+async def test_engine_retrieval_query_stream_emits_partial_then_final(monkeypatch: pytest.MonkeyPatch):
+    async def _qdrant(*args, **kwargs):
+        return [{"project": "alpha", "file": "notes/fast.md", "summary": "stop loss 61200", "score": 0.7}]
+
+    async def _topic_rollups(*args, **kwargs):
+        await asyncio.sleep(0.02)
+        return [{"project": "alpha", "file": "notes/slow.md", "summary": "stop loss history", "score": 0.9}]
+
+    monkeypatch.setattr(orchestrator, "search_qdrant", _qdrant)
+    monkeypatch.setattr(orchestrator, "search_topic_rollups", _topic_rollups)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_CACHE_ENABLED", False)
+    request = Request({"type": "http", "method": "POST", "path": "/v1/retrieval/query/stream", "headers": [], "query_string": b""})
+
+    response = await orchestrator.engine_retrieval_query_stream(
+        {
+            "query": "stop loss",
+            "limit": 5,
+            "sources": [orchestrator.RETRIEVAL_SOURCE_QDRANT, orchestrator.RETRIEVAL_SOURCE_TOPIC_ROLLUPS],
+            "retrieval_mode": "balanced",
+        },
+        request,
+    )
+    assert response.media_type == "application/x-ndjson"
+    frames = [json.loads(chunk) async for chunk in response.body_iterator]
+
+    assert [frame["event"] for frame in frames] == ["partial", "partial", "final"]
+    assert frames[0]["sources_completed"] == ["qdrant"]
+    assert frames[0]["sources_contributing"] == ["qdrant"]
+    assert [row["file"] for row in frames[0]["results"]] == ["notes/fast.md"]
+    assert set(frames[1]["sources_completed"]) == {"qdrant", "topic_rollups"}
+    assert len(frames[1]["results"]) == 2
+    assert "grounding" in frames[2]
+    assert frames[2]["retrieval_debug"]["source_counts"]["topic_rollups"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_retrieval_frames_dedupes_rows_repeated_by_later_hops(monkeypatch: pytest.MonkeyPatch):
+    first_hop = [
+        {"project": "alpha", "file": "notes/a.md", "summary": "stop loss 61200", "score": 0.9},
+        {"project": "alpha", "file": "notes/b.md", "summary": "stop loss history", "score": 0.6},
+    ]
+    second_hop = [
+        {"project": "alpha", "file": "notes/b.md", "summary": "stop loss history", "score": 0.8},
+        {"project": "alpha", "file": "notes/c.md", "summary": "stop placement", "score": 0.5},
+    ]
+
+    async def _execute(on_source_complete):
+        # An escalation hop reports the same source again with overlapping rows.
+        await on_source_complete("qdrant", first_hop, None)
+        await on_source_complete("qdrant", second_hop, None)
+        return {"results": []}
+
+    merge_inputs: list[list[str]] = []
+    merge = orchestrator._merge_federated_rows
+
+    def _merge(results_by_source, *args, **kwargs):
+        merge_inputs.append([row["file"] for row in results_by_source["qdrant"]])
+        return merge(results_by_source, *args, **kwargs)
+
+    monkeypatch.setattr(orchestrator, "_merge_federated_rows", _merge)
+    frames = [
+        frame
+        async for frame in orchestrator._stream_retrieval_frames(
+            query="stop loss",
+            limit=10,
+            source_weights=None,
+            execute=_execute,
+        )
+    ]
+    assert [frame["event"] for frame in frames] == ["partial", "partial", "final"]
+    files = [row["file"] for row in frames[1]["results"]]
+    assert sorted(files) == ["notes/a.md", "notes/b.md", "notes/c.md"]
+    assert frames[1]["sources_completed"] == ["qdrant"]
+    # The repeated row is held once, with its best score across hops.
+    assert merge_inputs[-1] == ["notes/a.md", "notes/b.md", "notes/c.md"]
+    assert [row["file"] for row in frames[1]["results"] if row["file"] == "notes/b.md"] == ["notes/b.md"]
+    assert next(row for row in frames[1]["results"] if row["file"] == "notes/b.md")["base_score"] == 0.8
+
+
+@pytest.mark.asyncio
+async def test_engine_retrieval_batch_query_dedupes_and_batches_qdrant(monkeypatch: pytest.MonkeyPatch):
+    batch_calls: list[list[str]] = []
+
+    async def _qdrant_batch(requests):
+        batch_calls.append([item["query"] for item in requests])
+        return [
+            [{"project": "alpha", "file": f"notes/{item['query'].replace(' ', '_')}.md", "summary": item["query"], "score": 0.8}]
+            for item in requests
+        ]
+
+    async def _qdrant(*args, **kwargs):
+        raise AssertionError("per-query qdrant search should not run when the batch succeeds")
+
+    monkeypatch.setattr(orchestrator, "search_qdrant_batch", _qdrant_batch)
+    monkeypatch.setattr(orchestrator, "search_qdrant", _qdrant)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_CACHE_ENABLED", False)
+    qdrant_only = [orchestrator.RETRIEVAL_SOURCE_QDRANT]
+
+    response = await orchestrator.engine_retrieval_batch_query(
+        {
+            "requests": [
+                {"query": "stop loss", "limit": 3, "sources": qdrant_only, "retrieval_mode": "balanced"},
+                {"query": "", "limit": 3},
+                {"query": "rpc provider", "limit": 3, "sources": qdrant_only, "retrieval_mode": "balanced"},
+                {"query": "stop loss", "limit": 3, "sources": qdrant_only, "retrieval_mode": "balanced"},
+            ]
+        }
+    )
+
+    rows = response["results"]
+    assert batch_calls == [["stop loss", "rpc provider"]]
+    assert [row["ok"] for row in rows] == [True, False, True, True]
+    assert rows[1]["error"]
+    assert [row["results"][0]["file"] for row in (rows[0], rows[2], rows[3])] == [
+        "notes/stop_loss.md",
+        "notes/rpc_provider.md",
+        "notes/stop_loss.md",
+    ]
+    assert rows[3]["deduplicated"] is True
+    assert rows[3]["results"] is not rows[0]["results"]
+    assert rows[0]["timing_ms"] is not None
+    assert response["batch"]["unique"] == 2
+    assert response["batch"]["deduplicated"] == 1
+    assert response["batch"]["errors"] == 1
+    assert response["batch"]["qdrant_batch"]["used"] is True
+
+
+@pytest.mark.asyncio
+async def test_engine_retrieval_batch_query_prefetch_skips_cached_and_honours_deadline(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    batch_calls: list[list[str]] = []
+    state = {"delay": 0.0}
+
+    async def _qdrant_batch(requests):
+        batch_calls.append([item["query"] for item in requests])
+        await asyncio.sleep(state["delay"])
+        return [
+            [{"project": "alpha", "file": f"notes/{item['query']}.md", "summary": item["query"], "score": 0.8}]
+            for item in requests
+        ]
+
+    async def _qdrant(query, **kwargs):
+        return [{"project": "alpha", "file": f"notes/{query}.md", "summary": query, "score": 0.8}]
+
+    monkeypatch.setattr(orchestrator, "search_qdrant_batch", _qdrant_batch)
+    monkeypatch.setattr(orchestrator, "search_qdrant", _qdrant)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_CACHE_ENABLED", True)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_REDIS_URL", "")
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_CACHE_TTL_SECS", 120.0)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_CACHE_MAX_KEYS", 128)
+    async with orchestrator.retrieval_pathway_cache_lock:
+        orchestrator.retrieval_pathway_cache.clear()
+    qdrant_only = [orchestrator.RETRIEVAL_SOURCE_QDRANT]
+
+    def _requests(*queries):
+        return [{"query": query, "limit": 3, "sources": qdrant_only, "retrieval_mode": "balanced"} for query in queries]
+
+    await orchestrator.engine_retrieval_batch_query({"requests": _requests("alpha", "beta")})
+    assert batch_calls == [["alpha", "beta"]]
+
+    # Cached jobs are left out of the prefetch; the two misses still share one batch call.
+    response = await orchestrator.engine_retrieval_batch_query({"requests": _requests("alpha", "gamma", "delta")})
+    assert batch_calls[-1] == ["gamma", "delta"]
+    assert response["batch"]["qdrant_batch"]["cached"] == 1
+    assert all(row["ok"] for row in response["results"])
+
+    # A single query warms the same cache entry the batch job looks up.
+    await orchestrator.federated_search_memory("omega", limit=3, sources=qdrant_only, retrieval_mode="balanced")
+    assert orchestrator._retrieval_pathway_cache_contains(
+        await orchestrator._batch_job_pathway_cache_key(_requests("omega")[0])
+    )
+
+    # A prefetch that overruns the batch deadline is abandoned instead of holding the batch.
+    state["delay"] = 1.0
+    started = time.monotonic()
+    response = await orchestrator.engine_retrieval_batch_query(
+        {"requests": _requests("eps", "zeta"), "deadline_ms": 200}
+    )
+    assert time.monotonic() - started < 0.9
+    assert response["batch"]["qdrant_batch"]["timed_out"] is True
+
+
+def test_compiled_query_matches_scorer_semantics():
+    compiled = orchestrator.CompiledQuery(
+        "Stop  Loss 61200",
+        positive_terms={"helius", "stop"},
+        negative_terms={"jito"},
+    )
+    body = "alpha\nnotes/risk.md\nmoved the stop loss 61200 after helius rpc review".lower()
+
+    assert compiled.phrase == "stop loss 61200"
+    assert compiled.match_score(body, lowered=True) == 1.0
+    hits = compiled.term_hits(body)
+    assert compiled.learning_hits(hits) == (2, 0)
+    assert compiled.numeric_overlap(body) == (1, True)
+    assert compiled.numeric_overlap("stop loss near 612000") == (0, True)
+    assert compiled.numeric_overlap("no numbers here") == (0, False)
+    partial = "notes about stop placement"
+    assert compiled.match_score(partial) == orchestrator._text_match_score("stop loss 61200", partial)
+    assert 0.0 < compiled.match_score(partial) < 1.0
+
+
+@pytest.mark.asyncio
+async def test_fetch_search_result_contents_is_concurrent_bounded_and_truncates(monkeypatch: pytest.MonkeyPatch):
+    active = {"now": 0, "peak": 0}
+    reads: list[str] = []
+
+    async def _read(project: str, file_name: str, **kwargs):
+        reads.append(file_name)
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        try:
+            await asyncio.sleep(1.0 if file_name == "slow.md" else 0.02)
+        finally:
+            active["now"] -= 1
+        return f"content of {file_name} " + "é" * 20
+
+    async def _no_runtime():
+        return None
+
+    monkeypatch.setattr(orchestrator, "read_project_file", _read)
+    monkeypatch.setattr(orchestrator, "_get_migration_runtime", _no_runtime)
+    monkeypatch.setattr(orchestrator, "MEMMCP_SEARCH_FETCH_CONCURRENCY", 2)
+    async with orchestrator.memory_read_cache_lock:
+        orchestrator.memory_read_cache.clear()
+    await orchestrator._memory_read_cache_set("alpha", "cached.md", "cached body")
+
+    results = [
+        {"project": "alpha", "file": "cached.md"},
+        {"project": "alpha", "file": "a.md"},
+        {"project": "alpha", "file": "b.md"},
+        {"project": "alpha", "file": "c.md"},
+        {"project": "alpha", "file": "slow.md"},
+        {"project": "alpha", "file": "a.md"},
+        {"project": "", "file": "orphan.md"},
+    ]
+    warnings = await orchestrator._fetch_search_result_contents(
+        results,
+        max_content_bytes=16,
+        deadline_secs=0.3,
+    )
+
+    assert "cached.md" not in reads
+    assert sorted(reads) == ["a.md", "b.md", "c.md", "slow.md"]
+    assert active["peak"] == 2
+    assert results[0]["content"] == "cached body"
+    assert results[1]["content"] == "content of a.md "
+    assert results[1]["content_truncated"] is True
+    assert results[5]["content"] == results[1]["content"]
+    assert results[4]["content"] is None
+    assert results[6]["content"] is None
+    assert warnings and "deadline" in warnings[0]
+
+
+@pytest.mark.asyncio
+async def test_qdrant_local_index_serves_fast_mode_and_qdrant_failures(monkeypatch: pytest.MonkeyPatch):
+    if orchestrator.np is None or orchestrator.qdrant_models is None:
+        pytest.skip("numpy and qdrant-client are required for the local vector index")
+
+    points = [
+        SimpleNamespace(
+            id=1,
+            vector=[1.0, 0.0, 0.0],
+            payload={"project": "alpha", "file": "a.md", "summary": "alpha one", "topic_tags": ["ops"]},
+        ),
+        SimpleNamespace(
+            id=2,
+            vector=[0.6, 0.8, 0.0],
+            payload={"project": "alpha", "file": "b.md", "summary": "alpha two", "topic_tags": ["infra"]},
+        ),
+        SimpleNamespace(
+            id=3,
+            vector=[0.0, 0.0, 1.0],
+            payload={"project": "alpha", "file": "c.md", "summary": "alpha three", "topic_tags": ["ops"]},
+        ),
+    ]
+    remote_searches = {"count": 0}
+
+    class _FakeQdrant:
+        async def count(self, **kwargs):
+            return SimpleNamespace(count=len(points))
+
+        async def scroll(self, **kwargs):
+            assert kwargs["with_vectors"] is True
+            return points, None
+
+        async def query_points(self, **kwargs):
+            remote_searches["count"] += 1
+            raise RuntimeError("connection refused")
+
+    async def _qdrant_call(operation, fn):
+        return await fn(_FakeQdrant(), "local")
+
+    async def _embed(_query: str):
+        return [0.9, 0.1, 0.0]
+
+    monkeypatch.setattr(orchestrator, "QDRANT_LOCAL_INDEX_ENABLED", True)
+    monkeypatch.setattr(orchestrator, "QDRANT_LOCAL_INDEX_PROJECTS", ["alpha"])
+    monkeypatch.setattr(orchestrator, "_qdrant_call", _qdrant_call)
+    monkeypatch.setattr(orchestrator, "embed_text", _embed)
+    monkeypatch.setattr(orchestrator, "qdrant_local_index", {})
+    monkeypatch.setattr(orchestrator, "retrieval_pathway_stats", orchestrator.OrderedDict())
+    monkeypatch.setattr(
+        orchestrator,
+        "qdrant_local_index_stats",
+        {key: 0 for key in ("hits", "misses", "degradedServes", "upserts", "deletes", "evictions", "loads")},
+    )
+
+    loaded = await orchestrator.load_qdrant_local_index_once()
+    assert loaded["projects"] == ["alpha"]
+
+    rows = await orchestrator.search_qdrant("alpha", limit=2, project_filter="alpha", prefer_local=True)
+    assert [row["file"] for row in rows] == ["a.md", "b.md"]
+    assert remote_searches["count"] == 0
+
+    await orchestrator._qdrant_local_index_add(
+        orchestrator.QDRANT_COLLECTION,
+        [
+            SimpleNamespace(
+                id=4,
+                vector=[1.0, 0.05, 0.0],
+                payload={"project": "alpha", "file": "d.md", "summary": "alpha four", "topic_tags": ["ops"]},
+            )
+        ],
+    )
+    rows = await orchestrator.search_qdrant(
+        "alpha",
+        limit=5,
+        project_filter="alpha",
+        topic_filter="ops",
+        prefer_local=True,
+    )
+    assert [row["file"] for row in rows] == ["d.md", "a.md", "c.md"]
+
+    # Qdrant failure degrades to the local partition instead of erroring.
+    rows = await orchestrator.search_qdrant("alpha", limit=1, project_filter="alpha")
+    assert remote_searches["count"] == 1
+    assert [row["file"] for row in rows] == ["d.md"]
+
+    # Projects that are not mirrored locally still surface the Qdrant error.
+    with pytest.raises(RuntimeError):
+        await orchestrator.search_qdrant("beta", limit=1, project_filter="beta", prefer_local=True)
+
+    snapshot = await orchestrator._qdrant_local_index_snapshot()
+    assert snapshot["projects"]["alpha"]["points"] == 4
+    assert snapshot["hits"] == 2
+    assert snapshot["degradedServes"] == 1
+
+    # Deleted points leave the partition, and re-upserting a point replaces its copy.
+    await orchestrator._qdrant_local_index_remove(orchestrator.QDRANT_COLLECTION, ["4"])
+    await orchestrator._qdrant_local_index_add(
+        orchestrator.QDRANT_COLLECTION,
+        [
+            SimpleNamespace(
+                id=3,
+                vector=[0.0, 0.0, 1.0],
+                payload={"project": "alpha", "file": "c.md", "summary": "alpha three v2", "topic_tags": ["infra"]},
+            )
+        ],
+    )
+    rows = await orchestrator.search_qdrant(
+        "alpha", limit=5, project_filter="alpha", topic_filter="ops", prefer_local=True
+    )
+    assert [row["file"] for row in rows] == ["a.md"]
+    snapshot = await orchestrator._qdrant_local_index_snapshot()
+    assert snapshot["projects"]["alpha"]["points"] == 3
+    assert snapshot["deletes"] == 1
+
+    # Mutations made while a reload scrolls Qdrant are replayed onto the new index.
+    real_load_project = orchestrator._qdrant_local_index_load_project
+
+    async def _load_project_racing(project, budget_bytes):
+        partition = await real_load_project(project, budget_bytes)
+        await orchestrator._qdrant_local_index_remove(orchestrator.QDRANT_COLLECTION, ["1"])
+        await orchestrator._qdrant_local_index_add(
+            orchestrator.QDRANT_COLLECTION,
+            [
+                SimpleNamespace(
+                    id=5,
+                    vector=[0.9, 0.1, 0.0],
+                    payload={"project": "alpha", "file": "e.md", "summary": "alpha five", "topic_tags": ["ops"]},
+                )
+            ],
+        )
+        return partition
+
+    monkeypatch.setattr(orchestrator, "_qdrant_local_index_load_project", _load_project_racing)
+    await orchestrator.load_qdrant_local_index_once()
+    rows = await orchestrator.search_qdrant(
+        "alpha", limit=5, project_filter="alpha", topic_filter="ops", prefer_local=True
+    )
+    assert [row["file"] for row in rows] == ["e.md", "c.md"]
+    assert orchestrator.qdrant_local_index_journal == []
+    assert orchestrator.qdrant_local_index_loads_running == 0
+
+
+@pytest.mark.asyncio
+async def test_qdrant_collection_profile_creates_missing_indexes_and_tunes_once(monkeypatch: pytest.MonkeyPatch):
+    if orchestrator.qdrant_models is None:
+        pytest.skip("qdrant-client is required for collection profiles")
+    calls: dict[str, list] = {"indexes": [], "updates": []}
+    info = SimpleNamespace(
+        payload_schema={"project": object()},
+        config=SimpleNamespace(
+            params=SimpleNamespace(vectors=SimpleNamespace(size=3, on_disk=None)),
+            hnsw_config=SimpleNamespace(m=16, ef_construct=100),
+            quantization_config=None,
+        ),
+    )
+
+    class _FakeQdrant:
+        async def get_collection(self, collection_name: str):
+            return info
+
+        async def create_payload_index(self, **kwargs):
+            calls["indexes"].append((kwargs["field_name"], kwargs["field_schema"]))
+
+        async def update_collection(self, **kwargs):
+            calls["updates"].append(kwargs)
+
+    async def _qdrant_call(operation, fn):
+        return await fn(_FakeQdrant(), "local")
+
+    monkeypatch.setattr(orchestrator, "_qdrant_call", _qdrant_call)
+    monkeypatch.setattr(orchestrator, "qdrant_collection_dim_cache", {})
+    monkeypatch.setattr(orchestrator, "qdrant_collection_profile_state", {})
+    monkeypatch.setattr(orchestrator, "QDRANT_QUANTIZATION", "scalar")
+    monkeypatch.setattr(orchestrator, "QDRANT_HNSW_M", 32)
+    monkeypatch.setattr(orchestrator, "QDRANT_HNSW_EF_CONSTRUCT", 0)
+    monkeypatch.setattr(orchestrator, "QDRANT_ON_DISK_VECTORS", False)
+
+    await orchestrator.ensure_qdrant_collection(3, "notes")
+
+    assert [field for field, _ in calls["indexes"]] == ["file", "topic_path", "topic_tags", "ts"]
+    assert dict(calls["indexes"])["ts"] == orchestrator.qdrant_models.PayloadSchemaType.INTEGER
+    assert len(calls["updates"]) == 1
+    assert calls["updates"][0]["hnsw_config"].m == 32
+    assert calls["updates"][0]["quantization_config"].scalar.type == orchestrator.qdrant_models.ScalarType.INT8
+    assert orchestrator.qdrant_collection_profile_state["notes"]["updated"] == ["hnsw_config", "quantization_config"]
+
+    # Profile is applied once per collection per process.
+    orchestrator.qdrant_collection_dim_cache.clear()
+    await orchestrator.ensure_qdrant_collection(3, "notes")
+    assert len(calls["indexes"]) == 4
+    assert len(calls["updates"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_project_registry_reconciles_via_project_counts_and_tracks_writes(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path,
+):
+    if orchestrator.qdrant_models is None:
+        pytest.skip("qdrant-client is required for project registry reconcile")
+    point_counts = {"alpha": 50, "beta": 20, "gamma": 5, "tiny": 1}
+    calls: dict[str, Any] = {"count": [], "fail": False}
+
+    class _FakeQdrant:
+        async def facet(self, **kwargs):
+            raise RuntimeError("404 page not found")
+
+        async def scroll(self, **kwargs):
+            raise AssertionError("reconcile must not scroll the collection")
+
+        async def count(self, **kwargs):
+            if calls["fail"]:
+                raise RuntimeError("qdrant unavailable")
+            project = kwargs["count_filter"].must[0].match.value
+            calls["count"].append((project, kwargs["exact"]))
+            points = point_counts.get(project, 0)
+            # The estimate rounds the one-point project down to zero.
+            return SimpleNamespace(count=points if kwargs["exact"] or points > 1 else 0)
+
+    class _FakeMongoCollection:
+        def find_one(self, query, projection=None):
+            return {"_id": 1} if query.get("project") == "mongo_only" else None
+
+    async def _qdrant_call(operation, fn):
+        return await fn(_FakeQdrant(), "local")
+
+    async def _memory_tool(name, arguments):
+        assert name == "list_projects"
+        return {"content": ["banked", "alpha"]}
+
+    async def _mongo_ready():
+        return True
+
+    registry_path = tmp_path / "project_registry.json"
+    monkeypatch.setattr(orchestrator, "_qdrant_call", _qdrant_call)
+    monkeypatch.setattr(orchestrator, "call_memory_tool", _memory_tool)
+    monkeypatch.setattr(orchestrator, "MONGO_RAW_ENABLED", True)
+    monkeypatch.setattr(orchestrator, "init_mongo_client", _mongo_ready)
+    monkeypatch.setattr(
+        orchestrator,
+        "MONGO_CLIENT",
+        {orchestrator.MONGO_RAW_DB: {orchestrator.MONGO_RAW_COLLECTION: _FakeMongoCollection()}},
+    )
+    monkeypatch.setattr(orchestrator, "PROJECT_REGISTRY_PATH", registry_path)
+    monkeypatch.setattr(
+        orchestrator,
+        "project_registry",
+        {name: {"writes": 1} for name in ["alpha", "beta", "gamma", "tiny", "stale", "banked", "mongo_only"]},
+    )
+    monkeypatch.setattr(orchestrator, "project_registry_kick_task", None)
+    monkeypatch.setattr(orchestrator, "project_registry_retry_at", 0.0)
+    monkeypatch.setattr(
+        orchestrator,
+        "project_registry_state",
+        {"lastReconciledAt": None, "lastReconcileMethod": None, "lastReconcileError": None, "consecutiveFailures": 0},
+    )
+
+    # The first listing is served from the registry while a reconcile runs in the background.
+    assert len(await orchestrator.list_qdrant_projects()) == 7
+    await orchestrator.project_registry_kick_task
+    # One estimated count per known project; only the zero estimates are recounted exactly.
+    assert sorted(project for project, exact in calls["count"] if not exact) == [
+        "alpha",
+        "banked",
+        "beta",
+        "gamma",
+        "mongo_only",
+        "stale",
+        "tiny",
+    ]
+    assert sorted(project for project, exact in calls["count"] if exact) == ["banked", "mongo_only", "stale", "tiny"]
+    # Projects still held by the memory bank or Mongo raw survive without Qdrant points.
+    assert await orchestrator.list_qdrant_projects() == ["alpha", "banked", "beta", "gamma", "mongo_only", "tiny"]
+    assert orchestrator.project_registry["beta"]["qdrant_points"] == 20
+    assert orchestrator.project_registry["tiny"]["qdrant_points"] == 1
+    assert orchestrator.project_registry["banked"]["qdrant_points"] == 0
+    assert orchestrator.project_registry_state["lastReconcileMethod"] == "count"
+    assert orchestrator.project_registry_state["lastPruned"] == 1
+
+    # A source that cannot be checked blocks pruning.
+    async def _memory_down(name, arguments):
+        raise orchestrator.HTTPException(503, "memory bank unavailable")
+
+    monkeypatch.setattr(orchestrator, "call_memory_tool", _memory_down)
+    point_counts.pop("tiny")
+    orchestrator.project_registry["tiny"]["first_seen_at"] = "2000-01-01T00:00:00Z"
+    result = await orchestrator.reconcile_project_registry_once()
+    assert result["pruned"] == []
+    assert "tiny" in orchestrator.project_registry
+
+    # Writes register new projects without touching Qdrant.
+    calls["count"].clear()
+    await orchestrator._project_registry_touch(["delta", "alpha"], count_write=True)
+    assert await orchestrator.list_qdrant_projects(limit=2) == ["alpha", "banked"]
+    assert "delta" in await orchestrator.list_qdrant_projects()
+    assert calls["count"] == []
+    assert orchestrator.project_registry["alpha"]["writes"] == 2
+
+    monkeypatch.setattr(orchestrator, "project_registry", {})
+    orchestrator._load_project_registry()
+    assert "delta" in orchestrator.project_registry
+
+    # Reconcile failures never reach listings and back off before the next attempt.
+    calls["fail"] = True
+    orchestrator.project_registry_state["lastReconciledAt"] = None
+    assert "delta" in await orchestrator.list_qdrant_projects()
+    await orchestrator.project_registry_kick_task
+    assert orchestrator.project_registry_state["consecutiveFailures"] == 1
+    await orchestrator.list_qdrant_projects()
+    assert orchestrator.project_registry_kick_task.done()
+    assert orchestrator.project_registry_state["consecutiveFailures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_federated_search_deadline_caps_slow_sources_and_skips_cache(monkeypatch: pytest.MonkeyPatch):
+    async def _qdrant(*args, **kwargs):
+        return [{"project": "alpha", "file": "notes/a.md", "summary": "fast row", "score": 0.8, "source": "qdrant"}]
+
+    async def _letta(*args, **kwargs):
+        await asyncio.sleep(5)
+        return [{"project": "alpha", "file": "notes/slow.md", "summary": "slow row", "score": 0.9, "source": "letta"}]
+
+    monkeypatch.setattr(orchestrator, "search_qdrant", _qdrant)
+    monkeypatch.setattr(orchestrator, "search_letta_archival", _letta)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_ENABLE_STAGED_FETCH", False)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_CACHE_ENABLED", True)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_DEADLINE_RESERVE_MS", 10)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_DEADLINE_MIN_SOURCE_MS", 50)
+    async with orchestrator.retrieval_pathway_cache_lock:
+        orchestrator.retrieval_pathway_cache.clear()
+
+    deadline = orchestrator.RetrievalDeadline(250)
+    started = time.monotonic()
+    results, debug, warnings = await orchestrator.federated_search_memory(
+        "alpha",
+        limit=5,
+        sources=[orchestrator.RETRIEVAL_SOURCE_QDRANT, orchestrator.RETRIEVAL_SOURCE_LETTA],
+        rerank_with_learning=False,
+        deadline=deadline,
+    )
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 1.0
+    assert [row["file"] for row in results] == ["notes/a.md"]
+    assert deadline.truncated is True
+    assert warnings
+    assert any(stage["stage"].endswith(":merge") for stage in deadline.stages)
+    async with orchestrator.retrieval_pathway_cache_lock:
+        assert not orchestrator.retrieval_pathway_cache
+
+    # A budget already spent below the per-source floor skips sources instead of starting them.
+    spent = orchestrator.RetrievalDeadline(40)
+    _, _, skipped_warnings = await orchestrator.federated_search_memory(
+        "alpha",
+        limit=5,
+        sources=[orchestrator.RETRIEVAL_SOURCE_LETTA],
+        rerank_with_learning=False,
+        deadline=spent,
+    )
+    assert spent.skipped_sources == [orchestrator.RETRIEVAL_SOURCE_LETTA]
+    assert spent.debug()["truncated"] is True
+    assert skipped_warnings
+
+
+def test_resolve_retrieval_deadline_prefers_tighter_budget():
+    request = SimpleNamespace(headers={orchestrator.RETRIEVAL_DEADLINE_HEADER: "120"})
+    assert orchestrator._resolve_retrieval_deadline(None, None) is None
+    assert orchestrator._resolve_retrieval_deadline(500, request).budget_ms == 120.0
+    assert orchestrator._resolve_retrieval_deadline(80, request).budget_ms == 80.0
+    with pytest.raises(orchestrator.HTTPException):
+        orchestrator._resolve_retrieval_deadline(None, SimpleNamespace(headers={orchestrator.RETRIEVAL_DEADLINE_HEADER: "soon"}))
+
+
+@pytest.mark.asyncio
+async def test_source_router_skips_sources_that_never_change_top_k(monkeypatch: pytest.MonkeyPatch):
+    calls = {"letta": 0}
+
+    async def _qdrant(*args, **kwargs):
+        return [{"project": "alpha", "file": "notes/a.md", "summary": "deploy runbook", "score": 0.9, "source": "qdrant"}]
+
+    async def _letta(*args, **kwargs):
+        calls["letta"] += 1
+        # Only ever repeats a row Qdrant already returned.
+        return [{"project": "alpha", "file": "notes/a.md", "summary": "deploy runbook", "score": 0.5, "source": "letta"}]
+
+    monkeypatch.setattr(orchestrator, "search_qdrant", _qdrant)
+    monkeypatch.setattr(orchestrator, "search_letta_archival", _letta)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_ENABLE_STAGED_FETCH", False)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_CACHE_ENABLED", False)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_SINGLEFLIGHT_ENABLED", False)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_SOURCE_ROUTER_ENABLED", True)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_SOURCE_ROUTER_SOURCES", [orchestrator.RETRIEVAL_SOURCE_LETTA])
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_SOURCE_ROUTER_MIN_OBSERVATIONS", 3)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_SOURCE_ROUTER_MIN_PROBABILITY", 0.25)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_SOURCE_ROUTER_EXPLORATION_RATE", 0.0)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_SOURCE_ROUTER_DECAY", 1.0)
+    monkeypatch.setattr(orchestrator, "retrieval_source_router", orchestrator.OrderedDict())
+    monkeypatch.setattr(
+        orchestrator,
+        "_resolve_retrieval_sources_for_mode",
+        lambda mode, sources: [orchestrator.RETRIEVAL_SOURCE_QDRANT, orchestrator.RETRIEVAL_SOURCE_LETTA],
+    )
+
+    async def _search():
+        return await orchestrator.federated_search_memory(
+            "deploy runbook",
+            limit=5,
+            project_filter="alpha",
+            rerank_with_learning=False,
+            retrieval_mode="balanced",
+        )
+
+    for _ in range(3):
+        _, debug, _ = await _search()
+        assert debug["source_router"]["decisions"]["letta"]["decision"] == "insufficient_data"
+    assert calls["letta"] == 3
+
+    results, debug, warnings = await _search()
+    assert calls["letta"] == 3
+    assert [row["file"] for row in results] == ["notes/a.md"]
+    assert debug["source_router"]["skipped"] == ["letta"]
+    assert debug["source_router"]["decisions"]["letta"]["decision"] == "skip"
+    assert debug["source_router"]["decisions"]["qdrant"]["decision"] == "always"
+    assert warnings == []
+
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_SOURCE_ROUTER_EXPLORATION_RATE", 1.0)
+    _, debug, _ = await _search()
+    assert calls["letta"] == 4
+    assert debug["source_router"]["decisions"]["letta"]["decision"] == "explore"
+
+    # Explicit source lists always reach every requested source.
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_SOURCE_ROUTER_EXPLORATION_RATE", 0.0)
+    monkeypatch.setattr(
+        orchestrator,
+        "_resolve_retrieval_sources_for_mode",
+        lambda mode, sources: list(sources or [orchestrator.RETRIEVAL_SOURCE_QDRANT]),
+    )
+    _, debug, _ = await orchestrator.federated_search_memory(
+        "deploy runbook",
+        limit=5,
+        project_filter="alpha",
+        sources=["qdrant", "letta"],
+        rerank_with_learning=False,
+    )
+    assert calls["letta"] == 5
+    assert debug["source_router"]["enabled"] is False
+
+
+@pytest.mark.asyncio
+async def test_search_mongo_raw_uses_text_index_and_falls_back_to_scan(monkeypatch: pytest.MonkeyPatch):
+    class _FakeCollection:
+        def __init__(self):
+            self.indexes: list[Any] = []
+            self.pipelines: list[list[dict[str, Any]]] = []
+            self.finds: list[dict[str, Any]] = []
+            self.text_error: Exception | None = None
+            self.text_empty = False
+
+        def create_index(self, keys, **kwargs):
+            self.indexes.append((keys, kwargs))
+            return kwargs.get("name", "idx")
+
+        def index_information(self):
+            return {"_id_": {"key": [("_id", 1)]}}
+
+        def aggregate(self, pipeline):
+            if self.text_error is not None:
+                raise self.text_error
+            self.pipelines.append(pipeline)
+            if self.text_empty:
+                return []
+            return [
+                {"project": "alpha", "file": "notes/deploy.md", "summary": "deploy runbook", "text_score": 2.0},
+                {"project": "alpha", "file": "notes/old.md", "summary": "", "content_snippet": "rollout checklist", "text_score": 1.0},
+            ]
+
+        def find(self, query_filter, projection=None):
+            self.finds.append({"filter": query_filter, "projection": projection})
+            docs = [{"project": "alpha", "file": "notes/scan.md", "summary": "deploy scan", "content_raw": "x"}]
+
+            class _Cursor(list):
+                def sort(self, *args):
+                    return self
+
+                def limit(self, *args):
+                    return self
+
+            return _Cursor(docs)
+
+    coll = _FakeCollection()
+
+    async def _init_mongo():
+        return True
+
+    monkeypatch.setattr(orchestrator, "init_mongo_client", _init_mongo)
+    monkeypatch.setattr(
+        orchestrator,
+        "MONGO_CLIENT",
+        {orchestrator.MONGO_RAW_DB: {orchestrator.MONGO_RAW_COLLECTION: coll}},
+    )
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_MONGO_TEXT_SEARCH_ENABLED", True)
+    monkeypatch.setattr(
+        orchestrator,
+        "mongo_text_search_state",
+        {
+            "ready": False,
+            "indexName": None,
+            "lastCheckedAt": None,
+            "lastError": None,
+            "retryAfterMonotonic": 0.0,
+            "textQueries": 0,
+            "scanQueries": 0,
+            "textFallbacks": 0,
+            "textEmptyFallbacks": 0,
+        },
+    )
+    monkeypatch.setattr(orchestrator, "mongo_text_index_task", None)
+
+    assert await orchestrator.ensure_mongo_text_search_indexes() is True
+    text_index = [kwargs for keys, kwargs in coll.indexes if kwargs.get("name") == orchestrator.MONGO_RAW_TEXT_INDEX_NAME]
+    assert text_index and text_index[0]["weights"]["summary"] > text_index[0]["weights"]["content_raw"]
+    assert ([("project", 1), ("updated_at", -1)], {}) in coll.indexes
+
+    rows = await orchestrator.search_mongo_raw("deploy", limit=5, project_filter="alpha")
+    assert [row["file"] for row in rows] == ["notes/deploy.md", "notes/old.md"]
+    # Stemmed-only matches are kept but rank below literal matches.
+    assert 0 < rows[1]["score"] <= 0.25 < rows[0]["score"]
+    match = coll.pipelines[0][0]["$match"]
+    assert match["project"] == "alpha"
+    assert match["$text"] == {"$search": "deploy"}
+    projection = coll.pipelines[0][-1]["$project"]
+    assert "content_raw" not in projection
+    assert "$substrCP" in projection["content_snippet"]
+    assert coll.finds == []
+
+    # The raw query never reaches $text: phrase quotes and negations are normalized away.
+    await orchestrator.search_mongo_raw('"deploy plan" -rollback', limit=5, project_filter="alpha")
+    assert coll.pipelines[-1][0]["$match"]["$text"] == {"$search": "deploy plan rollback"}
+
+    # A $text query with no hits falls back to the substring scan.
+    coll.text_empty = True
+    rows = await orchestrator.search_mongo_raw("deploy", limit=5, project_filter="alpha")
+    assert [row["file"] for row in rows] == ["notes/scan.md"]
+    assert orchestrator.mongo_text_search_state["textEmptyFallbacks"] == 1
+    assert orchestrator.mongo_text_search_state["ready"] is True
+    coll.finds.clear()
+
+    coll.text_error = RuntimeError("text index required for $text query")
+    rows = await orchestrator.search_mongo_raw("deploy", limit=5, project_filter="alpha")
+    assert [row["file"] for row in rows] == ["notes/scan.md"]
+    assert coll.finds[0]["filter"] == {"project": "alpha"}
+    assert orchestrator.mongo_text_search_state["ready"] is False
+    assert orchestrator.mongo_text_search_state["textFallbacks"] == 1
+    assert orchestrator._mongo_text_search_ready() is False
+
+    # Once the retry window passes, the background re-check is started and kept referenced.
+    orchestrator.mongo_text_search_state["retryAfterMonotonic"] = 0.0
+    assert orchestrator._mongo_text_search_ready() is False
+    task = orchestrator.mongo_text_index_task
+    assert task is not None
+    assert orchestrator._mongo_text_search_ready() is False
+    assert orchestrator.mongo_text_index_task is task
+    assert await task is True
+
+
+@pytest.mark.asyncio
+async def test_mindsdb_term_index_backfills_and_serves_equality_lookups(monkeypatch: pytest.MonkeyPatch):
+    executed: list[str] = []
+    state = {"join_error": None}
+
+    async def _execute(sql: str):
+        executed.append(sql)
+        if sql.startswith("SELECT COUNT(*)"):
+            count = 0 if "_terms" in sql else 1
+            return {"type": "table", "column_names": ["c"], "data": [[count]]}
+        if sql.startswith("SELECT project, file, summary, created_at FROM") and "OFFSET" in sql:
+            data = [] if "OFFSET 0" not in sql else [["alpha", "notes/old.md", "legacy deploy notes", "2025-01-01"]]
+            return {"type": "table", "column_names": ["project", "file", "summary", "created_at"], "data": data}
+        if " JOIN " in sql:
+            if state["join_error"] is not None:
+                raise state["join_error"]
+            return {
+                "type": "table",
+                "column_names": ["project", "file", "summary", "created_at", "hits"],
+                "data": [["alpha", "notes/deploy.md", "deploy runbook", "2025-02-01", 2]],
+            }
+        if sql.startswith("SELECT project, file, summary, created_at"):
+            return {
+                "type": "table",
+                "column_names": ["project", "file", "summary", "created_at"],
+                "data": [["alpha", "notes/scan.md", "deploy via scan", "2025-02-02"]],
+            }
+        return {"type": "ok"}
+
+    monkeypatch.setattr(orchestrator, "_mindsdb_execute", _execute)
+    monkeypatch.setattr(orchestrator, "MINDSDB_ENABLED", True)
+    monkeypatch.setattr(orchestrator, "MINDSDB_AUTOSYNC", True)
+    monkeypatch.setattr(orchestrator, "MINDSDB_TERM_INDEX_ENABLED", True)
+    monkeypatch.setattr(orchestrator, "mindsdb_table_ready", True)
+    monkeypatch.setattr(orchestrator, "mindsdb_target_table", "memory_events")
+    monkeypatch.setattr(orchestrator, "mindsdb_term_index_task", None)
+    monkeypatch.setattr(
+        orchestrator,
+        "mindsdb_term_index_state",
+        {
+            "table": None,
+            "ready": False,
+            "backfillRunning": False,
+            "backfilledRows": 0,
+            "lastBackfillAt": None,
+            "lastError": None,
+            "indexedRows": 0,
+            "indexErrors": 0,
+            "termQueries": 0,
+            "scanQueries": 0,
+            "termFallbacks": 0,
+        },
+    )
+
+    assert orchestrator._mindsdb_index_terms("notes/deploy.md rollout")[:3] == ["notes/deploy.md", "notes", "deploy"]
+
+    await orchestrator._insert_many_into_mindsdb(
+        [{"project": "alpha", "file": "notes/deploy.md", "summary": "deploy runbook", "created_at": "2025-02-01"}]
+    )
+    term_inserts = [sql for sql in executed if sql.startswith("INSERT INTO files.memory_events_terms")]
+    assert term_inserts and "'deploy'" in term_inserts[0]
+    # The populated event table triggered a backfill before term lookups are trusted.
+    await orchestrator.mindsdb_term_index_task
+    assert orchestrator.mindsdb_term_index_state["ready"] is True
+    assert orchestrator.mindsdb_term_index_state["backfilledRows"] == 1
+    assert any("'legacy'" in sql for sql in executed if sql.startswith("INSERT INTO files.memory_events_terms"))
+    assert "'#complete'" in [sql for sql in executed if sql.startswith("INSERT INTO files.memory_events_terms")][-1]
+    # Re-indexing a row first deletes the term rows it may already have.
+    legacy_delete = (
+        "DELETE FROM files.memory_events_terms WHERE (project = 'alpha' AND file = 'notes/old.md' "
+        "AND created_at = '2025-01-01');"
+    )
+    legacy_insert = next(
+        index for index, sql in enumerate(executed) if sql.startswith("INSERT INTO") and "'legacy'" in sql
+    )
+    assert executed[legacy_insert - 1] == legacy_delete
+    executed.clear()
+    await orchestrator.backfill_mindsdb_term_index("memory_events")
+    assert legacy_delete in executed
+
+    executed.clear()
+    rows = await orchestrator.search_mindsdb_memory("deploy", limit=5, project_filter="alpha")
+    assert [row["file"] for row in rows] == ["notes/deploy.md"]
+    assert len(executed) == 1
+    assert "term IN ('deploy')" in executed[0]
+    assert "project = 'alpha'" in executed[0]
+    assert "LIKE '%" not in executed[0]
+
+    state["join_error"] = RuntimeError("join not supported")
+    executed.clear()
+    rows = await orchestrator.search_mindsdb_memory("deploy", limit=5, project_filter="alpha")
+    assert [row["file"] for row in rows] == ["notes/scan.md"]
+    assert "LIKE '%deploy%'" in executed[-1]
+    assert orchestrator.mindsdb_term_index_state["termFallbacks"] == 1
+
+
+@pytest.mark.asyncio
+async def test_mindsdb_term_index_requires_marker_and_repairs_failed_writes(monkeypatch: pytest.MonkeyPatch):
+    executed: list[str] = []
+    state = {"marker": 0, "fail_terms": False}
+
+    async def _execute(sql: str):
+        executed.append(sql)
+        if sql.startswith("SELECT COUNT(*)"):
+            count = state["marker"] if "'#complete'" in sql else 5
+            return {"type": "table", "column_names": ["c"], "data": [[count]]}
+        if sql.startswith("SELECT project, file, summary, created_at FROM"):
+            return {"type": "table", "column_names": ["project", "file", "summary", "created_at"], "data": []}
+        if sql.startswith("INSERT INTO files.memory_events_terms"):
+            if "'#complete'" in sql:
+                state["marker"] = 1
+            elif state["fail_terms"]:
+                raise RuntimeError("term write failed")
+        if sql.startswith("DELETE FROM files.memory_events_terms") and "'#complete'" in sql:
+            state["marker"] = 0
+        return {"type": "ok"}
+
+    monkeypatch.setattr(orchestrator, "_mindsdb_execute", _execute)
+    monkeypatch.setattr(orchestrator, "MINDSDB_TERM_INDEX_ENABLED", True)
+    monkeypatch.setattr(orchestrator, "mindsdb_term_index_task", None)
+    monkeypatch.setattr(
+        orchestrator,
+        "mindsdb_term_index_state",
+        {"table": None, "ready": False, "backfillRunning": False, "repairPending": False, "backfilledRows": 0,
+         "lastBackfillAt": None, "lastError": None, "indexedRows": 0, "indexErrors": 0},
+    )
+
+    # A populated term table without the marker is a partial backfill, not a ready index.
+    assert await orchestrator._ensure_mindsdb_term_index("memory_events") == "memory_events_terms"
+    assert orchestrator.mindsdb_term_index_state["ready"] is False
+    await orchestrator.mindsdb_term_index_task
+    assert orchestrator.mindsdb_term_index_state["ready"] is True
+    assert state["marker"] == 1
+
+    state["fail_terms"] = True
+    await orchestrator._index_mindsdb_terms(
+        [{"project": "alpha", "file": "notes/a.md", "summary": "deploy notes"}], "memory_events"
+    )
+    assert orchestrator.mindsdb_term_index_state["ready"] is False
+    assert orchestrator.mindsdb_term_index_state["indexErrors"] == 1
+    state["fail_terms"] = False
+    await orchestrator.mindsdb_term_index_task
+    assert orchestrator.mindsdb_term_index_state["ready"] is True
+    assert state["marker"] == 1
+
+
+class _FakeRedisPipeline:
+    def __init__(self, redis: "_FakeRedis"):
+        self.redis = redis
+        self.ops: list[Any] = []
+
+    def mget(self, keys):
+        self.ops.append(lambda: [self.redis.store.get(key) for key in keys])
+
+    def set(self, key, value, ex=None):
+        self.ops.append(lambda: self.redis.store.__setitem__(key, value))
+
+    def incr(self, key):
+        def _incr():
+            value = int(self.redis.store.get(key) or 0) + 1
+            self.redis.store[key] = str(value).encode()
+            return value
+
+        self.ops.append(_incr)
+
+    async def execute(self):
+        self.redis.round_trips += 1
+        return [op() for op in self.ops]
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.store: dict[str, bytes] = {}
+        self.round_trips = 0
+
+    def pipeline(self, transaction=False):
+        return _FakeRedisPipeline(self)
+
+    async def get(self, key):
+        self.round_trips += 1
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None, nx=False):
+        self.round_trips += 1
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    async def delete(self, *keys):
+        self.round_trips += 1
+        for key in keys:
+            self.store.pop(key, None)
+
+
+@pytest.mark.asyncio
+async def test_retrieval_pathway_generation_token_is_shared_across_replicas(monkeypatch: pytest.MonkeyPatch):
+    redis = _FakeRedis()
+    available = {"redis": True}
+
+    async def _client():
+        return redis if available["redis"] else None
+
+    monkeypatch.setattr(orchestrator, "_get_retrieval_pathway_redis_client", _client)
+    monkeypatch.setattr(orchestrator, "_retrieval_pathway_generation_backend_enabled", lambda: True)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_INVALIDATION_ENABLED", True)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_GENERATION_REFRESH_SECS", 0.0)
+    monkeypatch.setattr(orchestrator, "retrieval_pathway_generations", {})
+    monkeypatch.setattr(orchestrator, "retrieval_pathway_generation_remote", {})
+
+    await orchestrator._bump_retrieval_pathway_generations([("alpha", "notes")])
+    shared = await orchestrator._retrieval_pathway_generation_token("alpha", None)
+    assert shared == "p:alpha=r1"
+
+    # Another replica has never seen the write locally but derives the same token.
+    orchestrator.retrieval_pathway_generations.clear()
+    assert await orchestrator._retrieval_pathway_generation_token("alpha", None) == shared
+
+    # With Redis unreachable the per-process counter takes over.
+    available["redis"] = False
+    orchestrator.retrieval_pathway_generations["p:alpha"] = 4
+    assert await orchestrator._retrieval_pathway_generation_token("alpha", None) == "p:alpha=l4"
+
+
+@pytest.mark.asyncio
+async def test_memory_read_cache_l2_shares_and_revalidates_across_replicas(monkeypatch: pytest.MonkeyPatch):
+    redis = _FakeRedis()
+
+    async def _client():
+        return redis
+
+    monkeypatch.setattr(orchestrator, "_get_retrieval_pathway_redis_client", _client)
+    monkeypatch.setattr(orchestrator, "_memory_read_cache_l2_enabled", lambda: True)
+    monkeypatch.setattr(orchestrator, "MEMMCP_READ_CACHE_L2_REVALIDATE_SECS", 0.0)
+    monkeypatch.setattr(orchestrator, "memory_read_cache", orchestrator.OrderedDict())
+    monkeypatch.setattr(orchestrator, "memory_read_cache_tier_latency", {})
+    monkeypatch.setattr(
+        orchestrator,
+        "memory_read_cache_l2_stats",
+        {key: 0 for key in orchestrator.memory_read_cache_l2_stats},
+    )
+    pair = ("alpha", "notes/a.md")
+
+    # Replica A reads the file and writes through to the shared tier, compressed.
+    await orchestrator._memory_read_cache_set(*pair, "shared body")
+    body_key, hash_key = orchestrator._memory_read_cache_l2_keys(orchestrator._memory_read_cache_key(*pair))
+    assert redis.store[body_key].startswith(b"z:")
+    assert redis.store[hash_key].decode() == orchestrator._content_sha256("shared body")
+    writes = orchestrator.memory_read_cache_l2_stats["writes"]
+    await orchestrator._memory_read_cache_set(*pair, "shared body")
+    assert orchestrator.memory_read_cache_l2_stats["writes"] == writes
+
+    # Replica B starts cold and is served from L2 in one round trip, then promotes to L1.
+    orchestrator.memory_read_cache.clear()
+    redis.round_trips = 0
+    assert await orchestrator._memory_read_cache_get_many([pair]) == {pair: "shared body"}
+    assert redis.round_trips == 1
+    assert orchestrator.memory_read_cache_l2_stats["hits"] == 1
+    assert orchestrator.memory_read_cache
+
+    # L1 hits are revalidated against the shared hash.
+    assert await orchestrator._memory_read_cache_get_many([pair]) == {pair: "shared body"}
+    assert orchestrator.memory_read_cache_l2_stats["revalidated"] == 1
+
+    # A write elsewhere invalidates the shared tier; this replica drops its L1 copy.
+    redis.store.pop(hash_key)
+    assert await orchestrator._memory_read_cache_get_many([pair]) == {}
+    assert orchestrator.memory_read_cache_l2_stats["revalidationDrops"] == 1
+    assert not orchestrator.memory_read_cache
+
+    # Corrupted bodies fail hash validation and are treated as misses.
+    await orchestrator._memory_read_cache_set(*pair, "new body")
+    await orchestrator._memory_read_cache_invalidate(*pair)
+    assert body_key not in redis.store and not orchestrator.memory_read_cache
+    redis.store[body_key] = orchestrator._serialize_memory_read_cache_l2("tampered", orchestrator._content_sha256("other"))
+    assert await orchestrator._memory_read_cache_get_many([pair]) == {}
+    assert orchestrator.memory_read_cache_l2_stats["hashMismatches"] == 1
+    assert orchestrator.memory_read_cache_tier_latency["l2"].samples(time.monotonic()) >= 3
+
+
+@pytest.mark.asyncio
+async def test_negative_cache_skips_repeat_misses_until_the_key_is_written(monkeypatch: pytest.MonkeyPatch):
+    reads = {"count": 0}
+    calls = {"letta": 0}
+
+    async def _remote(project, file_name, *, timeout_secs):
+        reads["count"] += 1
+        raise orchestrator.HTTPException(500, "memory_bank_read failed: file not found")
+
+    async def _call_mcp(payload):
+        return {"result": {"content": [{"type": "text", "text": "ok"}]}}
+
+    async def _qdrant(*args, **kwargs):
+        return [{"project": "alpha", "file": "notes/a.md", "summary": "deploy runbook", "score": 0.9, "source": "qdrant"}]
+
+    async def _letta(*args, **kwargs):
+        calls["letta"] += 1
         return []
 
-    async def _empty(*args, **kwargs):
-        return []
+    monkeypatch.setattr(orchestrator, "_read_project_file_remote", _remote)
+    monkeypatch.setattr(orchestrator, "_call_mcp", _call_mcp)
+    monkeypatch.setattr(orchestrator, "MEMMCP_READ_NEGATIVE_CACHE_TTL_SECS", 30.0)
+    monkeypatch.setattr(orchestrator, "memory_read_negative_cache", orchestrator.OrderedDict())
+    monkeypatch.setattr(orchestrator, "memory_read_cache", orchestrator.OrderedDict())
+
+    assert await orchestrator.read_project_file("alpha", "notes/missing.md", allow_missing=True) == ""
+    assert await orchestrator.read_project_file("alpha", "notes/missing.md", allow_missing=True) == ""
+    with pytest.raises(orchestrator.HTTPException) as excinfo:
+        await orchestrator.read_project_file("alpha", "notes/missing.md")
+    assert orchestrator._is_memory_not_found_http_error(excinfo.value)
+    assert reads["count"] == 1
+
+    await orchestrator.call_memory_tool(
+        "memory_bank_write",
+        {"projectName": "alpha", "fileName": "notes/missing.md", "content": "now present"},
+    )
+    assert await orchestrator.read_project_file("alpha", "notes/missing.md", allow_missing=True) == ""
+    assert reads["count"] == 2
 
     monkeypatch.setattr(orchestrator, "search_qdrant", _qdrant)
-    monkeypatch.setattr(orchestrator, "search_mongo_raw", _empty)
-    monkeypatch.setattr(orchestrator, "search_mindsdb_memory", _empty)
-    monkeypatch.setattr(orchestrator, "search_topic_rollups", _empty)
     monkeypatch.setattr(orchestrator, "search_letta_archival", _letta)
-    monkeypatch.setattr(orchestrator, "search_memory_bank_lexical", _memory_bank)
-    monkeypatch.setattr(orchestrator, "RETRIEVAL_ENABLE_STAGED_FETCH", True)
-    monkeypatch.setattr(orchestrator, "RETRIEVAL_SLOW_SOURCE_MIN_RESULTS", 1)
-    monkeypatch.setattr(orchestrator, "RETRIEVAL_SLOW_SOURCE_MIN_TOP_SCORE", 0.4)
-    monkeypatch.setattr(orchestrator, "RETRIEVAL_SLOW_SOURCE_MIN_DIVERSITY", 1)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_ENABLE_STAGED_FETCH", False)
     monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_CACHE_ENABLED", False)
-    monkeypatch.setattr(orchestrator, "RETRIEVAL_SLOW_SOURCE_STABILITY_ENABLED", True)
-    monkeypatch.setattr(orchestrator, "RETRIEVAL_SLOW_SOURCE_STABILITY_MIN_REQUESTS", 10)
-    monkeypatch.setattr(orchestrator, "RETRIEVAL_SLOW_SOURCE_TIMEOUT_RATE_THRESHOLD", 0.5)
-    monkeypatch.setattr(orchestrator, "RETRIEVAL_SLOW_SOURCE_ERROR_RATE_THRESHOLD", 0.6)
-    monkeypatch.setattr(orchestrator, "RETRIEVAL_SLOW_SOURCE_COOLDOWN_SECS", 180.0)
-    monkeypatch.setattr(orchestrator, "RETRIEVAL_LETTA_DEGRADED_TIMEOUT_SECS", 12.0)
-    monkeypatch.setattr(orchestrator, "RETRIEVAL_MEMORY_DEGRADED_TIMEOUT_SECS", 2.5)
-    monkeypatch.setattr(
-        orchestrator,
-        "RETRIEVAL_SOURCES_ENV",
-        ",".join(
-            [
-                orchestrator.RETRIEVAL_SOURCE_QDRANT,
-                orchestrator.RETRIEVAL_SOURCE_LETTA,
-                orchestrator.RETRIEVAL_SOURCE_MEMORY_BANK,
-            ]
-        ),
-    )
-    monkeypatch.setattr(
-        orchestrator,
-        "DEFAULT_RETRIEVAL_FAST_SOURCES",
-        [orchestrator.RETRIEVAL_SOURCE_QDRANT],
-    )
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_SINGLEFLIGHT_ENABLED", False)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_EMPTY_SOURCE_CACHE_TTL_SECS", 20.0)
+    monkeypatch.setattr(orchestrator, "retrieval_empty_source_cache", orchestrator.OrderedDict())
     monkeypatch.setattr(
         orchestrator,
-        "DEFAULT_RETRIEVAL_SLOW_SOURCES",
-        [orchestrator.RETRIEVAL_SOURCE_LETTA, orchestrator.RETRIEVAL_SOURCE_MEMORY_BANK],
+        "_resolve_retrieval_sources_for_mode",
+        lambda mode, sources: [orchestrator.RETRIEVAL_SOURCE_QDRANT, orchestrator.RETRIEVAL_SOURCE_LETTA],
     )
-    async with orchestrator.retrieval_latency_lock:
-        orchestrator.retrieval_source_request_counts.clear()
-        orchestrator.retrieval_source_error_counts.clear()
-        orchestrator.retrieval_source_timeout_counts.clear()
-        orchestrator.retrieval_slow_source_cooldown_until.clear()
-        orchestrator.retrieval_source_request_counts[orchestrator.RETRIEVAL_SOURCE_LETTA] = 20
-        orchestrator.retrieval_source_timeout_counts[orchestrator.RETRIEVAL_SOURCE_LETTA] = 16
-        orchestrator.retrieval_source_request_counts[orchestrator.RETRIEVAL_SOURCE_MEMORY_BANK] = 20
-        orchestrator.retrieval_source_timeout_counts[orchestrator.RETRIEVAL_SOURCE_MEMORY_BANK] = 12
 
-    results, debug, _ = await orchestrator.federated_search_memory(
-        "alpha",
-        limit=5,
-        sources=None,
-        rerank_with_learning=False,
-        retrieval_mode="deep",
-    )
+    async def _search():
+        return await orchestrator.federated_search_memory(
+            "deploy runbook",
+            limit=5,
+            project_filter="alpha",
+            rerank_with_learning=False,
+            retrieval_mode="balanced",
+        )
 
-    assert results
-    assert calls["qdrant"] == 1
-    assert calls["letta"] == 0
-    assert calls["memory_bank"] == 0
-    assert debug["retrieval_mode"] == "deep"
-    assert debug["staged_fetch"]["force_include_slow"] is False
-    assert debug["staged_fetch"]["slow_sources_skipped"] == [
-        orchestrator.RETRIEVAL_SOURCE_LETTA,
-        orchestrator.RETRIEVAL_SOURCE_MEMORY_BANK,
-    ]
-    assert orchestrator.RETRIEVAL_SOURCE_LETTA in debug["source_policy"]["degraded_sources"]
-    assert orchestrator.RETRIEVAL_SOURCE_MEMORY_BANK in debug["source_policy"]["degraded_sources"]
+    _, debug, _ = await _search()
+    assert calls["letta"] == 1
+    assert debug["empty_source_cache_hits"] == []
 
+    results, debug, warnings = await _search()
+    assert calls["letta"] == 1
+    assert debug["empty_source_cache_hits"] == ["letta"]
+    assert [row["file"] for row in results] == ["notes/a.md"]
+    assert warnings == []
 
-@pytest.mark.asyncio
-async def test_federated_search_pathway_cache_hits(monkeypatch: pytest.MonkeyPatch):
-    calls = {"qdrant": 0}
+    # A write into the searched project drops the marker even with generation tracking off.
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_INVALIDATION_ENABLED", False)
+    await orchestrator._bump_retrieval_pathway_generations([("alpha", "notes")])
+    _, debug, _ = await _search()
+    assert calls["letta"] == 2
+    assert debug["empty_source_cache_hits"] == []
 
-    async def _qdrant(*args, **kwargs):
-        calls["qdrant"] += 1
-        return [{"project": "alpha", "file": "notes/a.md", "summary": "cached result", "score": 0.8, "source": "qdrant"}]
+    # An empty answer from a source that swallowed a failure is never remembered.
+    async def _failing_letta(*args, **kwargs):
+        calls["letta"] += 1
+        return orchestrator._incomplete_source_rows()
 
-    monkeypatch.setattr(orchestrator, "search_qdrant", _qdrant)
-    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_CACHE_ENABLED", True)
-    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_CACHE_TTL_SECS", 120.0)
-    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_CACHE_MAX_KEYS", 128)
-    monkeypatch.setattr(orchestrator, "retrieval_pathway_cache_hits", 0)
-    monkeypatch.setattr(orchestrator, "retrieval_pathway_cache_misses", 0)
-    monkeypatch.setattr(orchestrator, "retrieval_pathway_cache_evictions", 0)
-    async with orchestrator.retrieval_pathway_cache_lock:
-        orchestrator.retrieval_pathway_cache.clear()
+    monkeypatch.setattr(orchestrator, "search_letta_archival", _failing_letta)
+    orchestrator.retrieval_empty_source_cache.clear()
+    await _search()
+    _, debug, _ = await _search()
+    assert calls["letta"] == 4
+    assert debug["empty_source_cache_hits"] == []
 
-    first, debug_first, _ = await orchestrator.federated_search_memory(
-        "alpha",
-        limit=5,
-        sources=[orchestrator.RETRIEVAL_SOURCE_QDRANT],
-        rerank_with_learning=False,
-        retrieval_mode="balanced",
-    )
-    second, debug_second, _ = await orchestrator.federated_search_memory(
-        "alpha",
-        limit=5,
-        sources=[orchestrator.RETRIEVAL_SOURCE_QDRANT],
-        rerank_with_learning=False,
-        retrieval_mode="balanced",
+
+@pytest.mark.asyncio
+async def test_letta_search_cache_shares_background_warms_across_replicas(monkeypatch: pytest.MonkeyPatch):
+    redis = _FakeRedis()
+    release = asyncio.Event()
+    fetches = {"count": 0}
+
+    async def _client():
+        return redis
+
+    async def _fetch(**kwargs):
+        fetches["count"] += 1
+        await release.wait()
+        return {"rows": "ignored"}
+
+    def _rows(**kwargs):
+        return [{"project": "alpha", "file": "notes/a.md", "summary": "deploy runbook", "score": 0.7}]
+
+    monkeypatch.setattr(orchestrator, "_get_retrieval_pathway_redis_client", _client)
+    monkeypatch.setattr(orchestrator, "_letta_search_cache_backend_enabled", lambda: True)
+    monkeypatch.setattr(orchestrator, "_fetch_letta_archival_payload", _fetch)
+    monkeypatch.setattr(orchestrator, "_letta_search_rows_from_payload", _rows)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_LETTA_ASYNC_WARM_ENABLED", True)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_LETTA_CACHE_ENABLED", True)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_REDIS_COMPRESS", True)
+    monkeypatch.setattr(orchestrator, "letta_search_cache", orchestrator.OrderedDict())
+    monkeypatch.setattr(orchestrator, "letta_search_warm_inflight", {})
+    monkeypatch.setattr(
+        orchestrator,
+        "letta_search_cache_backend_stats",
+        {key: 0 for key in orchestrator.letta_search_cache_backend_stats},
     )
+    warm_kwargs = {
+        "cache_key": "k1",
+        "agent_id": "agent",
+        "query": "deploy runbook",
+        "limit": 5,
+        "top_k": 10,
+        "project_filter": "alpha",
+        "topic_filter": None,
+        "headers": {},
+        "prior_timeout_secs": 1.0,
+    }
 
-    assert first
-    assert second
-    assert calls["qdrant"] == 1
-    assert debug_first["cache"]["pathway_hit"] is False
-    assert debug_second["cache"]["pathway_hit"] is True
-    assert orchestrator.retrieval_pathway_cache_hits >= 1
+    # Replica A times out and starts a background warm; replica B does the same
+    # while A is still running and leaves the warm to A.
+    await orchestrator._schedule_letta_search_cache_warm(**warm_kwargs)
+    await asyncio.sleep(0)
+    monkeypatch.setattr(orchestrator, "letta_search_warm_inflight", {})
+    await orchestrator._schedule_letta_search_cache_warm(**warm_kwargs)
+    assert orchestrator.letta_search_cache_backend_stats["warmClaimsLost"] == 1
+    release.set()
+    for _ in range(20):
+        await asyncio.sleep(0)
+    assert fetches["count"] == 1
+
+    blob = redis.store[orchestrator._letta_search_cache_redis_key("k1")]
+    assert blob.startswith(b"z:")
+    assert orchestrator._letta_search_cache_redis_key("warm:k1") not in redis.store
+
+    # Replica B's empty in-process cache is filled from the shared tier.
+    monkeypatch.setattr(orchestrator, "letta_search_cache", orchestrator.OrderedDict())
+    rows = await orchestrator._letta_search_cache_get("k1")
+    assert [row["file"] for row in rows] == ["notes/a.md"]
+    assert "k1" in orchestrator.letta_search_cache
+    assert orchestrator.letta_search_cache_backend_stats["hits"] == 1
+    trips = redis.round_trips
+    assert await orchestrator._letta_search_cache_get("k1") == rows
+    assert redis.round_trips == trips
 
 
 @pytest.mark.asyncio
@@ -789,9 +2405,8 @@ async def test_retrieval_pathway_cache_set_writes_backend(monkeypatch: pytest.Mo
 
 @pytest.mark.asyncio
 async def test_retrieval_latency_snapshot_reports_percentiles(monkeypatch: pytest.MonkeyPatch):
-    monkeypatch.setattr(orchestrator, "RETRIEVAL_LATENCY_HISTORY_LIMIT", 128)
     async with orchestrator.retrieval_latency_lock:
-        orchestrator.retrieval_source_latency_samples.clear()
+        orchestrator.retrieval_latency_sketches.clear()
         orchestrator.retrieval_source_request_counts.clear()
         orchestrator.retrieval_source_error_counts.clear()
         orchestrator.retrieval_source_timeout_counts.clear()
@@ -826,11 +2441,78 @@ async def test_retrieval_latency_snapshot_reports_percentiles(monkeypatch: pytes
     assert letta["requests"] == 3
     assert letta["errors"] == 1
     assert letta["timeouts"] == 1
+    assert letta["lifetime"] == {"requests": 3, "errors": 1, "timeouts": 1}
     assert letta["p99Ms"] >= letta["p95Ms"] >= letta["p50Ms"] >= letta["minMs"]
     assert snapshot["modes"]["balanced"] == 2
     assert snapshot["modes"]["deep"] == 1
 
 
+def test_windowed_latency_sketch_quantiles_and_expiry():
+    sketch = orchestrator.WindowedLatencySketch(60.0)
+    rng = random.Random(3)
+    values = sorted(rng.uniform(5.0, 5000.0) for _ in range(2000))
+    for index, value in enumerate(values):
+        sketch.record(value, 1000.0 + index * 0.01, ok=index % 10 != 0, timed_out=index % 50 == 0)
+    now = 1000.0 + 2000 * 0.01
+    for pct in (0.5, 0.95, 0.99):
+        exact = values[int(pct * (len(values) - 1))]
+        assert sketch.quantile(pct, now) == pytest.approx(exact, rel=orchestrator.RETRIEVAL_LATENCY_SKETCH_ACCURACY)
+    summary = sketch.summary(now)
+    assert summary["samples"] == 2000
+    assert summary["errors"] == 200
+    assert summary["timeouts"] == 40
+    assert summary["minMs"] == round(values[0], 3)
+
+    # Slices older than the window are subtracted from the running totals.
+    sketch.record(42.0, now + 61.0)
+    assert sketch.samples(now + 61.0) == 1
+    assert sketch.quantile(0.99, now + 61.0) == pytest.approx(42.0, rel=orchestrator.RETRIEVAL_LATENCY_SKETCH_ACCURACY)
+    assert sketch.summary(now + 200.0) == {"samples": 0, "errors": 0, "timeouts": 0}
+
+
+def test_windowed_latency_sketch_quantile_does_not_mutate():
+    sketch = orchestrator.WindowedLatencySketch(60.0)
+    sketch.record(10.0, 1000.0)
+    sketch.record(30.0, 1030.0)
+    totals = list(sketch.totals)
+
+    # An exporter reading past the first slice's expiry sees only the live slice...
+    assert sketch.quantile(0.5, 1061.0) == pytest.approx(30.0, rel=orchestrator.RETRIEVAL_LATENCY_SKETCH_ACCURACY)
+    # ...without popping slices or touching the running totals.
+    assert len(sketch.slices) == 2
+    assert sketch.totals == totals
+    assert sketch.count == 2
+    assert sketch.quantile(0.5, 2000.0) is None
+
+
+@pytest.mark.asyncio
+async def test_retrieval_latency_sketch_prefers_warm_mode_and_exports_prometheus(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(orchestrator, "retrieval_latency_sketches", {})
+    for _ in range(5):
+        await orchestrator._record_retrieval_source_latency(
+            source="letta", duration_ms=1000.0, ok=True, timed_out=False, retrieval_mode="deep"
+        )
+    for _ in range(20):
+        await orchestrator._record_retrieval_source_latency(
+            source="letta", duration_ms=100.0, ok=True, timed_out=False, retrieval_mode="fast"
+        )
+
+    fast = await orchestrator._retrieval_latency_quantile("letta", 0.9, window="5m", retrieval_mode="fast", min_samples=10)
+    deep = await orchestrator._retrieval_latency_quantile("letta", 0.9, window="5m", retrieval_mode="deep", min_samples=10)
+    assert fast == pytest.approx(100.0, rel=0.03)
+    # The deep sketch is not warm yet, so the all-mode sketch answers.
+    assert deep == pytest.approx(1000.0, rel=0.03)
+
+    snapshot = await orchestrator._retrieval_latency_snapshot()
+    assert set(snapshot["sources"]["letta"]["modes"]) == {"deep", "fast"}
+    assert snapshot["sources"]["letta"]["windows"]["1m"]["samples"] == 25
+
+    if orchestrator.GaugeMetricFamily is not None:
+        family = next(orchestrator._RetrievalLatencyCollector().collect())
+        labels = {tuple(sample.labels.values()) for sample in family.samples}
+        assert ("letta", "fast", "5m", "0.95") in labels
+
+
 @pytest.mark.asyncio
 async def test_retrieval_slow_source_runtime_policy_marks_degraded_sources(monkeypatch: pytest.MonkeyPatch):
     monkeypatch.setattr(orchestrator, "RETRIEVAL_SLOW_SOURCE_STABILITY_ENABLED", True)
@@ -1067,6 +2749,103 @@ async def test_warm_retrieval_pathways_uses_top_observed_queries(monkeypatch: py
     assert "beta route" in warmed_queries
 
 
+@pytest.mark.asyncio
+async def test_predictive_warmer_refreshes_expiring_and_invalidated_hot_pathways(monkeypatch: pytest.MonkeyPatch):
+    warmed: list[tuple[str, int]] = []
+
+    async def _runner(entry: dict[str, Any]) -> bool:
+        warmed.append((str(entry.get("query")), int(entry.get("limit") or 0)))
+        return True
+
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_WARMER_ENABLED", True)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_CACHE_ENABLED", True)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_INVALIDATION_ENABLED", True)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_REDIS_URL", "")
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_WARMER_REFRESH_AHEAD_SECS", 15.0)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_WARMER_HALFLIFE_SECS", 900.0)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_WARMER_MIN_SCORE", 0.5)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_WARMER_BUDGET_MS", 100.0)
+    monkeypatch.setattr(orchestrator, "_run_retrieval_pathway_warm_query", _runner)
+    monkeypatch.setattr(orchestrator, "retrieval_pathway_stats", orchestrator.OrderedDict())
+    monkeypatch.setattr(orchestrator, "retrieval_pathway_warmer_wakeup", asyncio.Event())
+    monkeypatch.setattr(orchestrator, "retrieval_empty_source_cache", orchestrator.OrderedDict())
+
+    async def _observe(query: str, project: str, cached_for_secs: float | None) -> None:
+        await orchestrator._record_retrieval_pathway_observation(
+            query=query,
+            project_filter=project,
+            topic_filter=None,
+            sources=[orchestrator.RETRIEVAL_SOURCE_QDRANT],
+            source_weights={"qdrant": 1.0},
+            retrieval_mode="balanced",
+            limit=6,
+            cached_for_secs=cached_for_secs,
+        )
+
+    await _observe("alpha route", "alpha", 100.0)
+    await _observe("beta route", "beta", 100.0)
+    result = await orchestrator._warm_retrieval_pathways_once()
+    assert result["hot"] == 2
+    assert result["warmed"] == 0
+    assert 80.0 < result["nextDueInSecs"] <= 85.0
+
+    # Inside the refresh-ahead window the pathway is replayed with the live limit.
+    await _observe("alpha route", "alpha", 10.0)
+    result = await orchestrator._warm_retrieval_pathways_once()
+    assert warmed == [("alpha route", 6)]
+    assert (await orchestrator._warm_retrieval_pathways_once())["warmed"] == 0
+
+    # A write into beta's project wakes the warmer and marks only that pathway due.
+    await orchestrator._bump_retrieval_pathway_generations([("beta", "notes")])
+    assert orchestrator.retrieval_pathway_warmer_wakeup.is_set()
+    result = await orchestrator._warm_retrieval_pathways_once()
+    assert warmed[-1] == ("beta route", 6)
+    assert result["warmed"] == 1
+
+    # Pathways that have cooled off are not warmed; expensive ones wait for budget.
+    async with orchestrator.retrieval_pathway_stats_lock:
+        for entry in orchestrator.retrieval_pathway_stats.values():
+            entry["cached_until_monotonic"] = 0.0
+            if entry["project_filter"] == "alpha":
+                entry["score_monotonic"] -= 900.0 * 8
+            else:
+                entry["warm_cost_ms"] = 150.0
+    result = await orchestrator._warm_retrieval_pathways_once()
+    assert result["hot"] == 1
+    assert result["warmed"] == 0
+    assert result["budgetSkipped"] == 1
+    assert result["nextDueInSecs"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_retrieval_pathway_warmer_spaces_write_wakeups(monkeypatch: pytest.MonkeyPatch):
+    runs: list[float] = []
+
+    async def _warm_once():
+        runs.append(time.monotonic())
+        return {"warmed": 1, "skipped": 0, "nextDueInSecs": None}
+
+    wakeup = asyncio.Event()
+    monkeypatch.setattr(orchestrator, "_warm_retrieval_pathways_once", _warm_once)
+    monkeypatch.setattr(orchestrator, "retrieval_pathway_warmer_wakeup", wakeup)
+    monkeypatch.setattr(orchestrator, "RETRIEVAL_PATHWAY_WARMER_MIN_SPACING_SECS", 0.2)
+    monkeypatch.setattr(orchestrator, "retrieval_pathway_warmer_state", {"debouncedWakeups": 0})
+
+    worker = asyncio.create_task(orchestrator._retrieval_pathway_warmer_worker())
+    try:
+        # Steady writes keep setting the wakeup; runs still stay one spacing apart.
+        deadline = time.monotonic() + 0.7
+        while time.monotonic() < deadline:
+            wakeup.set()
+            await asyncio.sleep(0.01)
+    finally:
+        worker.cancel()
+        await asyncio.gather(worker, return_exceptions=True)
+    assert 2 <= len(runs) <= 4
+    assert all(later - earlier >= 0.19 for earlier, later in zip(runs, runs[1:]))
+    assert orchestrator.retrieval_pathway_warmer_state["debouncedWakeups"] >= 1
+
+
 def test_validate_security_posture_requires_api_key_in_production(monkeypatch: pytest.MonkeyPatch):
     monkeypatch.setattr(orchestrator, "MEMMCP_ENV", "production")
     monkeypatch.setattr(orchestrator, "ORCH_SECURITY_STRICT", True)
@@ -1143,6 +2922,7 @@ async def test_memory_search_fails_open_when_preference_store_unavailable(
 
     monkeypatch.setattr(orchestrator, "LEARNING_LOOP_ENABLED", True)
     monkeypatch.setattr(orchestrator, "list_feedback_records", _raise_feedback)
+    monkeypatch.setattr(orchestrator, "preference_context_cache", orchestrator.OrderedDict())
     monkeypatch.setattr(orchestrator, "_run_memory_recall_pipeline", _pipeline)
 
     response = await orchestrator.search_memory(orchestrator.MemorySearch(query="alpha"))
@@ -1151,6 +2931,66 @@ async def test_memory_search_fails_open_when_preference_store_unavailable(
     assert any("Preference context unavailable" in warning for warning in response["warnings"])
 
 
+@pytest.mark.asyncio
+async def test_preference_context_is_cached_until_feedback_and_overlaps_retrieval(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    feedback_reads: list[tuple[str | None, str | None]] = []
+    feedback_released = asyncio.Event()
+    order: list[str] = []
+
+    async def _list_feedback(project, user_id, source, limit):
+        feedback_reads.append((project, user_id))
+        await feedback_released.wait()
+        order.append("feedback")
+        return [{"rating": 5, "content": "prefers terse answers", "source": "user"}]
+
+    async def _pipeline(**kwargs):
+        order.append("retrieval")
+        # Without learning rerank the preference read runs alongside the sources.
+        feedback_released.set()
+        return (
+            [],
+            {"source_errors": {}, "source_counts": {}, "resolved_sources": []},
+            [],
+            {"strict_numeric_copy": True, "facts": [], "numeric_facts": []},
+        )
+
+    async def _task_db_exec(fn):
+        return {"id": "fb1"}
+
+    monkeypatch.setattr(orchestrator, "LEARNING_LOOP_ENABLED", True)
+    monkeypatch.setattr(orchestrator, "PREFERENCE_CACHE_TTL_SECS", 300.0)
+    monkeypatch.setattr(orchestrator, "list_feedback_records", _list_feedback)
+    monkeypatch.setattr(orchestrator, "_run_memory_recall_pipeline", _pipeline)
+    monkeypatch.setattr(orchestrator, "_task_db_exec", _task_db_exec)
+    monkeypatch.setattr(orchestrator, "preference_context_cache", orchestrator.OrderedDict())
+    monkeypatch.setattr(
+        orchestrator,
+        "preference_context_cache_stats",
+        {key: 0 for key in ("hits", "misses", "invalidations", "evictions", "overlapped")},
+    )
+
+    payload = orchestrator.MemorySearch(query="alpha", project="alpha", user_id="u1", rerank_with_learning=False)
+    response = await orchestrator.search_memory(payload)
+    assert order == ["retrieval", "feedback"]
+    assert response["preferences"]["positive"]
+    assert orchestrator.preference_context_cache_stats["overlapped"] == 1
+
+    await orchestrator.search_memory(payload)
+    await orchestrator.search_memory(payload.model_copy(update={"rerank_with_learning": True}))
+    assert feedback_reads == [("alpha", "u1")]
+    assert orchestrator.preference_context_cache_stats["hits"] == 2
+
+    # Feedback from another user leaves this scope cached; feedback in scope drops it.
+    await orchestrator.create_feedback_record("alpha", "u2", "user", None, 1, None, None, "x", None, None)
+    await orchestrator.search_memory(payload)
+    assert len(feedback_reads) == 1
+    await orchestrator.create_feedback_record("alpha", "u1", "user", None, 1, None, None, "y", None, None)
+    await orchestrator.search_memory(payload)
+    assert feedback_reads == [("alpha", "u1"), ("alpha", "u1")]
+
+
 @pytest.mark.asyncio
 async def test_memory_search_uses_agent_profile_pipeline_and_grounding(monkeypatch: pytest.MonkeyPatch):
     captured: dict[str, Any] = {}
@@ -3006,6 +4846,277 @@ async def test_rebuild_topic_rollups_dedupes_and_extracts_numeric_facts(
     assert any(fact["value"] == "7" for fact in decisions["numericFacts"])
 
 
+@pytest.mark.asyncio
+async def test_qdrant_backfill_scans_ts_segments_concurrently_and_resumes_from_checkpoint(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+):
+    points = [
+        SimpleNamespace(
+            id=idx,
+            payload={
+                "project": "alpha",
+                "file": f"notes/{idx}.md",
+                "summary": f"note {idx}",
+                **({"ts": 1_000 + idx * 10} if idx % 7 else {}),
+            },
+        )
+        for idx in range(1, 41)
+    ]
+    scrolls = {"paged": 0, "ordered": 0}
+
+    def _matches(point: Any, scroll_filter: Any) -> bool:
+        for condition in getattr(scroll_filter, "must", None) or []:
+            ts = point.payload.get("ts")
+            if isinstance(condition, orchestrator.qdrant_models.IsEmptyCondition):
+                if ts is not None:
+                    return False
+            elif condition.key == "ts":
+                if ts is None:
+                    return False
+                if condition.range.gte is not None and ts < condition.range.gte:
+                    return False
+                if condition.range.lt is not None and ts >= condition.range.lt:
+                    return False
+        return True
+
+    class _FakeQdrant:
+        async def scroll(self, **kwargs):
+            matched = [point for point in points if _matches(point, kwargs.get("scroll_filter"))]
+            order_by = kwargs.get("order_by")
+            if order_by is not None:
+                scrolls["ordered"] += 1
+                matched = sorted(
+                    (point for point in matched if "ts" in point.payload),
+                    key=lambda point: point.payload["ts"],
+                    reverse=order_by.direction == "desc",
+                )
+                return matched[: kwargs["limit"]], None
+            scrolls["paged"] += 1
+            offset = kwargs.get("offset") or 0
+            page = [point for point in matched if point.id >= offset][: kwargs["limit"] + 1]
+            next_offset = page[-1].id if len(page) > kwargs["limit"] else None
+            return page[: kwargs["limit"]], next_offset
+
+    async def _qdrant_call(operation, fn):
+        return await fn(_FakeQdrant(), "primary")
+
+    enqueued: list[str] = []
+
+    async def _enqueue(event_payload, targets, force_requeue=False):
+        enqueued.append(event_payload["file"])
+        return {"inserted": 1, "requeued": 0, "existing": 0}
+
+    monkeypatch.setattr(orchestrator, "_qdrant_call", _qdrant_call)
+    monkeypatch.setattr(orchestrator, "enqueue_fanout_outbox", _enqueue)
+    monkeypatch.setattr(orchestrator, "LANGFUSE_API_KEY", "")
+    monkeypatch.setattr(orchestrator, "memory_write_queue", asyncio.Queue(maxsize=4))
+    monkeypatch.setattr(orchestrator, "BACKFILL_CHECKPOINT_DIR", tmp_path / "backfill_jobs")
+    monkeypatch.setattr(orchestrator, "BACKFILL_PAGE_SIZE", 4)
+    monkeypatch.setattr(orchestrator, "backfill_jobs", orchestrator.OrderedDict())
+
+    first = await orchestrator.backfill_fanout_from_qdrant(
+        orchestrator.QdrantBackfillRequest(targets=["mindsdb"], limit=10, segments=3, job_id="qdrant-import")
+    )
+    assert first["job_status"] == "limit_reached"
+    assert first["scanned_rows"] == 10
+    # Three ts ranges plus the points without ts, found via two ordered bound lookups.
+    assert first["segments"] == 4
+    assert scrolls["ordered"] == 2
+
+    # A restart loses the in-memory registry; the checkpoint on disk carries the cursors.
+    orchestrator.backfill_jobs.clear()
+    checkpoint = json.loads((tmp_path / "backfill_jobs" / "qdrant-import.json").read_text(encoding="utf-8"))
+    assert checkpoint["status"] == "limit_reached"
+    status = await orchestrator.get_backfill_job("qdrant-import")
+    assert status["job"]["scanned"] == 10
+    assert len(status["job"]["segmentsDetail"]) == 4
+
+    resumed = await orchestrator.backfill_fanout_from_qdrant(
+        orchestrator.QdrantBackfillRequest(targets=["mindsdb"], limit=1000, segments=3, job_id="qdrant-import")
+    )
+    assert resumed["job_status"] == "completed"
+    # Every point is enqueued; only the pages cut short by the first run's limit are re-read.
+    assert set(enqueued) == {point.payload["file"] for point in points}
+    assert len(enqueued) - len(set(enqueued)) < 4 * orchestrator.BACKFILL_PAGE_SIZE
+    listed = await orchestrator.list_backfill_jobs()
+    assert listed["jobs"][0]["jobId"] == "qdrant-import"
+    assert listed["jobs"][0]["segmentsDone"] == 4
+    assert listed["jobs"][0]["runs"] == 2
+
+    with pytest.raises(orchestrator.HTTPException) as conflict:
+        await orchestrator.backfill_fanout_from_qdrant(
+            orchestrator.QdrantBackfillRequest(targets=["mongo_raw"], limit=10, job_id="qdrant-import")
+        )
+    assert conflict.value.status_code == 409
+
+    # An ad-hoc job (no job_id) is tracked in memory only and leaves no checkpoint behind.
+    adhoc = await orchestrator.backfill_fanout_from_qdrant(
+        orchestrator.QdrantBackfillRequest(targets=["mindsdb"], limit=5, segments=2)
+    )
+    assert adhoc["job_status"] == "limit_reached"
+    assert (await orchestrator.get_backfill_job(adhoc["job_id"]))["job"]["checkpointed"] is False
+    assert sorted(path.name for path in (tmp_path / "backfill_jobs").iterdir()) == ["qdrant-import.json"]
+
+
+def test_capped_mongo_backfill_keeps_one_newest_first_segment():
+    class _FakeCollection:
+        def __init__(self, total: int):
+            self.total = total
+
+        def count_documents(self, query_filter, limit=0):
+            return min(self.total, limit) if limit else self.total
+
+        def find_one(self, query_filter, projection=None, sort=None):
+            return None
+
+    # More matching rows than the limit: one segment in global updated_at order.
+    assert orchestrator._mongo_backfill_segments(_FakeCollection(50), {}, 4, 10) == [
+        {"index": 0, "order": "updated_at"}
+    ]
+    assert orchestrator._mongo_backfill_segments(_FakeCollection(10), {}, 4, 10) == [{"index": 0}]
+
+    updated_at = datetime(2026, 1, 2, tzinfo=timezone.utc)
+    cursor = {
+        "updatedAt": orchestrator._mongo_backfill_encode_updated_at(updated_at),
+        "id": orchestrator._mongo_backfill_encode_id(orchestrator.ObjectId("0" * 24)),
+    }
+    restored = json.loads(json.dumps(cursor))
+    after = orchestrator._mongo_backfill_newest_filter({"project": "alpha"}, restored)
+    assert after["$and"][0] == {"project": "alpha"}
+    branches = after["$and"][1]["$or"]
+    assert branches[0] == {"updated_at": {"$lt": updated_at}}
+    assert branches[1]["_id"] == {"$lt": orchestrator.ObjectId("0" * 24)}
+    assert {"updated_at": None} in branches
+
+
+@pytest.mark.asyncio
+async def test_topic_rollup_qdrant_rows_are_sorted_newest_first(monkeypatch: pytest.MonkeyPatch):
+    async def _segments(collection, base_conditions, count):
+        return [{"index": 0}, {"index": 1}]
+
+    def _fetcher(collection, base_conditions, operation):
+        async def _fetch(segment, cursor, page_limit):
+            # The older segment answers last, as concurrent segments may.
+            await asyncio.sleep(0 if segment["index"] else 0.01)
+            ts_values = [100, 300] if segment["index"] == 0 else [200, None]
+            points = [
+                SimpleNamespace(payload={"project": "alpha", "file": f"{ts}.md", **({"ts": ts} if ts else {})})
+                for ts in ts_values
+            ]
+            return points, None
+
+        return _fetch
+
+    monkeypatch.setattr(orchestrator, "_qdrant_backfill_segments", _segments)
+    monkeypatch.setattr(orchestrator, "_qdrant_backfill_page_fetcher", _fetcher)
+    monkeypatch.setattr(orchestrator, "backfill_jobs", orchestrator.OrderedDict())
+
+    rows = await orchestrator._topic_rollup_entries_from_qdrant(scan_limit=10)
+    assert [row["file"] for row in rows] == ["300.md", "200.md", "100.md", "None.md"]
+    assert all("_ts" not in row for row in rows)
+
+
+@pytest.mark.asyncio
+async def test_incremental_topic_rollups_match_rebuild_and_replay_deltas(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+):
+    monkeypatch.setattr(orchestrator, "TOPIC_ROLLUP_PATH", tmp_path / "topic_rollups.json")
+    monkeypatch.setattr(orchestrator, "TOPIC_INDEX_PATH", tmp_path / "topic_index.json")
+    monkeypatch.setattr(orchestrator, "TOPIC_ROLLUP_ENABLED", True)
+    monkeypatch.setattr(orchestrator, "TOPIC_ROLLUP_INCREMENTAL_ENABLED", True)
+    monkeypatch.setattr(orchestrator, "TOPIC_ROLLUP_DELTA_COMPACT_LINES", 10)
+    monkeypatch.setattr(orchestrator, "topic_rollup_persisted_delta_seq", -1)
+    monkeypatch.setattr(orchestrator, "TOPIC_ROLLUP_HISTORY_SCAN_LIMIT", 50)
+    rows = [
+        {
+            "timestamp": "2026-03-02T17:00:00Z",
+            "project": "alpha",
+            "file": "decisions/a.md",
+            "topic_path": "decisions/knobs",
+            "summary": "PnL improved to 123.45 after retry budget change.",
+        },
+        {
+            "timestamp": "2026-03-02T17:01:00Z",
+            "project": "alpha",
+            "file": "decisions/b.md",
+            "topic_path": "decisions",
+            "summary": "Queue depth dropped by 7 in the latest run.",
+        },
+        {
+            "timestamp": "2026-03-02T17:02:00Z",
+            "project": "beta",
+            "file": "notes/c.md",
+            "topic_path": "notes",
+            "summary": "Nothing numeric here.",
+        },
+    ]
+    async with orchestrator.topic_tree_lock:
+        orchestrator.topic_tree.clear()
+    # The write path bumps the topic tree for every write, a replayed one included.
+    for row in [*rows, rows[0]]:
+        await orchestrator._update_topic_tree(row["project"], row["topic_path"])
+    async with orchestrator.memory_write_history_lock:
+        orchestrator.memory_write_history.clear()
+        orchestrator.memory_write_history.extend(rows)
+    rebuilt = await orchestrator.rebuild_topic_rollups_once()
+
+    async with orchestrator.topic_rollup_lock:
+        orchestrator.topic_rollup_index.clear()
+    await orchestrator._set_topic_rollup_snapshot(
+        {"generatedAt": None, "projects": {}, "projectsCount": 0, "topicsCount": 0},
+        started_at=time.perf_counter(),
+        source="test",
+    )
+    for row in rows:
+        assert await orchestrator._apply_topic_rollup_write(row) is True
+    # A replayed write is recognised: it still counts as an event but not as a recent entry.
+    assert await orchestrator._apply_topic_rollup_write(rows[0]) is False
+    assert orchestrator._topic_rollup_health_snapshot()["dirtyTopics"] == 3
+
+    fields = ("path", "eventCount", "recentEventCount", "uniqueFiles", "summarySnippets", "numericFacts", "children")
+
+    def _topics(index: dict[str, Any]) -> dict[str, list[tuple[Any, ...]]]:
+        return {
+            project: [tuple(json.dumps(topic.get(field), sort_keys=True) for field in fields) for topic in payload["topics"]]
+            for project, payload in index["projects"].items()
+        }
+
+    assert _topics(orchestrator.topic_rollup_index) == _topics(rebuilt)
+
+    assert await orchestrator._flush_topic_rollup_deltas() == 3
+    assert await orchestrator._flush_topic_rollup_deltas() == 0
+    delta_path = orchestrator._topic_rollup_delta_path()
+    assert len(delta_path.read_text(encoding="utf-8").splitlines()) == 1
+
+    # A restart restores the last full snapshot and replays the delta log over it.
+    expected = _topics(orchestrator.topic_rollup_index)
+    async with orchestrator.topic_rollup_lock:
+        orchestrator.topic_rollup_index.clear()
+    orchestrator._load_topic_rollup_index()
+    assert _topics(orchestrator.topic_rollup_index) == expected
+    assert orchestrator.topic_rollup_index["historyEntriesDeduped"] == 3
+
+    # A snapshot that reaches disk after later deltas were appended keeps those deltas.
+    async with orchestrator.topic_rollup_lock:
+        stale_snapshot = json.loads(json.dumps(orchestrator.topic_rollup_index))
+    assert await orchestrator._apply_topic_rollup_write({**rows[1], "summary": "Queue depth dropped by 9."}) is True
+    assert await orchestrator._flush_topic_rollup_deltas() == 1
+    await orchestrator._persist_topic_rollup_index(stale_snapshot)
+    lines = delta_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["seq"] for line in lines] == [stale_snapshot["deltaSeq"] + 1]
+    expected = _topics(orchestrator.topic_rollup_index)
+    async with orchestrator.topic_rollup_lock:
+        orchestrator.topic_rollup_index.clear()
+    orchestrator._load_topic_rollup_index()
+    assert _topics(orchestrator.topic_rollup_index) == expected
+
+    # A full snapshot write folds the deltas in and truncates the log.
+    await orchestrator.rebuild_topic_rollups_once()
+    assert not delta_path.exists()
+
+
 @pytest.mark.asyncio
 async def test_search_topic_rollups_returns_rollup_source_rows():
     async with orchestrator.topic_rollup_lock: